@@ -0,0 +1,287 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Callback plugin that summarizes the HMC requests of the modules of this
+collection across a playbook run.
+"""
+
+import os
+import json
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = r"""
+---
+name: zhmc_stats
+type: aggregate
+short_description: Summarize the HMC requests of a playbook run
+version_added: "2.15.0"
+description:
+  - Collects the HMC request statistics that the modules of the IBM Z HMC
+    collection return in the C(_zhmc_stats) item of their result, and the
+    retries they return in the C(retries) item.
+  - At the end of the playbook run, displays a summary with the slowest
+    tasks, the HMC requests by resource type, the time spent in HMC requests
+    versus waiting for jobs and status changes, and the retries.
+  - Optionally, writes the summary and the per-task statistics as a JSON
+    report file.
+  - The modules return their statistics only when the environment variable
+    C(ZHMC_STATS) is set to C(true) in their environment. When the
+    C(enable_module_stats) option is set, this callback plugin sets it in the
+    environment of the Ansible controller if not set, which is inherited by
+    modules that run on the controller (e.g. in tasks that are delegated to
+    localhost).
+requirements:
+  - Enable the callback plugin in the C(callbacks_enabled) setting of the
+    C([defaults]) section of the C(ansible.cfg) file.
+options:
+  enable_module_stats:
+    description:
+      - Set the environment variable C(ZHMC_STATS) to C(true) in the
+        environment of the Ansible controller if not set, so that modules
+        that run on the controller return their statistics. If not set, the
+        modules return their statistics only when C(ZHMC_STATS) is set for
+        them, e.g. with the C(environment) keyword.
+    type: bool
+    default: false
+    env:
+      - name: ZHMC_STATS_ENABLE
+    ini:
+      - section: callback_zhmc_stats
+        key: enable_module_stats
+  report_file:
+    description:
+      - Path name of the JSON report file. If not set, no report file is
+        written. If the file cannot be written, a warning is displayed and
+        the playbook result is not affected.
+    type: path
+    env:
+      - name: ZHMC_STATS_REPORT
+    ini:
+      - section: callback_zhmc_stats
+        key: report_file
+  top:
+    description:
+      - Number of slowest tasks that are displayed in the summary.
+    type: int
+    default: 10
+    env:
+      - name: ZHMC_STATS_TOP
+    ini:
+      - section: callback_zhmc_stats
+        key: top
+"""
+
+# Name of the environment variable that enables the HMC request statistics
+# in the module results
+STATS_ENVVAR = 'ZHMC_STATS'
+
+# Names of the statistics items that are summed up across tasks
+SUMMED_ITEMS = ('request_count', 'request_time', 'response_bytes',
+                'wait_time', 'logon_time')
+
+
+def resource_type(request_key):
+    """
+    Return the resource type of an HMC request from its key in the HMC
+    request statistics.
+
+    For example, 'GET /api/partitions/{id}/nics/{id}' and
+    'POST /api/partitions/{id}/operations/start' have resource types 'nics'
+    and 'partitions', respectively.
+
+    Parameters:
+      request_key (str): The HTTP method and URI template of the request.
+
+    Returns:
+      str: The resource type.
+    """
+    template = request_key.split(' ', 1)[-1]
+    segs = [s for s in template.split('/') if s and s != 'api']
+    if 'operations' in segs:
+        segs = segs[:segs.index('operations')]
+    while segs and segs[-1] == '{id}':
+        segs.pop()
+    return segs[-1] if segs else template
+
+
+def task_stats(module_result):
+    """
+    Return the HMC request statistics of a task from its module result,
+    summed up across the loop items of the task.
+
+    Parameters:
+      module_result (dict): The module result of the task.
+
+    Returns:
+      dict: The HMC request statistics with the items in SUMMED_ITEMS,
+      'requests_by_resource' and 'retries', or None if the module result
+      has no HMC request statistics and no retries.
+    """
+    results = [module_result]
+    results.extend(r for r in module_result.get('results') or []
+                   if isinstance(r, dict))
+    stats = dict.fromkeys(SUMMED_ITEMS, 0)
+    stats['requests_by_resource'] = {}
+    stats['retries'] = 0
+    found = False
+    for result in results:
+        zhmc_stats = result.get('_zhmc_stats')
+        if zhmc_stats:
+            found = True
+            for item in SUMMED_ITEMS:
+                stats[item] += zhmc_stats.get(item) or 0
+            by_resource = stats['requests_by_resource']
+            for key, req in (zhmc_stats.get('requests') or {}).items():
+                rtype = resource_type(key)
+                by_resource[rtype] = by_resource.get(rtype, 0) + req['count']
+        retries = result.get('retries')
+        if retries:
+            found = True
+            stats['retries'] += sum(retries.values())
+    return stats if found else None
+
+
+class CallbackModule(CallbackBase):
+    """
+    Callback plugin that summarizes the HMC requests of the modules of this
+    collection across a playbook run.
+    """
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'ibm.ibm_zhmc.zhmc_stats'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.report_file = None
+        self.top = 10
+        self.tasks = []
+        self._start_times = {}
+        self._run_start_time = time.time()
+
+    def set_options(self, task_keys=None, var_options=None, direct=None):
+        super().set_options(task_keys=task_keys, var_options=var_options,
+                            direct=direct)
+        self.report_file = self.get_option('report_file')
+        self.top = self.get_option('top')
+        if self.get_option('enable_module_stats'):
+            self.enable_module_stats()
+
+    @staticmethod
+    def enable_module_stats():
+        """
+        Enable the HMC request statistics in the results of the modules that
+        run on the Ansible controller, unless ZHMC_STATS is already set.
+        """
+        os.environ.setdefault(STATS_ENVVAR, 'true')
+
+    def v2_runner_on_start(self, host, task):
+        # pylint: disable=missing-function-docstring
+        self._start_times[(host.get_name(), task._uuid)] = time.time()
+
+    def v2_runner_on_ok(self, result):
+        # pylint: disable=missing-function-docstring
+        self.record(result, failed=False)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        # pylint: disable=missing-function-docstring
+        self.record(result, failed=True)
+
+    def record(self, result, failed):
+        """
+        Record the HMC request statistics of a task result, if any.
+        """
+        # pylint: disable=protected-access
+        stats = task_stats(result._result)
+        host = result._host.get_name()
+        start_time = self._start_times.pop((host, result._task._uuid), None)
+        if stats is None:
+            return
+        stats['task'] = result._task.get_name()
+        stats['host'] = host
+        stats['action'] = result._task.action
+        stats['failed'] = failed
+        stats['duration'] = None if start_time is None else \
+            time.time() - start_time
+        self.tasks.append(stats)
+
+    def report(self):
+        """
+        Return the report of the playbook run as a dict with items 'totals',
+        'requests_by_resource', 'slowest_tasks' and 'tasks'.
+        """
+        totals = dict.fromkeys(SUMMED_ITEMS, 0)
+        totals['retries'] = 0
+        totals['tasks'] = len(self.tasks)
+        totals['duration'] = time.time() - self._run_start_time
+        by_resource = {}
+        for stats in self.tasks:
+            for item in SUMMED_ITEMS + ('retries',):
+                totals[item] += stats[item]
+            for rtype, count in stats['requests_by_resource'].items():
+                by_resource[rtype] = by_resource.get(rtype, 0) + count
+        slowest = sorted(
+            self.tasks, key=lambda s: s['duration'] or s['request_time'],
+            reverse=True)[:self.top]
+        return {
+            'totals': totals,
+            'requests_by_resource': dict(sorted(
+                by_resource.items(), key=lambda i: i[1], reverse=True)),
+            'slowest_tasks': slowest,
+            'tasks': self.tasks,
+        }
+
+    def v2_playbook_on_stats(self, stats):
+        # pylint: disable=missing-function-docstring,unused-argument
+        report = self.report()
+        totals = report['totals']
+        display = self._display
+        display.banner("ZHMC STATS")
+        display.display(
+            f"{totals['tasks']} tasks with {totals['request_count']} HMC "
+            f"requests ({totals['response_bytes']} response bytes), "
+            f"{totals['retries']} retries")
+        display.display(
+            f"Time in HMC requests: {totals['request_time']:.1f} s, "
+            f"waiting for jobs and status: {totals['wait_time']:.1f} s, "
+            f"logon: {totals['logon_time']:.1f} s")
+        if report['slowest_tasks']:
+            display.display("Slowest tasks:")
+        for s in report['slowest_tasks']:
+            duration = '-' if s['duration'] is None else \
+                f"{s['duration']:.1f} s"
+            display.display(
+                f"  {s['task']} ({s['host']}): {duration}, "
+                f"{s['request_count']} requests in "
+                f"{s['request_time']:.1f} s, waits {s['wait_time']:.1f} s, "
+                f"{s['retries']} retries")
+        if report['requests_by_resource']:
+            display.display("HMC requests by resource type:")
+        for rtype, count in report['requests_by_resource'].items():
+            display.display(f"  {rtype}: {count}")
+        if self.report_file:
+            try:
+                with open(self.report_file, 'w', encoding='utf-8') as fp:
+                    json.dump(report, fp, indent=2)
+            except OSError as exc:
+                display.warning(
+                    f"Cannot write HMC statistics report file "
+                    f"{self.report_file}: {exc}")
+            else:
+                display.display(f"HMC statistics report written to "
+                                f"{self.report_file}")
@@ -19,26 +19,57 @@ Utility functions for use by more than one Ansible module.
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import atexit
 import logging
 import traceback
+import os
+import math
+import fcntl
+import hashlib
+import json
+import tempfile
 import threading
+import functools
 import sys
+import time
+import random
 import re
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from urllib.parse import urlsplit
 from ansible.module_utils.basic import missing_required_lib
 
+# Profiling of a module invocation (see ModuleProfiler) is started already
+# here, so that it also covers the import of the zhmcclient package. The
+# environment variable is PROFILE_DIR_ENVVAR, which is defined further down.
+IMPORT_PROFILE = None
+if os.environ.get('ZHMC_PROFILE_DIR'):
+    import cProfile
+    IMPORT_PROFILE = cProfile.Profile()
+    try:
+        IMPORT_PROFILE.enable()
+    except ValueError:
+        # Another profiler is already active in this process
+        IMPORT_PROFILE = None
+
 try:
-    from zhmcclient import Session, ClientAuthError, HTTPError
+    from zhmcclient import Session, ClientAuthError, HTTPError, \
+        OperationTimeout, StatusTimeout, ConnectTimeout, RetryTimeoutConfig, \
+        NotificationReceiver, NotFound
+    from urllib3.exceptions import NewConnectionError
+    from zhmcclient import Error as ClientError
+    from zhmcclient import ConnectionError as ClientConnectionError
     IMP_ZHMCCLIENT_ERR = None
 except ImportError:
     IMP_ZHMCCLIENT_ERR = traceback.format_exc()
 
-try:
-    from zhmcclient_mock import FakedSession
-    IMP_ZHMCCLIENT_MOCK_ERR = None
-except ImportError:
-    IMP_ZHMCCLIENT_MOCK_ERR = traceback.format_exc()
+# The zhmcclient_mock package is imported only when a faked session is used
+# (see open_session()), because importing it takes a significant part of the
+# start time of each module invocation.
+
+# Logger for the interactions with the HMC (set up by log_init())
+HMC_LOGGER = logging.getLogger('zhmcclient.hmc')
 
 BLANKED_OUT = '********'  # Replacement for blanked out sensitive values
 
@@ -85,6 +116,14 @@ class VersionError(Error):
     pass
 
 
+class GovernorError(Error):
+    """
+    Indicates that no session or request slot of the HMC governor became
+    free within the governor timeout.
+    """
+    pass
+
+
 # Partition status values that cause failure in any status related method
 PART_BAD_STATUSES = ('communications-not-active', 'status-check')
 
@@ -98,201 +137,2236 @@ PART_STOPPING_END_STATUSES = (
     'stopped', 'terminated'
 ) + PART_BAD_STATUSES
 
+# Poll intervals in seconds for waiting for the status of a partition or LPAR:
+# Initial interval, maximum interval, increase factor
+STATUS_POLL_INTERVALS = (1.0, 10.0, 1.5)
 
-def common_fail_on_import_errors(module):
+# Poll intervals in seconds for waiting for the completion of a job:
+# Initial interval, maximum interval, increase factor
+JOB_POLL_INTERVALS = (1.0, 15.0, 1.5)
+
+# Poll intervals in seconds for waiting for the fulfillment of storage
+# volumes: Initial interval, maximum interval, increase factor
+FULFILLMENT_POLL_INTERVALS = (2.0, 30.0, 1.5)
+
+# Poll intervals in seconds for waiting for the fulfillment of storage
+# volumes while object notifications for the storage group are received.
+# The notifications end each poll interval early, so polling only guards
+# against missed notifications.
+FULFILLMENT_NOTIFIED_POLL_INTERVALS = (30.0, 120.0, 2.0)
+
+# Minimum time in seconds between two checks for the fulfillment of storage
+# volumes, so that a burst of notifications does not cause a check for each
+# notification.
+FULFILLMENT_MIN_CHECK_INTERVAL = 2.0
+
+# Relative random jitter applied to each poll interval
+POLL_JITTER = 0.2
+
+# Environment variables for limiting the load that the modules running on the
+# same system put on an HMC (see HmcGovernor)
+GOVERNOR_MAX_SESSIONS_ENVVAR = 'ZHMC_MAX_SESSIONS'
+GOVERNOR_MAX_REQUESTS_ENVVAR = 'ZHMC_MAX_REQUESTS'
+GOVERNOR_REQUEST_RATE_ENVVAR = 'ZHMC_REQUEST_RATE'
+GOVERNOR_DIR_ENVVAR = 'ZHMC_GOVERNOR_DIR'
+GOVERNOR_TIMEOUT_ENVVAR = 'ZHMC_GOVERNOR_TIMEOUT'
+
+# Default time in seconds for waiting for a free session or request slot of
+# the HmcGovernor
+DEFAULT_GOVERNOR_TIMEOUT = 3600
+
+# Interval in seconds for checking for a free slot of a FileSemaphore
+GOVERNOR_POLL_INTERVAL = 0.05
+
+# Environment variables for the selection of the HMC from a list of redundant
+# HMCs (see HmcSelector)
+HMC_SELECTION_ENVVAR = 'ZHMC_HMC_SELECTION'
+HMC_SELECTION_TTL_ENVVAR = 'ZHMC_HMC_SELECTION_TTL'
+
+# Default time in seconds for which the HMC selection is cached
+DEFAULT_HMC_SELECTION_TTL = 300
+
+# Environment variable for the time in seconds for which the API feature
+# lists of the HMC and its CPCs are cached (see FeatureCache)
+FEATURE_CACHE_TTL_ENVVAR = 'ZHMC_FEATURE_CACHE_TTL'
+
+# Connect and read timeout in seconds for probing an HMC
+HMC_PROBE_TIMEOUT = 10
+
+# Environment variable for routing read-only modules to the alternate HMC of
+# a list of redundant HMCs (see routed_hosts())
+READ_WRITE_SPLIT_ENVVAR = 'ZHMC_READ_WRITE_SPLIT'
+
+# Environment variables for the retry of HMC operations that failed with a
+# transient error (see RetryPolicy)
+RETRY_ATTEMPTS_ENVVAR = 'ZHMC_RETRY_ATTEMPTS'
+RETRY_TIMEOUT_ENVVAR = 'ZHMC_RETRY_TIMEOUT'
+
+# Default maximum number of retries of an HMC operation
+DEFAULT_RETRY_ATTEMPTS = 3
+
+# Default overall timeout in seconds for the retries of an HMC operation
+DEFAULT_RETRY_TIMEOUT = 300
+
+# Retry intervals in seconds: Initial interval, maximum interval, increase
+# factor
+RETRY_INTERVALS = (2.0, 30.0, 2.0)
+
+# HTTP status codes of transient HMC errors, with their reason codes (None
+# means any reason code):
+# 409.2: Target object is busy performing another operation
+# 503: HMC is temporarily unavailable (e.g. too many sessions or requests)
+RETRYABLE_HTTP_ERRORS = {
+    409: (2,),
+    503: None,
+}
+
+# Name of the environment variable that enables the HMC request statistics
+# in the module results
+STATS_ENVVAR = 'ZHMC_STATS'
+
+# Pattern for the object IDs and element IDs in HMC URIs, which are replaced
+# by '{id}' in the URI templates of the HMC request statistics
+URI_ID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?'
+    r'[0-9a-fA-F]{12}|[0-9]+')
+
+# URI of the Logon operation
+LOGON_URI = '/api/sessions'
+
+# Environment variable for the directory of the profiles of module invocations
+PROFILE_DIR_ENVVAR = 'ZHMC_PROFILE_DIR'
+
+
+class FileSemaphore:
     """
-    Check for import errors in this module.
+    Counting semaphore that is shared by all processes on the same system,
+    implemented with flock() locks on a set of slot files in a directory.
+
+    Waiters are granted slots in the order of their arrival: Each waiter
+    draws a ticket from a queue file and may only take a free slot when no
+    waiter with an earlier ticket is still waiting. The queue file is only
+    locked while it is updated, so that a waiter never blocks other waiters
+    while it sleeps.
+
+    Because flock() locks are released by the operating system when a
+    process ends, a slot is never lost when a module process terminates
+    abnormally. For the same reason, each waiter holds an flock() lock on a
+    file for its ticket, so that the tickets of waiters that terminated
+    abnormally are detected and removed from the queue.
     """
-    if IMP_ZHMCCLIENT_ERR is not None:
-        module.fail_json(msg=missing_required_lib("zhmcclient"),
-                         exception=IMP_ZHMCCLIENT_ERR)
-    if IMP_ZHMCCLIENT_MOCK_ERR is not None:
-        module.fail_json(msg=missing_required_lib("zhmcclient_mock"),
-                         exception=IMP_ZHMCCLIENT_MOCK_ERR)
+
+    def __init__(self, directory, name, count):
+        """
+        Parameters:
+          directory (str): Path name of the directory for the lock files.
+          name (str): Name of the semaphore, used as lock file name prefix.
+          count (int): Number of slots.
+        """
+        self._name = name
+        self._directory = directory
+        self._queue_path = os.path.join(directory, f"{name}.queue")
+        self._slot_paths = [os.path.join(directory, f"{name}.{i}")
+                            for i in range(count)]
+
+    def acquire(self, timeout=None):
+        """
+        Acquire a slot, waiting until one is free and all earlier waiters
+        have acquired a slot.
+
+        Parameters:
+          timeout (int or float): Maximum time in seconds to wait for a free
+            slot. None or 0 means to wait without a timeout.
+
+        Returns:
+          file: The open slot file, to be passed to release().
+
+        Raises:
+          GovernorError: No slot became free within the timeout.
+        """
+        deadline = Deadline(timeout)
+        ticket, ticket_file = self._enqueue()
+        try:
+            while True:
+                slot = self._try_acquire(ticket)
+                if slot is not None:
+                    return slot
+                if deadline.expired():
+                    raise GovernorError(
+                        f"Timed out after {timeout} s waiting for a free "
+                        f"slot of {self._name} (all {len(self._slot_paths)} "
+                        "slots are in use); the wait can be adjusted with "
+                        f"the {GOVERNOR_TIMEOUT_ENVVAR} environment variable")
+                time.sleep(GOVERNOR_POLL_INTERVAL)
+        finally:
+            self._dequeue(ticket, ticket_file)
+
+    def _ticket_path(self, ticket):
+        return os.path.join(self._directory, f"{self._name}.ticket.{ticket}")
+
+    def _update_queue(self, update_func):
+        """
+        Call update_func with the queue under the lock of the queue file, and
+        write the queue back.
+
+        The queue is a dict with items 'next' (next ticket number) and
+        'waiting' (list of the ticket numbers of the waiters, in the order of
+        arrival).
+
+        Returns:
+          The return value of update_func.
+        """
+        with open(self._queue_path, 'a+', encoding='utf-8') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                fp.seek(0)
+                try:
+                    queue = json.loads(fp.read())
+                    queue['next'] = int(queue['next'])
+                    queue['waiting'] = [int(t) for t in queue['waiting']]
+                except (ValueError, TypeError, KeyError):
+                    queue = {'next': 0, 'waiting': []}
+                result = update_func(queue)
+                fp.seek(0)
+                fp.truncate()
+                fp.write(json.dumps(queue))
+                fp.flush()
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+        return result
+
+    def _enqueue(self):
+        """
+        Draw a ticket and lock its ticket file.
+
+        Returns:
+          tuple(ticket, ticket_file): The ticket number and the open ticket
+          file.
+        """
+        def enqueue(queue):
+            ticket = queue['next']
+            while True:
+                # The ticket file is locked before the ticket becomes visible
+                # in the queue, so that it is not taken for an abandoned
+                # ticket. A ticket file that is still locked can only exist
+                # if the queue file was reset, and its number is skipped.
+                # pylint: disable=consider-using-with
+                ticket_file = open(self._ticket_path(ticket), 'a',
+                                   encoding='utf-8')
+                try:
+                    fcntl.flock(ticket_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    ticket_file.close()
+                    ticket += 1
+                    continue
+                break
+            queue['next'] = ticket + 1
+            queue['waiting'].append(ticket)
+            return ticket, ticket_file
+
+        return self._update_queue(enqueue)
+
+    def _dequeue(self, ticket, ticket_file):
+        """
+        Remove a ticket from the queue and release its ticket file.
+        """
+        def dequeue(queue):
+            if ticket in queue['waiting']:
+                queue['waiting'].remove(ticket)
+
+        self._update_queue(dequeue)
+        try:
+            os.remove(self._ticket_path(ticket))
+        except OSError:
+            pass
+        fcntl.flock(ticket_file, fcntl.LOCK_UN)
+        ticket_file.close()
+
+    def _abandoned(self, ticket):
+        """
+        Return a boolean indicating whether the waiter with a ticket has
+        terminated without removing its ticket from the queue.
+        """
+        try:
+            # pylint: disable=consider-using-with
+            ticket_file = open(self._ticket_path(ticket), 'r',
+                               encoding='utf-8')
+        except OSError:
+            return True
+        try:
+            fcntl.flock(ticket_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            ticket_file.close()
+            return False
+        try:
+            os.remove(self._ticket_path(ticket))
+        except OSError:
+            pass
+        fcntl.flock(ticket_file, fcntl.LOCK_UN)
+        ticket_file.close()
+        return True
+
+    def _try_acquire(self, ticket):
+        """
+        Take a free slot if the ticket is the first one in the queue, without
+        waiting.
+
+        Returns:
+          file: The open slot file, or None if an earlier waiter is still
+          waiting or no slot is free.
+        """
+        def try_acquire(queue):
+            if ticket not in queue['waiting']:
+                # The queue file was reset, so the ticket is queued again
+                queue['waiting'].append(ticket)
+                return None
+            for earlier in queue['waiting']:
+                if earlier == ticket:
+                    break
+                if not self._abandoned(earlier):
+                    return None
+            queue['waiting'] = queue['waiting'][
+                queue['waiting'].index(ticket):]
+            for slot_path in self._slot_paths:
+                # pylint: disable=consider-using-with
+                slot = open(slot_path, 'a', encoding='utf-8')
+                try:
+                    fcntl.flock(slot, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    slot.close()
+                    continue
+                return slot
+            return None
+
+        return self._update_queue(try_acquire)
+
+    @staticmethod
+    def release(slot):
+        """
+        Release a slot that was acquired with acquire().
+        """
+        fcntl.flock(slot, fcntl.LOCK_UN)
+        slot.close()
 
 
-def open_session(params):
+class FileRateLimiter:
     """
-    Open a session with the HMC and validate session-related parameters.
+    Request rate limiter that is shared by all processes on the same system.
 
-    This is called by modules in order to communicate with the HMC.
+    The time at which the next request may be sent is kept in a file that is
+    updated under an flock() lock, so that requests are spaced evenly and are
+    granted in the order of arrival.
+    """
 
-    There are three ways the session can be established:
+    def __init__(self, directory, name, rate):
+        """
+        Parameters:
+          directory (str): Path name of the directory for the file.
+          name (str): Name of the rate limiter, used as file name prefix.
+          rate (float): Maximum number of requests per second.
+        """
+        self._path = os.path.join(directory, f"{name}.rate")
+        self._interval = 1.0 / rate
 
-    * Faked session: If the '_faked_session' item in `params` is present
-      and not `None`, a faked (=mocked) session with that
-      zhmcclient_mock.FakedSession object is returned, and there is no
-      communication with an HMC established. The faked session will not be
-      logged off in close_session(). This is used for testing only.
+    def acquire(self):
+        """
+        Wait until the next request may be sent.
+        """
+        with open(self._path, 'a+', encoding='utf-8') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                fp.seek(0)
+                try:
+                    next_time = float(fp.read() or 0)
+                except ValueError:
+                    next_time = 0
+                now = time.time()
+                start_time = max(now, next_time)
+                fp.seek(0)
+                fp.truncate()
+                fp.write(repr(start_time + self._interval))
+                fp.flush()
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+        if start_time > now:
+            time.sleep(start_time - now)
+
+
+class HmcGovernor:
+    """
+    Governor that limits the load that the modules running on the same system
+    (e.g. in multiple Ansible forks) put on an HMC.
 
-    * HMC session with module-scope logoff: If the 'session_id' item in
-      `params` is absent or `None`, a zhmcclient.Session object is
-      returned that is set up with a newly created HMC session. That HMC session
-      will be logged off in close_session().
+    It limits the number of concurrent HMC sessions, the number of concurrent
+    HTTP requests and the rate of HTTP requests. Waiting sessions and requests
+    are served in the order of arrival, and waiting for a session or request
+    slot is limited by a timeout.
 
-    * HMC session with user-controlled logoff: If the 'session_id' item in
-      `params` is present and not `None`, a zhmcclient.Session object is
-      returned that is set up for this existing HMC session. That HMC session
-      will not be logged off in close_session().
+    The time spent waiting in the governor is recorded in WAIT_METRICS.
+    """
+
+    def __init__(self, hmc_host, max_sessions=0, max_requests=0,
+                 request_rate=0, directory=None,
+                 timeout=DEFAULT_GOVERNOR_TIMEOUT):
+        """
+        Parameters:
+          hmc_host (str or list of str): The HMC host(s). The limits apply
+            to all sessions with the same HMC host(s).
+          max_sessions (int): Maximum number of concurrent sessions, or 0 for
+            no limit.
+          max_requests (int): Maximum number of concurrent HTTP requests, or 0
+            for no limit.
+          request_rate (float): Maximum number of HTTP requests per second, or
+            0 for no limit.
+          directory (str): Path name of the directory for the lock files. If
+            None, a directory for the current user in the system temporary
+            directory is used.
+          timeout (int or float): Maximum time in seconds to wait for a
+            session or request slot, or 0 for no timeout.
+        """
+        directory = state_directory(directory)
+        name = hmc_host_key(hmc_host)
+        self._sessions = FileSemaphore(
+            directory, f"{name}.session", max_sessions) \
+            if max_sessions else None
+        self._requests = FileSemaphore(
+            directory, f"{name}.request", max_requests) \
+            if max_requests else None
+        self._rate = FileRateLimiter(directory, name, request_rate) \
+            if request_rate else None
+        self._timeout = timeout
+        self._session_slot = None
+
+    @classmethod
+    def from_environment(cls, hmc_host):
+        """
+        Return a governor for the HMC host(s) that is configured from the
+        ZHMC_MAX_SESSIONS, ZHMC_MAX_REQUESTS, ZHMC_REQUEST_RATE,
+        ZHMC_GOVERNOR_TIMEOUT and ZHMC_GOVERNOR_DIR environment variables, or
+        None if no limits are set.
+
+        Raises:
+          ParameterError: Invalid value of an environment variable.
+        """
+        limits = []
+        for envvar, type_, default in (
+                (GOVERNOR_MAX_SESSIONS_ENVVAR, int, 0),
+                (GOVERNOR_MAX_REQUESTS_ENVVAR, int, 0),
+                (GOVERNOR_REQUEST_RATE_ENVVAR, float, 0),
+                (GOVERNOR_TIMEOUT_ENVVAR, float, DEFAULT_GOVERNOR_TIMEOUT)):
+            value = os.environ.get(envvar, '') or default
+            try:
+                value = type_(value)
+            except ValueError:
+                raise ParameterError(
+                    f"Environment variable {envvar} has an invalid value: "
+                    f"{value!r}")
+            if value < 0:
+                raise ParameterError(
+                    f"Environment variable {envvar} must not be negative, "
+                    f"but is: {value!r}")
+            limits.append(value)
+        max_sessions, max_requests, request_rate, timeout = limits
+        if not (max_sessions or max_requests or request_rate):
+            return None
+        directory = os.environ.get(GOVERNOR_DIR_ENVVAR) or None
+        return cls(hmc_host, max_sessions, max_requests, request_rate,
+                   directory, timeout)
+
+    def acquire_session(self):
+        """
+        Wait for a session slot, if the number of sessions is limited.
+
+        Raises:
+          GovernorError: No session slot became free within the timeout.
+        """
+        if self._sessions is not None and self._session_slot is None:
+            start_time = time.time()
+            self._session_slot = self._sessions.acquire(self._timeout)
+            WAIT_METRICS.record(
+                'governor-session', time.time() - start_time, 1, False)
+
+    def release_session(self):
+        """
+        Release the session slot, if one was acquired.
+        """
+        if self._session_slot is not None:
+            self._sessions.release(self._session_slot)
+            self._session_slot = None
+
+    def send_request(self, send_func, *args, **kwargs):
+        """
+        Send an HTTP request by calling send_func, after waiting for the rate
+        limit and for a request slot.
+
+        Raises:
+          GovernorError: No request slot became free within the timeout.
+        """
+        start_time = time.time()
+        if self._rate is not None:
+            self._rate.acquire()
+        slot = None
+        if self._requests is not None:
+            slot = self._requests.acquire(self._timeout)
+        WAIT_METRICS.record(
+            'governor-request', time.time() - start_time, 1, False)
+        try:
+            return send_func(*args, **kwargs)
+        finally:
+            if slot is not None:
+                self._requests.release(slot)
+
+    def govern_requests(self, requests_session):
+        """
+        Make the HTTP requests of a requests.Session object subject to this
+        governor, and return the requests.Session object.
+        """
+        for adapter in requests_session.adapters.values():
+            adapter.send = functools.partial(self.send_request, adapter.send)
+        return requests_session
+
+    def attach(self, session):
+        """
+        Make the HTTP requests of a zhmcclient session subject to this
+        governor, including those of requests sessions that are created
+        when the zhmcclient session logs on again.
+        """
+        hook_requests_sessions(session, self.govern_requests)
+        session.zhmc_governor = self
+
+
+def state_directory(directory=None):
+    """
+    Return the directory for the state that is shared by the modules running
+    on the same system (e.g. the lock files of HmcGovernor), and make sure
+    it exists.
 
     Parameters:
-      params (dict): Module parameters, with these items:
-        - hmc_host (str or list of str): The hostnames or IP addresses of a
-          single HMC or of a list of redundant HMCs, suitable for
-          zhmcclient.Session: A single HMC must be specified as a string type
-          or as a list type with one item. An HMC list must be specified as a
-          list type.
-        - hmc_auth (dict): Credentials, either with password or session_id.
-          In case of a password, a new HMC session is created.
-          In case of a session_id, that existing HMC session is used.
-        - _faked_session (zhmcclient_mock.FakedSession): Faked session, if
-          testing.
+      directory (str): Path name of the directory. If None, a directory for
+        the current user in the system temporary directory is used.
+    """
+    if directory is None:
+        directory = os.path.join(
+            tempfile.gettempdir(), f"zhmc-governor-{os.getuid()}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return directory
 
-    Returns:
-      tuple: Tuple with these items:
-      - session (zhmcclient.Session): The session object to use.
-      - logoff (bool): Indicator to logoff in close_session().
+
+def hmc_host_key(hmc_host):
     """
+    Return a key for the HMC host(s) that is suitable as a file name.
+    """
+    return hashlib.sha256(repr(hmc_host).encode('utf-8')).hexdigest()[:16]
 
-    faked_session = params.get('_faked_session', None)
-    if faked_session is not None:
-        # Faked session
-        if not isinstance(faked_session, FakedSession):
+
+class HmcSelector:
+    """
+    Selection of the HMC with the lowest latency from a list of redundant
+    HMCs.
+
+    The HMCs are probed concurrently by connecting to them and performing the
+    'Query API Version' operation, which does not require a logon. The HMCs
+    that responded are ordered by their response time, followed by the HMCs
+    that did not respond, in the original order. Since zhmcclient uses the
+    HMCs of a list in the order given and fails over to the next one when an
+    HMC cannot be reached, the fastest healthy HMC is used first.
+
+    The order is cached in a file that is shared by the modules running on
+    the same system, and is used until its time to live has expired. An
+    order in which no HMC responded is not cached.
+    """
+
+    def __init__(self, hmc_host, ttl=DEFAULT_HMC_SELECTION_TTL,
+                 verify_cert=True, directory=None,
+                 probe_timeout=HMC_PROBE_TIMEOUT):
+        """
+        Parameters:
+          hmc_host (list of str): The redundant HMCs.
+          ttl (float): Time in seconds for which the order is cached, or 0
+            for not caching it.
+          verify_cert (bool or str): Certificate verification for probing
+            the HMCs, as for zhmcclient.Session.
+          directory (str): Path name of the directory for the cache file. If
+            None, the default of state_directory() is used.
+          probe_timeout (float): Connect and read timeout in seconds for
+            probing an HMC.
+        """
+        self.hmc_host = list(hmc_host)
+        self.ttl = ttl
+        self.verify_cert = verify_cert
+        self.probe_timeout = probe_timeout
+        self._cache_path = os.path.join(
+            state_directory(directory), f"{hmc_host_key(hmc_host)}.selection")
+
+    @classmethod
+    def from_environment(cls, hmc_host, verify_cert=True):
+        """
+        Return a selector for the HMC host(s) that is configured from the
+        ZHMC_HMC_SELECTION, ZHMC_HMC_SELECTION_TTL and ZHMC_GOVERNOR_DIR
+        environment variables, or None if the HMCs are to be used in the
+        order given, or if there is only a single HMC.
+
+        Raises:
+          ParameterError: Invalid value of an environment variable.
+        """
+        selection = os.environ.get(HMC_SELECTION_ENVVAR, '').strip().lower()
+        if selection not in ('', 'order', 'latency'):
             raise ParameterError(
-                "Module parameter '_faked_session' must be a FakedSession "
-                f"object if specified, but is of type {type(faked_session)}")
-        logoff = False
-        return faked_session, logoff
+                f"Environment variable {HMC_SELECTION_ENVVAR} has an invalid "
+                f"value: {selection!r}")
+        ttl = os.environ.get(HMC_SELECTION_TTL_ENVVAR, '')
+        try:
+            ttl = float(ttl) if ttl else DEFAULT_HMC_SELECTION_TTL
+        except ValueError:
+            raise ParameterError(
+                f"Environment variable {HMC_SELECTION_TTL_ENVVAR} has an "
+                f"invalid value: {ttl!r}")
+        if ttl < 0:
+            raise ParameterError(
+                f"Environment variable {HMC_SELECTION_TTL_ENVVAR} must not be "
+                f"negative, but is: {ttl!r}")
+        if selection != 'latency':
+            return None
+        if not isinstance(hmc_host, list) or len(hmc_host) < 2:
+            return None
+        directory = os.environ.get(GOVERNOR_DIR_ENVVAR) or None
+        return cls(hmc_host, ttl, verify_cert=verify_cert,
+                   directory=directory)
 
-    hmc_host = params['hmc_host']
-    hmc_auth = params['hmc_auth']
-    session_id = hmc_auth.get('session_id', None)
-    if session_id is None:
-        # New HMC session with module-scope logoff
-        required_items = ('userid', 'password')
-        missing_required_items = [
-            p for p in required_items if hmc_auth.get(p, None) is None
-        ]
-        if missing_required_items:
+    def probe(self, host):
+        """
+        Probe an HMC and return its response time in seconds, or None if it
+        did not respond successfully.
+        """
+        rt_config = RetryTimeoutConfig(
+            connect_timeout=self.probe_timeout, connect_retries=0,
+            read_timeout=self.probe_timeout, read_retries=0)
+        session = Session(host, verify_cert=self.verify_cert,
+                          retry_timeout_config=rt_config)
+        start_time = time.time()
+        try:
+            session.get('/api/version', logon_required=False)
+        except ClientError as exc:
+            HMC_LOGGER.debug("Probing HMC %s failed: %s", host, exc)
+            return None
+        rtt = time.time() - start_time
+        HMC_LOGGER.debug("Probing HMC %s took %.3f s", host, rtt)
+        return rtt
+
+    def ordered_hosts(self):
+        """
+        Return the HMCs ordered by their response time, using the cached order
+        if it has not expired.
+
+        Returns:
+          list of str: The ordered HMCs.
+        """
+        hosts = self._load()
+        if hosts is not None:
+            return hosts
+        rtts = run_concurrently(self.probe, self.hmc_host, len(self.hmc_host))
+        healthy = sorted(
+            (rtt, index) for index, rtt in enumerate(rtts) if rtt is not None)
+        hosts = [self.hmc_host[index] for _, index in healthy]
+        hosts.extend(h for h, rtt in zip(self.hmc_host, rtts) if rtt is None)
+        if healthy:
+            self._save(hosts)
+        return hosts
+
+    def _load(self):
+        """
+        Return the cached order of the HMCs, or None if there is no cached
+        order or if it has expired.
+        """
+        try:
+            with open(self._cache_path, encoding='utf-8') as fp:
+                cache = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        try:
+            if time.time() - cache['time'] >= self.ttl or \
+                    sorted(cache['hosts']) != sorted(self.hmc_host):
+                return None
+        except (KeyError, TypeError):
+            return None
+        return cache['hosts']
+
+    def _save(self, hosts):
+        """
+        Cache the order of the HMCs, unless the time to live is 0.
+        """
+        if not self.ttl:
+            return
+        cache = {'time': time.time(), 'hosts': hosts}
+        tmp_path = f"{self._cache_path}.{os.getpid()}"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fp:
+                json.dump(cache, fp)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as exc:
+            HMC_LOGGER.debug("Caching the HMC selection failed: %s", exc)
+
+
+class FeatureCache:
+    """
+    Cache for the API feature lists of the HMC and its CPCs.
+
+    The feature lists are cached in a file that is shared by the modules
+    running on the same system, with one entry per HMC or CPC that is used
+    until its time to live has expired. Since the API features change only
+    with firmware upgrades, a time to live in the range of hours is
+    reasonable.
+    """
+
+    def __init__(self, hmc_host, ttl=0, directory=None):
+        """
+        Parameters:
+          hmc_host (str or list of str): The HMC host(s).
+          ttl (float): Time in seconds for which the feature lists are
+            cached, or 0 for not caching them.
+          directory (str): Path name of the directory for the cache file. If
+            None, the default of state_directory() is used. The directory is
+            not created if the feature lists are not cached.
+        """
+        self.ttl = ttl
+        self._cache_path = os.path.join(
+            state_directory(directory),
+            f"{hmc_host_key(hmc_host)}.features") if ttl else None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, hmc_host):
+        """
+        Return a cache for the HMC host(s) that is configured from the
+        ZHMC_FEATURE_CACHE_TTL and ZHMC_GOVERNOR_DIR environment variables.
+        If ZHMC_FEATURE_CACHE_TTL is not set, the feature lists are not
+        cached.
+
+        Raises:
+          ParameterError: Invalid value of an environment variable.
+        """
+        ttl = os.environ.get(FEATURE_CACHE_TTL_ENVVAR, '')
+        try:
+            ttl = float(ttl) if ttl else 0
+        except ValueError:
             raise ParameterError(
-                "Module parameter 'hmc_auth' has no 'session_id' item and "
-                f"therefore must have items {required_items!r}, but "
-                f"{missing_required_items!r} are missing.")
-        userid = hmc_auth['userid']
-        password = hmc_auth['password']
-        logoff = True
-    else:
-        # Existing HMC session with user-controlled logoff
-        forbidden_items = ('userid', 'password')
-        present_forbidden_items = [
-            p for p in forbidden_items if hmc_auth.get(p, None) is not None
-        ]
-        if present_forbidden_items:
+                f"Environment variable {FEATURE_CACHE_TTL_ENVVAR} has an "
+                f"invalid value: {ttl!r}")
+        if ttl < 0:
             raise ParameterError(
-                "Module parameter 'hmc_auth' has the 'session_id' item and "
-                f"therefore must not have items {forbidden_items!r}, but "
-                f"{present_forbidden_items!r} are present.")
-        userid = None
-        password = None
-        logoff = False
+                f"Environment variable {FEATURE_CACHE_TTL_ENVVAR} must not be "
+                f"negative, but is: {ttl!r}")
+        directory = os.environ.get(GOVERNOR_DIR_ENVVAR) or None
+        return cls(hmc_host, ttl, directory=directory)
+
+    def features(self, key, list_func):
+        """
+        Return the API feature list for a key, using the cached list if it
+        has not expired.
+
+        This method can be called concurrently from multiple threads.
+
+        Parameters:
+          key (str): Key of the HMC or CPC, e.g. its URI.
+          list_func (callable): Function without arguments that retrieves
+            the feature list from the HMC, e.g. Cpc.list_api_features.
+
+        Returns:
+          list of str: The API feature list.
+        """
+        entry = self._load().get(key)
+        if entry is not None:
+            return entry['features']
+        features = list_func()
+        self._save(key, features)
+        return features
+
+    def _load(self):
+        """
+        Return the cache entries that have not expired, as a dict with the
+        key and a dict with items 'time' and 'features'.
+        """
+        if not self.ttl:
+            return {}
+        try:
+            with open(self._cache_path, encoding='utf-8') as fp:
+                cache = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        try:
+            return {key: entry for key, entry in cache.items()
+                    if now - entry['time'] < self.ttl}
+        except (AttributeError, KeyError, TypeError):
+            return {}
+
+    def _save(self, key, features):
+        """
+        Cache the feature list for a key, unless the time to live is 0.
+        """
+        if not self.ttl:
+            return
+        with self._lock:
+            cache = self._load()
+            cache[key] = {'time': time.time(), 'features': features}
+            tmp_path = f"{self._cache_path}.{os.getpid()}"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as fp:
+                    json.dump(cache, fp)
+                os.replace(tmp_path, self._cache_path)
+            except OSError as exc:
+                HMC_LOGGER.debug("Caching the API features failed: %s", exc)
+
+
+class JobJournal:
+    """
+    Journal of the HMC jobs of long-running operations that are in progress,
+    for resuming to await them after the module or the Ansible controller
+    has been restarted.
+
+    The journal is kept in a file that is shared by the modules running on
+    the same system, with one entry per target resource, keyed by its URI.
+    """
+
+    def __init__(self, hmc_host, directory=None):
+        """
+        Parameters:
+          hmc_host (str or list of str): The HMC host(s).
+          directory (str): Path name of the directory for the journal file.
+            If None, the default of state_directory() is used.
+        """
+        self._path = os.path.join(
+            state_directory(directory), f"{hmc_host_key(hmc_host)}.jobs")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, hmc_host):
+        """
+        Return a journal for the HMC host(s) in the directory specified in
+        the ZHMC_GOVERNOR_DIR environment variable.
+        """
+        directory = os.environ.get(GOVERNOR_DIR_ENVVAR) or None
+        return cls(hmc_host, directory=directory)
+
+    def get(self, key):
+        """
+        Return the entry for a key as a dict, or None if there is no entry.
+        """
+        return self._load().get(key)
+
+    def set(self, key, entry):
+        """
+        Set the entry for a key.
+
+        Parameters:
+          key (str): URI of the target resource.
+          entry (dict): JSON-serializable entry, e.g. with the job URI.
+        """
+        with self._lock:
+            journal = self._load()
+            journal[key] = entry
+            self._save(journal)
+
+    def remove(self, key):
+        """
+        Remove the entry for a key, if it exists.
+        """
+        with self._lock:
+            journal = self._load()
+            if journal.pop(key, None) is not None:
+                self._save(journal)
+
+    def _load(self):
+        """
+        Return the journal entries as a dict.
+        """
+        try:
+            with open(self._path, encoding='utf-8') as fp:
+                journal = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        return journal if isinstance(journal, dict) else {}
+
+    def _save(self, journal):
+        """
+        Save the journal entries.
+        """
+        tmp_path = f"{self._path}.{os.getpid()}"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fp:
+                json.dump(journal, fp)
+            os.replace(tmp_path, self._path)
+        except OSError as exc:
+            HMC_LOGGER.debug("Saving the job journal failed: %s", exc)
+
+
+def routed_hosts(hmc_host, hosts, read_only):
+    """
+    Return the HMCs for a session when read/write splitting is enabled.
+
+    The first HMC of the redundant HMCs in hmc_host is the primary HMC, and
+    the others are alternate HMCs. Sessions of modules that only read from
+    the HMC use the alternate HMCs first and fail over to the primary HMC.
+    Sessions of modules that may change something on the HMC use the primary
+    HMC first and fail over to the alternate HMCs.
+
+    Parameters:
+      hmc_host (str or list of str): The HMC host(s), as specified by the
+        user.
+      hosts (str or list of str): The HMC host(s) in the order in which they
+        would otherwise be used (e.g. as ordered by HmcSelector).
+      read_only (bool): Whether the session is used only for reading.
+
+    Returns:
+      str or list of str: The HMC host(s) in the order to be used.
+    """
+    if not isinstance(hmc_host, list) or len(hmc_host) < 2:
+        return hosts
+    primary = hmc_host[0]
+    alternates = [h for h in hosts if h != primary]
+    if read_only:
+        return alternates + [primary]
+    return [primary] + alternates
+
+
+def hook_requests_sessions(session, hook):
+    """
+    Call a hook function for the requests.Session object of a zhmcclient
+    session and for each requests.Session object that is created when the
+    zhmcclient session logs on again.
+
+    Parameters:
+      session (zhmcclient.Session): The zhmcclient session.
+      hook (callable): Function that is called with a requests.Session
+        object and returns it.
+    """
+    # pylint: disable=protected-access
+    new_session = session._new_session
+
+    def hooked_new_session(retry_timeout_config):
+        return hook(new_session(retry_timeout_config))
+
+    session._new_session = hooked_new_session
+    if session._session is not None:
+        hook(session._session)
+
+
+def common_fail_on_import_errors(module):
+    """
+    Check for import errors in this module.
+    """
+    if IMP_ZHMCCLIENT_ERR is not None:
+        module.fail_json(msg=missing_required_lib("zhmcclient"),
+                         exception=IMP_ZHMCCLIENT_ERR)
+
+
+def is_faked_session(session):
+    """
+    Return whether a session is a faked session (zhmcclient_mock.FakedSession).
+
+    This does not import the zhmcclient_mock package: If it has not been
+    imported, the session cannot be a faked session.
+    """
+    mock_module = sys.modules.get('zhmcclient_mock')
+    if mock_module is None:
+        return False
+    return isinstance(session, mock_module.FakedSession)
+
+
+def open_session(params, read_only=False):
+    """
+    Open a session with the HMC and validate session-related parameters.
+
+    This is called by modules in order to communicate with the HMC.
+
+    There are three ways the session can be established:
+
+    * Faked session: If the '_faked_session' item in `params` is present
+      and not `None`, a faked (=mocked) session with that
+      zhmcclient_mock.FakedSession object is returned, and there is no
+      communication with an HMC established. The faked session will not be
+      logged off in close_session(). This is used for testing only.
+
+    * HMC session with module-scope logoff: If the 'session_id' item in
+      `params` is absent or `None`, a zhmcclient.Session object is
+      returned that is set up with a newly created HMC session. That HMC session
+      will be logged off in close_session().
+
+    * HMC session with user-controlled logoff: If the 'session_id' item in
+      `params` is present and not `None`, a zhmcclient.Session object is
+      returned that is set up for this existing HMC session. That HMC session
+      will not be logged off in close_session().
+
+    For HMC sessions, the load on the HMC is limited by an HmcGovernor if
+    limits are set in the environment (see HmcGovernor.from_environment()).
+    The session then waits for a session slot before it is returned, and
+    releases it in close_session().
+
+    If enabled in the environment (see stats_enabled()), the HMC requests of
+    the session are recorded in REQUEST_STATS.
+
+    For new HMC sessions with a list of redundant HMCs, the HMCs are used in
+    the order of their latency if that is enabled in the environment (see
+    HmcSelector.from_environment()). Otherwise, they are used in the order
+    given. If read/write splitting is enabled with the ZHMC_READ_WRITE_SPLIT
+    environment variable, read-only sessions use the alternate HMCs first
+    and other sessions use the primary HMC first (see routed_hosts()).
+
+    Parameters:
+      params (dict): Module parameters, with these items:
+        - hmc_host (str or list of str): The hostnames or IP addresses of a
+          single HMC or of a list of redundant HMCs, suitable for
+          zhmcclient.Session: A single HMC must be specified as a string type
+          or as a list type with one item. An HMC list must be specified as a
+          list type.
+        - hmc_auth (dict): Credentials, either with password or session_id.
+          In case of a password, a new HMC session is created.
+          In case of a session_id, that existing HMC session is used.
+        - _faked_session (zhmcclient_mock.FakedSession): Faked session, if
+          testing.
+
+      read_only (bool): Indicates that the session is used only for reading
+        from the HMC, e.g. for listing resources or gathering facts.
+
+    Returns:
+      tuple: Tuple with these items:
+      - session (zhmcclient.Session): The session object to use.
+      - logoff (bool): Indicator to logoff in close_session().
+    """
+
+    faked_session = params.get('_faked_session', None)
+    if faked_session is not None:
+        # Faked session
+        # pylint: disable=import-outside-toplevel
+        from zhmcclient_mock import FakedSession
+        if not isinstance(faked_session, FakedSession):
+            raise ParameterError(
+                "Module parameter '_faked_session' must be a FakedSession "
+                f"object if specified, but is of type {type(faked_session)}")
+        logoff = False
+        if stats_enabled():
+            REQUEST_STATS.attach(faked_session)
+        return faked_session, logoff
+
+    hmc_host = params['hmc_host']
+    hmc_auth = params['hmc_auth']
+    session_id = hmc_auth.get('session_id', None)
+    if session_id is None:
+        # New HMC session with module-scope logoff
+        required_items = ('userid', 'password')
+        missing_required_items = [
+            p for p in required_items if hmc_auth.get(p, None) is None
+        ]
+        if missing_required_items:
+            raise ParameterError(
+                "Module parameter 'hmc_auth' has no 'session_id' item and "
+                f"therefore must have items {required_items!r}, but "
+                f"{missing_required_items!r} are missing.")
+        userid = hmc_auth['userid']
+        password = hmc_auth['password']
+        logoff = True
+    else:
+        # Existing HMC session with user-controlled logoff
+        forbidden_items = ('userid', 'password')
+        present_forbidden_items = [
+            p for p in forbidden_items if hmc_auth.get(p, None) is not None
+        ]
+        if present_forbidden_items:
+            raise ParameterError(
+                "Module parameter 'hmc_auth' has the 'session_id' item and "
+                f"therefore must not have items {forbidden_items!r}, but "
+                f"{present_forbidden_items!r} are present.")
+        userid = None
+        password = None
+        logoff = False
+
+    ca_certs = hmc_auth.get('ca_certs', None)
+    verify = hmc_auth.get('verify', True)
+    verify_cert = ca_certs if verify else False
+
+    session_host = hmc_host
+    selector = HmcSelector.from_environment(hmc_host, verify_cert)
+    split = env_flag(READ_WRITE_SPLIT_ENVVAR)
+    if session_id is None:
+        if selector is not None:
+            session_host = selector.ordered_hosts()
+        if split:
+            session_host = routed_hosts(hmc_host, session_host, read_only)
+
+    session = Session(
+        session_host, userid, password, verify_cert=verify_cert,
+        session_id=session_id)
+
+    if stats_enabled():
+        REQUEST_STATS.attach(session)
+
+    governor = HmcGovernor.from_environment(hmc_host)
+    if governor is not None:
+        governor.attach(session)
+        governor.acquire_session()
+
+    return session, logoff
+
+
+def close_session(session, logoff):
+    """
+    Close a session with the HMC.
+
+    Parameters:
+      session (zhmcclient.Session): The session object to close.
+      logoff (bool): Indicator to logoff the session.
+    """
+    try:
+        if logoff:
+            try:
+                session.logoff()
+            except ClientAuthError:
+                pass
+    finally:
+        governor = getattr(session, 'zhmc_governor', None)
+        if governor is not None:
+            governor.release_session()
+
+
+def hmc_auth_parameter():
+    "Return the Ansible module definition of the hmc_auth parameter."
+    hmc_auth = dict(
+        required=True,
+        type='dict',
+        options=dict(
+            userid=dict(required=False, type='str', default=None),
+            password=dict(required=False, type='str', default=None,
+                          no_log=True),
+            session_id=dict(required=False, type='str', default=None,
+                            no_log=True),
+            ca_certs=dict(required=False, type='str', default=None),
+            verify=dict(required=False, type='bool', default=True),
+        ),
+    )
+    return hmc_auth
+
+
+def eq_hex(hex_actual, hex_new, prop_name):
+    """
+    Test two hex string values of a property for equality.
+    """
+    if hex_actual:
+        try:
+            int_actual = int(hex_actual, 16)
+        except ValueError:
+            raise ParameterError(
+                f"Unexpected: Actual value of property {prop_name!r} is not "
+                f"a valid  hex number: {hex_actual!r}")
+    else:
+        int_actual = None
+    if hex_new:
+        try:
+            int_new = int(hex_new, 16)
+        except ValueError:
+            raise ParameterError(
+                f"New value for property {prop_name!r} is not a valid "
+                f"hex number: {hex_new!r}")
+    else:
+        int_new = None
+    return int_actual == int_new
+
+
+def _normalized_mac(mac_str):
+    mac_ints = [int(h, 16) for h in mac_str.split(':')]
+    mac_str = ':'.join(["%02x" % i for i in mac_ints])
+    return mac_str
+
+
+def eq_mac(mac_actual, mac_new, prop_name):
+    """
+    Test two MAC address string values of a property for equality.
+    """
+
+    if mac_actual:
+        try:
+            mac_actual = _normalized_mac(mac_actual)
+        except ValueError:
+            raise ParameterError(
+                f"Unexpected: Actual value of property {prop_name!r} is not "
+                f"a valid MAC address: {mac_actual!r}")
+    else:
+        mac_actual = None
+    if mac_new:
+        try:
+            mac_new = _normalized_mac(mac_new)
+        except ValueError:
+            raise ParameterError(
+                f"New value for property {prop_name!r} is not a valid "
+                f"MAC address: {mac_new!r}")
+    else:
+        mac_new = None
+    return mac_actual == mac_new
+
+
+class Deadline:
+    """
+    Overall deadline for a module task, that is spread across the nested
+    waits performed by the task.
+
+    Each wait that is performed with a deadline is limited to the time that
+    remains until the deadline.
+    """
+
+    def __init__(self, timeout=None):
+        """
+        Parameters:
+          timeout(int or float): Overall timeout in seconds, starting now.
+            None or 0 means that there is no overall deadline.
+        """
+        self._timeout = timeout or None
+        if self._timeout is None:
+            self._end_time = None
+        else:
+            self._end_time = time.time() + self._timeout
+
+    @property
+    def timeout(self):
+        """
+        int or float: Overall timeout in seconds, or None if there is no
+        overall deadline.
+        """
+        return self._timeout
+
+    def remaining(self):
+        """
+        Return the remaining time in seconds until the deadline, or None if
+        there is no overall deadline. Once the deadline has passed, 0 is
+        returned.
+        """
+        if self._end_time is None:
+            return None
+        return max(self._end_time - time.time(), 0)
+
+    def expired(self):
+        """
+        Return a boolean indicating whether the deadline has passed.
+        """
+        return self.remaining() == 0
+
+    def limit(self, timeout):
+        """
+        Return the timeout to be used for a nested wait, by limiting the
+        specified timeout to the remaining time until the deadline.
+
+        Parameters:
+          timeout(int or float): Timeout in seconds of the nested wait. None
+            or 0 means that the nested wait has no timeout.
+
+        Returns:
+          int or float: Limited timeout in seconds, or None if neither the
+          nested wait nor the deadline have a timeout. The limited timeout is
+          at least 1 second, so that a nested wait still checks once for its
+          completion (zhmcclient interprets a timeout of 0 as no timeout).
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout or None
+        if timeout:
+            remaining = min(timeout, remaining)
+        return max(remaining, 1)
+
+
+def task_deadline(session, timeout=None):
+    """
+    Return the overall deadline for the waits performed by a module task.
+
+    Parameters:
+      session (zhmcclient.Session): The session with the HMC.
+      timeout (int or float): Overall timeout in seconds for the task. If
+        None, the default async operation timeout of the session is used.
+
+    Returns:
+      Deadline: The deadline, starting now.
+    """
+    if timeout is None:
+        timeout = session.retry_timeout_config.operation_timeout
+    return Deadline(timeout)
+
+
+def limit_timeout(timeout, deadline):
+    """
+    Return the timeout to be used for a nested wait, limited by the overall
+    deadline if one is specified (see Deadline.limit()).
+
+    Parameters:
+      timeout(int or float): Timeout in seconds of the nested wait.
+      deadline(Deadline): Overall deadline, or None.
+    """
+    if deadline is None:
+        return timeout
+    return deadline.limit(timeout)
+
+
+class WaitMetrics:
+    """
+    Metrics about the time spent in waits for status changes and job
+    completion, accumulated per kind of wait within a module call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def record(self, kind, duration, polls, timed_out):
+        """
+        Record a completed wait.
+
+        Parameters:
+          kind(str): Kind of wait (e.g. 'job', 'partition-status').
+          duration(float): Duration of the wait in seconds.
+          polls(int): Number of polls performed during the wait.
+          timed_out(bool): Indicates whether the wait timed out.
+        """
+        with self._lock:
+            m = self._metrics.setdefault(
+                kind, {'waits': 0, 'polls': 0, 'time': 0.0, 'timeouts': 0})
+            m['waits'] += 1
+            m['polls'] += polls
+            m['time'] += duration
+            if timed_out:
+                m['timeouts'] += 1
+
+    def total_time(self):
+        """
+        Return the total time in seconds spent in waits of all kinds.
+        """
+        with self._lock:
+            return sum(m['time'] for m in self._metrics.values())
+
+    def as_dict(self):
+        """
+        Return the metrics as a dict with the kind of wait as a key and a dict
+        with items 'waits', 'polls', 'time' and 'timeouts' as a value.
+        """
+        with self._lock:
+            return {kind: dict(m) for kind, m in self._metrics.items()}
+
+    def reset(self):
+        """
+        Reset the metrics.
+        """
+        with self._lock:
+            self._metrics = {}
+
+
+# Wait metrics of the current module call
+WAIT_METRICS = WaitMetrics()
+
+
+def poll_until(check_func, timeout=None, deadline=None, kind='wait',
+               intervals=STATUS_POLL_INTERVALS, jitter=POLL_JITTER,
+               wakeup=None, fallback_intervals=None, min_interval=0):
+    """
+    Call a check function repeatedly until it indicates completion, with
+    exponentially increasing poll intervals between the calls.
+
+    The poll intervals start with a short interval so that short transitions
+    are detected quickly, and grow up to a maximum interval to reduce the load
+    on the HMC during long transitions. A random jitter is applied to each
+    interval to avoid that concurrent waits poll the HMC in lock step.
+
+    The wait time is recorded in WAIT_METRICS.
+
+    Parameters:
+      check_func (callable): Check function without arguments. It must return
+        a tuple (done, value), where done indicates completion.
+
+      timeout (int or float): Timeout in seconds for the wait. None or 0 means
+        that the wait has no timeout.
+
+      deadline (Deadline): Overall deadline that limits the timeout, or None.
+
+      kind (str): Kind of wait, for the metrics.
+
+      intervals (tuple): Poll intervals in seconds, as a tuple of (initial
+        interval, maximum interval, increase factor).
+
+      jitter (float): Relative random jitter applied to each poll interval.
+
+      wakeup (WakeupEvent): Event that ends a poll interval early when it is
+        set (e.g. upon a notification), or None. Once the event is closed
+        (e.g. because the notifications can no longer be received), polling
+        continues without it, using fallback_intervals.
+
+      fallback_intervals (tuple): Poll intervals in seconds after the wakeup
+        event was closed, in the same format as intervals. None means to
+        continue with intervals.
+
+      min_interval (int or float): Minimum time in seconds between the
+        starts of two calls to the check function, when the wakeup event ends
+        a poll interval early.
+
+    Returns:
+      tuple(done, value): The result of the last call to the check function.
+      If done is False, the wait timed out.
+    """
+    timeout = limit_timeout(timeout, deadline)
+    start_time = time.time()
+    end_time = start_time + timeout if timeout else None
+    interval, max_interval, factor = intervals
+    polls = 0
+    while True:
+        polls += 1
+        check_time = time.time()
+        if wakeup is not None:
+            # Clear before the check, so that changes during the check are
+            # not missed
+            wakeup.clear()
+        done, value = check_func()
+        if done:
+            break
+        now = time.time()
+        if end_time is not None and now >= end_time:
+            break
+        sleep_time = interval * random.uniform(  # nosec B311
+            1 - jitter, 1 + jitter)
+        if end_time is not None:
+            sleep_time = min(sleep_time, end_time - now)
+        if wakeup is not None:
+            wakeup.wait(sleep_time)
+            if wakeup.closed:
+                # The wait may have ended early, so check right away
+                wakeup = None
+                if fallback_intervals is not None:
+                    interval, max_interval, factor = fallback_intervals
+                continue
+            sleep_time = check_time + min_interval - time.time()
+            if end_time is not None:
+                sleep_time = min(sleep_time, end_time - time.time())
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+        else:
+            time.sleep(sleep_time)
+        interval = min(interval * factor, max_interval)
+    WAIT_METRICS.record(kind, time.time() - start_time, polls, not done)
+    return done, value
+
+
+def wait_for_job_completion(job, operation_timeout=None, deadline=None):
+    """
+    Wait for completion of an HMC job, delete the job on the HMC and return
+    the result of the asynchronous HMC operation.
+
+    This is a replacement for zhmcclient.Job.wait_for_completion() that polls
+    with increasing intervals (see poll_until()).
+
+    Parameters:
+      job (zhmcclient.Job): The job.
+
+      operation_timeout (int or float): Timeout in seconds for the job
+        completion. 0 means that there is no timeout. None means that the
+        default async operation timeout of the session is used.
+
+      deadline (Deadline): Overall deadline that limits the timeout, or None.
+
+    Returns:
+      dict or None: The result of the asynchronous HMC operation.
+
+    Raises:
+      zhmcclient.HTTPError: The job completed in error.
+      zhmcclient.OperationTimeout: The timeout expired.
+    """
+    if operation_timeout is None:
+        operation_timeout = job.session.retry_timeout_config.operation_timeout
+
+    def check():
+        try:
+            job_status, op_result = job.check_for_completion()
+        except ClientConnectionError:
+            # The HMC may be restarting, so we continue polling
+            return False, None
+        return job_status == 'complete', op_result
+
+    done, result = poll_until(
+        check, operation_timeout, deadline, kind='job',
+        intervals=JOB_POLL_INTERVALS)
+    if not done:
+        timeout = limit_timeout(operation_timeout, deadline)
+        raise OperationTimeout(
+            f"Waiting for completion of job {job.uri} timed out "
+            f"(operation timeout: {timeout} s)", timeout)
+    return result
+
+
+class SubmittedJobs:
+    """
+    HMC jobs that were submitted without waiting for their completion, within
+    a module call.
+
+    The URIs of these jobs are returned to the playbook in the 'job_uris'
+    item of the module result, so that their completion can be awaited later
+    (e.g. using the zhmc_job module).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = []
+
+    def add(self, job):
+        """
+        Add a submitted job.
+
+        Parameters:
+          job(zhmcclient.Job): The job.
+        """
+        with self._lock:
+            self._jobs.append(job)
+
+    def uris(self):
+        """
+        Return the list of URIs of the submitted jobs, in the order in which
+        they were added.
+        """
+        with self._lock:
+            return [job.uri for job in self._jobs]
+
+    def reset(self):
+        """
+        Reset the submitted jobs.
+        """
+        with self._lock:
+            self._jobs = []
+
+
+# Jobs submitted without waiting for completion in the current module call
+SUBMITTED_JOBS = SubmittedJobs()
+
+
+def submitted_jobs_result():
+    """
+    Return the items to be added to the module result for the jobs that were
+    submitted without waiting for their completion, and reset the submitted
+    jobs.
+
+    Returns:
+      dict: A dict with item 'job_uris' containing the list of job URIs, if
+      jobs were submitted. Otherwise, an empty dict.
+    """
+    job_uris = SUBMITTED_JOBS.uris()
+    SUBMITTED_JOBS.reset()
+    if not job_uris:
+        return {}
+    return {'job_uris': job_uris}
+
+
+class RetryStats:
+    """
+    Statistics about the retries of HMC operations within a module call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries = {}
+
+    def record(self, operation):
+        """
+        Record a retry of an HMC operation.
+
+        Parameters:
+          operation(str): The operation, as the zhmcclient method name and
+            the URI of the resource.
+        """
+        with self._lock:
+            self._retries[operation] = self._retries.get(operation, 0) + 1
+
+    def as_dict(self):
+        """
+        Return the statistics as a dict with the retried operations (method
+        name and resource URI) as a key and the number of retries as a value.
+        """
+        with self._lock:
+            return dict(self._retries)
+
+    def reset(self):
+        """
+        Reset the statistics.
+        """
+        with self._lock:
+            self._retries = {}
+
+
+# Retry statistics of the current module call
+RETRY_STATS = RetryStats()
+
+
+class RetryPolicy:
+    """
+    Policy for retrying HMC operations that failed with a transient error,
+    with exponentially increasing intervals between the attempts.
+
+    Transient errors are the HTTP status and reason codes in
+    RETRYABLE_HTTP_ERRORS, and connection errors for which the request has
+    provably not reached the HMC (connect timeouts and refused connections).
+    Other connection errors such as read timeouts or connection resets are
+    not retried, because the HMC may have performed the operation already.
+
+    The retry policy is meant to be applied only to idempotent operations
+    (see retry_operation()).
+
+    The retries are recorded in RETRY_STATS.
+    """
+
+    def __init__(self, attempts=DEFAULT_RETRY_ATTEMPTS,
+                 timeout=DEFAULT_RETRY_TIMEOUT, intervals=RETRY_INTERVALS,
+                 jitter=POLL_JITTER):
+        """
+        Parameters:
+          attempts (int): Maximum number of retries of an operation. 0 means
+            that operations are not retried.
+          timeout (int or float): Overall timeout in seconds for the retries
+            of an operation. A retry is not started if it would start after
+            the timeout. None or 0 means that there is no timeout.
+          intervals (tuple): Retry intervals in seconds, as a tuple of
+            (initial interval, maximum interval, increase factor).
+          jitter (float): Relative random jitter applied to each interval.
+        """
+        self.attempts = attempts
+        self.timeout = timeout
+        self.intervals = intervals
+        self.jitter = jitter
+
+    @classmethod
+    def from_environment(cls):
+        """
+        Return a retry policy that is configured from the ZHMC_RETRY_ATTEMPTS
+        and ZHMC_RETRY_TIMEOUT environment variables, using the defaults for
+        unset variables.
+
+        Raises:
+          ParameterError: Invalid value of an environment variable.
+        """
+        values = []
+        for envvar, default in ((RETRY_ATTEMPTS_ENVVAR, DEFAULT_RETRY_ATTEMPTS),
+                                (RETRY_TIMEOUT_ENVVAR, DEFAULT_RETRY_TIMEOUT)):
+            value = os.environ.get(envvar, '')
+            if value == '':
+                values.append(default)
+                continue
+            try:
+                value = int(value)
+            except ValueError:
+                raise ParameterError(
+                    f"Environment variable {envvar} has an invalid value: "
+                    f"{value!r}")
+            if value < 0:
+                raise ParameterError(
+                    f"Environment variable {envvar} must not be negative, "
+                    f"but is: {value!r}")
+            values.append(value)
+        attempts, timeout = values
+        return cls(attempts, timeout)
+
+    @staticmethod
+    def is_retryable(exc):
+        """
+        Return a boolean indicating whether an exception raised by an HMC
+        operation is a transient error.
+        """
+        if isinstance(exc, HTTPError):
+            if exc.http_status not in RETRYABLE_HTTP_ERRORS:
+                return False
+            reasons = RETRYABLE_HTTP_ERRORS[exc.http_status]
+            return reasons is None or exc.reason in reasons
+        if isinstance(exc, ConnectTimeout):
+            return True
+        if isinstance(exc, ClientConnectionError):
+            # The connection to the HMC could not be established if the
+            # underlying requests exception has a urllib3 NewConnectionError
+            # as an argument, or a MaxRetryError that has it as its reason.
+            for arg in getattr(exc.details, 'args', ()):
+                if isinstance(getattr(arg, 'reason', arg),
+                              NewConnectionError):
+                    return True
+        return False
+
+    def call(self, operation, func, *args, **kwargs):
+        """
+        Call a function that performs an HMC operation, and retry it according
+        to this policy if it fails with a transient error.
+
+        Parameters:
+          operation (str): The operation, as the zhmcclient method name and
+            the URI of the resource, for the statistics and log.
+          func (callable): The function, which is called with the remaining
+            positional and keyword arguments.
+
+        Returns:
+          The return value of the function.
+        """
+        deadline = Deadline(self.timeout)
+        interval, max_interval, factor = self.intervals
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except (HTTPError, ClientConnectionError) as exc:
+                if attempt >= self.attempts or not self.is_retryable(exc):
+                    raise
+                sleep_time = interval * random.uniform(  # nosec B311
+                    1 - self.jitter, 1 + self.jitter)
+                remaining = deadline.remaining()
+                if remaining is not None and sleep_time >= remaining:
+                    raise
+                attempt += 1
+                HMC_LOGGER.debug(
+                    "Retrying %s (retry %d of %d) after %.1f s upon %s: %s",
+                    operation, attempt, self.attempts, sleep_time,
+                    exc.__class__.__name__, exc)
+                RETRY_STATS.record(operation)
+                time.sleep(sleep_time)
+                interval = min(interval * factor, max_interval)
+
+
+def retry_operation(resource, method_name, *args, **kwargs):
+    """
+    Call a method of a zhmcclient resource object that performs an idempotent
+    synchronous HMC operation (e.g. update_properties() or delete()), and
+    retry it upon transient HMC errors according to the RetryPolicy defined in
+    the environment (see RetryPolicy.from_environment()).
+
+    Operations that are not idempotent, such as the creation of resources,
+    must not be performed with this function, because retrying them may
+    perform them twice. Asynchronous HMC operations must be submitted with
+    retry_job_submission() instead.
+
+    The retries are recorded in RETRY_STATS, with the method name and the URI
+    of the resource as the operation.
+
+    Parameters:
+      resource (zhmcclient.BaseResource): The resource object.
+      method_name (str): Name of the method, which is called with the
+        remaining positional and keyword arguments.
+
+    Returns:
+      The return value of the method.
+    """
+    return RetryPolicy.from_environment().call(
+        f"{method_name} {resource.uri}", getattr(resource, method_name),
+        *args, **kwargs)
+
+
+class JobSubmissionRetryPolicy(RetryPolicy):
+    """
+    Retry policy for the submission of asynchronous HMC operations.
+
+    Submitting an asynchronous HMC operation twice may run its job twice, so
+    a submission is retried only if the HMC has certainly not accepted it:
+    when the HMC rejected it with one of the HTTP errors in
+    RETRYABLE_HTTP_ERRORS, or when the connection to the HMC was refused.
+    Connect timeouts are not retried, because zhmcclient has already retried
+    the connection in that case.
+    """
+
+    @staticmethod
+    def is_retryable(exc):
+        """
+        Return a boolean indicating whether an exception raised by the
+        submission of an asynchronous HMC operation is a transient error for
+        which the HMC has certainly not accepted the submission.
+        """
+        if isinstance(exc, ConnectTimeout):
+            return False
+        return RetryPolicy.is_retryable(exc)
+
+
+def retry_job_submission(resource, method_name, *args, **kwargs):
+    """
+    Submit an asynchronous HMC operation (e.g. start() or activate()) by
+    calling a method of a zhmcclient resource object with
+    wait_for_completion=False, and retry the submission upon transient HMC
+    errors according to the JobSubmissionRetryPolicy defined in the
+    environment.
+
+    Only the submission is retried, not the job: Waiting for the completion
+    of the job is left to the caller (e.g. with wait_for_job_completion()).
+
+    The retries are recorded in RETRY_STATS, with the method name and the URI
+    of the resource as the operation.
+
+    Parameters:
+      resource (zhmcclient.BaseResource): The resource object.
+      method_name (str): Name of the method, which is called with the
+        remaining positional and keyword arguments.
+
+    Returns:
+      zhmcclient.Job: The job of the asynchronous HMC operation.
+    """
+    kwargs['wait_for_completion'] = False
+    return JobSubmissionRetryPolicy.from_environment().call(
+        f"{method_name} {resource.uri}", getattr(resource, method_name),
+        *args, **kwargs)
+
+
+def retries_result():
+    """
+    Return the items to be added to the module result for the retries of HMC
+    operations, and reset the retry statistics.
+
+    Returns:
+      dict: A dict with item 'retries' containing a dict with the retried
+      operations (method name and resource URI) as a key and the number of
+      retries as a value, if operations were retried. Otherwise, an empty
+      dict.
+    """
+    retries = RETRY_STATS.as_dict()
+    RETRY_STATS.reset()
+    if not retries:
+        return {}
+    return {'retries': retries}
+
+
+def uri_template(uri):
+    """
+    Return the URI template of an HMC URI, i.e. its path without query
+    parameters and with the object IDs and element IDs replaced by '{id}'.
+
+    Parameters:
+      uri (str): The URI, optionally with scheme and host.
+
+    Returns:
+      str: The URI template, e.g. '/api/partitions/{id}/nics/{id}'.
+    """
+    path = urlsplit(uri).path
+    return '/'.join(
+        '{id}' if URI_ID_PATTERN.fullmatch(seg) else seg
+        for seg in path.split('/'))
+
+
+def percentile(values, percent):
+    """
+    Return the percentile of a list of values using the nearest-rank
+    method, or None if the list is empty.
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    rank = max(int(math.ceil(percent / 100.0 * len(values))), 1)
+    return values[rank - 1]
+
+
+class RequestStats:
+    """
+    Statistics about the HMC requests within a module call, accumulated per
+    HTTP method and URI template.
+
+    For HMC sessions, the HTTP requests are measured, including the Logon
+    operation. For faked sessions, the get(), post() and delete() methods of
+    the session are measured and no response bytes are recorded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._logon_time = None
+
+    def record(self, method, uri, duration, nbytes=0):
+        """
+        Record a completed HMC request.
+
+        Parameters:
+          method(str): The HTTP method, e.g. 'GET'.
+          uri(str): The URI of the request, optionally with scheme and host.
+          duration(float): Duration of the request in seconds.
+          nbytes(int): Number of bytes in the response body.
+        """
+        template = uri_template(uri)
+        key = f"{method.upper()} {template}"
+        with self._lock:
+            r = self._requests.setdefault(
+                key, {'count': 0, 'bytes': 0, 'durations': []})
+            r['count'] += 1
+            r['bytes'] += nbytes
+            r['durations'].append(duration)
+            if method.upper() == 'POST' and template == LOGON_URI:
+                self._logon_time = (self._logon_time or 0.0) + duration
+
+    def as_dict(self):
+        """
+        Return the statistics as a dict with these items:
+
+        - 'requests': Dict with the HTTP method and URI template as a key and
+          a dict with items 'count', 'time', 'p95_time' and 'bytes' as a
+          value.
+        - 'request_count', 'request_time', 'request_p95_time',
+          'response_bytes': Totals across all requests.
+        - 'logon_time': Time for the Logon operation, or None if there was no
+          Logon.
+        """
+        with self._lock:
+            requests_ = {}
+            all_durations = []
+            total_bytes = 0
+            for key, r in sorted(self._requests.items()):
+                requests_[key] = {
+                    'count': r['count'],
+                    'time': sum(r['durations']),
+                    'p95_time': percentile(r['durations'], 95),
+                    'bytes': r['bytes'],
+                }
+                all_durations.extend(r['durations'])
+                total_bytes += r['bytes']
+            return {
+                'requests': requests_,
+                'request_count': len(all_durations),
+                'request_time': sum(all_durations),
+                'request_p95_time': percentile(all_durations, 95),
+                'response_bytes': total_bytes,
+                'logon_time': self._logon_time,
+            }
+
+    def reset(self):
+        """
+        Reset the statistics.
+        """
+        with self._lock:
+            self._requests = {}
+            self._logon_time = None
+
+    def send_request(self, send_func, request, *args, **kwargs):
+        """
+        Send an HTTP request using the send function of a requests adapter,
+        and record it.
+        """
+        start_time = time.time()
+        response = send_func(request, *args, **kwargs)
+        self.record(request.method, request.url, time.time() - start_time,
+                    len(response.content or b''))
+        return response
+
+    def measure_requests(self, requests_session):
+        """
+        Make the HTTP requests of a requests.Session object recorded in these
+        statistics, and return the requests.Session object.
+        """
+        for adapter in requests_session.adapters.values():
+            adapter.send = functools.partial(self.send_request, adapter.send)
+        return requests_session
 
-    ca_certs = hmc_auth.get('ca_certs', None)
-    verify = hmc_auth.get('verify', True)
-    verify_cert = ca_certs if verify else False
-    session = Session(
-        hmc_host, userid, password, verify_cert=verify_cert,
-        session_id=session_id)
-    return session, logoff
+    def attach(self, session):
+        """
+        Make the HMC requests of a zhmcclient session recorded in these
+        statistics.
 
+        If the statistics were already attached to the session (e.g. for a
+        faked session that is reused), nothing is done.
+        """
+        if getattr(session, 'zhmc_request_stats', None) is not None:
+            return
+        session.zhmc_request_stats = self
+        if not is_faked_session(session):
+            hook_requests_sessions(session, self.measure_requests)
+            return
+        for method in ('get', 'post', 'delete'):
+            func = getattr(session, method)
 
-def close_session(session, logoff):
+            def measured(uri, *args, _func=func, _method=method, **kwargs):
+                start_time = time.time()
+                try:
+                    return _func(uri, *args, **kwargs)
+                finally:
+                    self.record(_method, uri, time.time() - start_time)
+
+            setattr(session, method, measured)
+
+
+# HMC request statistics of the current module call
+REQUEST_STATS = RequestStats()
+
+
+def env_flag(envvar):
     """
-    Close a session with the HMC.
+    Return the boolean value of an environment variable that enables a
+    function. An unset or empty environment variable disables the function.
 
-    Parameters:
-      session (zhmcclient.Session): The session object to close.
-      logoff (bool): Indicator to logoff the session.
+    Raises:
+      ParameterError: Invalid value of the environment variable.
     """
-    if logoff:
-        try:
-            session.logoff()
-        except ClientAuthError:
-            pass
+    value = os.environ.get(envvar, '').strip().lower()
+    if value in ('', '0', 'false', 'no', 'off'):
+        return False
+    if value in ('1', 'true', 'yes', 'on'):
+        return True
+    raise ParameterError(
+        f"Environment variable {envvar} has an invalid value: {value!r}")
 
 
-def hmc_auth_parameter():
-    "Return the Ansible module definition of the hmc_auth parameter."
-    hmc_auth = dict(
-        required=True,
-        type='dict',
-        options=dict(
-            userid=dict(required=False, type='str', default=None),
-            password=dict(required=False, type='str', default=None,
-                          no_log=True),
-            session_id=dict(required=False, type='str', default=None,
-                            no_log=True),
-            ca_certs=dict(required=False, type='str', default=None),
-            verify=dict(required=False, type='bool', default=True),
-        ),
-    )
-    return hmc_auth
+def stats_enabled():
+    """
+    Return whether the HMC request statistics are enabled in the module
+    results, using the ZHMC_STATS environment variable.
+
+    Raises:
+      ParameterError: Invalid value of the environment variable.
+    """
+    return env_flag(STATS_ENVVAR)
 
 
-def eq_hex(hex_actual, hex_new, prop_name):
+def stats_result():
     """
-    Test two hex string values of a property for equality.
+    Return the items to be added to the module result for the HMC request
+    statistics and wait metrics, and reset them.
+
+    Returns:
+      dict: A dict with item '_zhmc_stats' containing the HMC request
+      statistics (see RequestStats.as_dict()) with additional items 'waits'
+      (see WaitMetrics.as_dict()) and 'wait_time', if the statistics are
+      enabled. Otherwise, an empty dict.
     """
-    if hex_actual:
+    stats = REQUEST_STATS.as_dict()
+    stats['waits'] = WAIT_METRICS.as_dict()
+    stats['wait_time'] = WAIT_METRICS.total_time()
+    REQUEST_STATS.reset()
+    WAIT_METRICS.reset()
+    try:
+        enabled = stats_enabled()
+    except ParameterError:
+        # Already surfaced by open_session()
+        enabled = False
+    if not enabled:
+        return {}
+    return {'_zhmc_stats': stats}
+
+
+class ModuleProfiler:
+    """
+    Opt-in profiling of a module invocation with cProfile.
+
+    It is enabled by setting the ZHMC_PROFILE_DIR environment variable to a
+    directory on the system running the module. One profile file in the
+    pstats format is written to that directory per module invocation.
+
+    The profiler is started when this module is imported (so that the import
+    of the zhmcclient package is covered), or otherwise by log_init(), which
+    every module calls before performing its task. The profile file is
+    written by module_result_items(), which every module calls when exiting,
+    or at process exit if the module ended in another way (e.g. with a
+    traceback).
+
+    cProfile covers only the thread that enabled it before Python 3.12.
+    Therefore, the calls made in the worker threads of run_concurrently() are
+    profiled separately in each worker thread, and are merged into the
+    profile file. Threads that are not started by run_concurrently() (e.g.
+    the receiver thread of a notification receiver) are not covered before
+    Python 3.12.
+    """
+
+    def __init__(self, profile=None):
+        """
+        Parameters:
+          profile (cProfile.Profile): A profile that is already enabled, or
+            None.
+        """
+        self.profile = profile
+        self.module_name = None
+        self._lock = threading.Lock()
+        self._thread_profiles = []
+        if profile is not None:
+            atexit.register(self.stop)
+
+    def start(self, module_name):
+        """
+        Start profiling the invocation of a module, if enabled and not yet
+        started.
+
+        Parameters:
+          module_name (str): Name of the module, used in the profile file name.
+        """
+        if self.profile is not None:
+            self.module_name = self.module_name or module_name
+            return
+        if not os.environ.get(PROFILE_DIR_ENVVAR):
+            return
+        # pylint: disable=import-outside-toplevel
+        import cProfile
+        profile = cProfile.Profile()
         try:
-            int_actual = int(hex_actual, 16)
+            profile.enable()
         except ValueError:
-            raise ParameterError(
-                f"Unexpected: Actual value of property {prop_name!r} is not "
-                f"a valid  hex number: {hex_actual!r}")
-    else:
-        int_actual = None
-    if hex_new:
+            # Another profiler is already active in this process
+            return
+        self.profile = profile
+        self.module_name = module_name
+        atexit.register(self.stop)
+
+    def wrap(self, func):
+        """
+        Return a function that calls func and profiles the call in the
+        current thread, if profiling is started. This is used for the worker
+        threads of run_concurrently().
+        """
+        if self.profile is None:
+            return func
+        # pylint: disable=import-outside-toplevel
+        import cProfile
+
+        @functools.wraps(func)
+        def profiled_func(*args, **kwargs):
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Since Python 3.12, the profile of the module invocation
+                # already covers all threads
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.disable()
+                with self._lock:
+                    self._thread_profiles.append(profile)
+
+        return profiled_func
+
+    def stop(self):
+        """
+        Stop profiling and write the profile file, if started.
+
+        Returns:
+          str: Path name of the profile file, or None if profiling was not
+          started or the profile file could not be written.
+        """
+        profile = self.profile
+        if profile is None:
+            return None
+        profile.disable()
+        self.profile = None
+        atexit.unregister(self.stop)
+        with self._lock:
+            thread_profiles = self._thread_profiles
+            self._thread_profiles = []
+        directory = os.environ.get(PROFILE_DIR_ENVVAR)
+        if not directory:
+            return None
+        # pylint: disable=import-outside-toplevel
+        import pstats
+        module_name = self.module_name or 'zhmc_module'
+        timestamp = time.strftime('%Y%m%d-%H%M%S')
+        filename = f"{module_name}-{timestamp}-{os.getpid()}.pstats"
+        filepath = os.path.join(directory, filename)
         try:
-            int_new = int(hex_new, 16)
-        except ValueError:
-            raise ParameterError(
-                f"New value for property {prop_name!r} is not a valid "
-                f"hex number: {hex_new!r}")
-    else:
-        int_new = None
-    return int_actual == int_new
+            os.makedirs(directory, exist_ok=True)
+            stats = pstats.Stats(profile)
+            for thread_profile in thread_profiles:
+                stats.add(thread_profile)
+            stats.dump_stats(filepath)
+        except OSError:
+            # Profiling must not cause the module to fail
+            return None
+        return filepath
 
 
-def _normalized_mac(mac_str):
-    mac_ints = [int(h, 16) for h in mac_str.split(':')]
-    mac_str = ':'.join(["%02x" % i for i in mac_ints])
-    return mac_str
+PROFILER = ModuleProfiler(IMPORT_PROFILE)
 
 
-def eq_mac(mac_actual, mac_new, prop_name):
+def profile_result():
     """
-    Test two MAC address string values of a property for equality.
+    Stop profiling the module invocation and return the items to be added to
+    the module result for it.
+
+    Returns:
+      dict: A dict with item '_zhmc_profile' containing the path name of the
+      profile file, if profiling is enabled. Otherwise, an empty dict.
     """
+    filepath = PROFILER.stop()
+    if filepath is None:
+        return {}
+    return {'_zhmc_profile': filepath}
 
-    if mac_actual:
-        try:
-            mac_actual = _normalized_mac(mac_actual)
-        except ValueError:
-            raise ParameterError(
-                f"Unexpected: Actual value of property {prop_name!r} is not "
-                f"a valid MAC address: {mac_actual!r}")
-    else:
-        mac_actual = None
-    if mac_new:
-        try:
-            mac_new = _normalized_mac(mac_new)
-        except ValueError:
-            raise ParameterError(
-                f"New value for property {prop_name!r} is not a valid "
-                f"MAC address: {mac_new!r}")
-    else:
-        mac_new = None
-    return mac_actual == mac_new
+
+def module_result_items():
+    """
+    Return the items to be added to the module result by the common
+    functions, and reset their state for the next module call.
+
+    Returns:
+      dict: The items for the module result (see submitted_jobs_result(),
+      retries_result(), stats_result() and profile_result()).
+    """
+    items = submitted_jobs_result()
+    items.update(retries_result())
+    items.update(stats_result())
+    items.update(profile_result())
+    return items
+
+
+def run_concurrently(func, items, max_workers):
+    """
+    Call a function for each item of a list, concurrently in a pool of
+    threads, and return the results in the order of the items.
+
+    If the function raises an exception for any item, the remaining calls
+    are still completed, and the first exception (in the order of the items)
+    is raised.
+
+    Parameters:
+      func (callable): Function to be called with an item as its only
+        argument.
+
+      items (list): The items.
+
+      max_workers (int): Maximum number of concurrent calls.
+
+    Returns:
+      list: The return values of the function calls.
+    """
+    if not items:
+        return []
+    max_workers = max(min(max_workers, len(items)), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        func = PROFILER.wrap(func)
+        futures = [executor.submit(func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def wait_for_partition_status(
+        partition, statuses, status_timeout=None, deadline=None):
+    """
+    Wait until the partition reaches one of the specified statuses.
+
+    This is a replacement for zhmcclient.Partition.wait_for_status() that
+    polls with increasing intervals (see poll_until()), and that retrieves the
+    status using pull_partition_status().
+
+    Parameters:
+      partition (zhmcclient.Partition): The partition.
+
+      statuses (list of str): The desired statuses.
+
+      status_timeout (int or float): Timeout in seconds for reaching one of
+        the desired statuses. 0 means that there is no timeout. None means that
+        the default status timeout of the session is used.
+
+      deadline (Deadline): Overall deadline that limits the timeout, or None.
+
+    Returns:
+      str: The status that was reached.
+
+    Raises:
+      zhmcclient.StatusTimeout: The timeout expired.
+    """
+    if status_timeout is None:
+        status_timeout = \
+            partition.manager.session.retry_timeout_config.status_timeout
+
+    def check():
+        status = pull_partition_status(partition)
+        return status in statuses, status
+
+    done, status = poll_until(
+        check, status_timeout, deadline, kind='partition-status',
+        intervals=STATUS_POLL_INTERVALS)
+    if not done:
+        timeout = limit_timeout(status_timeout, deadline)
+        raise StatusTimeout(
+            f"Waiting for partition {partition.name} to reach status(es) "
+            f"'{statuses}' timed out after {timeout} s - current status is "
+            f"'{status}'", status, statuses, timeout)
+    return status
 
 
 def pull_partition_status(partition):
@@ -300,6 +2374,9 @@ def pull_partition_status(partition):
     Retrieve the partition operational status as fast as possible and return
     it.
 
+    The status is retrieved with a "Get Partition Properties" operation on the
+    partition URI that selects only the 'status' property.
+
     Partition status values and their meaning:
 
     Status             Resources allocated   OS running
@@ -314,17 +2391,17 @@ def pull_partition_status(partition):
     paused             yes                   no
     comm-not-active    unknown               unknown
     status-check       unknown               unknown
+
+    Parameters:
+      partition (zhmcclient.Partition): The partition.
     """
-    parts = partition.manager.cpc.partitions.list(
-        filter_args={'name': partition.name})
-    if len(parts) != 1:
-        raise AssertionError()
-    this_part = parts[0]
-    actual_status = this_part.get_property('status')
+    partition.pull_properties(['status'])
+    actual_status = partition.get_property('status')
     return actual_status
 
 
-def stop_partition(logger, partition, check_mode):
+def stop_partition(
+        logger, partition, check_mode, deadline=None, wait=True):
     """
     Ensure that the partition is stopped, regardless of what its current
     operational status is. In some cases, multiple "Stop Partition" operations
@@ -360,6 +2437,14 @@ def stop_partition(logger, partition, check_mode):
         in which case this method does ot actually stop the partition, but
         just returns what would have been done.
 
+      deadline (Deadline): Overall deadline for the waits performed by this
+        function, or None.
+
+      wait (bool): Indicates whether to wait for completion of the final
+        "Stop Partition" operation. If False, the job of that operation is
+        added to SUBMITTED_JOBS, and the partition may still be in status
+        'stopping' when this method returns.
+
     Returns:
       bool: Indicates whether the partition was changed.
 
@@ -389,9 +2474,9 @@ def stop_partition(logger, partition, check_mode):
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
             # Let it first finish the starting
-            partition.wait_for_status(PART_STARTING_END_STATUSES)
+            status = wait_for_partition_status(
+                partition, PART_STARTING_END_STATUSES, deadline=deadline)
             # Then stop it in the next loop turn
-            status = pull_partition_status(partition)
             partition.update_properties_local({'status': status})
             changed = True
         elif status == 'stopping':
@@ -399,16 +2484,21 @@ def stop_partition(logger, partition, check_mode):
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
             # Let it finish the stopping
-            partition.wait_for_status(PART_STOPPING_END_STATUSES)
-            status = pull_partition_status(partition)
+            status = wait_for_partition_status(
+                partition, PART_STOPPING_END_STATUSES, deadline=deadline)
             partition.update_properties_local({'status': status})
             changed = True
         elif status in ('terminated', 'active', 'degraded', 'paused'):
             logger.debug("Stop partition %r on CPC %r (current status: %r)",
                          partition.name, partition.manager.cpc.name, status)
             if not check_mode:
-                job = partition.stop(wait_for_completion=False)
-                job.wait_for_completion()
+                job = retry_job_submission(partition, 'stop')
+                if not wait:
+                    SUBMITTED_JOBS.add(job)
+                    partition.update_properties_local({'status': 'stopping'})
+                    changed = True
+                    break
+                wait_for_job_completion(job, deadline=deadline)
                 status = pull_partition_status(partition)
             else:
                 status = 'stopped'
@@ -427,7 +2517,8 @@ def stop_partition(logger, partition, check_mode):
     return changed
 
 
-def start_partition(logger, partition, check_mode):
+def start_partition(
+        logger, partition, check_mode, deadline=None, wait=True):
     """
     Ensure that the partition is started, regardless of what its current
     operational status is.
@@ -468,6 +2559,14 @@ def start_partition(logger, partition, check_mode):
         in which case this method does not actually change the partition, but
         just returns what would have been done.
 
+      deadline (Deadline): Overall deadline for the waits performed by this
+        function, or None.
+
+      wait (bool): Indicates whether to wait for completion of the final
+        "Start Partition" operation. If False, the job of that operation is
+        added to SUBMITTED_JOBS, and the partition may still be in status
+        'starting' when this method returns.
+
     Returns:
       bool: Indicates whether the partition was changed.
 
@@ -499,9 +2598,9 @@ def start_partition(logger, partition, check_mode):
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
             # Let it first finish the stopping
-            partition.wait_for_status(PART_STOPPING_END_STATUSES)
+            status = wait_for_partition_status(
+                partition, PART_STOPPING_END_STATUSES, deadline=deadline)
             # Then start it in the next loop turn
-            status = pull_partition_status(partition)
             partition.update_properties_local({'status': status})
             changed = True
         elif status == 'starting':
@@ -509,8 +2608,8 @@ def start_partition(logger, partition, check_mode):
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
             # Let it finish the starting
-            partition.wait_for_status(PART_STARTING_END_STATUSES)
-            status = pull_partition_status(partition)
+            status = wait_for_partition_status(
+                partition, PART_STARTING_END_STATUSES, deadline=deadline)
             partition.update_properties_local({'status': status})
             changed = True
         elif status in ('terminated', 'paused'):
@@ -524,8 +2623,8 @@ def start_partition(logger, partition, check_mode):
             logger.debug("Stop partition %r on CPC %r (current status: %r)",
                          partition.name, partition.manager.cpc.name, status)
             if not check_mode:
-                job = partition.stop(wait_for_completion=False)
-                job.wait_for_completion()
+                job = retry_job_submission(partition, 'stop')
+                wait_for_job_completion(job, deadline=deadline)
                 status = pull_partition_status(partition)
             else:
                 status = 'stopped'
@@ -535,8 +2634,13 @@ def start_partition(logger, partition, check_mode):
             logger.debug("Start partition %r on CPC %r (current status: %r)",
                          partition.name, partition.manager.cpc.name, status)
             if not check_mode:
-                job = partition.start(wait_for_completion=False)
-                job.wait_for_completion()
+                job = retry_job_submission(partition, 'start')
+                if not wait:
+                    SUBMITTED_JOBS.add(job)
+                    partition.update_properties_local({'status': 'starting'})
+                    changed = True
+                    break
+                wait_for_job_completion(job, deadline=deadline)
                 status = pull_partition_status(partition)
             else:
                 # In check mode, simulate the behavior for linux-type partitions
@@ -562,7 +2666,8 @@ def start_partition(logger, partition, check_mode):
     return changed
 
 
-def wait_for_transition_completion(logger, partition):
+def wait_for_transition_completion(
+        logger, partition, deadline=None):
     """
     If the partition is in a transitional state ('starting', 'stopping'),
     wait for completion of that transition.
@@ -595,6 +2700,9 @@ def wait_for_transition_completion(logger, partition):
 
       partition (zhmcclient.Partition): The partition.
 
+      deadline (Deadline): Overall deadline for the waits performed by this
+        function, or None.
+
     Raises:
       StatusError: CPC has issues, partition has a bad status.
       zhmcclient.Error: Any zhmcclient exception can happen.
@@ -614,14 +2722,14 @@ def wait_for_transition_completion(logger, partition):
             logger.debug("Waiting for completion of stopping of partition %r "
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
-            partition.wait_for_status(PART_STOPPING_END_STATUSES)
-            status = pull_partition_status(partition)
+            status = wait_for_partition_status(
+                partition, PART_STOPPING_END_STATUSES, deadline=deadline)
         elif status == 'starting':
             logger.debug("Waiting for completion of starting of partition %r "
                          "on CPC %r",
                          partition.name, partition.manager.cpc.name)
-            partition.wait_for_status(PART_STARTING_END_STATUSES)
-            status = pull_partition_status(partition)
+            status = wait_for_partition_status(
+                partition, PART_STARTING_END_STATUSES, deadline=deadline)
         else:
             break
     else:
@@ -632,10 +2740,139 @@ def wait_for_transition_completion(logger, partition):
             f"loop. Current status: {status!r}.")
 
 
+# Timeout in seconds and poll intervals for waiting for the new NIC to show
+# up in the 'nic-uris' property of the partition in find_nic_for_500_12().
+NIC_URIS_TIMEOUT = 10
+NIC_URIS_POLL_INTERVALS = (0.5, 2.0, 1.5)
+
+
+class Error_500_12(Error):
+    # pylint: disable=invalid-name
+    """
+    Error while circumventing HTTP 500.12 in find_nic_for_500_12().
+    """
+    pass
+
+
+def find_nic_for_500_12(logger, nic_props, partition):
+    """
+    Circumvention for a defect where "Create NIC" on a Hipersocket adapter
+    fails with HTTP 500.12 when the Partition Link feature on z16 is enabled.
+
+    The NIC has been created in this case, but it still has the name that was
+    created automatically by the Partition Link support.
+
+    We identify the NIC based on its underlying Hipersockets adapter and the
+    device number, and return that NIC.
+
+    Parameters:
+      logger (logging.Logger): The logger to be used.
+
+      nic_props (dict): Input properties of the NIC, with underscores in the
+        property names, including the artificial properties 'adapter_name' and
+        'adapter_port'.
+
+      partition (zhmcclient.Partition): The partition of the NIC.
+    """
+    # Pull nic-uris property in partition to get the new NIC. If this is done
+    # immediately, the number if NICs will not have changed, so we try for a
+    # while, with increasing wait times in between.
+    initial_nic_uris = partition.get_property('nic-uris')
+
+    def check():
+        partition.pull_properties(['nic-uris'])
+        nic_uris = partition.get_property('nic-uris')
+        if len(nic_uris) == len(initial_nic_uris) + 1:
+            return True, next(iter(set(nic_uris) - set(initial_nic_uris)))
+        return False, None
+
+    found, nic_uri = poll_until(
+        check, timeout=NIC_URIS_TIMEOUT, kind='partition-nic-uris',
+        intervals=NIC_URIS_POLL_INTERVALS)
+    if found:
+        logger.debug("Found NIC URI: %r", nic_uri)
+    else:
+        logger.warning(
+            "Could not get partition property 'nic-uris' updated with "
+            "new NIC after %s seconds, trying filtering", NIC_URIS_TIMEOUT)
+    if nic_uri:
+        logger.debug(
+            "Finding NIC by URI %r", nic_uri)
+        filter_args = {
+            'element-uri': nic_uri,
+        }
+        try:
+            nic = partition.nics.find(**filter_args)
+        except NotFound:
+            raise Error_500_12(
+                f"Cannot find NIC with URI {nic_uri!r}"
+            )
+    else:
+        try:
+            props = nic_props or {}
+            adapter_name = props['adapter_name']
+            adapter_port_index = int(props['adapter_port'])
+            device_number = props['device_number']
+        except KeyError:
+            raise Error_500_12(
+                "Not all input parameters provided that are required for the "
+                "circumvention: adapter_name, adapter_port, device_number"
+            )
+        try:
+            adapter = partition.manager.cpc.adapters.find(name=adapter_name)
+            adapter.ports.find(index=adapter_port_index)
+        except HTTPError as exc:
+            raise Error_500_12(
+                f"Cannot find adapter {adapter_name!r} or port "
+                f"{adapter_port_index!r}: {exc}"
+            )
+        adapter_family = adapter.get_property('adapter-family')
+        if adapter_family != 'hipersockets':
+            raise Error_500_12(
+                "HTTP error 500.12 happened for a non-Hipersockets adapter "
+                f"{adapter_name!r}"
+            )
+        try:
+            vswitches = partition.manager.cpc.virtual_switches.findall(
+                **{'backing-adapter-uri': adapter.uri})
+        except HTTPError as exc:
+            raise Error_500_12(
+                "Cannot find virtual switch for backing adapter "
+                f"{adapter_name!r}: {exc}"
+            )
+        found_vswitch = None
+        for vswitch in vswitches:
+            if vswitch.get_property('port') == adapter_port_index:
+                found_vswitch = vswitch
+                break
+        if not found_vswitch:
+            raise Error_500_12(
+                f"Cannot find virtual switch for port {adapter_port_index!r} "
+                f"on backing adapter {adapter_name!r}"
+            )
+        filter_args = {
+            'type': 'iqd',
+            'device-number': device_number,
+            'virtual-switch-uri': found_vswitch.uri,
+        }
+        logger.debug(
+            "Finding NIC by filter arguments: %r", filter_args)
+        try:
+            nic = partition.nics.find(**filter_args)
+        except NotFound:
+            raise Error_500_12(
+                f"Cannot find NIC with filter arguments {filter_args!r}"
+            )
+    return nic
+
+
 def pull_lpar_status(lpar):
     """
     Retrieve the LPAR operational status as fast as possible and return it.
 
+    The status is retrieved with a "Get Logical Partition Properties"
+    operation on the LPAR URI that selects only the 'status' property.
+
     LPAR status values and their meaning:
 
     Status             Resources allocated   OS running
@@ -645,17 +2882,18 @@ def pull_lpar_status(lpar):
     operating          yes                   yes
     acceptable         yes                   yes
     exceptions         unknown               unknown
+
+    Parameters:
+      lpar (zhmcclient.Lpar): The LPAR.
     """
-    lpars = lpar.manager.cpc.lpars.list(filter_args={'name': lpar.name})
-    if len(lpars) != 1:
-        raise AssertionError()
-    this_lpar = lpars[0]
-    actual_status = this_lpar.get_property('status')
+    lpar.pull_properties(['status'])
+    actual_status = lpar.get_property('status')
     return actual_status
 
 
 def ensure_lpar_inactive(
-        logger, lpar, check_mode, operation_timeout, status_timeout):
+        logger, lpar, check_mode, operation_timeout, status_timeout,
+        deadline=None, wait=True):
     """
     Ensure that the LPAR is in an inactive status, regardless of what its
     current operational status is.
@@ -680,6 +2918,14 @@ def ensure_lpar_inactive(
       status_timeout (int): Timeout in seconds, for waiting for the desired
         LPAR status to be reached.
 
+      deadline (Deadline): Overall deadline that limits the operation and
+        status timeouts, or None.
+
+      wait (bool): Indicates whether to wait for completion of the
+        "Deactivate Logical Partition" operation. If False, the job of that
+        operation is added to SUBMITTED_JOBS and this function returns
+        without waiting for the job or the LPAR status.
+
     Returns:
       bool: Indicates whether the LPAR was changed.
 
@@ -697,10 +2943,15 @@ def ensure_lpar_inactive(
 
     logger.debug("Deactivating LPAR %r (current status %r)",
                  lpar.name, status)
+    if not check_mode and not wait:
+        job = lpar.deactivate(wait_for_completion=False, force=True)
+        SUBMITTED_JOBS.add(job)
+        return True
     if not check_mode:
         lpar.deactivate(
-            operation_timeout=operation_timeout,
-            status_timeout=status_timeout,
+            operation_timeout=limit_timeout(
+                operation_timeout, deadline),
+            status_timeout=limit_timeout(status_timeout, deadline),
             force=True)
         status = pull_lpar_status(lpar)
     changed = True
@@ -715,7 +2966,8 @@ def ensure_lpar_inactive(
 
 def ensure_lpar_active(
         logger, lpar, check_mode, activation_profile_name, operation_timeout,
-        status_timeout, allow_status_exceptions, force):
+        status_timeout, allow_status_exceptions, force, deadline=None,
+        wait=True):
     """
     Ensure that the LPAR is at least active, regardless of what its
     current operational status is.
@@ -759,6 +3011,14 @@ def ensure_lpar_active(
         one of the active statuses: If `True`, the LPAR is re-activated.
         Otherwise, nothing is done.
 
+      deadline (Deadline): Overall deadline that limits the operation and
+        status timeouts, or None.
+
+      wait (bool): Indicates whether to wait for completion of the
+        "Activate Logical Partition" operation. If False, the job of that
+        operation is added to SUBMITTED_JOBS and this function returns
+        without waiting for the job or the LPAR status.
+
     Returns:
       bool: Indicates whether the LPAR was changed.
 
@@ -775,11 +3035,18 @@ def ensure_lpar_active(
             logger.debug("LPAR %r is in status %r and force is specified, "
                          "re-activating it%s",
                          lpar.name, status, check_mode_txt)
-            if not check_mode:
+            if not check_mode and not wait:
+                job = lpar.activate(
+                    wait_for_completion=False,
+                    activation_profile_name=activation_profile_name,
+                    force=True)
+                SUBMITTED_JOBS.add(job)
+            elif not check_mode:
                 lpar.activate(
                     activation_profile_name=activation_profile_name,
-                    operation_timeout=operation_timeout,
-                    status_timeout=status_timeout,
+                    operation_timeout=limit_timeout(
+                        operation_timeout, deadline),
+                    status_timeout=limit_timeout(status_timeout, deadline),
                     allow_status_exceptions=allow_status_exceptions,
                     force=True)
                 status = pull_lpar_status(lpar)
@@ -796,11 +3063,18 @@ def ensure_lpar_active(
     if status == 'not-activated':
         logger.debug("LPAR %r is in status %r, activating it%s",
                      lpar.name, status, check_mode_txt)
+        if not check_mode and not wait:
+            job = lpar.activate(
+                wait_for_completion=False,
+                activation_profile_name=activation_profile_name)
+            SUBMITTED_JOBS.add(job)
+            return True
         if not check_mode:
             lpar.activate(
                 activation_profile_name=activation_profile_name,
-                operation_timeout=operation_timeout,
-                status_timeout=status_timeout,
+                operation_timeout=limit_timeout(
+                    operation_timeout, deadline),
+                status_timeout=limit_timeout(status_timeout, deadline),
                 allow_status_exceptions=allow_status_exceptions)
             status = pull_lpar_status(lpar)
         else:
@@ -823,7 +3097,8 @@ def ensure_lpar_active(
 def ensure_lpar_loaded(
         logger, lpar, check_mode, activation_profile_name, load_address,
         load_parameter, clear_indicator, store_status_indicator,
-        operation_timeout, status_timeout, allow_status_exceptions, force):
+        operation_timeout, status_timeout, allow_status_exceptions, force,
+        deadline=None, wait=True):
     """
     Ensure that the LPAR is loaded, regardless of what its current operational
     status is.
@@ -913,6 +3188,15 @@ def ensure_lpar_loaded(
         one of the operating statuses: If `True`, the LPAR is re-loaded.
         Otherwise, nothing is done.
 
+      deadline (Deadline): Overall deadline that limits the operation and
+        status timeouts, or None.
+
+      wait (bool): Indicates whether to wait for completion of the
+        "Load Logical Partition" operation. If False, the job of that
+        operation is added to SUBMITTED_JOBS and this function returns
+        without waiting for the job or the LPAR status. An activation that
+        is needed before the load is still waited for.
+
     Returns:
       bool: Indicates whether the LPAR was changed.
 
@@ -929,14 +3213,24 @@ def ensure_lpar_loaded(
             logger.debug("LPAR %r is in status %r and force is specified, "
                          "re-loading it%s",
                          lpar.name, status, check_mode_txt)
-            if not check_mode:
+            if not check_mode and not wait:
+                job = lpar.load(
+                    wait_for_completion=False,
+                    load_address=load_address,
+                    load_parameter=load_parameter,
+                    clear_indicator=clear_indicator,
+                    store_status_indicator=store_status_indicator,
+                    force=True)
+                SUBMITTED_JOBS.add(job)
+            elif not check_mode:
                 lpar.load(
                     load_address=load_address,
                     load_parameter=load_parameter,
                     clear_indicator=clear_indicator,
                     store_status_indicator=store_status_indicator,
-                    operation_timeout=operation_timeout,
-                    status_timeout=status_timeout,
+                    operation_timeout=limit_timeout(
+                        operation_timeout, deadline),
+                    status_timeout=limit_timeout(status_timeout, deadline),
                     allow_status_exceptions=allow_status_exceptions,
                     force=True)
                 status = pull_lpar_status(lpar)
@@ -956,8 +3250,9 @@ def ensure_lpar_loaded(
         if not check_mode:
             lpar.activate(
                 activation_profile_name=activation_profile_name,
-                operation_timeout=operation_timeout,
-                status_timeout=status_timeout,
+                operation_timeout=limit_timeout(
+                    operation_timeout, deadline),
+                status_timeout=limit_timeout(status_timeout, deadline),
                 allow_status_exceptions=allow_status_exceptions)
             status = pull_lpar_status(lpar)
         else:
@@ -970,14 +3265,24 @@ def ensure_lpar_loaded(
         # The LPAR was defined not to auto-load, so we load it.
         logger.debug("LPAR %r is in status %r, loading it%s",
                      lpar.name, status, check_mode_txt)
+        if not check_mode and not wait:
+            job = lpar.load(
+                wait_for_completion=False,
+                load_address=load_address,
+                load_parameter=load_parameter,
+                clear_indicator=clear_indicator,
+                store_status_indicator=store_status_indicator)
+            SUBMITTED_JOBS.add(job)
+            return True
         if not check_mode:
             lpar.load(
                 load_address=load_address,
                 load_parameter=load_parameter,
                 clear_indicator=clear_indicator,
                 store_status_indicator=store_status_indicator,
-                operation_timeout=operation_timeout,
-                status_timeout=status_timeout,
+                operation_timeout=limit_timeout(
+                    operation_timeout, deadline),
+                status_timeout=limit_timeout(status_timeout, deadline),
                 allow_status_exceptions=allow_status_exceptions)
             status = pull_lpar_status(lpar)
         else:
@@ -1105,6 +3410,228 @@ def hyphened_list(value):
     return ret_value
 
 
+# Dictionary of properties of NIC resources, in this format:
+#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
+# where:
+#   name: Name of the property according to the data model, with hyphens
+#     replaced by underscores (this is how it is or would be specified in
+#     the 'properties' module parameter).
+#   allowed: Indicates whether it is allowed in the 'properties' module
+#     parameter.
+#   create: Indicates whether it can be specified for the "Create NIC"
+#     operation.
+#   update: Indicates whether it can be specified for the "Update NIC
+#     Properties" operation (at all).
+#   update_while_active: Indicates whether it can be specified for the "Update
+#     NIC Properties" operation while the partition of the NIC is active. None
+#     means "not applicable" (i.e. update=False).
+#   eq_func: Equality test function for two values of the property; None means
+#     to use Python equality.
+#   type_cast: Type cast function for an input value of the property; None
+#     means to use it directly. This can be used for example to convert
+#     integers provided as strings by Ansible back into integers (that is a
+#     current deficiency of Ansible).
+# Note: This should always represent the latest version of the HMC/SE.
+# Attempts to set a property that does not exist or that is not writeable in
+# the target HMC will be handled by the HMC rejecting the operation.
+ZHMC_NIC_PROPERTIES = {
+
+    # create+update properties:
+    'name': (
+        False, True, True, True, None, None),  # provided in 'name' module parm
+    # The type property became creatable with the network-express-support
+    # feature (SE 2.17.0).
+    'type': (True, True, False, False, None, None),
+    'description': (True, True, True, True, None, to_unicode),
+    'device_number': (True, True, True, True, eq_hex, None),
+    'network_adapter_port_uri': (
+        False, True, True, True, None, None),  # via adapter_name/_port
+    'virtual_switch_uri': (
+        False, True, True, True, None, None),  # via adapter_name/_port
+    'adapter_name': (
+        True, True, True, True, None,
+        None),  # artificial property, type_cast ignored
+    'adapter_port': (
+        True, True, True, True, None,
+        None),  # artificial property, type_cast ignored
+    # The ssc-*, vlan-id and mac-address properties were introduced in
+    # API version 2.2 (an update of SE 2.13.1).
+    # The mac-address property was changed to be writeable in API version 2.20
+    # (SE 2.14.0).
+    'ssc_management_nic': (True, True, True, True, None, None),
+    'ssc_ip_address_type': (True, True, True, True, None, None),
+    'ssc_ip_address': (True, True, True, True, None, None),
+    'ssc_mask_prefix': (True, True, True, True, None, None),
+    'vlan_id': (True, True, True, True, None, int),
+    'mac_address': (True, True, True, None, eq_mac, None),
+    # The vlan-type property was introduced in API version 2.20 (SE 2.14.0).
+    'vlan_type': (True, True, True, True, None, None),
+    # The function-* properties were introduced in API version 3.4
+    # (SE 2.15 GA2).
+    'function_number': (True, True, True, True, None, int),
+    'function_range': (True, True, True, True, None, int),
+    # The promiscuous-mode property was introduced with the
+    # network-express-support feature (SE 2.17.0).
+    'promiscuous_mode': (True, True, True, True, None, None),
+
+    # read-only properties:
+    'element-uri': (False, False, False, None, None, None),
+    'element-id': (False, False, False, None, None, None),
+    'parent': (False, False, False, None, None, None),
+    'class': (False, False, False, None, None, None),
+    # The partition-link-uri property was introduced with the
+    # dpm-partition-lifecycle-management feature (SE 2.17.0).
+    'partition_link_uri': (False, False, False, None, None, None),
+}
+
+
+# Dictionary of properties of HBA resources, in this format:
+#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
+# where:
+#   name: Name of the property according to the data model, with hyphens
+#     replaced by underscores (this is how it is or would be specified in
+#     the 'properties' module parameter).
+#   allowed: Indicates whether it is allowed in the 'properties' module
+#     parameter.
+#   create: Indicates whether it can be specified for the "Create HBA"
+#     operation.
+#   update: Indicates whether it can be specified for the "Update HBA
+#     Properties" operation (at all).
+#   update_while_active: Indicates whether it can be specified for the "Update
+#     HBA Properties" operation while the partition of the HBA is active. None
+#     means "not applicable" (i.e. update=False).
+#   eq_func: Equality test function for two values of the property; None means
+#     to use Python equality.
+#   type_cast: Type cast function for an input value of the property; None
+#     means to use it directly. This can be used for example to convert
+#     integers provided as strings by Ansible back into integers (that is a
+#     current deficiency of Ansible).
+ZHMC_HBA_PROPERTIES = {
+
+    # create-only properties:
+    'adapter_port_uri': (
+        False, True, False, None, None, None),  # via adapter_name/_port
+    'adapter_name': (
+        True, True, False, None, None,
+        None),  # artificial property, type_cast ignored
+    'adapter_port': (
+        True, True, False, None, None,
+        None),  # artificial property, type_cast ignored
+
+    # create+update properties:
+    'name': (
+        False, True, True, True, None, None),  # provided in 'name' module parm
+    'description': (True, True, True, True, None, to_unicode),
+    'device_number': (True, True, True, True, eq_hex, None),
+
+    # read-only properties:
+    'element-uri': (False, False, False, None, None, None),
+    'element-id': (False, False, False, None, None, None),
+    'parent': (False, False, False, None, None, None),
+    'class': (False, False, False, None, None, None),
+    'wwpn': (False, False, False, None, None, None),
+}
+
+
+# Dictionary of properties of virtual function resources, in this format:
+#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
+# where:
+#   name: Name of the property according to the data model, with hyphens
+#     replaced by underscores (this is how it is or would be specified in
+#     the 'properties' module parameter).
+#   allowed: Indicates whether it is allowed in the 'properties' module
+#     parameter.
+#   create: Indicates whether it can be specified for the "Create Virtual
+#     Function" operation.
+#   update: Indicates whether it can be specified for the "Update Virtual
+#     Function Properties" operation (at all).
+#   update_while_active: Indicates whether it can be specified for the "Update
+#     Virtual Function Properties" operation while the partition of the
+#     virtual function is active. None means "not applicable" (i.e.
+#     update=False).
+#   eq_func: Equality test function for two values of the property; None means
+#     to use Python equality.
+#   type_cast: Type cast function for an input value of the property; None
+#     means to use it directly. This can be used for example to convert
+#     integers provided as strings by Ansible back into integers (that is a
+#     current deficiency of Ansible).
+ZHMC_VFUNCTION_PROPERTIES = {
+
+    # create+update properties:
+    'name': (
+        False, True, True, True, None, None),  # provided in 'name' module parm
+    'description': (True, True, True, True, None, to_unicode),
+    'device_number': (True, True, True, True, eq_hex, None),
+    'adapter_uri': (
+        False, True, True, True, None, None),  # via adapter_name
+    'adapter_name': (
+        True, True, True, True, None,
+        None),  # artificial property, type_cast ignored
+
+    # read-only properties:
+    'element-uri': (False, False, False, None, None, None),
+    'element-id': (False, False, False, None, None, None),
+    'parent': (False, False, False, None, None, None),
+    'class': (False, False, False, None, None, None),
+}
+
+
+# Dictionary of properties of storage volume resources, in this format:
+#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
+# where:
+#   name: Name of the property according to the data model, with hyphens
+#     replaced by underscores (this is how it is or would be specified in
+#     the 'properties' module parameter).
+#   allowed: Indicates whether it is allowed in the 'properties' module
+#     parameter.
+#   create: Indicates whether it can be specified for creating a storage volume
+#     using the "Modify Storage Group Properties" operation (i.e.
+#     operation="create" in "storage-volume-request-info").
+#   update: Indicates whether it can be specified for modifying a storage
+#     volume using the "Modify Storage Group Properties" operation (i.e.
+#     operation="modify" in "storage-volume-request-info").
+#   update_while_active: Indicates whether it can be specified for modifying a
+#     storage volume using the "Modify Storage Group Properties" operation
+#     while the storage group is attached to any partition. None means
+#     "not applicable" (used for update=False).
+#   eq_func: Equality test function for two values of the property; None means
+#     to use Python equality.
+#   type_cast: Type cast function for an input value of the property; None
+#     means to use it directly. This can be used for example to convert
+#     integers provided as strings by Ansible back into integers (that is a
+#     current deficiency of Ansible).
+ZHMC_STORAGE_VOLUME_PROPERTIES = {
+
+    # create-only properties: None
+    # update-only properties: None
+
+    # create+update properties:
+    'name': (False, True, True, True, None, None),  # provided in module parm
+    'description': (True, True, True, True, None, to_unicode),
+    'size': (True, True, True, True, None, float),
+    'usage': (True, True, True, True, None, None),
+    'model': (True, True, True, True, None, None),  # ECKD only
+    'cylinders': (True, True, True, True, None, int),  # ECKD only
+    'device_number': (True, True, True, True, eq_hex, int),  # ECKD only
+
+    # read-only properties:
+    'element_uri': (False, False, False, None, None, None),
+    'element_id': (False, False, False, None, None, None),
+    'parent': (False, False, False, None, None, None),
+    'class': (False, False, False, None, None, None),
+    'fulfillment_state': (False, False, False, None, None, None),
+    'active_size': (False, False, False, None, None, None),
+    'uuid': (False, False, False, None, None, None),
+    'active_model': (False, False, False, None, None, None),
+    'control_unit_uri': (False, False, False, None, None, None),
+    'eckd_type': (False, False, False, None, None, None),
+    'unit_address': (False, False, False, None, None, None),
+
+    # artificial properties:
+    # 'type': 'fc' or 'fcp', as defined in its storage group
+}
+
+
 def process_normal_property(
         prop_name, resource_properties, input_props, resource):
     """
@@ -1219,8 +3746,13 @@ def log_init(logger_name, log_file=None):
 
         log_file (string): Path name of a log file to log to, or `None`.
           If `None`, logging will be propagated to the Python root logger.
+
+    If the ZHMC_PROFILE_DIR environment variable is set, this function also
+    starts profiling the module invocation (see ModuleProfiler).
     """
 
+    PROFILER.start(logger_name)
+
     # The datefmt parameter of logging.Formatter() supports the datetime
     # formatting placeholders of time.strftime(). Unfortunately, the %f
     # placeholder for microseconds is not supported by time.strftime().
@@ -1475,6 +4007,195 @@ class NotificationThread(threading.Thread):
         return self._ready_event.wait(timeout)
 
 
+class WakeupEvent(threading.Event):
+    """
+    Event that ends the poll intervals of poll_until() early, and that can
+    be closed to indicate that it will no longer be set.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    def close(self):
+        """
+        Indicate that the event will no longer be set, and wake up a waiter
+        so that it can continue without the event.
+        """
+        self.closed = True
+        self.set()
+
+
+class ObjectNotifications:
+    """
+    Receiver for the object notifications of an HMC session (e.g. property
+    change notifications), that sets a wakeup event when a notification for
+    one of a set of objects arrives.
+
+    The notifications are received on the object notification topic of the
+    session in a separate thread. If notifications cannot be received (for
+    faked sessions, for sessions that were established with a session ID, or
+    if the connection to the HMC notification service fails), the wakeup
+    event is None, so that waits fall back to polling. If the receiving
+    thread ends while notifications are still needed (e.g. because the
+    connection to the HMC notification service was lost), the wakeup event
+    is closed, so that waits also fall back to polling.
+
+    Use this class as a context manager.
+    """
+
+    def __init__(self, session, hmc_auth, object_uris):
+        """
+        Parameters:
+          session (zhmcclient.Session): The session with the HMC. It must be
+            logged on.
+
+          hmc_auth (dict): The 'hmc_auth' module parameter, for the userid and
+            password.
+
+          object_uris (iterable of str): URIs of the objects whose
+            notifications set the wakeup event.
+        """
+        self._session = session
+        self._hmc_auth = hmc_auth
+        self._object_uris = set(object_uris)
+        self._receiver = None
+        self._thread = None
+        self.wakeup = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_):
+        self.stop()
+
+    def start(self):
+        """
+        Start receiving notifications, if possible.
+        """
+        userid = self._hmc_auth.get('userid')
+        password = self._hmc_auth.get('password')
+        topic = self._session.object_topic
+        if is_faked_session(self._session) or not userid or not password \
+                or not topic:
+            return
+        receiver = NotificationReceiver(
+            topic, self._session.actual_host, userid, password,
+            verify_cert=self._session.verify_cert)
+        try:
+            receiver.connect()
+        except ClientError as exc:
+            HMC_LOGGER.debug(
+                "Object notifications are not used, falling back to "
+                "polling: %s", exc)
+            receiver.close()
+            return
+        self._receiver = receiver
+        self.wakeup = WakeupEvent()
+        self._thread = NotificationThread(target=self._receive)
+        self._thread.start()
+
+    def _receive(self):
+        """
+        Thread function that sets the wakeup event for notifications of the
+        objects. It returns when the receiver is closed, and closes the
+        wakeup event when it ends.
+        """
+        try:
+            for headers, _ in self._receiver.notifications():
+                if headers.get('object-uri') in self._object_uris:
+                    self.wakeup.set()
+                if self._thread.need_to_stop():
+                    return
+        finally:
+            if not self._thread.need_to_stop():
+                HMC_LOGGER.debug(
+                    "Object notifications are no longer received, falling "
+                    "back to polling")
+            self.wakeup.close()
+
+    def stop(self):
+        """
+        Stop receiving notifications.
+        """
+        if self._receiver is None:
+            return
+        self._thread.stop()
+        self._receiver.close()
+        try:
+            self._thread.join(timeout=5)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Errors in receiving notifications only caused more polling
+            HMC_LOGGER.debug("Object notification thread failed: %s", exc)
+        self._receiver = None
+
+
+def wait_for_fulfillment(
+        storage_group, hmc_auth, storage_volume_uris=None, timeout=None,
+        deadline=None):
+    """
+    Wait until the storage volumes of a storage group are fulfilled, i.e.
+    until their 'fulfillment-state' property is 'complete'.
+
+    Each check lists the storage volumes of the storage group with a single
+    'List Storage Volumes of a Storage Group' operation. The checks are
+    triggered by the object notifications for the storage group if they can
+    be received (see ObjectNotifications), and otherwise by polling.
+
+    Parameters:
+      storage_group (zhmcclient.StorageGroup): The storage group.
+
+      hmc_auth (dict): The 'hmc_auth' module parameter.
+
+      storage_volume_uris (list of str): URIs of the storage volumes to wait
+        for, or None for all storage volumes of the storage group. Storage
+        volumes that no longer exist are not waited for.
+
+      timeout (int or float): Timeout in seconds for the fulfillment. 0 means
+        that there is no timeout. None means that the default status timeout
+        of the session is used.
+
+      deadline (Deadline): Overall deadline that limits the timeout, or None.
+
+    Raises:
+      zhmcclient.StatusTimeout: The timeout expired.
+    """
+    session = storage_group.manager.session
+    if timeout is None:
+        timeout = session.retry_timeout_config.status_timeout
+
+    def check():
+        svs = storage_group.storage_volumes.list()
+        if storage_volume_uris is not None:
+            svs = [sv for sv in svs if sv.uri in storage_volume_uris]
+        pending = {sv.name: sv.get_property('fulfillment-state')
+                   for sv in svs
+                   if sv.get_property('fulfillment-state') != 'complete'}
+        return not pending, pending
+
+    with ObjectNotifications(
+            session, hmc_auth, [storage_group.uri]) as notifications:
+        if notifications.wakeup is not None:
+            intervals = FULFILLMENT_NOTIFIED_POLL_INTERVALS
+        else:
+            intervals = FULFILLMENT_POLL_INTERVALS
+        done, pending = poll_until(
+            check, timeout, deadline, kind='fulfillment', intervals=intervals,
+            wakeup=notifications.wakeup,
+            fallback_intervals=FULFILLMENT_POLL_INTERVALS,
+            min_interval=FULFILLMENT_MIN_CHECK_INTERVAL)
+    if not done:
+        timeout = limit_timeout(timeout, deadline)
+        states = sorted(set(pending.values()))
+        raise StatusTimeout(
+            f"Waiting for fulfillment of storage volumes "
+            f"{', '.join(sorted(pending))} of storage group "
+            f"{storage_group.name} timed out after {timeout} s - current "
+            f"fulfillment states are '{states}'", states, ['complete'],
+            timeout)
+
+
 def params_deepcopy(params):
     """
     Return a deep copy of the module input parameters, for dict items where
@@ -119,8 +119,10 @@ options:
     description:
       - The name of the target adapter. In case of renaming an adapter, this is
         the new name of the adapter.
+      - "Exactly one of O(name) and O(adapters) must be specified."
     type: str
-    required: true
+    required: false
+    default: null
   match:
     description:
       - "Only for O(state=set): Match properties for identifying the
@@ -186,6 +188,48 @@ options:
     type: dict
     required: false
     default: null
+  adapters:
+    description:
+      - "Only for O(state=set|facts): Multiple target adapters in the CPC, as
+         an alternative to O(name), O(match) and O(properties) for a single
+         target adapter. This allows configuring many adapters, e.g. after
+         installing new hardware, with a single task."
+      - "All adapters of the CPC are listed once, and the target adapters are
+         identified from that list, using the same rules as for a single
+         target adapter. Match values for the C(adapter_id) and
+         C(channel_path_id) properties are compared as hex numbers, and match
+         values for other properties are compared for equality."
+      - "The properties of all target adapters are checked before any adapter
+         is changed. The adapters are then updated concurrently, and their
+         ports are retrieved concurrently."
+      - "The outcome for each adapter is returned in RV(adapters). If the
+         update fails for any of the adapters, the module fails and returns
+         RV(adapters)."
+    type: list
+    elements: dict
+    required: false
+    default: null
+    suboptions:
+      name:
+        description:
+          - "The name of the target adapter. In case of renaming an adapter,
+             this is the new name of the adapter."
+        type: str
+        required: true
+      match:
+        description:
+          - "Only for O(state=set): Match properties for identifying the target
+             adapter, as described for O(match)."
+        type: dict
+        required: false
+        default: null
+      properties:
+        description:
+          - "Only for O(state=set): New values for the properties of the
+             adapter, as described for O(properties)."
+        type: dict
+        required: false
+        default: null
   log_file:
     description:
       - "File path of a log file to which the logic flow of this module as well
@@ -240,6 +284,26 @@ EXAMPLES = """
       description: "This is adapter {{ my_adapter_name }}"
   register: adapter1
 
+- name: "Ensure multiple existing adapters identified by their adapter ID have
+         the desired names and property values"
+  zhmc_adapter:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    adapters:
+      - name: "OSD_110"
+        match:
+          adapter_id: "110"
+        properties:
+          description: "OSA adapter in slot 110"
+      - name: "FCP_120"
+        match:
+          adapter_id: "120"
+        properties:
+          description: "FCP adapter in slot 120"
+    state: set
+  register: adapters1
+
 - name: "Ensure a Hipersockets adapter exists and has the desired property
          values"
   zhmc_adapter:
@@ -272,11 +336,23 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the adapter
+       upon transient HMC errors, by operation (method name and resource URI).
+       Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/adapters/8805c0f5-cbab-11f1-9b2a-fa163e1c2d3a": 2
+    }
 adapter:
   description:
     - "For O(state=absent), an empty dictionary."
     - "For O(state=set|present|facts), the adapter and its ports."
-  returned: success
+  returned: success, when O(name) is specified
   type: dict
   contains:
     name:
@@ -341,6 +417,55 @@ adapter:
         "type": "fcp",
         "used-capacity": 20
     }
+adapters:
+  description:
+    - "For O(adapters), the outcome for each adapter, in the order of
+       O(adapters)."
+    - "In case of a failure because the update has failed for any of the
+       adapters, this is also returned."
+  returned: success or failure, when O(adapters) is specified
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: "Adapter name from O(adapters)"
+      type: str
+    changed:
+      description: "Indicates whether the adapter properties were changed."
+      type: bool
+    status:
+      description:
+        - "Outcome for the adapter. One of:"
+        - "'complete' - The adapter has the specified properties."
+        - "'failed' - The update of the adapter or the retrieval of its
+           properties has failed."
+      type: str
+    error:
+      description: "Error message, if the status is 'failed'. Otherwise,
+        null."
+      type: str
+    adapter:
+      description: "The adapter and its ports, as described for RV(adapter).
+        Only present if the status is 'complete'."
+      type: dict
+  sample:
+    [
+        {
+            "name": "FCP_120",
+            "changed": true,
+            "status": "complete",
+            "error": null,
+            "adapter": {
+                "adapter-id": "120",
+                "name": "FCP_120",
+                "ports": [
+                    {
+                        "name": "Port 0"
+                    }
+                ]
+            }
+        }
+    ]
 """
 
 import logging  # noqa: E402
@@ -351,7 +476,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, eq_hex, common_fail_on_import_errors, \
-    parse_hmc_host, blanked_params  # noqa: E402
+    parse_hmc_host, blanked_params, module_result_items, \
+    run_concurrently, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -437,6 +563,17 @@ ZHMC_ADAPTER_PROPERTIES = {
 }
 
 
+# Maximum number of adapters that are processed concurrently for the
+# 'adapters' module parameter
+ADAPTER_MAX_PARALLEL = 10
+
+# Maximum number of ports of an adapter whose properties are retrieved
+# concurrently
+PORT_MAX_PARALLEL = 4
+
+# Adapter properties whose match values are compared as hex numbers
+HEX_MATCH_PROPERTIES = ('adapter-id', 'channel-path-id')
+
 # Conversion of crypto types between module parameter values and HMC values
 CRYPTO_TYPES_MOD2HMC = {
     'acc': 'accelerator',
@@ -556,6 +693,20 @@ def identify_adapter(cpc, name, match_props):
     Raises:
       zhmcclient.NotFound: The adapter was not found.
     """
+    filter_args = match_filter_args(match_props)
+    if not filter_args:
+        filter_args['name'] = name
+
+    adapter = cpc.adapters.find(**filter_args)
+    return adapter
+
+
+def match_filter_args(match_props):
+    """
+    Return the match properties as a dictionary of filter arguments, with
+    hyphens in the property names and with the type cast from the property
+    definition applied to the match values.
+    """
     filter_args = {}
     if match_props:
         for prop_name in match_props:
@@ -569,31 +720,220 @@ def identify_adapter(cpc, name, match_props):
                     match_value = type_cast(match_value)
 
             filter_args[prop_name_hmc] = match_value
-    else:
-        filter_args['name'] = name
+    return filter_args
 
-    adapter = cpc.adapters.find(**filter_args)
-    return adapter
+
+def adapter_matches(adapter, filter_args):
+    """
+    Return whether the locally available properties of an adapter match all
+    filter arguments.
+    """
+    for prop_name_hmc, match_value in filter_args.items():
+        actual_value = adapter.properties.get(prop_name_hmc, None)
+        if prop_name_hmc in HEX_MATCH_PROPERTIES:
+            if not eq_hex(actual_value, match_value, prop_name_hmc):
+                return False
+        elif actual_value != match_value:
+            return False
+    return True
+
+
+def find_adapters(cpc, adapter_items):
+    """
+    Identify the target adapters specified in the 'adapters' module parameter
+    using a single list operation for all adapters of the CPC.
+
+    Each target adapter is identified as described for identify_adapter(),
+    using an in-memory index on the name and adapter ID of the listed
+    adapters. The full properties of the candidate adapters are retrieved
+    (concurrently) only if match properties are specified that are not
+    returned by the list operation.
+
+    Returns:
+      tuple (adapters, name_index), where:
+        * adapters: list of zhmcclient.Adapter with the target adapters, in
+          the order of the items.
+        * name_index: dict of all adapters of the CPC by name.
+
+    Raises:
+      ParameterError: An adapter was not found or was not uniquely
+        identified.
+    """
+    all_adapters = cpc.adapters.list()
+    name_index = {adapter.name: adapter for adapter in all_adapters}
+    id_index = {}
+    for adapter in all_adapters:
+        adapter_id = adapter.properties.get('adapter-id', None)
+        if adapter_id:
+            id_index[int(adapter_id, 16)] = adapter
+
+    adapters = []
+    for item in adapter_items:
+        filter_args = match_filter_args(item['match'])
+        if not filter_args:
+            filter_args['name'] = item['name']
+
+        if 'name' in filter_args:
+            candidate = name_index.get(filter_args['name'], None)
+            candidates = [candidate] if candidate else []
+        elif 'adapter-id' in filter_args:
+            try:
+                adapter_id = int(str(filter_args['adapter-id']), 16)
+            except ValueError:
+                raise ParameterError(
+                    "Match value for property 'adapter_id' of adapter "
+                    f"{item['name']!r} is not a valid hex number: "
+                    f"{filter_args['adapter-id']!r}")
+            candidate = id_index.get(adapter_id, None)
+            candidates = [candidate] if candidate else []
+        else:
+            candidates = all_adapters
+
+        pull_candidates = [
+            adapter for adapter in candidates
+            if not adapter.full_properties and
+            any(p not in adapter.properties for p in filter_args)]
+        run_concurrently(
+            lambda adapter: adapter.pull_full_properties(),
+            pull_candidates, ADAPTER_MAX_PARALLEL)
+
+        matching = [adapter for adapter in candidates
+                    if adapter_matches(adapter, filter_args)]
+        if not matching:
+            raise ParameterError(
+                f"Adapter {item['name']!r} was not found in CPC "
+                f"{cpc.name!r} using the match properties {filter_args!r}")
+        if len(matching) > 1:
+            raise ParameterError(
+                f"Adapter {item['name']!r} was not uniquely identified in "
+                f"CPC {cpc.name!r} using the match properties "
+                f"{filter_args!r}: "
+                f"{', '.join(adapter.name for adapter in matching)}")
+        adapters.append(matching[0])
+
+    adapter_uris = [adapter.uri for adapter in adapters]
+    if len(set(adapter_uris)) != len(adapter_uris):
+        raise ParameterError(
+            "Module parameter 'adapters' specifies the same adapter more than "
+            "once.")
+
+    return adapters, name_index
 
 
 def get_adapter_ports(adapter):
     """
-    Retrieve the ports of an adapter from the HMC.
+    Retrieve the ports of an adapter from the HMC. The properties of the
+    ports are retrieved concurrently.
 
     Returns:
       list of dict with all port properties. In case of unconfigured FICON
       adapters, the property list is short (from list()).
     """
     ports = adapter.ports.list()
-    result_ports = []
-    for port in ports:
-        # FICON adapters in unconfigured state reject the "Get Storage Port
-        # Properties" operation with HTTP Error 404,4 "Get for Storage Port
-        # Properties is not supported for this card type".
-        if adapter.get_property('type') != 'not-configured':
-            port.pull_full_properties()
-        result_ports.append(dict(port.properties))
-    return result_ports
+    # FICON adapters in unconfigured state reject the "Get Storage Port
+    # Properties" operation with HTTP Error 404,4 "Get for Storage Port
+    # Properties is not supported for this card type".
+    if adapter.get_property('type') != 'not-configured':
+        run_concurrently(
+            lambda port: port.pull_full_properties(), ports,
+            PORT_MAX_PARALLEL)
+    return [dict(port.properties) for port in ports]
+
+
+def adapter_report(name, changed, status, error=None,
+                   adapter_properties=None):
+    """
+    Return the outcome item for an adapter of the 'adapters' module
+    parameter.
+    """
+    report = {
+        'name': name,
+        'changed': changed,
+        'status': status,
+        'error': error,
+    }
+    if adapter_properties is not None:
+        report['adapter'] = adapter_properties
+    return report
+
+
+def update_adapter(adapter, params, check_mode, name_in_use):
+    """
+    Ensure that the properties specified in the module parameters are set on
+    an existing adapter whose full properties have been retrieved.
+
+    Parameters:
+
+      adapter (zhmcclient.Adapter): The adapter.
+
+      params (dict): Module parameters, or an item of the 'adapters' module
+        parameter.
+
+      check_mode (bool): Check mode.
+
+      name_in_use (callable): Function that is called with a new adapter name
+        in check mode, and returns whether another adapter with that name
+        exists.
+
+    Returns:
+      tuple (changed, result), where result is a dict with the adapter
+      properties (without ports).
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+    changed = False
+    result = dict(adapter.properties)
+
+    # It was identified by name or match properties, so it does exist.
+    # Update its properties and change adapter and crypto type, if
+    # needed.
+    # pylint: disable=unused-variable
+    create_props, update_props, chg_adapter_type, chg_crypto_type = \
+        process_properties(adapter, params)
+
+    if update_props:
+        if not check_mode:
+            retry_operation(adapter, 'update_properties', update_props)
+        else:
+            # Simulate rejection of renaming the adapter if another
+            # adapter with that name already exists.
+            if 'name' in update_props:
+                new_name = update_props['name']
+                if new_name != adapter.name and name_in_use(new_name):
+                    # The exception raised does not need to be a fully
+                    # equipped HTTPError, but just good enough for the
+                    # module to produce its failure message.
+                    raise zhmcclient.HTTPError({
+                        'message': "An adapter with the name specified "
+                        "in the request body already exists on its "
+                        "parent CPC.",
+                        'http-status': 400,
+                        'reason': 8,
+                    })
+            result.update(update_props)  # from input values
+        changed = True
+
+    if chg_adapter_type:
+        if not check_mode:
+            adapter.change_adapter_type(chg_adapter_type)
+        else:
+            result['type'] = chg_adapter_type
+        changed = True
+
+    if chg_crypto_type:
+        if not check_mode:
+            adapter.change_crypto_type(chg_crypto_type)
+        else:
+            result['crypto-type'] = chg_crypto_type
+        changed = True
+
+    if changed and not check_mode:
+        adapter.pull_full_properties()
+        result = dict(adapter.properties)  # from actual values
+
+    return changed, result
 
 
 def ensure_set(params, check_mode):
@@ -611,8 +951,6 @@ def ensure_set(params, check_mode):
     adapter_name = params['name']
     adapter_match = params['match'] or {}
 
-    changed = False
-
     session, logoff = open_session(params)
     try:
         client = zhmcclient.Client(session)
@@ -621,59 +959,19 @@ def ensure_set(params, check_mode):
         # The default exception handling is sufficient for the above.
 
         adapter.pull_full_properties()
-        result = dict(adapter.properties)
-
-        # It was identified by name or match properties, so it does exist.
-        # Update its properties and change adapter and crypto type, if
-        # needed.
-        # pylint: disable=unused-variable
-        create_props, update_props, chg_adapter_type, chg_crypto_type = \
-            process_properties(adapter, params)
-
-        if update_props:
-            if not check_mode:
-                adapter.update_properties(update_props)
-            else:
-                # Simulate rejection of renaming the adapter if another
-                # adapter with that name already exists.
-                if 'name' in update_props:
-                    new_name = update_props['name']
-                    if new_name != adapter.name:
-                        try:
-                            cpc.adapters.find(name=new_name)
-                        except zhmcclient.NotFound:
-                            pass
-                        else:
-                            # The exception raised does not need to be a fully
-                            # equipped HTTPError, but just good enough for the
-                            # module to produce its failure message.
-                            raise zhmcclient.HTTPError({
-                                'message': "An adapter with the name specified "
-                                "in the request body already exists on its "
-                                "parent CPC.",
-                                'http-status': 400,
-                                'reason': 8,
-                            })
-                result.update(update_props)  # from input values
-            changed = True
 
-        if chg_adapter_type:
-            if not check_mode:
-                adapter.change_adapter_type(chg_adapter_type)
-            else:
-                result['type'] = chg_adapter_type
-            changed = True
+        def name_in_use(new_name):
+            """
+            Return whether another adapter with the new name exists.
+            """
+            try:
+                cpc.adapters.find(name=new_name)
+            except zhmcclient.NotFound:
+                return False
+            return True
 
-        if chg_crypto_type:
-            if not check_mode:
-                adapter.change_crypto_type(chg_crypto_type)
-            else:
-                result['crypto-type'] = chg_crypto_type
-            changed = True
-
-        if changed and not check_mode:
-            adapter.pull_full_properties()
-            result = dict(adapter.properties)  # from actual values
+        changed, result = update_adapter(
+            adapter, params, check_mode, name_in_use)
 
         result['ports'] = get_adapter_ports(adapter)
 
@@ -798,7 +1096,7 @@ def ensure_present(params, check_mode):
 
             if update_props:
                 if not check_mode:
-                    adapter.update_properties(update_props)
+                    retry_operation(adapter, 'update_properties', update_props)
                 else:
                     result.update(update_props)  # from input values
                 changed = True
@@ -861,7 +1159,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            adapter.delete()
+            retry_operation(adapter, 'delete')
         changed = True
 
         return changed, result
@@ -884,7 +1182,7 @@ def facts(params, check_mode):
     cpc_name = params['cpc_name']
     adapter_name = params['name']
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
@@ -901,6 +1199,148 @@ def facts(params, check_mode):
         close_session(session, logoff)
 
 
+def ensure_set_multiple(params, check_mode):
+    """
+    Identify the target adapters (that must exist) specified in the 'adapters'
+    module parameter and ensure that the specified properties are set on the
+    adapters, and return the outcome for each adapter.
+
+    The properties of all adapters are checked before any adapter is changed.
+    The adapters are then updated concurrently.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    cpc_name = params['cpc_name']
+    adapter_items = params['adapters']
+
+    session, logoff = open_session(params)
+    try:
+        client = zhmcclient.Client(session)
+        cpc = client.cpcs.find(name=cpc_name)
+        # The default exception handling is sufficient for the above.
+
+        adapters, name_index = find_adapters(cpc, adapter_items)
+        run_concurrently(
+            lambda adapter: adapter.pull_full_properties(),
+            [adapter for adapter in adapters if not adapter.full_properties],
+            ADAPTER_MAX_PARALLEL)
+
+        # Check the properties of all adapters before changing any adapter
+        for item, adapter in zip(adapter_items, adapters):
+            process_properties(adapter, item)
+
+        def name_in_use(new_name):
+            """
+            Return whether an adapter with the new name exists.
+            """
+            return new_name in name_index
+
+        def set_adapter(target):
+            """
+            Ensure that the properties are set on the adapter and return the
+            outcome for the adapter.
+            """
+            item, adapter = target
+            changed = False
+            try:
+                changed, result = update_adapter(
+                    adapter, item, check_mode, name_in_use)
+                result['ports'] = get_adapter_ports(adapter)
+            except (Error, zhmcclient.Error) as exc:
+                return adapter_report(item['name'], changed, 'failed',
+                                      str(exc))
+            return adapter_report(item['name'], changed, 'complete',
+                                  adapter_properties=result)
+
+        reports = run_concurrently(
+            set_adapter, list(zip(adapter_items, adapters)),
+            ADAPTER_MAX_PARALLEL)
+        changed = any(report['changed'] for report in reports)
+        return changed, reports
+
+    finally:
+        close_session(session, logoff)
+
+
+def facts_multiple(params, check_mode):
+    # pylint: disable=unused-argument
+    """
+    Identify the target adapters specified in the 'adapters' module parameter
+    and return facts about the adapters and their ports, as the outcome for
+    each adapter.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    cpc_name = params['cpc_name']
+    adapter_items = params['adapters']
+
+    session, logoff = open_session(params, read_only=True)
+    try:
+        client = zhmcclient.Client(session)
+        cpc = client.cpcs.find(name=cpc_name)
+        # The default exception handling is sufficient for the above.
+
+        adapters, _ = find_adapters(cpc, adapter_items)
+
+        def get_adapter(target):
+            """
+            Return the outcome for the adapter, with its properties and ports.
+            """
+            item, adapter = target
+            try:
+                if not adapter.full_properties:
+                    adapter.pull_full_properties()
+                result = dict(adapter.properties)
+                result['ports'] = get_adapter_ports(adapter)
+            except zhmcclient.Error as exc:
+                return adapter_report(item['name'], False, 'failed', str(exc))
+            return adapter_report(item['name'], False, 'complete',
+                                  adapter_properties=result)
+
+        reports = run_concurrently(
+            get_adapter, list(zip(adapter_items, adapters)),
+            ADAPTER_MAX_PARALLEL)
+        return False, reports
+
+    finally:
+        close_session(session, logoff)
+
+
+def check_target_params(params):
+    """
+    Check the module parameters that specify the target adapters.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+    """
+    if params['adapters'] is None:
+        if params['name'] is None:
+            raise ParameterError(
+                "One of the 'name' and 'adapters' module parameters must be "
+                "specified.")
+        return
+    for param_name in ('name', 'match', 'properties'):
+        if params[param_name] is not None:
+            raise ParameterError(
+                f"The {param_name!r} module parameter is mutually exclusive "
+                "with the 'adapters' module parameter.")
+    if params['state'] not in ('set', 'facts'):
+        raise ParameterError(
+            "The 'adapters' module parameter is supported only for "
+            f"state=set and state=facts, but state={params['state']} was "
+            "specified.")
+    adapter_names = [item['name'] for item in params['adapters']]
+    if len(set(adapter_names)) != len(adapter_names):
+        raise ParameterError(
+            "Module parameter 'adapters' specifies duplicate adapter names.")
+
+
 def perform_task(params, check_mode):
     """
     Perform the task for this module, dependent on the 'state' module
@@ -913,6 +1353,14 @@ def perform_task(params, check_mode):
       ParameterError: An issue with the module parameters.
       zhmcclient.Error: Any zhmcclient exception can happen.
     """
+    check_target_params(params)
+    if params['adapters'] is not None:
+        multiple_actions = {
+            "set": ensure_set_multiple,
+            "facts": facts_multiple,
+        }
+        return multiple_actions[params['state']](params, check_mode)
+
     actions = {
         "set": ensure_set,
         "present": ensure_present,
@@ -922,6 +1370,14 @@ def perform_task(params, check_mode):
     return actions[params['state']](params, check_mode)
 
 
+# Suboptions of the 'adapters' module parameter
+ADAPTER_OPTIONS = dict(
+    name=dict(required=True, type='str'),
+    match=dict(required=False, type='dict', default=None),
+    properties=dict(required=False, type='dict', default=None),
+)
+
+
 def main():
     """Main function"""
 
@@ -931,11 +1387,13 @@ def main():
         hmc_host=dict(required=True, type='raw'),
         hmc_auth=hmc_auth_parameter(),
         cpc_name=dict(required=True, type='str'),
-        name=dict(required=True, type='str'),
+        name=dict(required=False, type='str', default=None),
         match=dict(required=False, type='dict', default=None),
         state=dict(required=True, type='str',
                    choices=['set', 'present', 'absent', 'facts']),
         properties=dict(required=False, type='dict', default=None),
+        adapters=dict(required=False, type='list', elements='dict',
+                      options=ADAPTER_OPTIONS, default=None),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -970,14 +1428,29 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
+    if module.params['adapters'] is not None:
+        failed_names = [r['name'] for r in result
+                        if r['status'] != 'complete']
+        if failed_names:
+            msg = (f"Ensuring state={module.params['state']} has not "
+                   f"completed for {len(failed_names)} of {len(result)} "
+                   f"adapters: {', '.join(failed_names)}")
+            LOGGER.debug("Module exit (failure): msg: %r, adapters: %r",
+                         msg, result)
+            module.fail_json(msg=msg, adapters=result, **module_result_items())
+        LOGGER.debug(
+            "Module exit (success): changed: %r, adapters: %r",
+            changed, result)
+        module.exit_json(
+            changed=changed, adapters=result, **module_result_items())
+
     LOGGER.debug(
         "Module exit (success): changed: %r, adapter: %r", changed, result)
-    module.exit_json(
-        changed=changed, adapter=result)
+    module.exit_json(changed=changed, adapter=result, **module_result_items())
 
 
 if __name__ == '__main__':
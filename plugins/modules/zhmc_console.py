@@ -126,6 +126,20 @@ options:
     type: int
     required: false
     default: 3600
+  upgrade_wait:
+    description:
+      - "Controls whether the module waits for completion of the upgrade, for
+         O(state=upgrade)."
+      - "If True (default), the module waits until the upgrade has completed,
+         using O(upgrade_timeout)."
+      - "If False, the module returns once the upgrade has been submitted to
+         the HMC, and returns the URI of the HMC job in RV(job_uris). The
+         completion of the job can be awaited with the
+         R(zhmc_job module,zhmc_job_module). The returned facts then reflect
+         the state before the upgrade."
+    type: bool
+    required: false
+    default: true
   backup_location_type:
     description:
       - "Type of backup location for the HMC backup that is performed:"
@@ -192,6 +206,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+job_uris:
+  description:
+    - "URIs of the HMC jobs of the operations that were submitted without
+       waiting for their completion, for O(upgrade_wait=false). Not returned
+       if no such operations were submitted."
+  returned: success
+  type: list
+  elements: str
+  sample:
+    [
+      "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a"
+    ]
 hmc:
   description: "The facts about the HMC."
   returned: success
@@ -238,7 +264,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, \
-    common_fail_on_import_errors, parse_hmc_host, blanked_params  # noqa: E402
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    SUBMITTED_JOBS, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -275,7 +302,7 @@ def facts(module):
       zhmcclient.Error: Any zhmcclient exception can happen.
     """
 
-    session, logoff = open_session(module.params)
+    session, logoff = open_session(module.params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         console = client.consoles.console
@@ -303,6 +330,7 @@ def upgrade(module):
     module.fail_on_missing_params(['bundle_level'])
     bundle_level = module.params['bundle_level']
     upgrade_timeout = module.params['upgrade_timeout']
+    upgrade_wait = module.params['upgrade_wait']
     accept_firmware = module.params['accept_firmware']
     backup_location_type = module.params['backup_location_type']
 
@@ -326,12 +354,15 @@ def upgrade(module):
             # This may restart the HMC, but zhmcclient will re-establish the
             # session.
             try:
-                console.single_step_install(
+                job = console.single_step_install(
                     bundle_level=bundle_level,
                     accept_firmware=accept_firmware,
                     backup_location_type=backup_location_type,
-                    wait_for_completion=True,
+                    wait_for_completion=upgrade_wait,
                     operation_timeout=upgrade_timeout)
+                if not upgrade_wait:
+                    # The job is returned to be awaited later.
+                    SUBMITTED_JOBS.add(job)
                 changed = True
             except zhmcclient.HTTPError as exc:
                 if exc.http_status == 400 and exc.reason == 356:
@@ -380,6 +411,7 @@ def main():
         state=dict(required=True, type='str', choices=['facts', 'upgrade']),
         bundle_level=dict(required=False, type='str', default=None),
         upgrade_timeout=dict(required=False, type='int', default=3600),
+        upgrade_wait=dict(required=False, type='bool', default=True),
         backup_location_type=dict(
             required=False, type='str', choices=['ftp', 'usb'], default='usb'),
         accept_firmware=dict(required=False, type='bool', default=True),
@@ -416,14 +448,14 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, hmc: %r",
                  changed, result)
     module.exit_json(
-        changed=changed, hmc=result)
+        changed=changed, hmc=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -113,9 +113,41 @@ options:
         default: true
   name:
     description:
-      - The name of the target CPC.
+      - "The name of the target CPC."
+      - "Required, unless O(names) is specified."
     type: str
-    required: true
+    required: false
+    default: null
+  names:
+    description:
+      - "The names of multiple target CPCs, for O(state=active),
+         O(state=inactive) and O(state=upgrade). Mutually exclusive with
+         O(name)."
+      - "For O(state=active) and O(state=inactive), the status of all
+         specified CPCs is checked before any of them is activated or
+         deactivated. The activations or deactivations are then started for
+         all CPCs at once, and their completion is awaited together within
+         O(operation_timeout). For O(state=active), the specified
+         O(properties) are set on each CPC as soon as it is active."
+      - "For O(state=upgrade), the CPCs are upgraded in the specified order,
+         in waves of up to O(upgrade_max_parallel) CPCs that are upgraded
+         concurrently. The next wave is started only if all CPCs of the
+         previous wave have been upgraded and are healthy, i.e. they
+         communicate with the HMC and their status is acceptable. Otherwise,
+         the remaining CPCs are skipped. The upgrade jobs in progress are
+         recorded on the system running the module, in the directory
+         specified by the E(ZHMC_GOVERNOR_DIR) environment variable, so that
+         running the module again after an interruption resumes awaiting
+         them instead of starting new upgrades. For resuming after a restart
+         of that system, the directory must persist across restarts. CPCs
+         that have already been upgraded are not changed again."
+      - "The outcome for each CPC is returned in RV(cpcs). If the operation
+         fails, does not complete in time, or is skipped for any of the
+         CPCs, the module fails and returns RV(cpcs)."
+    type: list
+    elements: str
+    required: false
+    default: null
   state:
     description:
       - "The desired state for the CPC. All states are fully idempotent
@@ -142,7 +174,8 @@ options:
       - "This parameter is ignored for O(state) values that cause no properties
          to be returned."
       - "The returned child resources (adapters, partitions, storage groups)
-         cannot be excluded using this parameter."
+         cannot be excluded using this parameter. Use the O(include)
+         parameter for that."
       - "The specified properties are passed to the 'Get CPC Properties' HMC
          operation using the 'properties' query parameter and save time for
          the HMC to pull together all properties."
@@ -150,6 +183,43 @@ options:
     elements: str
     required: false
     default: null
+  include:
+    description:
+      - "The child resources of the CPC that are returned in the result, for
+         O(state=active|set|facts|upgrade)."
+      - "The child resources are listed concurrently, with one list operation
+         per selected kind of child resource."
+      - "An empty list causes no child resources to be returned, which saves
+         the list operations."
+    type: list
+    elements: str
+    choices: ['partitions', 'adapters', 'storage_groups']
+    required: false
+    default: ['partitions', 'adapters', 'storage_groups']
+  include_additional_properties:
+    description:
+      - "Additional properties to be returned for the child resources, in
+         addition to the subset of their properties that is returned by
+         default (see the result description)."
+      - "The parameter is a dictionary. The key of each dictionary item is
+         the kind of child resource (V(partitions) or V(adapters)), and the
+         value is a list of property names for that kind of child resource,
+         with underscores instead of hyphens."
+      - "The additional properties are passed to the list operation of the
+         child resources using the 'additional-properties' query parameter,
+         which was added in HMC version 2.16.0."
+      - "Storage groups do not support additional properties."
+    type: dict
+    required: false
+    default: null
+  operation_timeout:
+    description:
+      - "Timeout in seconds for the completion of the activations or
+         deactivations of the CPCs specified in O(names). The timeout applies
+         to all CPCs together."
+    type: int
+    required: false
+    default: 3600
   activation_profile_name:
     description:
       - "The name of the reset activation profile to be used when activating the
@@ -188,9 +258,32 @@ options:
   upgrade_timeout:
     description:
       - "Timeout in seconds for waiting for completion of upgrade (e.g. 10800)"
+      - "With O(names), the timeout applies to each wave of upgrades."
     type: int
     required: false
     default: 10800
+  upgrade_wait:
+    description:
+      - "Controls whether the module waits for completion of the upgrade, for
+         O(state=upgrade)."
+      - "If True (default), the module waits until the upgrade has completed,
+         using O(upgrade_timeout)."
+      - "If False, the module returns once the upgrade has been submitted to
+         the HMC, and returns the URI of the HMC job in RV(job_uris). The
+         completion of the job can be awaited with the
+         R(zhmc_job module,zhmc_job_module). The returned facts then reflect
+         the state before the upgrade."
+      - "Must be True if O(names) is specified."
+    type: bool
+    required: false
+    default: true
+  upgrade_max_parallel:
+    description:
+      - "Maximum number of CPCs that are upgraded concurrently in a wave, for
+         O(state=upgrade) with O(names)."
+    type: int
+    required: false
+    default: 1
   accept_firmware:
     description:
       - "Accept the previous bundle level before installing the new level."
@@ -226,6 +319,20 @@ EXAMPLES = """
     state: facts
   register: cpc1
 
+- name: Gather facts about the CPC and its partitions with their CPU counts
+  zhmc_cpc:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    name: "{{ my_cpc_name }}"
+    state: facts
+    include:
+      - partitions
+    include_additional_properties:
+      partitions:
+        - ifl_processors
+        - cp_processors
+  register: cpc1
+
 - name: Ensure the CPC is inactive
   zhmc_cpc:
     hmc_host: "{{ my_hmc_host }}"
@@ -241,6 +348,16 @@ EXAMPLES = """
     state: active
   register: cpc1
 
+- name: Ensure multiple CPCs in DPM mode are active, activating them together
+  zhmc_cpc:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    names: "{{ my_cpc_names }}"
+    state: active
+    operation_timeout: 3600
+    include: []
+  register: cpcs1
+
 - name: Ensure the CPC has the desired property values
   zhmc_cpc:
     hmc_host: "{{ my_hmc_host }}"
@@ -262,6 +379,18 @@ EXAMPLES = """
     bundle_level: "S71"
     upgrade_timeout: 10800
   register: cpc1
+
+- name: Upgrade the SE firmware of multiple CPCs, two at a time
+  zhmc_cpc:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    names: "{{ my_cpc_names }}"
+    state: upgrade
+    bundle_level: "S71"
+    upgrade_timeout: 10800
+    upgrade_max_parallel: 2
+    include: []
+  register: cpcs1
 """
 
 RETURN = """
@@ -274,12 +403,100 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates of the CPC and of the
+       submissions of its activation or deactivation (method names start,
+       stop, activate, deactivate) upon transient HMC errors, by operation
+       (method name and resource URI). Not returned if no operations were
+       retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/cpcs/8805ebb6-cbab-11f1-9b2b-fa163e1c2d3b": 1,
+      "start /api/cpcs/8805ebb6-cbab-11f1-9b2b-fa163e1c2d3b": 2
+    }
+cpcs:
+  description:
+    - "For O(names), the outcome of the activation, deactivation or upgrade
+       for each CPC, in the order of O(names)."
+    - "In case of a failure because the operation has failed, timed out or
+       was skipped for any of the CPCs, this is also returned."
+  returned: success or failure, when O(names) is specified
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: "CPC name"
+      type: str
+    changed:
+      description: "Indicates whether the CPC was activated, deactivated or
+        upgraded, or whether its properties were changed."
+      type: bool
+    status:
+      description:
+        - "Outcome for the CPC. One of:"
+        - "'complete' - The CPC is in the desired state."
+        - "'failed' - The activation, deactivation or property update has
+           failed."
+        - "'timeout' - The activation or deactivation has not completed
+           within O(operation_timeout), or the upgrade has not completed
+           within O(upgrade_timeout). A timed out upgrade continues on the
+           HMC and is awaited again when the module is run again."
+        - "'unhealthy' - The upgrade has completed, but the CPC does not
+           communicate with the HMC or its status is not acceptable."
+        - "'skipped' - The upgrade was not started because a CPC of a
+           previous wave was not upgraded successfully."
+      type: str
+    error:
+      description: "Error message, if the status is 'failed' or 'timeout'.
+        Otherwise, null."
+      type: str
+    duration:
+      description: "Time in seconds from starting the operation on the CPC
+        until the CPC was in the desired state and had its properties set."
+      type: float
+    cpc:
+      description: "The resource properties of the CPC after the properties
+        have been set or after the upgrade, plus the child resources as
+        described for RV(cpc). Only present for O(state=active) and
+        O(state=upgrade) if the status is 'complete'."
+      type: dict
+  sample:
+    [
+        {
+            "name": "CPCA",
+            "changed": true,
+            "status": "complete",
+            "error": null,
+            "duration": 612.4,
+            "cpc": {
+                "name": "CPCA",
+                "status": "active"
+            }
+        }
+    ]
+job_uris:
+  description:
+    - "URIs of the HMC jobs of the operations that were submitted without
+       waiting for their completion, for O(upgrade_wait=false). Not returned
+       if no such operations were submitted."
+  returned: success
+  type: list
+  elements: str
+  sample:
+    [
+      "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a"
+    ]
 cpc:
   description:
     - "For O(state=inactive), an empty dictionary."
     - "For O(state=active|set|facts|upgrade), the resource properties of the
        CPC after after any specified updates have been applied, and its
-       adapters, partitions, and storage groups."
+       adapters, partitions, and storage groups as selected with the
+       O(include) parameter."
   returned: success
   type: dict
   contains:
@@ -293,7 +510,9 @@ cpc:
       type: raw
     adapters:
       description: "The adapters of the CPC, with a subset of their
-        properties. For details, see the R(HMC API,HMC API) book."
+        properties and the properties specified in
+        O(include_additional_properties). For details, see the
+        R(HMC API,HMC API) book. Only present if selected in O(include)."
       type: list
       elements: dict
       contains:
@@ -317,7 +536,9 @@ cpc:
           type: str
     partitions:
       description: "The defined partitions of the CPC, with a subset of their
-        properties. For details, see the R(HMC API,HMC API) book."
+        properties and the properties specified in
+        O(include_additional_properties). For details, see the
+        R(HMC API,HMC API) book. Only present if selected in O(include)."
       type: list
       elements: dict
       contains:
@@ -335,7 +556,8 @@ cpc:
           type: str
     storage-groups:
       description: "The storage groups associated with the CPC, with a subset
-        of their properties. For details, see the R(HMC API,HMC API) book."
+        of their properties. For details, see the R(HMC API,HMC API) book.
+        Only present if selected in O(include)."
       type: list
       elements: dict
       contains:
@@ -411,13 +633,16 @@ cpc:
 
 import logging  # noqa: E402
 import traceback  # noqa: E402
+import time  # noqa: E402
 from ansible.module_utils.basic import AnsibleModule, \
     missing_required_lib  # noqa: E402
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, StatusError, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, pull_properties, \
-    parse_hmc_host, blanked_params  # noqa: E402
+    parse_hmc_host, blanked_params, run_concurrently, Deadline, JobJournal, \
+    wait_for_job_completion, SUBMITTED_JOBS, module_result_items, \
+    retry_operation, retry_job_submission  # noqa: E402
 
 try:
     import zhmcclient
@@ -430,6 +655,28 @@ LOGGER_NAME = 'zhmc_cpc'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
+# CPC status values of an inactive CPC
+INACTIVE_STATUSES = ('not-operating', 'no-power')
+
+# CPC status values of an active CPC
+ACTIVE_STATUSES = ('active', 'operating', 'exceptions', 'service-required',
+                   'degraded', 'acceptable', 'service')
+
+# CPC status values of a CPC that does not communicate with the HMC
+UNREACHABLE_STATUSES = ('not-communicating', 'status-check')
+
+# Maximum number of concurrent CPC activations or deactivations that are
+# started for the 'names' module parameter.
+CPC_MAX_PARALLEL = 10
+
+# Kinds of child resources that can be selected with the 'include' module
+# parameter, and whether they support additional properties.
+INCLUDE_CHILDREN = {
+    'partitions': True,
+    'adapters': True,
+    'storage_groups': False,
+}
+
 # Dictionary of properties of CPC resources, in this format:
 #   name: (allowed, create, update, eq_func, type_cast)
 # where:
@@ -532,12 +779,44 @@ def process_properties(cpc, params):
     return update_props
 
 
-def add_artificial_properties(cpc_properties, cpc):
+def check_include_params(params):
+    """
+    Check the 'include_additional_properties' module parameter.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+    """
+    include = params['include']
+    include_add_props = params['include_additional_properties'] or {}
+    for child, prop_names in include_add_props.items():
+        if child not in INCLUDE_CHILDREN:
+            raise ParameterError(
+                f"Invalid child resource {child!r} in the "
+                "'include_additional_properties' module parameter. Valid "
+                f"values are: {', '.join(INCLUDE_CHILDREN)}")
+        if not INCLUDE_CHILDREN[child]:
+            raise ParameterError(
+                f"Child resource {child!r} does not support additional "
+                "properties in the 'include_additional_properties' module "
+                "parameter.")
+        if child not in include:
+            raise ParameterError(
+                f"Child resource {child!r} is specified in the "
+                "'include_additional_properties' module parameter but not in "
+                "the 'include' module parameter.")
+        if not isinstance(prop_names, list):
+            raise ParameterError(
+                f"The value for child resource {child!r} in the "
+                "'include_additional_properties' module parameter must be a "
+                f"list of property names, but is: {prop_names!r}")
+
+
+def add_artificial_properties(cpc_properties, cpc, params):
     """
     Add artificial properties to the CPC properties.
 
     Upon return, the cpc_properties dict has been extended by these artificial
-    properties:
+    properties, if selected in the 'include' module parameter:
 
     * 'partitions': List of partitions of the CPC, with the list subset of
       their properties.
@@ -547,17 +826,34 @@ def add_artificial_properties(cpc_properties, cpc):
 
     * 'storage-groups': List of storage groups attached to the partition, with
       the list subset of their properties.
-    """
-    partitions = cpc.partitions.list()
-    cpc_properties['partitions'] = [dict(p.properties) for p in partitions]
 
-    adapters = cpc.adapters.list()
-    cpc_properties['adapters'] = [dict(a.properties) for a in adapters]
+    The list subset of properties is extended by the properties specified in
+    the 'include_additional_properties' module parameter.
 
-    storage_groups = cpc.manager.console.storage_groups.list(
-        filter_args={'cpc-uri': cpc.uri})
-    cpc_properties['storage-groups'] = [dict(sg.properties)
-                                        for sg in storage_groups]
+    The selected child resources are listed concurrently.
+    """
+    include = params['include']
+    include_add_props = params['include_additional_properties'] or {}
+
+    def list_children(child):
+        add_props = include_add_props.get(child)
+        if add_props:
+            add_props = [p.replace('_', '-') for p in add_props]
+        else:
+            add_props = None
+        if child == 'partitions':
+            children = cpc.partitions.list(additional_properties=add_props)
+        elif child == 'adapters':
+            children = cpc.adapters.list(additional_properties=add_props)
+        else:  # storage_groups
+            children = cpc.manager.console.storage_groups.list(
+                filter_args={'cpc-uri': cpc.uri})
+        return [dict(c.properties) for c in children]
+
+    children_list = run_concurrently(
+        list_children, include, len(INCLUDE_CHILDREN))
+    for child, children in zip(include, children_list):
+        cpc_properties[child.replace('_', '-')] = children
 
 
 def update_cpc_properties(cpc, params, check_mode):
@@ -581,7 +877,7 @@ def update_cpc_properties(cpc, params, check_mode):
 
     if update_props:
         if not check_mode:
-            cpc.update_properties(update_props)
+            retry_operation(cpc, 'update_properties', update_props)
         # Some updates of CPC properties are not reflected in a new
         # retrieval of properties until after a few seconds (usually the
         # second retrieval).
@@ -617,25 +913,25 @@ def ensure_active(module):
 
         # Activate the CPC
         cpc_status = cpc.get_property('status')
-        if cpc_status in ('not-operating', 'no-power'):
+        if cpc_status in INACTIVE_STATUSES:
             # CPC is inactive
             if not module.check_mode:
                 cpc_dpm_enabled = cpc.get_property('dpm-enabled')
                 if cpc_dpm_enabled:
-                    cpc.start()
+                    job = retry_job_submission(cpc, 'start')
                 else:
                     if not activation_profile_name:
                         raise ParameterError(
                             f"CPC {cpc_name!r} is in classic mode and "
                             "activation requires the 'activation_profile_name' "
                             "parameter to be specified")
-                    cpc.activate(
+                    job = retry_job_submission(
+                        cpc, 'activate',
                         activation_profile_name=activation_profile_name,
                         force=True)
+                wait_for_job_completion(job)
             changed = True
-        elif cpc_status in ('active', 'operating', 'exceptions',
-                            'service-required', 'degraded', 'acceptable',
-                            'service'):
+        elif cpc_status in ACTIVE_STATUSES:
             # CPC is already active
             pass
         else:
@@ -650,7 +946,7 @@ def ensure_active(module):
             cpc, module.params, module.check_mode)
         changed |= _changed
 
-        add_artificial_properties(cpc_properties, cpc)
+        add_artificial_properties(cpc_properties, cpc, module.params)
 
         return changed, cpc_properties
 
@@ -680,18 +976,17 @@ def ensure_inactive(module):
 
         # Inactivate the CPC
         cpc_status = cpc.get_property('status')
-        if cpc_status in ('not-operating', 'no-power'):
+        if cpc_status in INACTIVE_STATUSES:
             # Already inactive
             pass
-        elif cpc_status in ('active', 'operating', 'exceptions',
-                            'service-required', 'degraded', 'acceptable',
-                            'service'):
+        elif cpc_status in ACTIVE_STATUSES:
             if not module.check_mode:
                 cpc_dpm_enabled = cpc.get_property('dpm-enabled')
                 if cpc_dpm_enabled:
-                    cpc.stop()
+                    job = retry_job_submission(cpc, 'stop')
                 else:
-                    cpc.deactivate(force=True)
+                    job = retry_job_submission(cpc, 'deactivate', force=True)
+                wait_for_job_completion(job)
             changed = True
         else:
             # cpc_status in ('not-communicating', 'status-check')
@@ -706,6 +1001,177 @@ def ensure_inactive(module):
         close_session(session, logoff)
 
 
+def cpc_report(name, changed, status, duration, error=None,
+               cpc_properties=None):
+    """
+    Return the outcome item for the activation or deactivation of a CPC.
+    """
+    report = {
+        'name': name,
+        'changed': changed,
+        'status': status,
+        'error': error,
+        'duration': round(duration, 1),
+    }
+    if cpc_properties is not None:
+        report['cpc'] = cpc_properties
+    return report
+
+
+def find_cpcs(client, cpc_names):
+    """
+    Return the CPCs with the specified names, in the order of the names,
+    using a single list operation.
+
+    Raises:
+      ParameterError: A CPC does not exist or is not managed by the HMC.
+    """
+    managed_cpcs = {cpc.name: cpc for cpc in client.cpcs.list()}
+    cpcs = []
+    for cpc_name in cpc_names:
+        try:
+            cpcs.append(managed_cpcs[cpc_name])
+        except KeyError:
+            raise ParameterError(
+                f"CPC {cpc_name!r} does not exist or is not managed by the "
+                "HMC.")
+    return cpcs
+
+
+def ensure_multiple(module):
+    """
+    Ensure that multiple CPCs are active or inactive, and return the outcome
+    for each CPC.
+
+    The status of all CPCs is checked before any CPC is activated or
+    deactivated. The activations or deactivations are then started
+    concurrently, and their completion is awaited concurrently within the
+    shared timeout 'operation_timeout'. For state=active, the properties are
+    set on each CPC as soon as its activation has completed.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      StatusError: A CPC is in a status that does not allow the operation.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    cpc_names = module.params['names']
+    state = module.params['state']
+    activation_profile_name = module.params['activation_profile_name']
+    operation_timeout = module.params['operation_timeout']
+    check_mode = module.check_mode
+
+    if len(set(cpc_names)) != len(cpc_names):
+        raise ParameterError(
+            "Module parameter 'names' specifies duplicate CPC names.")
+
+    session, logoff = open_session(module.params)
+    try:
+        client = zhmcclient.Client(session)
+        cpcs = find_cpcs(client, cpc_names)
+
+        run_concurrently(
+            lambda cpc: cpc.pull_properties(['status', 'dpm-enabled']),
+            cpcs, CPC_MAX_PARALLEL)
+
+        # Check the status of all CPCs before starting any operation
+        pending_cpcs = []
+        for cpc in cpcs:
+            cpc_status = cpc.get_property('status')
+            if state == 'active':
+                if cpc_status in INACTIVE_STATUSES:
+                    if not cpc.get_property('dpm-enabled') and \
+                            not activation_profile_name:
+                        raise ParameterError(
+                            f"CPC {cpc.name!r} is in classic mode and "
+                            "activation requires the "
+                            "'activation_profile_name' parameter to be "
+                            "specified")
+                    pending_cpcs.append(cpc)
+                elif cpc_status not in ACTIVE_STATUSES:
+                    raise StatusError(
+                        f"CPC {cpc.name!r} cannot be activated because it is "
+                        f"in status {cpc_status!r}")
+            else:
+                if cpc_status in ACTIVE_STATUSES:
+                    pending_cpcs.append(cpc)
+                elif cpc_status not in INACTIVE_STATUSES:
+                    raise StatusError(
+                        f"CPC {cpc.name!r} cannot be deactivated because it "
+                        f"is in status {cpc_status!r}")
+
+        def start_operation(cpc):
+            """
+            Start the activation or deactivation of the CPC and return a
+            tuple (start_time, job or exception). In check mode, the job is
+            None.
+            """
+            start_time = time.time()
+            if check_mode:
+                return start_time, None
+            dpm_enabled = cpc.get_property('dpm-enabled')
+            try:
+                if state == 'active' and dpm_enabled:
+                    job = retry_job_submission(cpc, 'start')
+                elif state == 'active':
+                    job = retry_job_submission(
+                        cpc, 'activate',
+                        activation_profile_name=activation_profile_name,
+                        force=True)
+                elif dpm_enabled:
+                    job = retry_job_submission(cpc, 'stop')
+                else:
+                    job = retry_job_submission(cpc, 'deactivate', force=True)
+            except zhmcclient.Error as exc:
+                return start_time, exc
+            return start_time, job
+
+        started = dict(zip(
+            [cpc.name for cpc in pending_cpcs],
+            run_concurrently(start_operation, pending_cpcs, CPC_MAX_PARALLEL)))
+
+        deadline = Deadline(operation_timeout)
+
+        def complete_operation(cpc):
+            """
+            Await the activation or deactivation of the CPC, set its
+            properties for state=active, and return the outcome for the CPC.
+            """
+            changed = cpc.name in started
+            start_time, job = started.get(cpc.name, (time.time(), None))
+            if isinstance(job, zhmcclient.Error):
+                # The operation could not be started
+                return cpc_report(cpc.name, False, 'failed',
+                                  time.time() - start_time, str(job))
+            try:
+                if job is not None:
+                    wait_for_job_completion(job, operation_timeout, deadline)
+                cpc_properties = None
+                if state == 'active':
+                    _changed, cpc_properties = update_cpc_properties(
+                        cpc, module.params, check_mode)
+                    changed |= _changed
+                    add_artificial_properties(
+                        cpc_properties, cpc, module.params)
+            except zhmcclient.OperationTimeout as exc:
+                return cpc_report(cpc.name, changed, 'timeout',
+                                  time.time() - start_time, str(exc))
+            except (Error, zhmcclient.Error) as exc:
+                return cpc_report(cpc.name, changed, 'failed',
+                                  time.time() - start_time, str(exc))
+            return cpc_report(cpc.name, changed, 'complete',
+                              time.time() - start_time,
+                              cpc_properties=cpc_properties)
+
+        # Awaiting the jobs mostly sleeps, so all CPCs are awaited at once
+        reports = run_concurrently(complete_operation, cpcs, len(cpcs))
+        changed = any(report['changed'] for report in reports)
+        return changed, reports
+
+    finally:
+        close_session(session, logoff)
+
+
 def ensure_set(module):
     """
     Identify the target CPC and ensure that the specified properties are set on
@@ -732,7 +1198,7 @@ def ensure_set(module):
             cpc, module.params, module.check_mode)
         changed |= _changed
 
-        add_artificial_properties(cpc_properties, cpc)
+        add_artificial_properties(cpc_properties, cpc, module.params)
 
         return changed, cpc_properties
 
@@ -753,7 +1219,7 @@ def facts(module):
     cpc_name = module.params['name']
     select_prop_names = module.params['select_properties']  # with underscores
 
-    session, logoff = open_session(module.params)
+    session, logoff = open_session(module.params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
@@ -762,7 +1228,7 @@ def facts(module):
         pull_properties(cpc, select_prop_names)
         cpc_properties = dict(cpc.properties)
 
-        add_artificial_properties(cpc_properties, cpc)
+        add_artificial_properties(cpc_properties, cpc, module.params)
 
         return False, cpc_properties
 
@@ -770,6 +1236,23 @@ def facts(module):
         close_session(session, logoff)
 
 
+def check_upgrade_support(console):
+    """
+    Check that the HMC supports firmware upgrades through the Web Services
+    API.
+
+    Raises:
+      ParameterError: The HMC does not support firmware upgrades.
+    """
+    ec_mcl = console.prop('ec-mcl-description')
+    hmc_bundle_level = ec_mcl.get('bundle-level', None)
+    if hmc_bundle_level is None:
+        hmc_version = console.prop('version')
+        raise ParameterError(
+            f"HMC version {hmc_version} does not support firmware upgrade "
+            "through the Web Services API")
+
+
 def upgrade(module):
     """
     Upgrades the firmware of the SE of this CPC to a new bundle level.
@@ -782,6 +1265,7 @@ def upgrade(module):
     module.fail_on_missing_params(['bundle_level'])
     bundle_level = module.params['bundle_level']
     upgrade_timeout = module.params['upgrade_timeout']
+    upgrade_wait = module.params['upgrade_wait']
     accept_firmware = module.params['accept_firmware']
     cpc_name = module.params['name']
     select_prop_names = module.params['select_properties']  # with underscores
@@ -793,23 +1277,20 @@ def upgrade(module):
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
 
-        ec_mcl = console.prop('ec-mcl-description')
-        hmc_bundle_level = ec_mcl.get('bundle-level', None)
-        if hmc_bundle_level is None:
-            hmc_version = console.prop('version')
-            raise ParameterError(
-                f"HMC version {hmc_version} does not support firmware upgrade "
-                "through the Web Services API")
+        check_upgrade_support(console)
 
         changed = False
 
         if not module.check_mode:
             try:
-                cpc.single_step_install(
+                job = cpc.single_step_install(
                     bundle_level=bundle_level,
                     accept_firmware=accept_firmware,
-                    wait_for_completion=True,
+                    wait_for_completion=upgrade_wait,
                     operation_timeout=upgrade_timeout)
+                if not upgrade_wait:
+                    # The job is returned to be awaited later.
+                    SUBMITTED_JOBS.add(job)
                 changed = True
             except zhmcclient.HTTPError as exc:
                 if exc.http_status == 400 and exc.reason == 356:
@@ -821,7 +1302,7 @@ def upgrade(module):
         pull_properties(cpc, select_prop_names)
         cpc_properties = dict(cpc.properties)
 
-        add_artificial_properties(cpc_properties, cpc)
+        add_artificial_properties(cpc_properties, cpc, module.params)
 
         return changed, cpc_properties
 
@@ -829,6 +1310,164 @@ def upgrade(module):
         close_session(session, logoff)
 
 
+def upgrade_multiple(module):
+    """
+    Upgrade the firmware of the SEs of multiple CPCs to a new bundle level in
+    waves, and return the outcome for each CPC.
+
+    The CPCs are upgraded in the order of 'names', in waves of up to
+    'upgrade_max_parallel' CPCs whose upgrades run concurrently. Each
+    upgrade is submitted as an HMC job whose status is polled within the
+    per-wave timeout 'upgrade_timeout'. The next wave is started only if all
+    CPCs of the previous wave have been upgraded and are healthy. Otherwise,
+    the remaining CPCs are skipped.
+
+    The upgrade jobs in progress are recorded in a JobJournal, so that
+    running the module again after an interruption resumes awaiting them
+    instead of submitting new upgrades.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    module.fail_on_missing_params(['bundle_level'])
+    cpc_names = module.params['names']
+    bundle_level = module.params['bundle_level']
+    upgrade_timeout = module.params['upgrade_timeout']
+    accept_firmware = module.params['accept_firmware']
+    max_parallel = module.params['upgrade_max_parallel']
+    select_prop_names = module.params['select_properties']  # with underscores
+    check_mode = module.check_mode
+
+    if not module.params['upgrade_wait']:
+        raise ParameterError(
+            "The 'upgrade_wait' module parameter must be true if the 'names' "
+            "module parameter is specified.")
+    if max_parallel < 1:
+        raise ParameterError(
+            "The 'upgrade_max_parallel' module parameter must be at least 1, "
+            f"but is {max_parallel}.")
+    if len(set(cpc_names)) != len(cpc_names):
+        raise ParameterError(
+            "Module parameter 'names' specifies duplicate CPC names.")
+
+    journal = JobJournal.from_environment(module.params['hmc_host'])
+
+    session, logoff = open_session(module.params)
+    try:
+        client = zhmcclient.Client(session)
+        console = client.consoles.console
+        check_upgrade_support(console)
+        cpcs = find_cpcs(client, cpc_names)
+
+        def submit_upgrade(cpc):
+            """
+            Submit the upgrade of the CPC, or resume an upgrade job of a
+            previous run of the module, and return the job. If the SE is
+            already at the bundle level, return None.
+            """
+            entry = journal.get(cpc.uri)
+            if entry and entry.get('bundle-level') == bundle_level:
+                job = zhmcclient.Job(
+                    session, entry['job-uri'], 'POST',
+                    f"{cpc.uri}/operations/single-step-install")
+                try:
+                    job.query_status()
+                    LOGGER.debug("Resuming upgrade job %s of CPC %r",
+                                 job.uri, cpc.name)
+                    return job
+                except zhmcclient.HTTPError as exc:
+                    if exc.http_status != 404:
+                        raise
+                    # The job no longer exists on the HMC
+            journal.remove(cpc.uri)
+            try:
+                job = cpc.single_step_install(
+                    bundle_level=bundle_level,
+                    accept_firmware=accept_firmware,
+                    wait_for_completion=False,
+                    operation_timeout=upgrade_timeout)
+            except zhmcclient.HTTPError as exc:
+                if exc.http_status == 400 and exc.reason == 356:
+                    # SE was already at that bundle level
+                    return None
+                raise
+            journal.set(cpc.uri, {
+                'job-uri': job.uri,
+                'bundle-level': bundle_level,
+            })
+            return job
+
+        def upgrade_cpc(cpc, deadline):
+            """
+            Upgrade the CPC, check its health, and return the outcome for the
+            CPC.
+            """
+            start_time = time.time()
+            changed = False
+            try:
+                job = None if check_mode else submit_upgrade(cpc)
+                if job is not None:
+                    changed = True
+                    try:
+                        wait_for_job_completion(job, upgrade_timeout, deadline)
+                    except zhmcclient.HTTPError:
+                        # The upgrade has failed and is not resumed
+                        journal.remove(cpc.uri)
+                        raise
+                    journal.remove(cpc.uri)
+                pull_properties(cpc, select_prop_names,
+                                ['status', 'has_unacceptable_status'])
+                cpc_status = cpc.get_property('status')
+                if cpc_status in UNREACHABLE_STATUSES or \
+                        cpc.get_property('has-unacceptable-status'):
+                    return cpc_report(
+                        cpc.name, changed, 'unhealthy',
+                        time.time() - start_time,
+                        f"CPC {cpc.name!r} is in status {cpc_status!r} after "
+                        "the upgrade")
+                cpc_properties = dict(cpc.properties)
+                add_artificial_properties(cpc_properties, cpc, module.params)
+            except zhmcclient.OperationTimeout as exc:
+                # The job remains in the journal for resuming it
+                return cpc_report(cpc.name, changed, 'timeout',
+                                  time.time() - start_time, str(exc))
+            except (Error, zhmcclient.Error) as exc:
+                return cpc_report(cpc.name, changed, 'failed',
+                                  time.time() - start_time, str(exc))
+            return cpc_report(cpc.name, changed, 'complete',
+                              time.time() - start_time,
+                              cpc_properties=cpc_properties)
+
+        reports = []
+        skip_reason = None
+        for index in range(0, len(cpcs), max_parallel):
+            wave = cpcs[index:index + max_parallel]
+            if skip_reason:
+                reports.extend(cpc_report(cpc.name, False, 'skipped', 0,
+                                          skip_reason) for cpc in wave)
+                continue
+            deadline = Deadline(upgrade_timeout)
+            wave_reports = run_concurrently(
+                lambda cpc, _deadline=deadline: upgrade_cpc(cpc, _deadline),
+                wave, len(wave))
+            reports.extend(wave_reports)
+            failed_names = [r['name'] for r in wave_reports
+                            if r['status'] != 'complete']
+            if failed_names:
+                skip_reason = (
+                    "The upgrade was skipped because the upgrade of CPCs "
+                    f"{', '.join(failed_names)} in a previous wave did not "
+                    "complete successfully")
+
+        changed = any(report['changed'] for report in reports)
+        return changed, reports
+
+    finally:
+        close_session(session, logoff)
+
+
 def perform_task(module):
     """
     Perform the task for this module, dependent on the 'state' module
@@ -848,6 +1487,23 @@ def perform_task(module):
         "facts": facts,
         "upgrade": upgrade,
     }
+    check_include_params(module.params)
+    if module.params['names'] is not None:
+        if module.params['state'] not in ('active', 'inactive', 'upgrade'):
+            raise ParameterError(
+                "The 'names' module parameter is only permitted for "
+                "state=active, state=inactive and state=upgrade.")
+        if module.params['name'] is not None:
+            raise ParameterError(
+                "The 'name' and 'names' module parameters are mutually "
+                "exclusive.")
+        if module.params['state'] == 'upgrade':
+            return upgrade_multiple(module)
+        return ensure_multiple(module)
+    if module.params['name'] is None:
+        raise ParameterError(
+            "The 'name' module parameter is required, unless the 'names' "
+            "module parameter is specified.")
     return actions[module.params['state']](module)
 
 
@@ -859,15 +1515,25 @@ def main():
     argument_spec = dict(
         hmc_host=dict(required=True, type='raw'),
         hmc_auth=hmc_auth_parameter(),
-        name=dict(required=True, type='str'),
+        name=dict(required=False, type='str', default=None),
+        names=dict(required=False, type='list', elements='str',
+                   default=None),
         state=dict(required=True, type='str',
                    choices=['inactive', 'active', 'set', 'facts', 'upgrade']),
         select_properties=dict(required=False, type='list', elements='str',
                                default=None),
+        include=dict(required=False, type='list', elements='str',
+                     choices=['partitions', 'adapters', 'storage_groups'],
+                     default=['partitions', 'adapters', 'storage_groups']),
+        include_additional_properties=dict(required=False, type='dict',
+                                           default=None),
+        operation_timeout=dict(required=False, type='int', default=3600),
         activation_profile_name=dict(required=False, type='str', default=None),
         properties=dict(required=False, type='dict', default=None),
         bundle_level=dict(required=False, type='str', default=None),
         upgrade_timeout=dict(required=False, type='int', default=10800),
+        upgrade_wait=dict(required=False, type='bool', default=True),
+        upgrade_max_parallel=dict(required=False, type='int', default=1),
         accept_firmware=dict(required=False, type='bool', default=True),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
@@ -902,14 +1568,28 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
+    if module.params['names'] is not None:
+        failed_names = [r['name'] for r in result
+                        if r['status'] != 'complete']
+        if failed_names:
+            msg = (f"Ensuring state={module.params['state']} has not "
+                   f"completed for {len(failed_names)} of {len(result)} "
+                   f"CPCs: {', '.join(failed_names)}")
+            LOGGER.debug("Module exit (failure): msg: %r, cpcs: %r",
+                         msg, result)
+            module.fail_json(msg=msg, cpcs=result, **module_result_items())
+        LOGGER.debug("Module exit (success): changed: %s, cpcs: %r",
+                     changed, result)
+        module.exit_json(changed=changed, cpcs=result, **module_result_items())
+
     LOGGER.debug("Module exit (success): changed: %s, cpc: %r",
                  changed, result)
     module.exit_json(
-        changed=changed, cpc=result)
+        changed=changed, cpc=result, **module_result_items())
 
 
 if __name__ == '__main__':
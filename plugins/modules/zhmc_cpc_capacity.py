@@ -453,7 +453,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, common_fail_on_import_errors, parse_hmc_host, \
-    underscore_properties, blanked_params  # noqa: E402
+    underscore_properties, blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -752,7 +752,7 @@ def facts(module):
 
     cpc_name = module.params['name']
 
-    session, logoff = open_session(module.params)
+    session, logoff = open_session(module.params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
@@ -837,14 +837,13 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, cpc: %r",
                  changed, result)
-    module.exit_json(
-        changed=changed, cpc=result)
+    module.exit_json(changed=changed, cpc=result, **module_result_items())
 
 
 if __name__ == '__main__':
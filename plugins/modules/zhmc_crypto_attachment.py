@@ -375,7 +375,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, common_fail_on_import_errors, \
-    parse_hmc_host, blanked_params, UNKNOWN_NAME  # noqa: E402
+    parse_hmc_host, blanked_params, UNKNOWN_NAME, \
+    module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -1001,7 +1002,7 @@ def facts(params, check_mode):
     cpc_name = params['cpc_name']
     partition_name = params['partition_name']
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
@@ -1098,7 +1099,7 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
@@ -1106,7 +1107,8 @@ def main():
         "Module exit (success): changed: %r, crypto_configuration: %r, "
         "changes: %r", changed, result, changes)
     module.exit_json(
-        changed=changed, crypto_configuration=result, changes=changes)
+        changed=changed, crypto_configuration=result, changes=changes,
+        **module_result_items())
 
 
 if __name__ == '__main__':
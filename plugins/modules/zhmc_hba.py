@@ -220,6 +220,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the HBA upon
+       transient HMC errors, by operation (method name and resource URI). Not
+       returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/partitions/8806043a-cbab-11f1-9b2c-fa163e1c2d3c/hbas/880604f9-cbab-11f1-ac3d-fa163e4d5e71": 1
+    }
 hba:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -246,8 +258,9 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, wait_for_transition_completion, \
-    eq_hex, to_unicode, process_normal_property, \
-    common_fail_on_import_errors, parse_hmc_host, blanked_params  # noqa: E402
+    to_unicode, process_normal_property, ZHMC_HBA_PROPERTIES, \
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    task_deadline, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -261,53 +274,6 @@ LOGGER_NAME = 'zhmc_hba'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
-# Dictionary of properties of HBA resources, in this format:
-#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
-# where:
-#   name: Name of the property according to the data model, with hyphens
-#     replaced by underscores (this is how it is or would be specified in
-#     the 'properties' module parameter).
-#   allowed: Indicates whether it is allowed in the 'properties' module
-#     parameter.
-#   create: Indicates whether it can be specified for the "Create HBA"
-#     operation.
-#   update: Indicates whether it can be specified for the "Update HBA
-#     Properties" operation (at all).
-#   update_while_active: Indicates whether it can be specified for the "Update
-#     HBA Properties" operation while the partition of the HBA is active. None
-#     means "not applicable" (i.e. update=False).
-#   eq_func: Equality test function for two values of the property; None means
-#     to use Python equality.
-#   type_cast: Type cast function for an input value of the property; None
-#     means to use it directly. This can be used for example to convert
-#     integers provided as strings by Ansible back into integers (that is a
-#     current deficiency of Ansible).
-ZHMC_HBA_PROPERTIES = {
-
-    # create-only properties:
-    'adapter_port_uri': (
-        False, True, False, None, None, None),  # via adapter_name/_port
-    'adapter_name': (
-        True, True, False, None, None,
-        None),  # artificial property, type_cast ignored
-    'adapter_port': (
-        True, True, False, None, None,
-        None),  # artificial property, type_cast ignored
-
-    # create+update properties:
-    'name': (
-        False, True, True, True, None, None),  # provided in 'name' module parm
-    'description': (True, True, True, True, None, to_unicode),
-    'device_number': (True, True, True, True, eq_hex, None),
-
-    # read-only properties:
-    'element-uri': (False, False, False, None, None, None),
-    'element-id': (False, False, False, None, None, None),
-    'parent': (False, False, False, None, None, None),
-    'class': (False, False, False, None, None, None),
-    'wwpn': (False, False, False, None, None, None),
-}
-
 
 def process_properties(partition, hba, params):
     """
@@ -450,6 +416,7 @@ def ensure_present(params, check_mode):
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -482,7 +449,7 @@ def ensure_present(params, check_mode):
                     if name not in create_props:
                         update2_props[name] = value
                 if update2_props:
-                    hba.update_properties(update2_props)
+                    retry_operation(hba, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed (for example, the
                 # partition does that with memory properties).
@@ -504,8 +471,9 @@ def ensure_present(params, check_mode):
                     if stop:
                         raise AssertionError()
 
-                    wait_for_transition_completion(LOGGER, partition)
-                    hba.update_properties(update_props)
+                    wait_for_transition_completion(
+                        LOGGER, partition, deadline=deadline)
+                    retry_operation(hba, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed (for example, the
                     # partition does that with memory properties).
@@ -554,7 +522,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            hba.delete()
+            retry_operation(hba, 'delete')
         changed = True
 
         return changed, result
@@ -631,13 +599,13 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, hba: %r", changed, result)
-    module.exit_json(changed=changed, hba=result)
+    module.exit_json(changed=changed, hba=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -176,7 +176,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, common_fail_on_import_errors, \
-    parse_hmc_host, blanked_params  # noqa: E402
+    parse_hmc_host, blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -211,7 +211,7 @@ def http_get(params, check_mode):
             "Module parameter 'request_body' is not permitted for HTTP GET")
 
     changed = False
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         result = session.get(uri)
         return changed, result
@@ -350,12 +350,15 @@ def main():
         response_body = exc.body
         LOGGER.debug(
             "Module exit (failure): changed: %r, msg: %s", changed, msg)
-        module.fail_json(changed=changed, msg=msg, response_body=response_body)
+        module.fail_json(
+            changed=changed, msg=msg, response_body=response_body,
+            **module_result_items())
     except (Error, zhmcclient.Error) as exc:
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): changed: %r, msg: %s", changed, msg)
-        module.fail_json(changed=changed, msg=msg)
+        module.fail_json(
+            changed=changed, msg=msg, **module_result_items())
     # The exceptions handled above are considered errors in the environment or
     # in user input. They have a proper message that stands on its own, so we
     # simply pass that message on and will not need a traceback.
@@ -364,7 +367,8 @@ def main():
 
     LOGGER.debug(
         "Module exit (success): changed: %r", changed)
-    module.exit_json(changed=changed, response_body=response_body)
+    module.exit_json(
+        changed=changed, response_body=response_body, **module_result_items())
 
 
 if __name__ == '__main__':
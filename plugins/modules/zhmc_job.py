@@ -0,0 +1,448 @@
+#!/usr/bin/python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+# For information on the format of the ANSIBLE_METADATA, DOCUMENTATION,
+# EXAMPLES, and RETURN strings, see
+# http://docs.ansible.com/ansible/dev_guide/developing_modules_documenting.html
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['stableinterface'],
+    'supported_by': 'community',
+    'shipped_by': 'other',
+    'other_repo_url': 'https://github.com/zhmcclient/zhmc-ansible-modules'
+}
+
+DOCUMENTATION = """
+---
+module: zhmc_job
+version_added: "2.15.0"
+short_description: Wait for completion of HMC jobs
+description:
+  - Wait for completion of a list of HMC jobs, concurrently.
+  - The jobs are typically the jobs of asynchronous HMC operations that were
+    submitted by other modules of this collection without waiting for their
+    completion (e.g. using O(ibm.ibm_zhmc.zhmc_partition#module:wait=false)),
+    which return the URIs of these jobs in their C(job_uris) result.
+  - Jobs that have ended are deleted on the HMC.
+  - In check mode, the current status of the jobs is retrieved once, without
+    waiting for their completion and without deleting them.
+author:
+  - Andreas Maier (@andy-maier)
+requirements:
+  - "The HMC userid must be the userid that submitted the HMC operations of
+     the jobs."
+options:
+  hmc_host:
+    description:
+      - The hostnames or IP addresses of a single HMC or of a list of redundant
+        HMCs. A single HMC can be specified as a string type or as an HMC list
+        with one item. An HMC list can be specified as a list type or as a
+        string type containing a Python list representation.
+      - The first available HMC of a list of redundant HMCs is used for the
+        entire execution of the module.
+    type: raw
+    required: true
+  hmc_auth:
+    description:
+      - The authentication credentials for the HMC.
+    type: dict
+    required: true
+    suboptions:
+      userid:
+        description:
+          - The userid (username) for authenticating with the HMC.
+            This is mutually exclusive with providing O(hmc_auth.session_id).
+        type: str
+        required: false
+        default: null
+      password:
+        description:
+          - The password for authenticating with the HMC.
+            This is mutually exclusive with providing O(hmc_auth.session_id).
+        type: str
+        required: false
+        default: null
+      session_id:
+        description:
+          - HMC session ID to be used.
+            This is mutually exclusive with providing O(hmc_auth.userid) and
+            O(hmc_auth.password) and can be created as described in the
+            R(zhmc_session module,zhmc_session_module).
+        type: str
+        required: false
+        default: null
+      ca_certs:
+        description:
+          - Path name of certificate file or certificate directory to be used
+            for verifying the HMC certificate. If null (default), the path name
+            in the E(REQUESTS_CA_BUNDLE) environment variable or the path name
+            in the E(CURL_CA_BUNDLE) environment variable is used, or if neither
+            of these variables is set, the certificates in the Mozilla CA
+            Certificate List provided by the 'certifi' Python package are used
+            for verifying the HMC certificate.
+        type: str
+        required: false
+        default: null
+      verify:
+        description:
+          - If True (default), verify the HMC certificate as specified in the
+            O(hmc_auth.ca_certs) parameter. If False, ignore what is specified in the
+            O(hmc_auth.ca_certs) parameter and do not verify the HMC certificate.
+        type: bool
+        required: false
+        default: true
+  job_uris:
+    description:
+      - "List of URIs of the HMC jobs to wait for."
+    type: list
+    elements: str
+    required: true
+  timeout:
+    description:
+      - "Timeout in seconds for waiting for completion of all jobs. If the
+         timeout expires, the module fails and returns the status of all
+         jobs in RV(jobs). 0 means that there is no timeout."
+    type: int
+    required: false
+    default: 3600
+  max_parallel:
+    description:
+      - "Maximum number of jobs that are awaited concurrently."
+    type: int
+    required: false
+    default: 10
+  log_file:
+    description:
+      - "File path of a log file to which the logic flow of this module as well
+         as interactions with the HMC are logged. If null, logging will be
+         propagated to the Python root logger."
+    type: str
+    required: false
+    default: null
+  _faked_session:
+    description:
+      - "An internal parameter used for testing the module."
+    type: raw
+    required: false
+    default: null
+"""
+
+EXAMPLES = """
+---
+# Note: The following examples assume that some variables named 'my_*' are set.
+
+- name: Start the partitions without waiting for completion
+  zhmc_partition:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    name: "{{ item }}"
+    state: active
+    wait: false
+    expand_nics: false
+  loop: "{{ my_partition_names }}"
+  register: start_results
+
+- name: Wait for completion of the start of all partitions
+  zhmc_job:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    job_uris: "{{ start_results.results | map(attribute='job_uris',
+      default=[]) | flatten }}"
+    timeout: 900
+  register: job_results
+"""
+
+RETURN = """
+changed:
+  description: Indicates if any change has been made by the module.
+    This will always be false.
+  returned: always
+  type: bool
+msg:
+  description: An error message that describes the failure.
+  returned: failure
+  type: str
+jobs:
+  description:
+    - "The status of the jobs, in the order of O(job_uris)."
+    - "In case of a failure because the timeout expired or because jobs have
+       failed, this is also returned, with the status of the jobs at the time
+       of the failure."
+  returned: success or failure
+  type: list
+  elements: dict
+  contains:
+    uri:
+      description: "URI of the job."
+      type: str
+    status:
+      description:
+        - "Status of the job. One of:"
+        - "'running' - The job has not ended."
+        - "'cancel-pending' - The job has not ended, but cancellation has been
+           requested."
+        - "'canceled' - The job was canceled and has ended."
+        - "'complete' - The job has completed its operation and has ended."
+        - "'not-found' - The job does not exist on the HMC (e.g. because
+           it was already deleted)."
+        - "'error' - The job status could not be retrieved."
+      type: str
+    job_status_code:
+      description: "HTTP status code of the operation performed by the job,
+        or null if the job has not ended."
+      type: int
+    job_reason_code:
+      description: "HTTP reason code of the operation performed by the job,
+        or null if the job has not ended."
+      type: int
+    job_results:
+      description: "Result of the operation performed by the job, as described
+        for the HMC operation in the R(HMC API,HMC API) book, or null if the
+        job has not ended or the operation has no result."
+      type: raw
+    failed:
+      description: "Indicates whether the job has failed, i.e. the job was
+        canceled or not found, its status could not be retrieved, or its
+        operation completed with an HTTP status code of 400 or greater."
+      type: bool
+    error:
+      description: "Error message, if the job status could not be retrieved.
+        Otherwise, null."
+      type: str
+  sample:
+    [
+        {
+            "uri": "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a",
+            "status": "complete",
+            "job_status_code": 204,
+            "job_reason_code": null,
+            "job_results": null,
+            "failed": false,
+            "error": null
+        }
+    ]
+"""
+
+import logging  # noqa: E402
+import traceback  # noqa: E402
+from ansible.module_utils.basic import AnsibleModule, \
+    missing_required_lib  # noqa: E402
+
+from ..module_utils.common import log_init, open_session, close_session, \
+    hmc_auth_parameter, Error, ParameterError, common_fail_on_import_errors, \
+    parse_hmc_host, blanked_params, Deadline, poll_until, run_concurrently, \
+    JOB_POLL_INTERVALS, module_result_items  # noqa: E402
+
+try:
+    import zhmcclient
+    IMP_ZHMCCLIENT_ERR = None
+except ImportError:
+    IMP_ZHMCCLIENT_ERR = traceback.format_exc()
+
+# Python logger name for this module
+LOGGER_NAME = 'zhmc_job'
+
+LOGGER = logging.getLogger(LOGGER_NAME)
+
+# Job status values that indicate that the job has ended
+JOB_END_STATUSES = ('complete', 'canceled')
+
+# Job status values for which no further waiting is needed
+JOB_FINAL_STATUSES = JOB_END_STATUSES + ('not-found', 'error')
+
+
+def job_report(job_uri, status, job_status_code=None, job_reason_code=None,
+               job_results=None, error=None):
+    """
+    Return the report item for a job.
+    """
+    failed = status in ('canceled', 'not-found', 'error') or \
+        (status == 'complete' and job_status_code is not None and
+         job_status_code >= 400)
+    return {
+        'uri': job_uri,
+        'status': status,
+        'job_status_code': job_status_code,
+        'job_reason_code': job_reason_code,
+        'job_results': job_results,
+        'failed': failed,
+        'error': error,
+    }
+
+
+def query_job(job):
+    """
+    Retrieve the status of a job and return its report item.
+
+    Errors are reflected in the report item and are not raised, except for
+    connection errors, which are raised so that the caller can retry.
+
+    Raises:
+      zhmcclient.ConnectionError: Connection error.
+    """
+    try:
+        status, status_code, reason_code, results = job.query_status()
+    except zhmcclient.HTTPError as exc:
+        if exc.http_status == 404:
+            return job_report(job.uri, 'not-found')
+        return job_report(job.uri, 'error', error=str(exc))
+    except zhmcclient.ConnectionError:
+        raise
+    except zhmcclient.Error as exc:
+        return job_report(job.uri, 'error', error=str(exc))
+    return job_report(job.uri, status, status_code, reason_code, results)
+
+
+def await_job(session, job_uri, deadline, check_mode):
+    """
+    Wait for completion of a job, delete the job if it has ended, and return
+    its report item.
+
+    In check mode, the job status is retrieved once and the job is not
+    deleted.
+    """
+    job = zhmcclient.Job(session, job_uri, None, None)
+
+    def check():
+        try:
+            report = query_job(job)
+        except zhmcclient.ConnectionError as exc:
+            # The HMC may be restarting (e.g. during an HMC upgrade), so we
+            # continue polling
+            return False, job_report(job_uri, 'running', error=str(exc))
+        return check_mode or report['status'] in JOB_FINAL_STATUSES, report
+
+    _, report = poll_until(
+        check, deadline=deadline, kind='job', intervals=JOB_POLL_INTERVALS)
+
+    if not check_mode and report['status'] in JOB_END_STATUSES:
+        try:
+            job.delete()
+        except zhmcclient.HTTPError as exc:
+            if exc.http_status != 404:
+                raise
+    LOGGER.debug("Job %s has status %r", job_uri, report['status'])
+    return report
+
+
+def perform_task(params, check_mode):
+    """
+    Wait for completion of the jobs and return the job reports.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    job_uris = params['job_uris']
+    timeout = params['timeout']
+    max_parallel = params['max_parallel']
+
+    if max_parallel < 1:
+        raise ParameterError(
+            f"The 'max_parallel' parameter must be at least 1, but is "
+            f"{max_parallel}.")
+
+    session, logoff = open_session(params)
+    try:
+        deadline = Deadline(timeout)
+
+        def _await_job(job_uri):
+            return await_job(session, job_uri, deadline, check_mode)
+
+        reports = run_concurrently(_await_job, job_uris, max_parallel)
+        return False, reports
+
+    finally:
+        close_session(session, logoff)
+
+
+def main():
+    """Main function"""
+
+    # The following definition of module input parameters must match the
+    # description of the options in the DOCUMENTATION string.
+    argument_spec = dict(
+        hmc_host=dict(required=True, type='raw'),
+        hmc_auth=hmc_auth_parameter(),
+        job_uris=dict(required=True, type='list', elements='str'),
+        timeout=dict(required=False, type='int', default=3600),
+        max_parallel=dict(required=False, type='int', default=10),
+        log_file=dict(required=False, type='str', default=None),
+        _faked_session=dict(required=False, type='raw'),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True)
+
+    if IMP_ZHMCCLIENT_ERR is not None:
+        module.fail_json(msg=missing_required_lib("zhmcclient"),
+                         exception=IMP_ZHMCCLIENT_ERR)
+
+    common_fail_on_import_errors(module)
+
+    log_file = module.params['log_file']
+    log_init(LOGGER_NAME, log_file)
+
+    module.params['hmc_host'] = parse_hmc_host(module.params['hmc_host'])
+
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Module entry: params: %r",
+                     blanked_params(module.params))
+
+    try:
+
+        changed, jobs = perform_task(module.params, module.check_mode)
+
+    except (Error, zhmcclient.Error) as exc:
+        # These exceptions are considered errors in the environment or in user
+        # input. They have a proper message that stands on its own, so we
+        # simply pass that message on and will not need a traceback.
+        msg = f"{exc.__class__.__name__}: {exc}"
+        LOGGER.debug("Module exit (failure): msg: %r", msg)
+        module.fail_json(msg=msg, **module_result_items())
+    # Other exceptions are considered module errors and are handled by Ansible
+    # by showing the traceback.
+
+    if not module.check_mode:
+        pending_uris = [j['uri'] for j in jobs
+                        if j['status'] not in JOB_FINAL_STATUSES]
+        failed_uris = [j['uri'] for j in jobs if j['failed']]
+        msg = None
+        if pending_uris:
+            msg = (f"Timeout expired after {module.params['timeout']} s "
+                   f"while waiting for completion of {len(pending_uris)} of "
+                   f"{len(jobs)} jobs: {', '.join(pending_uris)}")
+        elif failed_uris:
+            msg = (f"{len(failed_uris)} of {len(jobs)} jobs have failed: "
+                   f"{', '.join(failed_uris)}")
+        if msg:
+            LOGGER.debug("Module exit (failure): msg: %r, jobs: %r",
+                         msg, jobs)
+            module.fail_json(msg=msg, jobs=jobs, **module_result_items())
+
+    LOGGER.debug("Module exit (success): changed: %s, jobs: %r",
+                 changed, jobs)
+    module.exit_json(changed=changed, jobs=jobs, **module_result_items())
+
+
+if __name__ == '__main__':
+    main()
@@ -197,6 +197,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the LDAP
+       server definition upon transient HMC errors, by operation (method name
+       and resource URI). Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "delete /api/console/ldap-server-definitions/88061678-cbab-11f1-9b2d-fa163e1c2d3d": 1
+    }
 ldap_server_definition:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -246,7 +258,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params, blanked_dict, removed_dict  # noqa: E402
+    blanked_params, blanked_dict, removed_dict, \
+    module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -503,7 +516,7 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 lsd = console.ldap_server_definitions.create(create_props)
                 if update2_props:
-                    lsd.update_properties(update2_props)
+                    retry_operation(lsd, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 lsd.pull_full_properties()
@@ -528,7 +541,7 @@ def ensure_present(params, check_mode):
                         "properties updated: %r", lsd_name,
                         blanked_dict(update_props, WRITEONLY_PROPERTIES_USCORE))
                 if not check_mode:
-                    lsd.update_properties(update_props)
+                    retry_operation(lsd, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     lsd.pull_full_properties()
@@ -576,7 +589,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            lsd.delete()
+            retry_operation(lsd, 'delete')
         changed = True
 
         return changed, result
@@ -600,7 +613,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -683,14 +696,16 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, ldap_server_definition: %r",
         changed, result)
-    module.exit_json(changed=changed, ldap_server_definition=result)
+    module.exit_json(
+        changed=changed, ldap_server_definition=result,
+        **module_result_items())
 
 
 if __name__ == '__main__':
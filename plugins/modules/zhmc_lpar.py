@@ -297,6 +297,25 @@ options:
     type: bool
     required: false
     default: false
+  wait:
+    description:
+      - "Controls whether the module waits for completion of the HMC operation
+         that changes the LPAR status, for O(state=inactive), O(state=active)
+         and O(state=loaded)."
+      - "If True (default), the module waits until the operation has completed
+         and the LPAR has reached the desired status."
+      - "If False, the module returns once the operation has been submitted to
+         the HMC, and returns the URI of the HMC job in RV(job_uris). The
+         completion of the jobs can be awaited with the
+         R(zhmc_job module,zhmc_job_module). For O(state=loaded), an
+         activation of the LPAR that is needed before loading it is still
+         waited for."
+      - "Because the LPAR properties cannot be updated while the submitted
+         operation is still running, O(properties) must not be specified
+         with O(wait=false)."
+    type: bool
+    required: false
+    default: true
   os_ipl_token:
     description:
       - "Setting this parameter for O(state=reset_clear) or
@@ -320,7 +339,8 @@ options:
          defined as writeable in the data model for LPAR resources
          (where the property names contain underscores instead of hyphens)."
       - "Properties omitted in this dictionary will not be updated."
-      - "This parameter is not allowed for the other O(state) values."
+      - "This parameter is not allowed for the other O(state) values, and
+         is not allowed with O(wait=false)."
     type: dict
     required: false
     default: null
@@ -384,6 +404,16 @@ EXAMPLES = """
     state: loaded
   register: lpar1
 
+- name: Load the LPAR without waiting for the load to complete
+  zhmc_lpar:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    name: "{{ my_lpar_name }}"
+    state: loaded
+    wait: false
+  register: lpar1
+
 - name: Ensure the LPAR is initialized for loading, clearing its memory
   zhmc_lpar:
     hmc_host: "{{ my_hmc_host }}"
@@ -433,6 +463,30 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates of the LPAR upon transient HMC
+       errors, by operation (method name and resource URI). Not returned if no
+       operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/logical-partitions/88062913-cbab-11f1-9b2e-fa163e1c2d3e": 1
+    }
+job_uris:
+  description:
+    - "URIs of the HMC jobs of the operations that were submitted without
+       waiting for their completion, for O(wait=false). Not returned if no
+       such operations were submitted."
+  returned: success
+  type: list
+  elements: str
+  sample:
+    [
+      "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a"
+    ]
 lpar:
   description:
     - "For O(state=inactive|reset_clear|reset_normal), an empty dictionary."
@@ -622,7 +676,8 @@ from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, StatusError, \
     ensure_lpar_inactive, ensure_lpar_active, ensure_lpar_loaded, to_unicode, \
     process_normal_property, common_fail_on_import_errors, pull_properties, \
-    parse_hmc_host, blanked_params, removed_dict  # noqa: E402
+    parse_hmc_host, blanked_params, removed_dict, \
+    task_deadline, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -896,7 +951,7 @@ def update_lpar_properties(lpar, params, check_mode, check_status=False):
 
     if update_props:
         if not check_mode:
-            lpar.update_properties(update_props)
+            retry_operation(lpar, 'update_properties', update_props)
             # We refresh the properties after the update, in case an
             # input property value gets changed.
             pull_properties(lpar, select_prop_names, input_prop_names)
@@ -930,6 +985,7 @@ def ensure_inactive(params, check_mode):
     lpar_name = params['name']
     timeout = params['timeout']
     status_timeout = params['status_timeout']
+    wait = params['wait']
 
     properties = params['properties']
     if properties:
@@ -941,6 +997,7 @@ def ensure_inactive(params, check_mode):
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         lpar = cpc.lpars.find(name=lpar_name)
@@ -951,7 +1008,7 @@ def ensure_inactive(params, check_mode):
         # Deactivate the LPAR.
         changed |= ensure_lpar_inactive(
             LOGGER, lpar, check_mode, operation_timeout=timeout,
-            status_timeout=status_timeout)
+            status_timeout=status_timeout, deadline=deadline, wait=wait)
 
         return changed, {}
 
@@ -1065,13 +1122,20 @@ def ensure_active(params, check_mode):
     activation_profile_name = params['activation_profile_name']
     timeout = params['timeout']
     status_timeout = params['status_timeout']
+    wait = params['wait']
     allow_status_exceptions = params['allow_status_exceptions']
     force = params['force']
 
+    if params['properties'] and not wait:
+        raise ParameterError(
+            "Properties must not be specified together with wait=false for "
+            f"state=active with LPAR {lpar_name!r}.")
+
     changed = False
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         lpar = cpc.lpars.find(name=lpar_name)
@@ -1086,7 +1150,9 @@ def ensure_active(params, check_mode):
             operation_timeout=timeout,
             status_timeout=status_timeout,
             allow_status_exceptions=allow_status_exceptions,
-            force=force)
+            force=force,
+            deadline=deadline,
+            wait=wait)
 
         # Update the properties of the LPAR.
         _changed, lpar_properties = update_lpar_properties(
@@ -1123,13 +1189,20 @@ def ensure_loaded(params, check_mode):
     store_status_indicator = params['store_status_indicator']
     timeout = params['timeout']
     status_timeout = params['status_timeout']
+    wait = params['wait']
     allow_status_exceptions = params['allow_status_exceptions']
     force = params['force']
 
+    if params['properties'] and not wait:
+        raise ParameterError(
+            "Properties must not be specified together with wait=false for "
+            f"state=loaded with LPAR {lpar_name!r}.")
+
     changed = False
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         lpar = cpc.lpars.find(name=lpar_name)
@@ -1148,7 +1221,9 @@ def ensure_loaded(params, check_mode):
             operation_timeout=timeout,
             status_timeout=status_timeout,
             allow_status_exceptions=allow_status_exceptions,
-            force=force)
+            force=force,
+            deadline=deadline,
+            wait=wait)
 
         # Update the properties of the LPAR.
         _changed, lpar_properties = update_lpar_properties(
@@ -1228,7 +1303,7 @@ def facts(params, check_mode):
 
     changed = False
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -1300,6 +1375,7 @@ def main():
         status_timeout=dict(required=False, type='int', default=60),
         allow_status_exceptions=dict(required=False, type='bool', default=True),
         force=dict(required=False, type='bool', default=False),
+        wait=dict(required=False, type='bool', default=True),
         os_ipl_token=dict(required=False, type='str', default=None,
                           no_log=False),
         # Note: os_ipl_token is not a secret and no_log=False is the way
@@ -1339,13 +1415,14 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, lpar: %r", changed, result)
-    module.exit_json(changed=changed, lpar=result)
+    module.exit_json(
+        changed=changed, lpar=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -288,7 +288,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -357,7 +357,7 @@ def perform_os_messages(params):
     if max_messages is None:
         max_messages = 0
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
 
@@ -445,13 +445,13 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, messages: %r", changed, result)
-    module.exit_json(changed=changed, messages=result)
+    module.exit_json(changed=changed, messages=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -231,6 +231,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the NIC upon
+       transient HMC errors, by operation (method name and resource URI). Not
+       returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/partitions/88063d52-cbab-11f1-9b2f-fa163e1c2d3f/nics/88063e0c-cbab-11f1-ac40-fa163e4d5e74": 1
+    }
 nic:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -286,7 +298,6 @@ nic:
     }
 """
 
-import time  # noqa: E402
 import logging  # noqa: E402
 import traceback  # noqa: E402
 from ansible.module_utils.basic import AnsibleModule, \
@@ -294,8 +305,10 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, wait_for_transition_completion, \
-    eq_hex, eq_mac, to_unicode, process_normal_property, \
-    common_fail_on_import_errors, parse_hmc_host, blanked_params  # noqa: E402
+    to_unicode, process_normal_property, ZHMC_NIC_PROPERTIES, \
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    task_deadline, find_nic_for_500_12, module_result_items, \
+    retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -309,80 +322,6 @@ LOGGER_NAME = 'zhmc_nic'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
-# Dictionary of properties of NIC resources, in this format:
-#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
-# where:
-#   name: Name of the property according to the data model, with hyphens
-#     replaced by underscores (this is how it is or would be specified in
-#     the 'properties' module parameter).
-#   allowed: Indicates whether it is allowed in the 'properties' module
-#     parameter.
-#   create: Indicates whether it can be specified for the "Create NIC"
-#     operation.
-#   update: Indicates whether it can be specified for the "Update NIC
-#     Properties" operation (at all).
-#   update_while_active: Indicates whether it can be specified for the "Update
-#     NIC Properties" operation while the partition of the NIC is active. None
-#     means "not applicable" (i.e. update=False).
-#   eq_func: Equality test function for two values of the property; None means
-#     to use Python equality.
-#   type_cast: Type cast function for an input value of the property; None
-#     means to use it directly. This can be used for example to convert
-#     integers provided as strings by Ansible back into integers (that is a
-#     current deficiency of Ansible).
-# Note: This should always represent the latest version of the HMC/SE.
-# Attempts to set a property that does not exist or that is not writeable in
-# the target HMC will be handled by the HMC rejecting the operation.
-ZHMC_NIC_PROPERTIES = {
-
-    # create+update properties:
-    'name': (
-        False, True, True, True, None, None),  # provided in 'name' module parm
-    # The type property became creatable with the network-express-support
-    # feature (SE 2.17.0).
-    'type': (True, True, False, False, None, None),
-    'description': (True, True, True, True, None, to_unicode),
-    'device_number': (True, True, True, True, eq_hex, None),
-    'network_adapter_port_uri': (
-        False, True, True, True, None, None),  # via adapter_name/_port
-    'virtual_switch_uri': (
-        False, True, True, True, None, None),  # via adapter_name/_port
-    'adapter_name': (
-        True, True, True, True, None,
-        None),  # artificial property, type_cast ignored
-    'adapter_port': (
-        True, True, True, True, None,
-        None),  # artificial property, type_cast ignored
-    # The ssc-*, vlan-id and mac-address properties were introduced in
-    # API version 2.2 (an update of SE 2.13.1).
-    # The mac-address property was changed to be writeable in API version 2.20
-    # (SE 2.14.0).
-    'ssc_management_nic': (True, True, True, True, None, None),
-    'ssc_ip_address_type': (True, True, True, True, None, None),
-    'ssc_ip_address': (True, True, True, True, None, None),
-    'ssc_mask_prefix': (True, True, True, True, None, None),
-    'vlan_id': (True, True, True, True, None, int),
-    'mac_address': (True, True, True, None, eq_mac, None),
-    # The vlan-type property was introduced in API version 2.20 (SE 2.14.0).
-    'vlan_type': (True, True, True, True, None, None),
-    # The function-* properties were introduced in API version 3.4
-    # (SE 2.15 GA2).
-    'function_number': (True, True, True, True, None, int),
-    'function_range': (True, True, True, True, None, int),
-    # The promiscuous-mode property was introduced with the
-    # network-express-support feature (SE 2.17.0).
-    'promiscuous_mode': (True, True, True, True, None, None),
-
-    # read-only properties:
-    'element-uri': (False, False, False, None, None, None),
-    'element-id': (False, False, False, None, None, None),
-    'parent': (False, False, False, None, None, None),
-    'class': (False, False, False, None, None, None),
-    # The partition-link-uri property was introduced with the
-    # dpm-partition-lifecycle-management feature (SE 2.17.0).
-    'partition_link_uri': (False, False, False, None, None, None),
-}
-
 
 def process_properties(partition, nic, params):
     """
@@ -552,119 +491,6 @@ def process_properties(partition, nic, params):
     return create_props, update_props, stop
 
 
-class Error_500_12(Error):
-    # pylint: disable=invalid-name
-    """
-    Error while circumventing HTTP 500.12 in find_nic_for_500_12().
-    """
-    pass
-
-
-def find_nic_for_500_12(params, partition):
-    """
-    Circumvention for a defect where "Create NIC" on a Hipersocket adapter
-    fails with HTTP 500.12 when the Partition Link feature on z16 is enabled.
-
-    The NIC has been created in this case, but it still has the name that was
-    created automatically by the Partition Link support.
-
-    We identify the NIC based on its underlying Hipersockets adapter and the
-    device number, and return that NIC.
-    """
-    # Pull nic-uris property in partition to get the new NIC. If this is done
-    # immediately, the number if NICs will not have changed, so we try a few
-    # times, with a wait time in between.
-    initial_nic_uris = partition.get_property('nic-uris')
-    nic_uris = initial_nic_uris
-    attempts = 0
-    max_attempts = 10
-    nic_uri = None
-    while True:
-        time.sleep(1)
-        partition.pull_properties(['nic-uris'])
-        nic_uris = partition.get_property('nic-uris')
-        if len(nic_uris) == len(initial_nic_uris) + 1:
-            nic_uri = next(iter(set(nic_uris) - set(initial_nic_uris)))
-            LOGGER.debug(
-                "Found NIC URI after %d attempts: %r", attempts, nic_uri)
-            break
-        attempts += 1
-        if attempts >= max_attempts:
-            LOGGER.warning(
-                "Could not get partition property 'nic-uris' updated with "
-                "new NIC after %d attempts, trying filtering", attempts)
-            break
-    if nic_uri:
-        LOGGER.debug(
-            "Finding NIC by URI %r", nic_uri)
-        filter_args = {
-            'element-uri': nic_uri,
-        }
-        try:
-            nic = partition.nics.find(**filter_args)
-        except zhmcclient.NotFound:
-            raise Error_500_12(
-                f"Cannot find NIC with URI {nic_uri!r}"
-            )
-    else:
-        try:
-            props = params['properties']
-            adapter_name = props['adapter_name']
-            adapter_port_index = int(props['adapter_port'])
-            device_number = props['device_number']
-        except KeyError:
-            raise Error_500_12(
-                "Not all input parameters provided that are required for the "
-                "circumvention: adapter_name, adapter_port, device_number"
-            )
-        try:
-            adapter = partition.manager.cpc.adapters.find(name=adapter_name)
-            adapter.ports.find(index=adapter_port_index)
-        except zhmcclient.HTTPError as exc:
-            raise Error_500_12(
-                f"Cannot find adapter {adapter_name!r} or port "
-                f"{adapter_port_index!r}: {exc}"
-            )
-        adapter_family = adapter.get_property('adapter-family')
-        if adapter_family != 'hipersockets':
-            raise Error_500_12(
-                "HTTP error 500.12 happened for a non-Hipersockets adapter "
-                f"{adapter_name!r}"
-            )
-        try:
-            vswitches = partition.manager.cpc.virtual_switches.findall(
-                **{'backing-adapter-uri': adapter.uri})
-        except zhmcclient.HTTPError as exc:
-            raise Error_500_12(
-                "Cannot find virtual switch for backing adapter "
-                f"{adapter_name!r}: {exc}"
-            )
-        found_vswitch = None
-        for vswitch in vswitches:
-            if vswitch.get_property('port') == adapter_port_index:
-                found_vswitch = vswitch
-                break
-        if not found_vswitch:
-            raise Error_500_12(
-                f"Cannot find virtual switch for port {adapter_port_index!r} "
-                f"on backing adapter {adapter_name!r}"
-            )
-        filter_args = {
-            'type': 'iqd',
-            'device-number': device_number,
-            'virtual-switch-uri': found_vswitch.uri,
-        }
-        LOGGER.debug(
-            "Finding NIC by filter arguments: %r", filter_args)
-        try:
-            nic = partition.nics.find(**filter_args)
-        except zhmcclient.NotFound:
-            raise Error_500_12(
-                f"Cannot find NIC with filter arguments {filter_args!r}"
-            )
-    return nic
-
-
 def add_artificial_properties(nic_properties, nic):
     """
     Add artificial properties to the nic_properties dict.
@@ -729,6 +555,7 @@ def ensure_present(params, check_mode):
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -765,7 +592,8 @@ def ensure_present(params, check_mode):
                         LOGGER.warning(
                             "Circumventing HTTP 500.12 when creating NIC %r "
                             "on partition %r", nic_name, partition.name)
-                        nic = find_nic_for_500_12(params, partition)
+                        nic = find_nic_for_500_12(
+                            LOGGER, params['properties'], partition)
                         create_props, update_props, stop = process_properties(
                             partition, nic, params)
                         update_props['name'] = create_props.pop('name')
@@ -783,7 +611,7 @@ def ensure_present(params, check_mode):
                     if name not in create_props:
                         update2_props[name] = value
                 if update2_props:
-                    nic.update_properties(update2_props)
+                    retry_operation(nic, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed (for example, the
                 # partition does that with memory properties).
@@ -804,8 +632,9 @@ def ensure_present(params, check_mode):
                     # active, therefore:
                     if stop:
                         raise AssertionError()
-                    wait_for_transition_completion(LOGGER, partition)
-                    nic.update_properties(update_props)
+                    wait_for_transition_completion(
+                        LOGGER, partition, deadline=deadline)
+                    retry_operation(nic, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed (for example, the
                     # partition does that with memory properties).
@@ -855,7 +684,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            nic.delete()
+            retry_operation(nic, 'delete')
         changed = True
 
         return changed, result
@@ -881,7 +710,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -969,13 +798,13 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, nic: %r", changed, result)
-    module.exit_json(changed=changed, nic=result)
+    module.exit_json(changed=changed, nic=result, **module_result_items())
 
 
 if __name__ == '__main__':
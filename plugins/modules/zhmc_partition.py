@@ -214,6 +214,111 @@ options:
     type: dict
     required: false
     default: null
+  nics:
+    description:
+      - "The NICs of the partition, for O(state=stopped) and O(state=active).
+         Will be ignored for other O(state) values."
+      - "If specified, the partition will have exactly the specified NICs
+         after the module has run: Missing NICs are created, existing NICs
+         are updated with the specified properties, and NICs that are not
+         specified are deleted. If null, the NICs of the partition remain
+         unchanged."
+      - "The NICs are reconciled against a single retrieval of the current
+         NICs, once the partition exists. The HMC operations for them are
+         performed one after the other, after any status transition of the
+         partition has completed. If a NIC property needs to be updated that
+         cannot be updated while the partition is active (e.g.
+         C(mac_address)), the partition is stopped first, and for
+         O(state=active) started again afterwards."
+    type: list
+    elements: dict
+    required: false
+    default: null
+    suboptions:
+      name:
+        description:
+          - "The name of the NIC."
+        type: str
+        required: true
+      properties:
+        description:
+          - "Dictionary with input properties for the NIC, as described for
+             the C(properties) parameter of the
+             R(zhmc_nic module,zhmc_nic_module), including the artificial
+             properties C(adapter_name) and C(adapter_port)."
+        type: dict
+        required: false
+        default: null
+  hbas:
+    description:
+      - "The HBAs of the partition, for O(state=stopped) and O(state=active).
+         Will be ignored for other O(state) values. HBAs exist only on CPCs
+         without the 'dpm-storage-management' feature."
+      - "If specified, the partition will have exactly the specified HBAs
+         after the module has run, as described for O(nics). If null, the HBAs
+         of the partition remain unchanged."
+    type: list
+    elements: dict
+    required: false
+    default: null
+    suboptions:
+      name:
+        description:
+          - "The name of the HBA."
+        type: str
+        required: true
+      properties:
+        description:
+          - "Dictionary with input properties for the HBA, as described for
+             the C(properties) parameter of the
+             R(zhmc_hba module,zhmc_hba_module), including the artificial
+             properties C(adapter_name) and C(adapter_port)."
+        type: dict
+        required: false
+        default: null
+  virtual_functions:
+    description:
+      - "The virtual functions of the partition, for O(state=stopped) and
+         O(state=active). Will be ignored for other O(state) values."
+      - "If specified, the partition will have exactly the specified virtual
+         functions after the module has run, as described for O(nics). If
+         null, the virtual functions of the partition remain unchanged."
+    type: list
+    elements: dict
+    required: false
+    default: null
+    suboptions:
+      name:
+        description:
+          - "The name of the virtual function."
+        type: str
+        required: true
+      properties:
+        description:
+          - "Dictionary with input properties for the virtual function, as
+             described for the C(properties) parameter of the
+             R(zhmc_virtual_function module,zhmc_virtual_function_module),
+             including the artificial property C(adapter_name)."
+        type: dict
+        required: false
+        default: null
+  storage_groups:
+    description:
+      - "The names of the storage groups attached to the partition, for
+         O(state=stopped) and O(state=active). Will be ignored for other
+         O(state) values. Storage groups exist only on CPCs with the
+         'dpm-storage-management' feature."
+      - "If specified, the partition will have exactly the specified storage
+         groups attached after the module has run: Missing storage groups are
+         attached, and storage groups that are not specified are detached. If
+         null, the storage group attachments of the partition remain
+         unchanged."
+      - "The crypto configuration of the partition is specified with the
+         C(crypto_configuration) property in O(properties)."
+    type: list
+    elements: str
+    required: false
+    default: null
   image_name:
     description:
       - "Name of the ISO image for O(state=iso_mount)
@@ -292,6 +397,23 @@ options:
     type: bool
     required: false
     default: null
+  wait:
+    description:
+      - "Controls whether the module waits for completion of the 'Start
+         Partition' or 'Stop Partition' operation, for O(state=active) and
+         O(state=stopped)."
+      - "If True (default), the module waits until the partition has reached
+         the desired status."
+      - "If False, the module returns once the operation has been submitted to
+         the HMC, and returns the URI of the HMC job in RV(job_uris). The
+         partition may then still be in status 'starting' or 'stopping'. The
+         completion of the jobs can be awaited with the
+         R(zhmc_job module,zhmc_job_module). Other operations that are needed
+         (e.g. stopping the partition before property updates) are still
+         waited for."
+    type: bool
+    required: false
+    default: true
   log_file:
     description:
       - "File path of a log file to which the logic flow of this module as well
@@ -357,6 +479,55 @@ EXAMPLES = """
     expand_nics: false
   register: part1
 
+- name: Ensure the partition exists with its NICs and storage groups and is active
+  zhmc_partition:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    name: "{{ my_partition_name }}"
+    state: active
+    properties:
+      ifl_processors: 2
+      initial_memory: 4096
+      maximum_memory: 4096
+      boot_device: storage-volume
+      boot_storage_group_name: sg1
+      boot_storage_volume_name: boot1
+    nics:
+      - name: nic1
+        properties:
+          adapter_name: OSA1
+          adapter_port: 0
+          device_number: "1000"
+      - name: nic2
+        properties:
+          adapter_name: OSA2
+          adapter_port: 0
+          device_number: "1003"
+    storage_groups:
+      - sg1
+    expand_nics: true
+  register: part1
+
+- name: Start many partitions without waiting and then wait for all of them
+  zhmc_partition:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    name: "{{ item }}"
+    state: active
+    wait: false
+    expand_nics: false
+  loop: "{{ my_partition_names }}"
+  register: start_results
+
+- name: Wait for completion of the start of all partitions
+  zhmc_job:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    job_uris: "{{ start_results.results | map(attribute='job_uris',
+      default=[]) | flatten }}"
+
 - name: Ensure the partition does not exist
   zhmc_partition:
     hmc_host: "{{ my_hmc_host }}"
@@ -427,6 +598,33 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the
+       partition, the submissions of its start and stop, and the property
+       updates of its NICs, HBAs and virtual functions upon transient HMC
+       errors, by operation (method name and resource URI). Not returned if
+       no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "stop /api/partitions/880652b0-cbab-11f1-9b30-fa163e1c2d40": 1,
+      "update_properties /api/partitions/880652b0-cbab-11f1-9b30-fa163e1c2d40/nics/8806535a-cbab-11f1-ac41-fa163e4d5e75": 2
+    }
+job_uris:
+  description:
+    - "URIs of the HMC jobs of the operations that were submitted without
+       waiting for their completion, for O(wait=false). Not returned if no
+       such operations were submitted."
+  returned: success
+  type: list
+  elements: str
+  sample:
+    [
+      "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a"
+    ]
 partition:
   description:
     - "For O(state=absent|iso_mount|iso_unmount), an empty dictionary."
@@ -733,6 +931,7 @@ import traceback  # noqa: E402
 import uuid
 import random
 import types
+import functools
 from operator import itemgetter  # noqa: E402
 from ansible.module_utils.basic import AnsibleModule, \
     missing_required_lib  # noqa: E402
@@ -742,7 +941,9 @@ from ..module_utils.common import log_init, open_session, close_session, \
     start_partition, wait_for_transition_completion, eq_hex, to_unicode, \
     process_normal_property, ImageError, common_fail_on_import_errors, \
     pull_properties, parse_hmc_host, blanked_params, removed_dict, \
-    UNKNOWN_NAME, object_from_uri, object_properties  # noqa: E402
+    UNKNOWN_NAME, object_from_uri, object_properties, find_nic_for_500_12, \
+    ZHMC_NIC_PROPERTIES, ZHMC_HBA_PROPERTIES, ZHMC_VFUNCTION_PROPERTIES, \
+    task_deadline, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -1620,6 +1821,412 @@ def change_crypto_config(partition, crypto_changes, check_mode):
     return changed
 
 
+# Child elements of a partition that can be specified in module parameters,
+# in this format:
+#   param_name: (kind, prop_defs, manager_attr, art_names)
+# where:
+#   param_name: Name of the module parameter.
+#   kind: Kind of child element, for messages.
+#   prop_defs: Dictionary of property definitions of the child element (see
+#     process_normal_property()).
+#   manager_attr: Name of the attribute of zhmcclient.Partition with the
+#     manager for the child elements.
+#   art_names: Names of the artificial properties that identify the backing
+#     adapter (and port) of the child element.
+PARTITION_CHILDREN = {
+    'nics': (
+        'NIC', ZHMC_NIC_PROPERTIES, 'nics',
+        ('adapter_name', 'adapter_port')),
+    'hbas': (
+        'HBA', ZHMC_HBA_PROPERTIES, 'hbas',
+        ('adapter_name', 'adapter_port')),
+    'virtual_functions': (
+        'virtual function', ZHMC_VFUNCTION_PROPERTIES, 'virtual_functions',
+        ('adapter_name',)),
+}
+
+
+class AdapterResolver:
+    """
+    Resolves the artificial properties 'adapter_name' and 'adapter_port' of
+    the child elements of a partition to adapters, adapter ports and virtual
+    switches, retrieving each of them from the HMC only once.
+    """
+
+    def __init__(self, cpc):
+        self.cpc = cpc
+        self._adapters = None  # by name
+        self._ports = {}  # by (adapter URI, port index)
+        self._vswitch_uris = {}  # by adapter URI, then by port index
+        self._nes_feature = None
+
+    def adapter(self, adapter_name):
+        """
+        Return the adapter with the specified name.
+
+        Raises:
+          ParameterError: The adapter does not exist.
+        """
+        if self._adapters is None:
+            self._adapters = {a.name: a for a in self.cpc.adapters.list()}
+        try:
+            return self._adapters[adapter_name]
+        except KeyError:
+            raise ParameterError(
+                "Artificial property 'adapter_name' does not specify the "
+                f"name of an existing adapter: {adapter_name!r}")
+
+    def port(self, adapter, port_index):
+        """
+        Return the port with the specified index on the adapter.
+
+        Raises:
+          ParameterError: The port does not exist.
+        """
+        key = (adapter.uri, port_index)
+        if key not in self._ports:
+            try:
+                self._ports[key] = adapter.ports.find(index=port_index)
+            except zhmcclient.NotFound:
+                raise ParameterError(
+                    "Artificial property 'adapter_port' does not specify the "
+                    "index of an existing port on adapter "
+                    f"{adapter.name!r}: {port_index!r}")
+        return self._ports[key]
+
+    def vswitch_uri(self, adapter, port_index):
+        """
+        Return the URI of the virtual switch for the port with the specified
+        index on the adapter.
+
+        Raises:
+          ParameterError: The virtual switch does not exist.
+        """
+        if adapter.uri not in self._vswitch_uris:
+            vswitches = self.cpc.virtual_switches.findall(
+                **{'backing-adapter-uri': adapter.uri})
+            self._vswitch_uris[adapter.uri] = {
+                vs.get_property('port'): vs.uri for vs in vswitches}
+        try:
+            return self._vswitch_uris[adapter.uri][port_index]
+        except KeyError:
+            raise ParameterError(
+                f"There is no virtual switch for port {port_index!r} on "
+                f"adapter {adapter.name!r}")
+
+    def nes_feature(self):
+        """
+        Return whether the 'network-express-support' API feature is enabled
+        for the CPC.
+        """
+        if self._nes_feature is None:
+            self._nes_feature = self.cpc.api_feature_enabled(
+                'network-express-support')
+        return self._nes_feature
+
+
+def child_adapter_properties(kind, resolver, input_props, art_names):
+    """
+    Return the properties of a child element of a partition that result from
+    its artificial properties for the backing adapter (and port).
+
+    Parameters:
+
+      kind (str): Kind of child element, as in PARTITION_CHILDREN.
+
+      resolver (AdapterResolver): Resolver for the adapters of the CPC.
+
+      input_props (dict): Input properties of the child element.
+
+      art_names (tuple of str): Names of the artificial properties for the
+        kind of child element.
+
+    Returns:
+      dict: The resulting properties, with hyphens in their names.
+
+    Raises:
+      ParameterError: An issue with the artificial properties.
+    """
+    present = [name for name in art_names if name in input_props]
+    if not present:
+        return {}
+    if len(present) != len(art_names):
+        raise ParameterError(
+            f"Artificial properties {art_names!r} of a {kind} must either "
+            "all be specified or all be omitted.")
+    adapter = resolver.adapter(to_unicode(input_props['adapter_name']))
+    if kind == 'virtual function':
+        return {'adapter-uri': adapter.uri}
+    port_index = int(input_props['adapter_port'])
+    port = resolver.port(adapter, port_index)
+    if kind == 'HBA':
+        return {'adapter-port-uri': port.uri}
+    adapter_family = adapter.get_property('adapter-family')
+    if adapter_family in ('osa', 'hipersockets'):
+        if not resolver.nes_feature():
+            # The NIC is vswitch-based
+            return {
+                'virtual-switch-uri': resolver.vswitch_uri(
+                    adapter, port_index)}
+        return {'network-adapter-port-uri': port.uri}
+    if adapter_family in ('roce', 'cna', 'network-express', 'networking'):
+        # The NIC is adapter-based
+        return {'network-adapter-port-uri': port.uri}
+    raise ParameterError(
+        "Artificial property 'adapter_name' specifies the name of a "
+        f"non-network adapter of family {adapter_family!r}: "
+        f"{adapter.name!r}")
+
+
+def process_child_properties(kind, prop_defs, art_names, spec, child,
+                             resolver):
+    """
+    Process the properties of a child element of a partition that is
+    specified in the 'nics', 'hbas' or 'virtual_functions' module parameter,
+    and return the properties for creating it, and the properties that need
+    to be updated if it exists.
+
+    Parameters:
+
+      kind (str): Kind of child element, as in PARTITION_CHILDREN.
+
+      prop_defs (dict): Property definitions of the child element, as in
+        PARTITION_CHILDREN.
+
+      art_names (tuple of str): Names of the artificial properties for the
+        kind of child element.
+
+      spec (dict): Specification of the child element, with items 'name' and
+        'properties'.
+
+      child (zhmcclient.BaseResource): Child element with the full set of
+        current properties, or `None` if it does not exist.
+
+      resolver (AdapterResolver): Resolver for the adapters of the CPC.
+
+    Returns:
+      tuple of (create_props, update_props, stop), where stop indicates that
+      the partition needs to be stopped for updating the properties.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+    """
+    child_name = to_unicode(spec['name'])
+    create_props = {'name': child_name}
+    update_props = {}
+    stop = False
+    input_props = spec.get('properties') or {}
+    for prop_name in input_props:
+        if prop_name not in prop_defs:
+            raise ParameterError(
+                f"Property {prop_name!r} of {kind} {child_name!r} is not "
+                f"defined in the data model for {kind}s.")
+        if not prop_defs[prop_name][0]:
+            raise ParameterError(
+                f"Property {prop_name!r} of {kind} {child_name!r} is not "
+                "allowed in the module parameters.")
+        if prop_name in art_names:
+            # Artificial properties are processed together after this loop
+            continue
+        _create_props, _update_props, _stop = process_normal_property(
+            prop_name, prop_defs, input_props, child)
+        create_props.update(_create_props)
+        update_props.update(_update_props)
+        stop |= _stop
+
+    art_props = child_adapter_properties(
+        kind, resolver, input_props, art_names)
+    for hmc_prop_name, value in art_props.items():
+        if child is None:
+            create_props[hmc_prop_name] = value
+        elif child.properties.get(hmc_prop_name) != value:
+            if not prop_defs[hmc_prop_name.replace('-', '_')][2]:
+                raise ParameterError(
+                    f"The backing adapter of {kind} {child_name!r} cannot be "
+                    "changed once it exists.")
+            update_props[hmc_prop_name] = value
+            if not prop_defs[hmc_prop_name.replace('-', '_')][3]:
+                stop = True
+    return create_props, update_props, stop
+
+
+def create_child(kind, manager, spec, create_props, update_props, resolver):
+    """
+    Create a child element of a partition, and update its update-only
+    properties.
+
+    For NICs, this circumvents the HTTP 500.12 error of "Create NIC" for
+    Hipersockets adapters when the Partition Link feature on z16 is enabled,
+    in the same way as the zhmc_nic module.
+
+    Parameters:
+
+      kind (str): Kind of child element, as in PARTITION_CHILDREN.
+
+      manager (zhmcclient.BaseManager): Manager for the child elements.
+
+      spec (dict): Specification of the child element, with items 'name' and
+        'properties'.
+
+      create_props (dict): Properties for creating the child element.
+
+      update_props (dict): Properties for updating the child element, as
+        returned by process_child_properties() for a non-existing child.
+
+      resolver (AdapterResolver): Resolver for the adapters of the CPC.
+
+    Raises:
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+    try:
+        child = manager.create(create_props)
+    except zhmcclient.HTTPError as exc:
+        if kind != 'NIC' or exc.http_status != 500 or exc.reason != 12:
+            raise
+        # Circumvention for a defect that happens with Hipersocket NICs when
+        # the Partition Link feature on z16 is enabled: The NIC has been
+        # created, but with a different name.
+        LOGGER.warning(
+            "Circumventing HTTP 500.12 when creating NIC %r on partition %r",
+            create_props['name'], manager.partition.name)
+        child = find_nic_for_500_12(
+            LOGGER, spec.get('properties'), manager.partition)
+        child.pull_full_properties()
+        _, prop_defs, _, art_names = PARTITION_CHILDREN['nics']
+        _, update_props, _ = process_child_properties(
+            kind, prop_defs, art_names, spec, child, resolver)
+        update_props.pop('virtual-switch-uri', None)
+        if child.name != create_props['name']:
+            update_props['name'] = create_props['name']
+        create_props = {}
+    update2_props = {name: value for name, value in update_props.items()
+                     if name not in create_props}
+    if update2_props:
+        retry_operation(child, 'update_properties', update2_props)
+
+
+def reconcile_children(params, cpc, partition, created, check_mode,
+                       deadline=None):
+    """
+    Ensure that the partition has exactly the NICs, HBAs, virtual functions
+    and attached storage groups that are specified in the 'nics', 'hbas',
+    'virtual_functions' and 'storage_groups' module parameters, and that the
+    child elements have the specified properties. Module parameters that are
+    `None` leave the corresponding child elements unchanged.
+
+    The current child elements are retrieved once per kind. The needed
+    changes are then determined and validated before any change is made.
+    If any property update requires the partition to be stopped, the
+    partition is stopped. Otherwise, the completion of a status transition of
+    the partition is awaited. The changes are then performed one after the
+    other, because the HMC rejects concurrent changes of a partition as busy:
+    First, the child elements that are not specified are deleted (or storage
+    groups detached), then the missing child elements are created (or storage
+    groups attached) and the existing ones updated.
+
+    Parameters:
+
+      params (dict): Module input parameters.
+
+      cpc (zhmcclient.Cpc): CPC of the partition.
+
+      partition (zhmcclient.Partition): The partition. It must exist, except
+        in check mode.
+
+      created (bool): Indicates that the partition has just been created, so
+        that it has no child elements.
+
+      check_mode (bool): Indicates check mode, where no changes are made.
+
+      deadline (Deadline): Deadline for stopping the partition or waiting for
+        the completion of its status transition, or `None`.
+
+    Returns:
+      bool: Indicates whether changes were made (or would be made, in check
+      mode).
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      StatusError: An issue with the partition status.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+    resolver = AdapterResolver(cpc)
+    removals = []
+    changes = []
+    stop = False
+
+    for param_name, (kind, prop_defs, manager_attr, art_names) in \
+            PARTITION_CHILDREN.items():
+        specs = params[param_name]
+        if specs is None:
+            continue
+        names = [to_unicode(spec['name']) for spec in specs]
+        if len(set(names)) != len(names):
+            raise ParameterError(
+                f"Module parameter {param_name!r} specifies {kind}s with "
+                "duplicate names.")
+        manager = getattr(partition, manager_attr)
+        current = {} if created else \
+            {c.name: c for c in manager.list(full_properties=True)}
+        for spec in specs:
+            child = current.pop(to_unicode(spec['name']), None)
+            create_props, update_props, _stop = process_child_properties(
+                kind, prop_defs, art_names, spec, child, resolver)
+            if child is None:
+                changes.append(functools.partial(
+                    create_child, kind, manager, spec, create_props,
+                    update_props, resolver))
+                stop |= _stop
+            elif update_props:
+                changes.append(functools.partial(
+                    retry_operation, child, 'update_properties',
+                    update_props))
+                stop |= _stop
+        for child in current.values():
+            removals.append(functools.partial(
+                retry_operation, child, 'delete'))
+
+    sg_names = params['storage_groups']
+    if sg_names is not None:
+        attached = {} if created else \
+            {sg.name: sg for sg in partition.list_attached_storage_groups()}
+        storage_groups = None
+        for sg_name in sg_names:
+            if attached.pop(sg_name, None) is not None:
+                continue
+            if storage_groups is None:
+                storage_groups = {
+                    sg.name: sg for sg in
+                    cpc.manager.console.storage_groups.list(
+                        filter_args={'cpc-uri': cpc.uri})}
+            try:
+                storage_group = storage_groups[sg_name]
+            except KeyError:
+                raise ParameterError(
+                    "Module parameter 'storage_groups' specifies a storage "
+                    f"group that does not exist on CPC {cpc.name!r}: "
+                    f"{sg_name!r}")
+            changes.append(functools.partial(
+                partition.attach_storage_group, storage_group))
+        for storage_group in attached.values():
+            removals.append(functools.partial(
+                partition.detach_storage_group, storage_group))
+
+    if not (removals or changes):
+        return False
+    if not check_mode:
+        if stop:
+            stop_partition(LOGGER, partition, check_mode, deadline=deadline)
+        else:
+            wait_for_transition_completion(
+                LOGGER, partition, deadline=deadline)
+        for action in removals + changes:
+            action()
+    elif stop:
+        partition.update_properties_local({'status': 'stopped'})
+    return True
+
+
 def add_artificial_properties(
         partition_properties, partition, expand_storage_groups,
         expand_crypto_adapters, expand_nics):
@@ -1688,7 +2295,12 @@ def add_artificial_properties(
     partition_properties['hbas'] = hbas_prop
 
     if expand_nics:
-        # Get the NIC child elements of the partition
+        # Get the NIC child elements of the partition.
+        # NICs of a partition typically share their virtual switches, adapter
+        # ports and adapters, so these are retrieved only once.
+        vswitches = {}  # vswitch URI -> (adapter URI, port index)
+        ports = {}  # port URI -> (adapter URI, port index)
+        adapters = {}  # adapter URI -> (adapter name, adapter ID)
         nics_prop = []
         for nic in partition.nics.list(full_properties=True):
             nic_props = {}
@@ -1697,23 +2309,32 @@ def add_artificial_properties(
             vswitch_uri = nic.prop("virtual-switch-uri", None)
             if vswitch_uri:
                 # vswitch-based NIC (OSA, HS up to z16)
-                vswitch = cpc.virtual_switches.find(**{'object-uri': vswitch_uri})
-                adapter_uri = vswitch.get_property('backing-adapter-uri')
-                adapter_port = vswitch.get_property('port')
-                adapter = cpc.adapters.find(**{'object-uri': adapter_uri})
-                nic_props['adapter-name'] = adapter.name
-                nic_props['adapter-port'] = adapter_port
-                nic_props['adapter-id'] = adapter.get_property('adapter-id')
+                if vswitch_uri not in vswitches:
+                    vswitch = cpc.virtual_switches.resource_object(
+                        vswitch_uri)
+                    vswitch.pull_properties(['backing-adapter-uri', 'port'])
+                    vswitches[vswitch_uri] = (
+                        vswitch.get_property('backing-adapter-uri'),
+                        vswitch.get_property('port'))
+                adapter_uri, adapter_port = vswitches[vswitch_uri]
             else:
                 # adapter-based NIC (RoCE, CNA up to z16 or all adapter types
                 # since z17)
                 port_uri = nic.prop("network-adapter-port-uri", None)
-                port_props = session.get(port_uri)
-                adapter_uri = port_props['parent']
-                adapter = cpc.adapters.find(**{'object-uri': adapter_uri})
-                nic_props['adapter-name'] = adapter.name
-                nic_props['adapter-port'] = port_props['index']
-                nic_props['adapter-id'] = adapter.get_property('adapter-id')
+                if port_uri not in ports:
+                    port_props = session.get(port_uri)
+                    ports[port_uri] = (port_props['parent'],
+                                       port_props['index'])
+                adapter_uri, adapter_port = ports[port_uri]
+            if adapter_uri not in adapters:
+                adapter = cpc.adapters.resource_object(adapter_uri)
+                adapter.pull_properties(['name', 'adapter-id'])
+                adapters[adapter_uri] = (adapter.name,
+                                         adapter.get_property('adapter-id'))
+            adapter_name, adapter_id = adapters[adapter_uri]
+            nic_props['adapter-name'] = adapter_name
+            nic_props['adapter-port'] = adapter_port
+            nic_props['adapter-id'] = adapter_id
             nics_prop.append(nic_props)
         partition_properties['nics'] = nics_prop
 
@@ -1935,12 +2556,14 @@ def ensure_active(params, check_mode):
     expand_crypto_adapters = params['expand_crypto_adapters']
     expand_nics = params['expand_nics']
     select_prop_names = params['select_properties']  # with underscores
+    wait = params['wait']
 
     changed = False
     result = {}
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -1950,6 +2573,7 @@ def ensure_active(params, check_mode):
             pull_properties(partition, select_prop_names)
         except zhmcclient.NotFound:
             partition = None
+        created = partition is None
 
         if not partition:
             # It does not exist. Create it and update it if there are
@@ -1963,7 +2587,8 @@ def ensure_active(params, check_mode):
             if not check_mode:
                 partition = cpc.partitions.create(create_props)
                 if update2_props:
-                    partition.update_properties(update2_props)
+                    retry_operation(
+                        partition, 'update_properties', update2_props)
                 if crypto_changes:
                     change_crypto_config(partition, crypto_changes, check_mode)
                 # Properties are refreshed further down
@@ -1983,10 +2608,13 @@ def ensure_active(params, check_mode):
             if update_props:
                 if not check_mode:
                     if stop:
-                        stop_partition(LOGGER, partition, check_mode)
+                        stop_partition(
+                            LOGGER, partition, check_mode, deadline=deadline)
                     else:
-                        wait_for_transition_completion(LOGGER, partition)
-                    partition.update_properties(update_props)
+                        wait_for_transition_completion(
+                            LOGGER, partition, deadline=deadline)
+                    retry_operation(
+                        partition, 'update_properties', update_props)
                     # Properties are refreshed further down
                 else:
                     # Update the local object's properties
@@ -1999,7 +2627,11 @@ def ensure_active(params, check_mode):
         if not partition:
             raise AssertionError()
 
-        changed |= start_partition(LOGGER, partition, check_mode)
+        changed |= reconcile_children(
+            params, cpc, partition, created, check_mode, deadline=deadline)
+
+        changed |= start_partition(
+            LOGGER, partition, check_mode, deadline=deadline, wait=wait)
 
         if not check_mode:
 
@@ -2009,7 +2641,10 @@ def ensure_active(params, check_mode):
             pull_properties(partition, select_prop_names)
 
             status = partition.get_property('status')
-            if status not in ('active', 'degraded'):
+            end_statuses = ('active', 'degraded')
+            if not wait:
+                end_statuses += ('starting',)
+            if status not in end_statuses:
                 raise StatusError(
                     f"Could not get partition {partition.name!r} into an "
                     f"active state, status is: {status!r}")
@@ -2044,12 +2679,14 @@ def ensure_stopped(params, check_mode):
     expand_crypto_adapters = params['expand_crypto_adapters']
     expand_nics = params['expand_nics']
     select_prop_names = params['select_properties']  # with underscores
+    wait = params['wait']
 
     changed = False
     result = {}
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -2059,6 +2696,7 @@ def ensure_stopped(params, check_mode):
             pull_properties(partition, select_prop_names)
         except zhmcclient.NotFound:
             partition = None
+        created = partition is None
 
         if not partition:
             # It does not exist. Create it and update it if there are
@@ -2073,7 +2711,8 @@ def ensure_stopped(params, check_mode):
             if not check_mode:
                 partition = cpc.partitions.create(create_props)
                 if update2_props:
-                    partition.update_properties(update2_props)
+                    retry_operation(
+                        partition, 'update_properties', update2_props)
                 # Properties are refreshed further down
             else:
                 # Create a Partition object locally
@@ -2088,10 +2727,14 @@ def ensure_stopped(params, check_mode):
                 process_properties(cpc, partition, params)
             # Note: create_props in this case only contains 'name' and can be
             # ignored.
-            changed |= stop_partition(LOGGER, partition, check_mode)
+            # Property updates require the stop to be completed.
+            changed |= stop_partition(
+                LOGGER, partition, check_mode, deadline=deadline,
+                wait=wait or bool(update_props))
             if update_props:
                 if not check_mode:
-                    partition.update_properties(update_props)
+                    retry_operation(
+                        partition, 'update_properties', update_props)
                     # Properties are refreshed further down
                 else:
                     # Update the local object's properties
@@ -2104,6 +2747,9 @@ def ensure_stopped(params, check_mode):
         if not partition:
             raise AssertionError()
 
+        changed |= reconcile_children(
+            params, cpc, partition, created, check_mode, deadline=deadline)
+
         if not check_mode:
             # Properties are refreshed only when not in check mode, because
             # in check mode we have local (client-side) changes that are not
@@ -2111,7 +2757,10 @@ def ensure_stopped(params, check_mode):
             pull_properties(partition, select_prop_names)
 
             status = partition.get_property('status')
-            if status not in ('stopped'):
+            end_statuses = ('stopped',)
+            if not wait:
+                end_statuses += ('stopping',)
+            if status not in end_statuses:
                 raise StatusError(
                     f"Could not get partition {partition.name!r} into a "
                     f"stopped state, status is: {status!r}")
@@ -2147,6 +2796,7 @@ def ensure_absent(params, check_mode):
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -2157,8 +2807,9 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            stop_partition(LOGGER, partition, check_mode)
-            partition.delete()
+            stop_partition(
+                LOGGER, partition, check_mode, deadline=deadline)
+            retry_operation(partition, 'delete')
         changed = True
 
         return changed, result
@@ -2224,7 +2875,7 @@ def ensure_iso_mount(params, check_mode):
             # We only need to update the INS file
             if not check_mode:
                 props = {'boot-iso-ins-file': ins_file}
-                partition.update_properties(props)
+                retry_operation(partition, 'update_properties', props)
             changed = True
 
         return changed, result
@@ -2288,7 +2939,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -2332,6 +2983,13 @@ def perform_task(params, check_mode):
     return actions[params['state']](params, check_mode)
 
 
+# Suboptions of the module parameters for child elements of the partition
+CHILD_OPTIONS = dict(
+    name=dict(required=True, type='str'),
+    properties=dict(required=False, type='dict', default=None),
+)
+
+
 def main():
     """Main function"""
 
@@ -2348,6 +3006,14 @@ def main():
         select_properties=dict(required=False, type='list', elements='str',
                                default=None),
         properties=dict(required=False, type='dict', default=None),
+        nics=dict(required=False, type='list', elements='dict', default=None,
+                  options=CHILD_OPTIONS),
+        hbas=dict(required=False, type='list', elements='dict', default=None,
+                  options=CHILD_OPTIONS),
+        virtual_functions=dict(required=False, type='list', elements='dict',
+                               default=None, options=CHILD_OPTIONS),
+        storage_groups=dict(required=False, type='list', elements='str',
+                            default=None),
         image_name=dict(required=False, type='str', default=None),
         image_file=dict(required=False, type='str', default=None),
         ins_file=dict(required=False, type='str', default=None),
@@ -2355,6 +3021,7 @@ def main():
         expand_crypto_adapters=dict(required=False, type='bool',
                                     default=False),
         expand_nics=dict(required=False, type='bool', default=None),
+        wait=dict(required=False, type='bool', default=True),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -2402,13 +3069,14 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, partition: %r", changed, result)
-    module.exit_json(changed=changed, partition=result)
+    module.exit_json(
+        changed=changed, partition=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -193,6 +193,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the password
+       rule upon transient HMC errors, by operation (method name and resource
+       URI). Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/console/password-rules/88067209-cbab-11f1-9b31-fa163e1c2d41": 1
+    }
 password_rule:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -264,7 +276,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -501,7 +513,7 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 pwrule = console.password_rules.create(create_props)
                 if update2_props:
-                    pwrule.update_properties(update2_props)
+                    retry_operation(pwrule, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 pwrule.pull_full_properties()
@@ -524,7 +536,7 @@ def ensure_present(params, check_mode):
                     "Existing password rule %r needs to get properties "
                     "updated: %r", pwrule_name, update_props)
                 if not check_mode:
-                    pwrule.update_properties(update_props)
+                    retry_operation(pwrule, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     pwrule.pull_full_properties()
@@ -569,7 +581,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            pwrule.delete()
+            retry_operation(pwrule, 'delete')
         changed = True
 
         return changed, result
@@ -593,7 +605,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -675,14 +687,15 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, password_rule: %r",
         changed, result)
-    module.exit_json(changed=changed, password_rule=result)
+    module.exit_json(
+        changed=changed, password_rule=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -177,7 +177,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -202,7 +202,7 @@ def perform_list(params):
 
     full_properties = params['full_properties']
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         console = client.consoles.console
@@ -270,13 +270,14 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, password_rules: %r",
                  changed, result_list)
-    module.exit_json(changed=changed, password_rules=result_list)
+    module.exit_json(
+        changed=changed, password_rules=result_list, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -224,7 +224,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, common_fail_on_import_errors, \
-    parse_hmc_host, blanked_params  # noqa: E402
+    parse_hmc_host, blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -363,13 +363,15 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, hmc_auth: (not shown), "
                  "hmc_host: %r", changed, hmc_host)
-    module.exit_json(changed=changed, hmc_auth=hmc_auth, hmc_host=hmc_host)
+    module.exit_json(
+        changed=changed, hmc_auth=hmc_auth, hmc_host=hmc_host,
+        **module_result_items())
 
 
 if __name__ == '__main__':
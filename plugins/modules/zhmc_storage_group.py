@@ -123,8 +123,24 @@ options:
   name:
     description:
       - The name of the target storage group.
+      - "Required, except for O(state=discover) when O(names) is specified."
     type: str
-    required: true
+    required: false
+    default: null
+  names:
+    description:
+      - "The names of multiple target storage groups, for O(state=discover).
+         Mutually exclusive with O(name)."
+      - "The FCP discovery is started for all specified storage groups at
+         once, and if O(discover_wait) is True, their completion is awaited
+         together within O(discover_timeout). The outcome for each storage
+         group is returned in RV(storage_groups)."
+      - "If the discovery fails or does not complete in time for any of the
+         storage groups, the module fails and returns RV(storage_groups)."
+    type: list
+    elements: str
+    required: false
+    default: null
   state:
     description:
       - "The desired state for the storage group. All states are fully
@@ -139,7 +155,9 @@ options:
          is not changed."
       - "* V(discover): Triggers LUN discovery. If O(discover_wait) is
          specified, waits for completion of the discovery.
-         Requires that the storage group exists and is of type 'fcp'."
+         Requires that the storage group exists and is of type 'fcp'.
+         If O(names) is specified, triggers LUN discovery for multiple
+         storage groups concurrently."
       - "* V(facts): Returns the storage group properties."
     type: str
     required: true
@@ -165,6 +183,39 @@ options:
     type: dict
     required: false
     default: null
+  volumes:
+    description:
+      - "The storage volumes of the storage group, for O(state=present).
+         Will be ignored for other O(state) values."
+      - "If specified, the storage group will have exactly the specified
+         storage volumes after the module has run: Missing storage volumes are
+         created, existing storage volumes are updated with the specified
+         properties, and storage volumes that are not specified are deleted.
+         If null, the storage volumes of the storage group remain unchanged."
+      - "The storage volumes are reconciled against a single retrieval of the
+         current storage volumes, and all needed creations, updates and
+         deletions are performed with a single HMC operation, together with
+         any changes of the storage group properties."
+      - "The current storage volumes are determined in the same way as by the
+         R(zhmc_storage_volume module,zhmc_storage_volume_module)."
+    type: list
+    elements: dict
+    required: false
+    default: null
+    suboptions:
+      name:
+        description:
+          - "The name of the storage volume."
+        type: str
+        required: true
+      properties:
+        description:
+          - "Dictionary with input properties for the storage volume, as
+             described for the C(properties) parameter of the
+             R(zhmc_storage_volume module,zhmc_storage_volume_module)."
+        type: dict
+        required: false
+        default: null
   expand:
     description:
       - "If True, the return value will contain additional artificial
@@ -173,20 +224,63 @@ options:
     type: bool
     required: false
     default: false
+  partition_properties:
+    description:
+      - "List of partition properties to be returned for each attached
+         partition in the RV(storage_group.attached-partitions) return value,
+         in addition to the 'object-uri' and 'name' properties."
+      - "If specified, RV(storage_group.attached-partitions) is returned also
+         when O(expand) is False, and only the specified properties are
+         retrieved from the HMC."
+      - "If None/null, the full set of properties of the attached partitions
+         is returned if O(expand) is True."
+      - "The property names are specified with underscores instead of
+         hyphens."
+      - "The properties of the attached partitions are retrieved concurrently."
+    type: list
+    elements: str
+    required: false
+    default: null
   discover_wait:
     description:
       - "Boolean that controls whether to wait for completion of the FCP
          discovery for O(state=discover)."
+      - "If False, the URI of the HMC job for the FCP discovery is returned in
+         RV(job_uris), and its completion can be awaited with the
+         R(zhmc_job module,zhmc_job_module)."
     type: bool
     required: false
     default: false
   discover_timeout:
     description:
       - "Timeout in seconds for how long to wait for completion of the FCP
-         discovery for O(state=discover)."
+         discovery for O(state=discover). If O(names) is specified, this is
+         the timeout for the completion of all discoveries."
     type: int
     required: false
     default: 300
+  wait_for_fulfillment:
+    description:
+      - "Boolean that controls whether to wait until the storage volumes of
+         the storage group are fulfilled (i.e. their C(fulfillment-state)
+         property is V(complete)), for O(state=present|facts). For
+         O(state=present), the wait is skipped in check mode."
+      - "The wait is driven by the object notifications of the HMC for the
+         storage group if they can be received (i.e. if O(hmc_auth) specifies
+         userid and password), and falls back to polling otherwise. Each check
+         retrieves the storage volumes of the storage group with a single HMC
+         operation."
+    type: bool
+    required: false
+    default: false
+  fulfillment_timeout:
+    description:
+      - "Timeout in seconds for how long to wait for the fulfillment for
+         O(wait_for_fulfillment). If the timeout expires, the module fails.
+         0 means that there is no timeout."
+    type: int
+    required: false
+    default: 600
   log_file:
     description:
       - "File path of a log file to which the logic flow of this module as well
@@ -241,6 +335,28 @@ EXAMPLES = """
       max-partitions: 1
   register: sg1
 
+- name: Ensure the storage group exists and has exactly these storage volumes
+  zhmc_storage_group:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    name: "{{ my_storage_group_name }}"
+    state: present
+    properties:
+      type: fcp
+    volumes:
+      - name: "{{ my_storage_group_name }}-boot"
+        properties:
+          size: 32
+          usage: boot
+      - name: "{{ my_storage_group_name }}-data"
+        properties:
+          size: 128
+          usage: data
+    wait_for_fulfillment: true
+    fulfillment_timeout: 1800
+  register: sg1
+
 - name: Trigger LUN discovery
   zhmc_storage_group:
     hmc_host: "{{ my_hmc_host }}"
@@ -249,6 +365,17 @@ EXAMPLES = """
     name: "{{ my_storage_group_name }}"
     state: discover
   register: sg1
+
+- name: Trigger LUN discovery for multiple storage groups and wait for it
+  zhmc_storage_group:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    names: "{{ my_storage_group_names }}"
+    state: discover
+    discover_wait: true
+    discover_timeout: 600
+  register: sgs
 """
 
 RETURN = """
@@ -261,13 +388,85 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the storage
+       group upon transient HMC errors, by operation (method name and resource
+       URI). Property updates that create storage volumes are not retried. Not
+       returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/storage-groups/88068ab7-cbab-11f1-9b32-fa163e1c2d42": 1
+    }
+job_uris:
+  description:
+    - "URIs of the HMC jobs of the operations that were submitted without
+       waiting for their completion, for O(state=discover) with
+       O(discover_wait=false), and of the FCP discoveries whose completion
+       timed out for O(state=discover) with O(names)."
+  returned: success or failure
+  type: list
+  elements: str
+  sample:
+    [
+      "/api/jobs/fa7b6c3e-1d0a-11ef-9b2a-fa163e1c2d3a"
+    ]
+storage_groups:
+  description:
+    - "For O(state=discover) with O(names), the outcome of the FCP discovery
+       for each storage group, in the order of O(names)."
+    - "In case of a failure because the discovery has failed or timed out for
+       any of the storage groups, this is also returned."
+  returned: success or failure, when O(names) is specified
+  type: list
+  elements: dict
+  contains:
+    name:
+      description: "Storage group name"
+      type: str
+    status:
+      description:
+        - "Outcome of the FCP discovery. One of:"
+        - "'complete' - The discovery has completed successfully."
+        - "'failed' - The discovery has failed, could not be started, or the
+           storage group properties could not be retrieved after it."
+        - "'timeout' - The discovery has not completed within
+           O(discover_timeout). The job URI is returned in RV(job_uris)."
+        - "'submitted' - The discovery was started without waiting for its
+           completion (O(discover_wait=false)). The job URI is returned in
+           RV(job_uris)."
+      type: str
+    error:
+      description: "Error message, if the discovery has failed or timed out.
+        Otherwise, null."
+      type: str
+    storage_group:
+      description: "The resource properties of the storage group after the
+        discovery, plus additional artificial properties as described for
+        RV(storage_group). Only present if the status is 'complete'."
+      type: dict
+  sample:
+    [
+        {
+            "name": "sg1",
+            "status": "complete",
+            "error": null,
+            "storage_group": {
+                "name": "sg1",
+                "type": "fcp"
+            }
+        }
+    ]
 storage_group:
   description:
     - "For O(state=absent), an empty dictionary."
     - "For O(state=present|facts|discover), the resource properties of the
        target storage group after any changes, plus additional artificial
        properties as described below."
-  returned: success
+  returned: success, when O(names) is not specified
   type: dict
   contains:
     name:
@@ -287,7 +486,8 @@ storage_group:
     attached-partitions:
       description:
         - "Partitions to which the storage group is attached."
-        - "Only present if O(expand) is True."
+        - "Only present if O(expand) is True or O(partition_properties) is
+           specified."
       returned: "success"
       type: list
       elements: dict
@@ -295,7 +495,10 @@ storage_group:
         "{property}":
           description: "Properties of the partition, as described in the data
             model of the 'Partition' object in the R(HMC API,HMC API) book.
-            The property names have hyphens (-) as described in that book."
+            The property names have hyphens (-) as described in that book.
+            If O(partition_properties) is specified, only the specified
+            properties and the 'object-uri' and 'name' properties are
+            present."
           type: raw
     storage-volumes:
       description:
@@ -584,7 +787,9 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, wait_for_job_completion, SUBMITTED_JOBS, \
+    module_result_items, run_concurrently, Deadline, wait_for_fulfillment, \
+    ZHMC_STORAGE_VOLUME_PROPERTIES, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -598,6 +803,23 @@ LOGGER_NAME = 'zhmc_storage_group'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Maximum number of concurrent retrievals of storage volume properties for
+# the 'volumes' module parameter.
+VOLUME_MAX_PARALLEL = 8
+
+# Maximum number of concurrent retrievals of attached partition properties
+# for the 'attached-partitions' artificial property.
+PARTITION_MAX_PARALLEL = 10
+
+# Maximum number of concurrent FCP discoveries that are started and awaited
+# for the 'names' module parameter.
+DISCOVER_MAX_PARALLEL = 10
+
+# Properties of storage volumes that are returned by the 'List Storage Volumes
+# of a Storage Group' operation without retrieving their full properties.
+VOLUME_LIST_PROPERTIES = (
+    'element-uri', 'name', 'fulfillment-state', 'size', 'usage')
+
 # Dictionary of properties of storage group resources, in this format:
 #   name: (allowed, create, update, eq_func, type_cast)
 # where:
@@ -752,7 +974,129 @@ def process_properties(cpc, storage_group, params):
     return create_props, update_props
 
 
-def add_artificial_properties(sg_properties, storage_group, expand):
+def process_volume_properties(spec, storage_volume):
+    """
+    Process the properties of a storage volume that is specified in the
+    'volumes' module parameter, and return the properties for creating it,
+    and the properties that need to be updated if it exists.
+
+    Parameters:
+
+      spec (dict): Specification of the storage volume, with items 'name' and
+        'properties'.
+
+      storage_volume (zhmcclient.StorageVolume): Storage volume with the
+        current values of the specified properties, or `None` if it does not
+        exist.
+
+    Returns:
+      tuple of (create_props, update_props).
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+    """
+    sv_name = to_unicode(spec['name'])
+    create_props = {'name': sv_name}
+    update_props = {}
+    input_props = spec.get('properties') or {}
+    for prop_name in input_props:
+        if prop_name not in ZHMC_STORAGE_VOLUME_PROPERTIES:
+            raise ParameterError(
+                f"Property {prop_name!r} of storage volume {sv_name!r} is not "
+                "defined in the data model for storage volumes.")
+        if not ZHMC_STORAGE_VOLUME_PROPERTIES[prop_name][0]:
+            raise ParameterError(
+                f"Property {prop_name!r} of storage volume {sv_name!r} is not "
+                "allowed in the module parameters.")
+        _create_props, _update_props, _ = process_normal_property(
+            prop_name, ZHMC_STORAGE_VOLUME_PROPERTIES, input_props,
+            storage_volume)
+        create_props.update(_create_props)
+        update_props.update(_update_props)
+    return create_props, update_props
+
+
+def volume_requests(storage_group, params):
+    """
+    Determine the storage volume requests that are needed for the storage
+    group to have exactly the storage volumes that are specified in the
+    'volumes' module parameter, with the specified properties.
+
+    The current storage volumes are retrieved with a single 'List Storage
+    Volumes of a Storage Group' operation. The full properties of existing
+    storage volumes are retrieved (concurrently) only if the specified
+    properties are not all returned by that operation.
+
+    Parameters:
+
+      storage_group (zhmcclient.StorageGroup): The storage group, or `None`
+        if it does not exist yet.
+
+      params (dict): Module input parameters.
+
+    Returns:
+      list of dict: The storage volume request objects for the
+      'storage-volumes' field of the 'Create Storage Group' or 'Modify Storage
+      Group Properties' operation, with the deletions first. An empty list
+      means that no changes are needed, or that the 'volumes' module parameter
+      was not specified.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+    specs = params['volumes']
+    if specs is None:
+        return []
+    names = [to_unicode(spec['name']) for spec in specs]
+    if len(set(names)) != len(names):
+        raise ParameterError(
+            "Module parameter 'volumes' specifies storage volumes with "
+            "duplicate names.")
+
+    current = {}
+    if storage_group is not None:
+        for sv in storage_group.storage_volumes.list():
+            current.setdefault(sv.name, []).append(sv)
+
+    storage_volumes = []
+    pull_svs = []
+    for spec, name in zip(specs, names):
+        svs = current.pop(name, [])
+        if len(svs) > 1:
+            # The name of storage volumes within their storage group is not
+            # enforced to be unique.
+            raise ParameterError(
+                f"Storage group {storage_group.name!r} has multiple storage "
+                f"volumes with name {name!r}.")
+        sv = svs[0] if svs else None
+        storage_volumes.append(sv)
+        input_props = spec.get('properties') or {}
+        if sv is not None and any(
+                pn.replace('_', '-') not in VOLUME_LIST_PROPERTIES
+                for pn in input_props):
+            pull_svs.append(sv)
+    run_concurrently(zhmcclient.StorageVolume.pull_full_properties, pull_svs,
+                     VOLUME_MAX_PARALLEL)
+
+    requests = []
+    for svs in current.values():
+        for sv in svs:
+            requests.append({'operation': 'delete', 'element-uri': sv.uri})
+    for spec, sv in zip(specs, storage_volumes):
+        create_props, update_props = process_volume_properties(spec, sv)
+        if sv is None:
+            create_props['operation'] = 'create'
+            requests.append(create_props)
+        elif update_props:
+            update_props['operation'] = 'modify'
+            update_props['element-uri'] = sv.uri
+            requests.append(update_props)
+    return requests
+
+
+def add_artificial_properties(
+        sg_properties, storage_group, expand, partition_properties=None):
     """
     Add artificial properties to the storage_group object.
 
@@ -763,11 +1107,15 @@ def add_artificial_properties(sg_properties, storage_group, expand):
     * 'attached-partition-names': List of Partition names to which the storage
       group is attached.
 
-    If expand is True:
+    If expand is True or partition_properties is not None:
 
     * 'attached-partitions': List of Partition objects to which the storage
       group is attached. Each Partition object is represented as a dictionary
-      of its properties.
+      of its properties. If partition_properties is not None, only these
+      properties (with underscores) and 'object-uri' and 'name' are retrieved,
+      otherwise the full set of properties.
+
+    If expand is True:
 
     * 'storage-volumes': List of StorageVolume objects, each of which is
       represented as its dictionary of properties.
@@ -786,6 +1134,8 @@ def add_artificial_properties(sg_properties, storage_group, expand):
       Will only be present for FCP SGs.
     """
 
+    # The attached partitions are listed once, for the names and for the
+    # expanded properties.
     parts = storage_group.list_attached_partitions()
 
     # List of attached partitions (just the names)
@@ -795,15 +1145,26 @@ def add_artificial_properties(sg_properties, storage_group, expand):
     sg_properties['attached-partition-names'] = part_names_prop
     sg_type = storage_group.get_property('type')
 
-    if expand:
+    if expand or partition_properties is not None:
+
+        # List of attached partitions (full or selected set of properties).
+        if partition_properties is None:
+            pull_func = zhmcclient.Partition.pull_full_properties
+        else:
+            pull_props = ['object-uri', 'name']
+            for pname in partition_properties:
+                pname_hmc = pname.replace('_', '-')
+                if pname_hmc not in pull_props:
+                    pull_props.append(pname_hmc)
 
-        # List of attached partitions (full set of properties).
-        parts = storage_group.list_attached_partitions()
-        parts_prop = []
-        for part in parts:
-            part.pull_full_properties()
-            parts_prop.append(dict(part.properties))
-        sg_properties['attached-partitions'] = parts_prop
+            def pull_func(part):
+                part.pull_properties(pull_props)
+
+        run_concurrently(pull_func, parts, PARTITION_MAX_PARALLEL)
+        sg_properties['attached-partitions'] = \
+            [dict(part.properties) for part in parts]
+
+    if expand:
 
         # Storage volumes (full set of properties).
         # Note: We create the storage volumes from the 'storage-volume-uris'
@@ -851,7 +1212,12 @@ def ensure_present(params, check_mode):
     """
     Ensure that the storage group exists and has the specified properties.
 
-    Storage volumes are not subject of this function, they are handled by the
+    If the 'volumes' module parameter is specified, ensure that the storage
+    group has exactly the specified storage volumes. All storage volume
+    changes are sent in the 'storage-volumes' field of the single 'Create
+    Storage Group' or 'Modify Storage Group Properties' operation that is
+    also used for the storage group properties. Otherwise, storage volumes
+    are not subject of this function, they are handled by the
     zhmc_storage_volume.py module.
 
     Raises:
@@ -862,6 +1228,7 @@ def ensure_present(params, check_mode):
     cpc_name = params['cpc_name']
     storage_group_name = params['name']
     expand = params['expand']
+    partition_properties = params['partition_properties']
 
     changed = False
     result = {}
@@ -885,6 +1252,9 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 create_props, update_props = \
                     process_properties(cpc, storage_group, params)
+                sv_requests = volume_requests(storage_group, params)
+                if sv_requests:
+                    create_props['storage-volumes'] = sv_requests
                 storage_group = console.storage_groups.create(
                     create_props)
                 update2_props = {}
@@ -892,7 +1262,8 @@ def ensure_present(params, check_mode):
                     if name not in create_props:
                         update2_props[name] = value
                 if update2_props:
-                    storage_group.update_properties(update2_props)
+                    retry_operation(
+                        storage_group, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 storage_group.pull_full_properties()
@@ -908,9 +1279,18 @@ def ensure_present(params, check_mode):
             if create_props:
                 raise AssertionError("Unexpected "
                                      "create_props: %r" % create_props)
+            sv_requests = volume_requests(storage_group, params)
+            if sv_requests:
+                update_props['storage-volumes'] = sv_requests
             if update_props:
                 if not check_mode:
-                    storage_group.update_properties(update_props)
+                    if any(r['operation'] == 'create' for r in sv_requests):
+                        # Creating storage volumes is not idempotent, so it
+                        # must not be retried.
+                        storage_group.update_properties(update_props)
+                    else:
+                        retry_operation(
+                            storage_group, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     storage_group.pull_full_properties()
@@ -922,8 +1302,16 @@ def ensure_present(params, check_mode):
         if not check_mode:
             if not storage_group:
                 raise AssertionError()
+            if params['wait_for_fulfillment']:
+                wait_for_fulfillment(
+                    storage_group, params['hmc_auth'],
+                    timeout=params['fulfillment_timeout'])
+                storage_group.pull_full_properties()
             result = dict(storage_group.properties)
-            add_artificial_properties(result, storage_group, expand)
+            # The storage volume requests are not a storage group property
+            result.pop('storage-volumes', None)
+            add_artificial_properties(
+                result, storage_group, expand, partition_properties)
 
         return changed, result
 
@@ -972,7 +1360,7 @@ def ensure_absent(params, check_mode):
                 # This will raise HTTPError(409) if the partition is in one of
                 # the transitional states ('starting', 'stopping').
                 part.detach_storage_group(storage_group)
-            storage_group.delete()
+            retry_operation(storage_group, 'delete')
         changed = True
 
         return changed, result
@@ -994,6 +1382,7 @@ def discover(params, check_mode):
     cpc_name = params['cpc_name']
     storage_group_name = params['name']
     expand = params['expand']
+    partition_properties = params['partition_properties']
     discover_wait = params['discover_wait']
     discover_timeout = params['discover_timeout']
 
@@ -1022,14 +1411,18 @@ def discover(params, check_mode):
                 f"Storage group {storage_group_name!r} is not of type 'fcp', "
                 f"but {sg_type!r}.")
 
-        storage_group.discover_fcp(
-            force_restart=True, wait_for_completion=discover_wait,
-            operation_timeout=discover_timeout)
+        job = storage_group.discover_fcp(
+            force_restart=True, wait_for_completion=False)
+        if discover_wait:
+            wait_for_job_completion(job, discover_timeout)
+        else:
+            SUBMITTED_JOBS.add(job)
 
         storage_group.pull_full_properties()
 
         result = dict(storage_group.properties)
-        add_artificial_properties(result, storage_group, expand)
+        add_artificial_properties(
+            result, storage_group, expand, partition_properties)
 
         return changed, result
 
@@ -1037,6 +1430,131 @@ def discover(params, check_mode):
         close_session(session, logoff)
 
 
+def discover_report(name, status, error=None, sg_properties=None):
+    """
+    Return the outcome item for the FCP discovery of a storage group.
+    """
+    report = {
+        'name': name,
+        'status': status,
+        'error': error,
+    }
+    if sg_properties is not None:
+        report['storage_group'] = sg_properties
+    return report
+
+
+def discover_multiple(params, check_mode):
+    # pylint: disable=unused-argument
+    """
+    Trigger LUN discovery for multiple FCP storage groups at once, and return
+    the outcome for each storage group.
+
+    The discoveries are started concurrently. If 'discover_wait' is True,
+    their completion is awaited concurrently within the shared timeout
+    'discover_timeout', and facts are returned for the storage groups whose
+    discovery has completed.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+
+    cpc_name = params['cpc_name']
+    storage_group_names = params['names']
+    expand = params['expand']
+    partition_properties = params['partition_properties']
+    discover_wait = params['discover_wait']
+    discover_timeout = params['discover_timeout']
+
+    changed = False
+
+    if len(set(storage_group_names)) != len(storage_group_names):
+        raise ParameterError(
+            "Module parameter 'names' specifies duplicate storage group "
+            "names.")
+
+    session, logoff = open_session(params)
+    try:
+        client = zhmcclient.Client(session)
+        console = client.consoles.console
+        cpc = client.cpcs.find(name=cpc_name)
+        # The default exception handling is sufficient for the above.
+
+        cpc_storage_groups = {
+            sg.name: sg for sg in console.storage_groups.list(
+                filter_args={'cpc-uri': cpc.uri})}
+        storage_groups = []
+        for storage_group_name in storage_group_names:
+            try:
+                storage_group = cpc_storage_groups[storage_group_name]
+            except KeyError:
+                raise ParameterError(
+                    f"Storage group {storage_group_name!r} does not exist or "
+                    f"is not associated with the specified CPC "
+                    f"{cpc.name!r}.")
+            sg_type = storage_group.get_property('type')
+            if sg_type != 'fcp':
+                raise ParameterError(
+                    f"Storage group {storage_group_name!r} is not of type "
+                    f"'fcp', but {sg_type!r}.")
+            storage_groups.append(storage_group)
+
+        # Errors are reported per storage group, so that the jobs of the
+        # other storage groups are not lost.
+        def start_discovery(storage_group):
+            try:
+                return storage_group.discover_fcp(
+                    force_restart=True, wait_for_completion=False), None
+            except zhmcclient.Error as exc:
+                return None, discover_report(
+                    storage_group.name, 'failed', str(exc))
+
+        started = run_concurrently(
+            start_discovery, storage_groups, DISCOVER_MAX_PARALLEL)
+
+        if not discover_wait:
+            reports = []
+            for storage_group, (job, report) in zip(storage_groups, started):
+                if job is not None:
+                    SUBMITTED_JOBS.add(job)
+                    report = discover_report(storage_group.name, 'submitted')
+                reports.append(report)
+            return changed, reports
+
+        deadline = Deadline(discover_timeout)
+
+        def await_discovery(item):
+            storage_group, (job, report) = item
+            if job is None:
+                return report
+            try:
+                wait_for_job_completion(job, discover_timeout, deadline)
+            except zhmcclient.OperationTimeout as exc:
+                # The discovery continues, and can be awaited with zhmc_job
+                SUBMITTED_JOBS.add(job)
+                return discover_report(storage_group.name, 'timeout', str(exc))
+            except zhmcclient.Error as exc:
+                return discover_report(storage_group.name, 'failed', str(exc))
+            try:
+                storage_group.pull_full_properties()
+                sg_properties = dict(storage_group.properties)
+                add_artificial_properties(
+                    sg_properties, storage_group, expand, partition_properties)
+            except zhmcclient.Error as exc:
+                return discover_report(storage_group.name, 'failed', str(exc))
+            return discover_report(
+                storage_group.name, 'complete', sg_properties=sg_properties)
+
+        reports = run_concurrently(
+            await_discovery, list(zip(storage_groups, started)),
+            DISCOVER_MAX_PARALLEL)
+        return changed, reports
+
+    finally:
+        close_session(session, logoff)
+
+
 def facts(params, check_mode):
     # pylint: disable=unused-argument
     """
@@ -1051,11 +1569,12 @@ def facts(params, check_mode):
     cpc_name = params['cpc_name']
     storage_group_name = params['name']
     expand = params['expand']
+    partition_properties = params['partition_properties']
 
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -1063,7 +1582,6 @@ def facts(params, check_mode):
         cpc = client.cpcs.find(name=cpc_name)
 
         storage_group = console.storage_groups.find(name=storage_group_name)
-        storage_group.pull_full_properties()
 
         sg_cpc = storage_group.cpc
         if sg_cpc.uri != cpc.uri:
@@ -1072,8 +1590,15 @@ def facts(params, check_mode):
                 f"the specified CPC {cpc.name!r}, but with CPC "
                 f"{sg_cpc.name!r}.")
 
+        if params['wait_for_fulfillment']:
+            wait_for_fulfillment(
+                storage_group, params['hmc_auth'],
+                timeout=params['fulfillment_timeout'])
+        storage_group.pull_full_properties()
+
         result = dict(storage_group.properties)
-        add_artificial_properties(result, storage_group, expand)
+        add_artificial_properties(
+            result, storage_group, expand, partition_properties)
 
         return changed, result
 
@@ -1093,6 +1618,20 @@ def perform_task(params, check_mode):
       ParameterError: An issue with the module parameters.
       zhmcclient.Error: Any zhmcclient exception can happen.
     """
+    if params['names'] is not None:
+        if params['state'] != 'discover':
+            raise ParameterError(
+                "The 'names' module parameter is only permitted for "
+                "state=discover.")
+        if params['name'] is not None:
+            raise ParameterError(
+                "The 'name' and 'names' module parameters are mutually "
+                "exclusive.")
+        return discover_multiple(params, check_mode)
+    if params['name'] is None:
+        raise ParameterError(
+            "The 'name' module parameter is required, unless the 'names' "
+            "module parameter is specified for state=discover.")
     actions = {
         "absent": ensure_absent,
         "present": ensure_present,
@@ -1102,6 +1641,13 @@ def perform_task(params, check_mode):
     return actions[params['state']](params, check_mode)
 
 
+# Suboptions of the 'volumes' module parameter
+VOLUME_OPTIONS = dict(
+    name=dict(required=True, type='str'),
+    properties=dict(required=False, type='dict', default=None),
+)
+
+
 def main():
     """Main function"""
 
@@ -1111,13 +1657,22 @@ def main():
         hmc_host=dict(required=True, type='raw'),
         hmc_auth=hmc_auth_parameter(),
         cpc_name=dict(required=True, type='str'),
-        name=dict(required=True, type='str'),
+        name=dict(required=False, type='str', default=None),
+        names=dict(required=False, type='list', elements='str',
+                   default=None),
         state=dict(required=True, type='str',
                    choices=['absent', 'present', 'discover', 'facts']),
         properties=dict(required=False, type='dict', default=None),
+        volumes=dict(required=False, type='list', elements='dict',
+                     options=VOLUME_OPTIONS, default=None),
         expand=dict(required=False, type='bool', default=False),
+        partition_properties=dict(required=False, type='list', elements='str',
+                                  default=None),
         discover_wait=dict(required=False, type='bool', default=False),
         discover_timeout=dict(required=False, type='int', default=300),
+        wait_for_fulfillment=dict(required=False, type='bool',
+                                  default=False),
+        fulfillment_timeout=dict(required=False, type='int', default=600),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -1152,14 +1707,32 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
+    if module.params['names'] is not None:
+        failed_names = [r['name'] for r in result
+                        if r['status'] in ('failed', 'timeout')]
+        if failed_names:
+            msg = (f"FCP discovery has failed or timed out for "
+                   f"{len(failed_names)} of {len(result)} storage groups: "
+                   f"{', '.join(failed_names)}")
+            LOGGER.debug("Module exit (failure): msg: %r, storage_groups: %r",
+                         msg, result)
+            module.fail_json(
+                msg=msg, storage_groups=result, **module_result_items())
+        LOGGER.debug(
+            "Module exit (success): changed: %r, storage_groups: %r",
+            changed, result)
+        module.exit_json(
+            changed=changed, storage_groups=result, **module_result_items())
+
     LOGGER.debug(
         "Module exit (success): changed: %r, storage_group: %r",
         changed, result)
-    module.exit_json(changed=changed, storage_group=result)
+    module.exit_json(
+        changed=changed, storage_group=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -228,7 +228,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items  # noqa: E402
 
 try:
     import zhmcclient
@@ -361,7 +361,7 @@ def facts(params, check_mode):
     changed = False
     attached = None
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         console = client.consoles.console
@@ -459,14 +459,16 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, storage_group_attachment: %r",
         changed, result)
-    module.exit_json(changed=changed, storage_group_attachment=result)
+    module.exit_json(
+        changed=changed, storage_group_attachment=result,
+        **module_result_items())
 
 
 if __name__ == '__main__':
@@ -162,6 +162,28 @@ options:
     type: dict
     required: false
     default: null
+  wait_for_fulfillment:
+    description:
+      - "Boolean that controls whether to wait until the storage volume is
+         fulfilled (i.e. its C(fulfillment-state) property is V(complete)),
+         for O(state=present|facts). For O(state=present), the wait is skipped
+         in check mode."
+      - "The wait is driven by the object notifications of the HMC for the
+         storage group if they can be received (i.e. if O(hmc_auth) specifies
+         userid and password), and falls back to polling otherwise. Each check
+         retrieves the storage volumes of the storage group with a single HMC
+         operation."
+    type: bool
+    required: false
+    default: false
+  fulfillment_timeout:
+    description:
+      - "Timeout in seconds for how long to wait for the fulfillment for
+         O(wait_for_fulfillment). If the timeout expires, the module fails.
+         0 means that there is no timeout."
+    type: int
+    required: false
+    default: 600
   log_file:
     description:
       - "File path of a log file to which the logic flow of this module as well
@@ -213,6 +235,18 @@ EXAMPLES = """
       description: "Example storage volume 1"
       size: 1
   register: sv1
+
+- name: Wait until the storage volume is fulfilled
+  zhmc_storage_volume:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    storage_group_name: "{{ my_storage_group_name }}"
+    name: "{{ my_storage_volume_name }}"
+    state: facts
+    wait_for_fulfillment: true
+    fulfillment_timeout: 1800
+  register: sv1
 """
 
 RETURN = """
@@ -225,6 +259,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the storage
+       volume upon transient HMC errors, by operation (method name and resource
+       URI). Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "delete /api/storage-groups/8806a1d7-cbab-11f1-9b33-fa163e1c2d43/storage-volumes/8806a276-cbab-11f1-ac44-fa163e4d5e78": 1
+    }
 storage_volume:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -277,9 +323,10 @@ from ansible.module_utils.basic import AnsibleModule, \
     missing_required_lib  # noqa: E402
 
 from ..module_utils.common import log_init, open_session, close_session, \
-    hmc_auth_parameter, Error, ParameterError, eq_hex, to_unicode, \
+    hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items, wait_for_fulfillment, \
+    ZHMC_STORAGE_VOLUME_PROPERTIES, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -292,61 +339,6 @@ LOGGER_NAME = 'zhmc_storage_volume'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
-# Dictionary of properties of storage volume resources, in this format:
-#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
-# where:
-#   name: Name of the property according to the data model, with hyphens
-#     replaced by underscores (this is how it is or would be specified in
-#     the 'properties' module parameter).
-#   allowed: Indicates whether it is allowed in the 'properties' module
-#     parameter.
-#   create: Indicates whether it can be specified for creating a storage volume
-#     using the "Modify Storage Group Properties" operation (i.e.
-#     operation="create" in "storage-volume-request-info").
-#   update: Indicates whether it can be specified for modifying a storage
-#     volume using the "Modify Storage Group Properties" operation (i.e.
-#     operation="modify" in "storage-volume-request-info").
-#   update_while_active: Indicates whether it can be specified for modifying a
-#     storage volume using the "Modify Storage Group Properties" operation
-#     while the storage group is attached to any partition. None means
-#     "not applicable" (used for update=False).
-#   eq_func: Equality test function for two values of the property; None means
-#     to use Python equality.
-#   type_cast: Type cast function for an input value of the property; None
-#     means to use it directly. This can be used for example to convert
-#     integers provided as strings by Ansible back into integers (that is a
-#     current deficiency of Ansible).
-ZHMC_STORAGE_VOLUME_PROPERTIES = {
-
-    # create-only properties: None
-    # update-only properties: None
-
-    # create+update properties:
-    'name': (False, True, True, True, None, None),  # provided in module parm
-    'description': (True, True, True, True, None, to_unicode),
-    'size': (True, True, True, True, None, float),
-    'usage': (True, True, True, True, None, None),
-    'model': (True, True, True, True, None, None),  # ECKD only
-    'cylinders': (True, True, True, True, None, int),  # ECKD only
-    'device_number': (True, True, True, True, eq_hex, int),  # ECKD only
-
-    # read-only properties:
-    'element_uri': (False, False, False, None, None, None),
-    'element_id': (False, False, False, None, None, None),
-    'parent': (False, False, False, None, None, None),
-    'class': (False, False, False, None, None, None),
-    'fulfillment_state': (False, False, False, None, None, None),
-    'active_size': (False, False, False, None, None, None),
-    'uuid': (False, False, False, None, None, None),
-    'active_model': (False, False, False, None, None, None),
-    'control_unit_uri': (False, False, False, None, None, None),
-    'eckd_type': (False, False, False, None, None, None),
-    'unit_address': (False, False, False, None, None, None),
-
-    # artificial properties:
-    # 'type': 'fc' or 'fcp', as defined in its storage group
-}
-
 
 def process_properties(storage_volume, params):
     """
@@ -498,7 +490,8 @@ def ensure_present(params, check_mode):
                     if name not in create_props:
                         update2_props[name] = value
                 if update2_props:
-                    storage_volume.update_properties(update2_props)
+                    retry_operation(
+                        storage_volume, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 storage_volume.pull_full_properties()
@@ -516,7 +509,8 @@ def ensure_present(params, check_mode):
                                      "create_props: %r" % create_props)
             if update_props:
                 if not check_mode:
-                    storage_volume.update_properties(update_props)
+                    retry_operation(
+                        storage_volume, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     storage_volume.pull_full_properties()
@@ -528,6 +522,11 @@ def ensure_present(params, check_mode):
         if not check_mode:
             if not storage_volume:
                 raise AssertionError()
+            if params['wait_for_fulfillment']:
+                wait_for_fulfillment(
+                    storage_group, params['hmc_auth'], [storage_volume.uri],
+                    params['fulfillment_timeout'])
+                storage_volume.pull_full_properties()
 
         if storage_volume:
             result = dict(storage_volume.properties)
@@ -581,7 +580,7 @@ def ensure_absent(params, check_mode):
             raise
 
         if not check_mode:
-            storage_volume.delete()
+            retry_operation(storage_volume, 'delete')
         changed = True
 
         return changed, result
@@ -607,7 +606,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
         console = client.consoles.console
@@ -630,6 +629,10 @@ def facts(params, check_mode):
             # enforced to be unique.
             raise
 
+        if params['wait_for_fulfillment']:
+            wait_for_fulfillment(
+                storage_group, params['hmc_auth'], [storage_volume.uri],
+                params['fulfillment_timeout'])
         storage_volume.pull_full_properties()
         result = dict(storage_volume.properties)
         add_artificial_properties(result, storage_volume)
@@ -674,6 +677,9 @@ def main():
         state=dict(required=True, type='str',
                    choices=['absent', 'present', 'facts']),
         properties=dict(required=False, type='dict', default=None),
+        wait_for_fulfillment=dict(required=False, type='bool',
+                                  default=False),
+        fulfillment_timeout=dict(required=False, type='int', default=600),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -708,14 +714,15 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, storage_volume: %r",
         changed, result)
-    module.exit_json(changed=changed, storage_volume=result)
+    module.exit_json(
+        changed=changed, storage_volume=result, **module_result_items())
 
 
 if __name__ == '__main__':
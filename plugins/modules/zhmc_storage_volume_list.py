@@ -32,9 +32,10 @@ DOCUMENTATION = """
 ---
 module: zhmc_storage_volume_list
 version_added: "2.9.0"
-short_description: List storage volumes of a storage group (DPM mode)
+short_description: List storage volumes of storage groups (DPM mode)
 description:
-  - List storage volumes of a specific storage group.
+  - List storage volumes of a specific storage group, or of all storage groups
+    of a CPC or with matching names.
   - The returned storage volumes can be filtered by name, fulfillment state,
     minimum and maximum size, and usage (boot/data).
   - CPCs in classic mode are ignored (i.e. do not lead to a failure).
@@ -47,7 +48,7 @@ requirements:
     "dpm-storage-management" firmware feature) and must be in the Dynamic
     Partition Manager (DPM) operational mode.
   - "The HMC userid must have object-access permissions to these objects:
-    Target storage group."
+    Target storage groups."
 options:
   hmc_host:
     description:
@@ -111,8 +112,32 @@ options:
   storage_group_name:
     description:
       - Name of the storage group whose storage volumes are to be listed.
+      - Mutually exclusive with O(storage_group_name_pattern) and O(cpc_name).
+      - If None/null, the storage volumes of all storage groups selected by
+        O(storage_group_name_pattern) and O(cpc_name) are listed, and at least
+        one of these parameters must be specified.
     type: str
-    required: true
+    required: false
+    default: null
+  storage_group_name_pattern:
+    description:
+      - Limit the listed storage volumes to those of the storage groups whose
+        name matches the specified regular expression pattern.
+      - If None/null, no such filtering happens.
+      - "The storage groups are listed with a single HMC operation, and the
+         storage volumes of the selected storage groups are listed
+         concurrently."
+    type: str
+    required: false
+    default: null
+  cpc_name:
+    description:
+      - Limit the listed storage volumes to those of the storage groups that
+        are associated with the CPC with the specified name.
+      - If None/null, no such filtering happens.
+    type: str
+    required: false
+    default: null
   name:
     description:
       - Filter to limit returned storage volumes to those whose name matches the
@@ -176,7 +201,7 @@ options:
       - "If True, all properties of each storage volume will be returned.
         Default: False."
       - Mutually exclusive with O(additional_properties).
-      - "Note: Setting this to True causes a loop of 'Get Storage Group
+      - "Note: Setting this to True causes a loop of 'Get Storage Volume
         Properties' operations to be executed. It is preferable from a
         performance perspective to use the O(additional_properties) parameter
         instead."
@@ -217,6 +242,14 @@ EXAMPLES = """
     storage_group_name: SG1
     usage: data
   register: storage_volume_list
+
+- name: List the volumes that are not fulfilled in all storage groups of a CPC
+  zhmc_storage_volume_list:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    cpc_name: "{{ my_cpc_name }}"
+    fulfillment_state: pending
+  register: storage_volume_list
 """
 
 RETURN = """
@@ -238,6 +271,9 @@ storage_volumes:
     name:
       description: Storage volume name
       type: str
+    storage_group_name:
+      description: Name of the storage group of the storage volume.
+      type: str
     element_uri:
       description: Canonical URI of the storage volume object
       type: str
@@ -262,6 +298,7 @@ storage_volumes:
     [
         {
             "name": "storage_volume1",
+            "storage_group_name": "SG1",
             "element_uri": "/api/storage-groups/..../storage-volumes/....",
             "fulfillment_state": "complete",
             "size": 500.0,
@@ -277,7 +314,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, \
-    common_fail_on_import_errors, parse_hmc_host, blanked_params  # noqa: E402
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    module_result_items, run_concurrently  # noqa: E402
 
 try:
     import zhmcclient
@@ -290,17 +328,59 @@ LOGGER_NAME = 'zhmc_storage_volume_list'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Maximum number of concurrent storage volume listings when listing the
+# storage volumes of multiple storage groups
+LIST_MAX_PARALLEL = 10
+
+
+def list_storage_groups(client, params):
+    """
+    Return the storage groups whose storage volumes are to be listed, in the
+    order returned by the HMC.
+
+    Raises:
+      ParameterError: An issue with the module parameters.
+      zhmcclient.Error: Any zhmcclient exception can happen.
+    """
+    storage_group_name = params['storage_group_name']
+    storage_group_name_pattern = params['storage_group_name_pattern']
+    cpc_name = params['cpc_name']
+    console = client.consoles.console
+
+    if storage_group_name:
+        if storage_group_name_pattern or cpc_name:
+            raise ParameterError(
+                "The 'storage_group_name' module parameter is mutually "
+                "exclusive with the 'storage_group_name_pattern' and "
+                "'cpc_name' module parameters.")
+        return [console.storage_groups.find_by_name(storage_group_name)]
+
+    if not storage_group_name_pattern and not cpc_name:
+        raise ParameterError(
+            "One of the 'storage_group_name', 'storage_group_name_pattern' "
+            "and 'cpc_name' module parameters must be specified.")
+
+    filter_args = {}
+    if storage_group_name_pattern:
+        filter_args['name'] = storage_group_name_pattern
+    if cpc_name:
+        cpc = client.cpcs.find(name=cpc_name)
+        filter_args['cpc-uri'] = cpc.uri
+    return console.storage_groups.list(filter_args=filter_args)
+
 
 def perform_list(params):
     """
     List the storage volumes and return a subset of properties.
 
+    The storage volumes of multiple storage groups are listed concurrently,
+    with the filters passed on to the HMC for each storage group.
+
     Raises:
       ParameterError: An issue with the module parameters.
       zhmcclient.Error: Any zhmcclient exception can happen.
     """
 
-    storage_group_name = params['storage_group_name']
     name = params['name']
     fulfillment_state = params['fulfillment_state']
     maximum_size = params['maximum_size']
@@ -315,12 +395,10 @@ def perform_list(params):
             "The 'additional_properties' and 'full_properties' module "
             "parameters are mutually exclusive but both are specified.")
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         client = zhmcclient.Client(session)
-        console = client.consoles.console
-
-        storage_group = console.storage_groups.find_by_name(storage_group_name)
+        storage_groups = list_storage_groups(client, params)
         # The default exception handling is sufficient for the above.
 
         filter_args = {}
@@ -335,23 +413,31 @@ def perform_list(params):
         if usage:
             filter_args['usage'] = usage
 
-        # The additional-properties query parameter was added in HMC 2.17.0.
-        storage_volumes = storage_group.storage_volumes.list(
-            filter_args=filter_args,
-            full_properties=full_properties,
-            additional_properties=additional_properties)
+        def list_storage_volumes(storage_group):
+            # The additional-properties query parameter was added in HMC
+            # 2.17.0.
+            storage_volumes = storage_group.storage_volumes.list(
+                filter_args=filter_args,
+                full_properties=full_properties,
+                additional_properties=additional_properties)
+            storage_volume_list = []
+            for storage_volume in storage_volumes:
+                storage_volume_properties = {
+                    'storage_group_name': storage_group.name,
+                }
+                for pname_hmc, pvalue in storage_volume.properties.items():
+                    pname = pname_hmc.replace('-', '_')
+                    storage_volume_properties[pname] = pvalue
+
+                storage_volume_list.append(storage_volume_properties)
+            return storage_volume_list
+
+        storage_volume_lists = run_concurrently(
+            list_storage_volumes, storage_groups, LIST_MAX_PARALLEL)
         # The default exception handling is sufficient for the above.
 
-        storage_volume_list = []
-        for storage_volume in storage_volumes:
-            storage_volume_properties = {}
-            for pname_hmc, pvalue in storage_volume.properties.items():
-                pname = pname_hmc.replace('-', '_')
-                storage_volume_properties[pname] = pvalue
-
-            storage_volume_list.append(storage_volume_properties)
-
-        return storage_volume_list
+        return [sv_props for sv_list in storage_volume_lists
+                for sv_props in sv_list]
 
     finally:
         close_session(session, logoff)
@@ -365,7 +451,10 @@ def main():
     argument_spec = dict(
         hmc_host=dict(required=True, type='raw'),
         hmc_auth=hmc_auth_parameter(),
-        storage_group_name=dict(required=True, type='str'),
+        storage_group_name=dict(required=False, type='str', default=None),
+        storage_group_name_pattern=dict(
+            required=False, type='str', default=None),
+        cpc_name=dict(required=False, type='str', default=None),
         name=dict(required=False, type='str', default=None),
         fulfillment_state=dict(required=False, type='str', default=None),
         maximum_size=dict(required=False, type='int', default=None),
@@ -409,13 +498,14 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, storage_volumes: %r",
                  changed, result_list)
-    module.exit_json(changed=changed, storage_volumes=result_list)
+    module.exit_json(
+        changed=changed, storage_volumes=result_list, **module_result_items())
 
 
 if __name__ == '__main__':
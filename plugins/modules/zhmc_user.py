@@ -249,6 +249,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the HMC user
+       upon transient HMC errors, by operation (method name and resource URI).
+       Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/users/8806af69-cbab-11f1-9b34-fa163e1c2d44": 1
+    }
 user:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -488,7 +500,7 @@ from ..module_utils.common import log_init, open_session, close_session, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
     blanked_params, blanked_dict, removed_dict, NOT_PRESENT, \
     ObjectsByUriCache, object_from_uri, object_name, \
-    object_properties  # noqa: E402
+    object_properties, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -1208,7 +1220,7 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 user = console.users.create(create_props)
                 if update2_props:
-                    user.update_properties(update2_props)
+                    retry_operation(user, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 user.pull_full_properties()
@@ -1246,7 +1258,7 @@ def ensure_present(params, check_mode):
                         user_name,
                         blanked_dict(update_props, WRITEONLY_PROPERTIES_USCORE))
                 if not check_mode:
-                    user.update_properties(update_props)
+                    retry_operation(user, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     user.pull_full_properties()
@@ -1316,7 +1328,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            user.delete()
+            retry_operation(user, 'delete')
         changed = True
 
         return changed, result
@@ -1342,7 +1354,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -1438,13 +1450,13 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, user: %r", changed, result)
-    module.exit_json(changed=changed, user=result)
+    module.exit_json(changed=changed, user=result, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -196,6 +196,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the user
+       pattern upon transient HMC errors, by operation (method name and
+       resource URI). Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/console/user-patterns/8806bec2-cbab-11f1-9b35-fa163e1c2d45": 1
+    }
 user_pattern:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -292,7 +304,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, underscore_properties, \
-    common_fail_on_import_errors, parse_hmc_host, blanked_params  # noqa: E402
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -769,7 +782,8 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 upattern = console.user_patterns.create(create_props)
                 if update2_props:
-                    upattern.update_properties(update2_props)
+                    retry_operation(
+                        upattern, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 upattern.pull_full_properties()
@@ -793,7 +807,8 @@ def ensure_present(params, check_mode):
                     "Existing user pattern %r needs to get properties "
                     "updated: %r", upattern_name, update_props)
                 if not check_mode:
-                    upattern.update_properties(update_props)
+                    retry_operation(
+                        upattern, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     upattern.pull_full_properties()
@@ -840,7 +855,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            upattern.delete()
+            retry_operation(upattern, 'delete')
         changed = True
 
         return changed, result
@@ -864,7 +879,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -948,14 +963,15 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, user_pattern: %r",
         changed, result)
-    module.exit_json(changed=changed, user_pattern=result)
+    module.exit_json(
+        changed=changed, user_pattern=result, **module_result_items())
 
 
 if __name__ == '__main__':
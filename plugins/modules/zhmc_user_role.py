@@ -306,6 +306,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the user role
+       upon transient HMC errors, by operation (method name and resource URI).
+       Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/user-roles/8806cc1f-cbab-11f1-9b36-fa163e1c2d46": 3
+    }
 user_role:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -453,7 +465,7 @@ from ansible.module_utils.basic import AnsibleModule, \
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, to_unicode, \
     process_normal_property, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -1074,7 +1086,7 @@ def ensure_present(params, check_mode):
             if not check_mode:
                 urole = console.user_roles.create(create_props)
                 if update2_props:
-                    urole.update_properties(update2_props)
+                    retry_operation(urole, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed.
                 urole.pull_full_properties()
@@ -1123,7 +1135,7 @@ def ensure_present(params, check_mode):
                     "Existing user role %r needs to get properties "
                     "updated: %r", urole_name, update_props)
                 if not check_mode:
-                    urole.update_properties(update_props)
+                    retry_operation(urole, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed.
                     urole.pull_full_properties()
@@ -1206,7 +1218,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            urole.delete()
+            retry_operation(urole, 'delete')
         changed = True
 
         return changed, result
@@ -1230,7 +1242,7 @@ def facts(params, check_mode):
     changed = False
     result = {}
 
-    session, logoff = open_session(params)
+    session, logoff = open_session(params, read_only=True)
     try:
         # The default exception handling is sufficient for this code
         client = zhmcclient.Client(session)
@@ -1325,14 +1337,16 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, user_role: %r",
         changed, result)
-    module.exit_json(changed=changed, user_role=result)
+    module.exit_json(
+        changed=changed, user_role=result,
+        **module_result_items())
 
 
 if __name__ == '__main__':
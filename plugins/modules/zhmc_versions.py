@@ -108,6 +108,20 @@ options:
     elements: str
     required: false
     default: null
+  api_features:
+    description:
+      - "Controls whether the API feature lists of the HMC and of the CPCs are
+         retrieved and returned in RV(versions.hmc_api_features) and
+         RV(versions.cpcs[].cpc_api_features)."
+      - "Setting this to False saves one HMC operation per CPC when only the
+         versions are needed."
+      - "The API feature lists of the HMC and the CPCs are retrieved
+         concurrently. They are cached for all modules running on the same
+         system for the number of seconds specified in the
+         E(ZHMC_FEATURE_CACHE_TTL) environment variable, if set."
+    type: bool
+    required: false
+    default: true
   log_file:
     description:
       - "File path of a log file to which the logic flow of this module as well
@@ -140,6 +154,13 @@ EXAMPLES = """
     hmc_auth: "{{ my_hmc_auth }}"
     cpc_names: []
   register: hmc1
+
+- name: Retrieve version information without API features
+  zhmc_versions:
+    hmc_host: "{{ my_hmc_host }}"
+    hmc_auth: "{{ my_hmc_auth }}"
+    api_features: false
+  register: hmc1
 """
 
 RETURN = """
@@ -175,7 +196,9 @@ versions:
       type: list
       elements: int
     hmc_api_features:
-      description: "The available HMC API features."
+      description:
+        - "The available HMC API features."
+        - "Only present if O(api_features) is True."
       type: list
       elements: str
     cpcs:
@@ -207,7 +230,9 @@ versions:
           type: list
           elements: int
         cpc_api_features:
-          description: "The available CPC API features."
+          description:
+            - "The available CPC API features."
+            - "Only present if O(api_features) is True."
           type: list
           elements: str
 
@@ -246,7 +271,8 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, common_fail_on_import_errors, parse_hmc_host, \
-    blanked_params  # noqa: E402
+    blanked_params, module_result_items, run_concurrently, \
+    FeatureCache  # noqa: E402
 
 try:
     import zhmcclient
@@ -259,6 +285,9 @@ LOGGER_NAME = 'zhmc_versions'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
+# Maximum number of concurrent retrievals of API feature lists
+FEATURES_MAX_PARALLEL = 10
+
 
 def get_versions(module):
     """
@@ -270,9 +299,12 @@ def get_versions(module):
     """
 
     cpc_names = module.params['cpc_names']
+    api_features = module.params['api_features']
+
+    feature_cache = FeatureCache.from_environment(module.params['hmc_host'])
 
     versions = {}
-    session, logoff = open_session(module.params)
+    session, logoff = open_session(module.params, read_only=True)
     try:
 
         client = zhmcclient.Client(session)
@@ -292,17 +324,25 @@ def get_versions(module):
         versions['hmc_api_version'] = api_version_str
         versions['hmc_api_version_info'] = api_version_info
 
-        # Get HMC API features
-        versions['hmc_api_features'] = console.list_api_features()
+        # List managed CPCs and filter on the requested CPCs
+        cpcs = [cpc for cpc in client.cpcs.list()
+                if cpc_names is None or cpc.name in cpc_names]
 
-        # List managed CPCs
-        cpcs = client.cpcs.list()
-        versions['cpcs'] = []
-        for cpc in cpcs:
+        # Get HMC and CPC API features concurrently
+        if api_features:
 
-            # Filter on the requested CPCs
-            if cpc_names is not None and cpc.name not in cpc_names:
-                continue
+            def list_features(resource):
+                key = f"{versions['hmc_name']}:{resource.uri}"
+                return feature_cache.features(
+                    key, resource.list_api_features)
+
+            features_list = run_concurrently(
+                list_features, [console] + cpcs, FEATURES_MAX_PARALLEL)
+            versions['hmc_api_features'] = features_list[0]
+            cpc_features_list = features_list[1:]
+
+        versions['cpcs'] = []
+        for i, cpc in enumerate(cpcs):
 
             cpc_vers = {}
 
@@ -317,8 +357,8 @@ def get_versions(module):
             cpc_vers['se_version'] = se_version_str
             cpc_vers['se_version_info'] = se_version_info
 
-            # Get CPC API features
-            cpc_vers['cpc_api_features'] = cpc.list_api_features()
+            if api_features:
+                cpc_vers['cpc_api_features'] = cpc_features_list[i]
 
             versions['cpcs'].append(cpc_vers)
 
@@ -338,6 +378,7 @@ def main():
         hmc_auth=hmc_auth_parameter(),
         cpc_names=dict(required=False, type='list', elements='str',
                        default=None),
+        api_features=dict(required=False, type='bool', default=True),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -371,14 +412,14 @@ def main():
         # simply pass that message on and will not need a traceback.
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug("Module exit (failure): msg: %r", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug("Module exit (success): changed: %s, versions: %r",
                  changed, versions)
     module.exit_json(
-        changed=changed, versions=versions)
+        changed=changed, versions=versions, **module_result_items())
 
 
 if __name__ == '__main__':
@@ -215,6 +215,18 @@ msg:
   description: An error message that describes the failure.
   returned: failure
   type: str
+retries:
+  description:
+    - "Number of retries of the property updates and deletions of the virtual
+       function upon transient HMC errors, by operation (method name and
+       resource URI). Not returned if no operations were retried. See
+       R(Retrying transient HMC errors,Retrying transient HMC errors)."
+  returned: success or failure
+  type: dict
+  sample:
+    {
+      "update_properties /api/partitions/8806da18-cbab-11f1-9b37-fa163e1c2d47/virtual-functions/8806daa5-cbab-11f1-ac48-fa163e4d5e7c": 1
+    }
 virtual_function:
   description:
     - "For O(state=absent), an empty dictionary."
@@ -241,8 +253,9 @@ from ansible.module_utils.basic import AnsibleModule, \
 
 from ..module_utils.common import log_init, open_session, close_session, \
     hmc_auth_parameter, Error, ParameterError, wait_for_transition_completion, \
-    eq_hex, to_unicode, process_normal_property, common_fail_on_import_errors, \
-    parse_hmc_host, blanked_params  # noqa: E402
+    to_unicode, process_normal_property, ZHMC_VFUNCTION_PROPERTIES, \
+    common_fail_on_import_errors, parse_hmc_host, blanked_params, \
+    task_deadline, module_result_items, retry_operation  # noqa: E402
 
 try:
     import zhmcclient
@@ -255,48 +268,6 @@ LOGGER_NAME = 'zhmc_virtual_function'
 
 LOGGER = logging.getLogger(LOGGER_NAME)
 
-# Dictionary of properties of virtual function resources, in this format:
-#   name: (allowed, create, update, update_while_active, eq_func, type_cast)
-# where:
-#   name: Name of the property according to the data model, with hyphens
-#     replaced by underscores (this is how it is or would be specified in
-#     the 'properties' module parameter).
-#   allowed: Indicates whether it is allowed in the 'properties' module
-#     parameter.
-#   create: Indicates whether it can be specified for the "Create Virtual
-#     Function" operation.
-#   update: Indicates whether it can be specified for the "Update Virtual
-#     Function Properties" operation (at all).
-#   update_while_active: Indicates whether it can be specified for the "Update
-#     Virtual Function Properties" operation while the partition of the
-#     virtual function is active. None means "not applicable" (i.e.
-#     update=False).
-#   eq_func: Equality test function for two values of the property; None means
-#     to use Python equality.
-#   type_cast: Type cast function for an input value of the property; None
-#     means to use it directly. This can be used for example to convert
-#     integers provided as strings by Ansible back into integers (that is a
-#     current deficiency of Ansible).
-ZHMC_VFUNCTION_PROPERTIES = {
-
-    # create+update properties:
-    'name': (
-        False, True, True, True, None, None),  # provided in 'name' module parm
-    'description': (True, True, True, True, None, to_unicode),
-    'device_number': (True, True, True, True, eq_hex, None),
-    'adapter_uri': (
-        False, True, True, True, None, None),  # via adapter_name
-    'adapter_name': (
-        True, True, True, True, None,
-        None),  # artificial property, type_cast ignored
-
-    # read-only properties:
-    'element-uri': (False, False, False, None, None, None),
-    'element-id': (False, False, False, None, None, None),
-    'parent': (False, False, False, None, None, None),
-    'class': (False, False, False, None, None, None),
-}
-
 
 def process_properties(partition, vfunction, params):
     """
@@ -429,6 +400,7 @@ def ensure_present(params, check_mode):
 
     session, logoff = open_session(params)
     try:
+        deadline = task_deadline(session)
         client = zhmcclient.Client(session)
         cpc = client.cpcs.find(name=cpc_name)
         # The default exception handling is sufficient for the above.
@@ -461,7 +433,8 @@ def ensure_present(params, check_mode):
                     if name not in create_props:
                         update2_props[name] = value
                 if update2_props:
-                    vfunction.update_properties(update2_props)
+                    retry_operation(
+                        vfunction, 'update_properties', update2_props)
                 # We refresh the properties after the update, in case an
                 # input property value gets changed (for example, the
                 # partition does that with memory properties).
@@ -482,8 +455,10 @@ def ensure_present(params, check_mode):
                     # partition is active, therefore:
                     if stop:
                         raise AssertionError()
-                    wait_for_transition_completion(LOGGER, partition)
-                    vfunction.update_properties(update_props)
+                    wait_for_transition_completion(
+                        LOGGER, partition, deadline=deadline)
+                    retry_operation(
+                        vfunction, 'update_properties', update_props)
                     # We refresh the properties after the update, in case an
                     # input property value gets changed (for example, the
                     # partition does that with memory properties).
@@ -532,7 +507,7 @@ def ensure_absent(params, check_mode):
             return changed, result
 
         if not check_mode:
-            vfunction.delete()
+            retry_operation(vfunction, 'delete')
         changed = True
 
         return changed, result
@@ -609,14 +584,15 @@ def main():
         msg = f"{exc.__class__.__name__}: {exc}"
         LOGGER.debug(
             "Module exit (failure): msg: %s", msg)
-        module.fail_json(msg=msg)
+        module.fail_json(msg=msg, **module_result_items())
     # Other exceptions are considered module errors and are handled by Ansible
     # by showing the traceback.
 
     LOGGER.debug(
         "Module exit (success): changed: %r, virtual_function: %s",
         changed, result)
-    module.exit_json(changed=changed, virtual_function=result)
+    module.exit_json(
+        changed=changed, virtual_function=result, **module_result_items())
 
 
 if __name__ == '__main__':
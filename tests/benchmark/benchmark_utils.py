@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Utility functions for the benchmark tests.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import time
+import yaml
+
+from plugins.module_utils.common import RequestStats
+
+# File with the baselines of the benchmark results
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), 'baselines.yaml')
+
+# Simulated latency of each HMC request in seconds
+LATENCY = float(os.getenv('BENCHMARK_LATENCY', '0.002'))
+
+# Whether the wall times are compared with their baselines. The baselines
+# are absolute wall times that depend on the system they were measured on,
+# so this is only meaningful on that system.
+CHECK_TIMES = os.getenv('BENCHMARK_CHECK_TIMES', '').lower() in \
+    ('1', 'true', 'yes')
+
+# Factor by which the wall time may exceed its baseline
+TIME_TOLERANCE = float(os.getenv('BENCHMARK_TIME_TOLERANCE', '2.0'))
+
+# Absolute time in seconds by which the wall time may exceed its baseline,
+# to tolerate the jitter of short benchmarks
+TIME_SLACK = 0.05
+
+# Results of the benchmarks run in this pytest session, by benchmark name
+RESULTS = {}
+
+
+def add_latency(session, latency):
+    """
+    Add a simulated latency to each HMC request of a faked session.
+
+    Parameters:
+      session (zhmcclient_mock.FakedSession): The faked session.
+      latency (float): Latency of each HMC request in seconds.
+    """
+    for method in ('get', 'post', 'delete'):
+        func = getattr(session, method)
+
+        def delayed(*args, _func=func, **kwargs):
+            time.sleep(latency)
+            return _func(*args, **kwargs)
+
+        setattr(session, method, delayed)
+
+
+def run_benchmark(name, session, func, *args, **kwargs):
+    """
+    Run a benchmark function against a faked session with simulated latency,
+    record its result in RESULTS and return it.
+
+    Parameters:
+      name (str): Name of the benchmark.
+      session (zhmcclient_mock.FakedSession): The faked session, which is
+        also passed to the function in its module parameters.
+      func (callable): The function to be measured, which is called with the
+        remaining positional and keyword arguments.
+
+    Returns:
+      dict: The benchmark result with items 'wall_time', 'request_count' and
+      'requests' (see RequestStats.as_dict()).
+    """
+    add_latency(session, LATENCY)
+    stats = RequestStats()
+    stats.attach(session)
+    start_time = time.time()
+    func(*args, **kwargs)
+    wall_time = time.time() - start_time
+    request_stats = stats.as_dict()
+    result = {
+        'wall_time': round(wall_time, 4),
+        'request_count': request_stats['request_count'],
+        'requests': {k: v['count']
+                     for k, v in request_stats['requests'].items()},
+    }
+    RESULTS[name] = result
+    return result
+
+
+def load_baselines():
+    """
+    Return the baselines of the benchmark results as a dict by benchmark
+    name, with items 'wall_time' and 'request_count'.
+    """
+    if not os.path.exists(BASELINES_FILE):
+        return {}
+    with open(BASELINES_FILE, encoding='utf-8') as fp:
+        return yaml.safe_load(fp) or {}
+
+
+def save_baselines(results):
+    """
+    Update the baselines file with the benchmark results.
+    """
+    baselines = load_baselines()
+    for name, result in results.items():
+        baselines[name] = {
+            'wall_time': result['wall_time'],
+            'request_count': result['request_count'],
+        }
+    with open(BASELINES_FILE, 'w', encoding='utf-8') as fp:
+        fp.write("# Baselines of the benchmark results, updated with:\n"
+                 "#   BENCHMARK_UPDATE=true make benchmark\n"
+                 f"# Latency per HMC request: {LATENCY} s\n\n")
+        yaml.safe_dump(dict(sorted(baselines.items())), fp)
+
+
+def assert_baseline(name, result):
+    """
+    Assert that a benchmark result does not exceed its baseline: The request
+    count must not be larger, and if CHECK_TIMES is set, the wall time must
+    not be larger than allowed by TIME_TOLERANCE and TIME_SLACK.
+
+    Benchmarks without baseline pass.
+    """
+    baseline = load_baselines().get(name)
+    if baseline is None:
+        return
+    assert result['request_count'] <= baseline['request_count'], (
+        f"Benchmark {name} makes {result['request_count']} HMC requests, "
+        f"more than its baseline of {baseline['request_count']}. "
+        f"Requests: {result['requests']}")
+    if not CHECK_TIMES:
+        return
+    max_time = baseline['wall_time'] * TIME_TOLERANCE + TIME_SLACK
+    assert result['wall_time'] <= max_time, (
+        f"Benchmark {name} took {result['wall_time']} s, more than "
+        f"{max_time:.4f} s allowed by its baseline of "
+        f"{baseline['wall_time']} s")
@@ -0,0 +1,49 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pytest configuration for the benchmark tests.
+"""
+
+import os
+import json
+
+from .benchmark_utils import RESULTS, save_baselines
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # pylint: disable=unused-argument
+    """
+    Write the benchmark results to the file specified in BENCHMARK_RESULTS,
+    and update the baselines if BENCHMARK_UPDATE is set.
+    """
+    results_file = os.getenv('BENCHMARK_RESULTS')
+    if results_file:
+        with open(results_file, 'w', encoding='utf-8') as fp:
+            json.dump(RESULTS, fp, indent=2, sort_keys=True)
+    if os.getenv('BENCHMARK_UPDATE', '').lower() in ('1', 'true', 'yes'):
+        save_baselines(RESULTS)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Display the benchmark results.
+    """
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmark results")
+    for name, result in sorted(RESULTS.items()):
+        terminalreporter.write_line(
+            f"{name:45s} {result['wall_time']:9.4f} s "
+            f"{result['request_count']:6d} requests")
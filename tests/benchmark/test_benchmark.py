@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark tests for the hot paths of the list, facts and state modules,
+against synthetic mocked HMCs of several sizes with simulated request
+latency.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+import zhmcclient
+
+from plugins.modules import zhmc_partition, zhmc_partition_list, \
+    zhmc_lpar_list, zhmc_user
+from tests.common.mocked_hmc_generator import faked_session
+
+from .benchmark_utils import run_benchmark, assert_baseline
+
+HMC_AUTH = dict(userid='fake-userid', password='fake-password')
+
+
+def partition_params(session, name, state, **kwargs):
+    """
+    Return the module parameters for zhmc_partition.
+    """
+    params = {
+        'hmc_host': session.host,
+        'hmc_auth': HMC_AUTH,
+        'cpc_name': 'CPC_DPM1',
+        'name': name,
+        'state': state,
+        'select_properties': None,
+        'properties': None,
+        'nics': None,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
+        'image_name': None,
+        'image_file': None,
+        'ins_file': None,
+        'expand_storage_groups': False,
+        'expand_crypto_adapters': False,
+        'expand_nics': False,
+        'wait': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def list_params(session, cpc_name, full_properties=False):
+    """
+    Return the module parameters for the zhmc_*_list modules.
+    """
+    return {
+        'hmc_host': session.host,
+        'hmc_auth': HMC_AUTH,
+        'cpc_name': cpc_name,
+        'additional_properties': [],
+        'full_properties': full_properties,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+
+def first_partition(session, status):
+    """
+    Return the name of the first partition with a status, and set the status
+    of the first partition if no partition has it.
+    """
+    cpc = session.hmc.cpcs.list()[0]
+    partitions = cpc.partitions.list()
+    for partition in partitions:
+        if partition.properties['status'] == status:
+            return partition.properties['name']
+    partitions[0].properties['status'] = status
+    return partitions[0].properties['name']
+
+
+@pytest.mark.parametrize(
+    "full_properties, size", [
+        (False, 10),
+        (False, 100),
+        (False, 1000),
+        (True, 10),
+        (True, 100),
+    ]
+)
+def test_benchmark_partition_list(full_properties, size):
+    """
+    Benchmark zhmc_partition_list for a CPC with a number of partitions.
+    """
+    session = faked_session(partitions=size)
+    name = f"partition_list[full={full_properties},partitions={size}]"
+
+    # The code to be tested
+    result = run_benchmark(
+        name, session, zhmc_partition_list.perform_list,
+        list_params(session, 'CPC_DPM1', full_properties))
+
+    assert_baseline(name, result)
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_benchmark_lpar_list(size):
+    """
+    Benchmark zhmc_lpar_list for a CPC with a number of LPARs.
+    """
+    session = faked_session(dpm_cpcs=0, classic_cpcs=1, lpars=size)
+    name = f"lpar_list[lpars={size}]"
+
+    # The code to be tested
+    result = run_benchmark(
+        name, session, zhmc_lpar_list.perform_list,
+        list_params(session, 'CPC_CLA1'))
+
+    assert_baseline(name, result)
+
+
+@pytest.mark.parametrize("nics", [1, 10, 50])
+def test_benchmark_partition_facts(nics):
+    """
+    Benchmark the facts of a partition with a number of NICs, with
+    expand_nics.
+    """
+    session = faked_session(partitions=10, nics=nics)
+    name = f"partition_facts[expand_nics,nics={nics}]"
+    part_name = first_partition(session, 'active')
+
+    # The code to be tested
+    result = run_benchmark(
+        name, session, zhmc_partition.perform_task,
+        partition_params(session, part_name, 'facts', expand_nics=True),
+        check_mode=False)
+
+    assert_baseline(name, result)
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_benchmark_partition_update(size):
+    """
+    Benchmark updating a property of a stopped partition in a CPC with a
+    number of partitions.
+    """
+    session = faked_session(partitions=size)
+    name = f"partition_update[partitions={size}]"
+    part_name = first_partition(session, 'stopped')
+
+    # The code to be tested
+    result = run_benchmark(
+        name, session, zhmc_partition.perform_task,
+        partition_params(session, part_name, 'stopped',
+                         properties={'description': 'Updated'}),
+        check_mode=False)
+
+    client = zhmcclient.Client(session)
+    partition = client.cpcs.find(name='CPC_DPM1').partitions.find(
+        name=part_name)
+    assert partition.get_property('description') == 'Updated'
+    assert_baseline(name, result)
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_benchmark_user_facts(size):
+    """
+    Benchmark the facts of a user with expand, on an HMC with a number of
+    users and user roles.
+    """
+    session = faked_session(users=size, user_roles=size // 10)
+    name = f"user_facts[expand,users={size}]"
+    params = {
+        'hmc_host': session.host,
+        'hmc_auth': HMC_AUTH,
+        'name': 'USER1',
+        'state': 'facts',
+        'properties': None,
+        'expand': True,
+        'expand_names': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # The code to be tested
+    result = run_benchmark(
+        name, session, zhmc_user.perform_task, params, check_mode=False)
+
+    assert_baseline(name, result)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark tests for the import time of the modules, which is paid on every
+task since each module invocation runs in a new Python process.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import sys
+import glob
+import json
+import subprocess
+import pytest
+
+from .benchmark_utils import RESULTS, assert_baseline
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+MODULE_NAMES = sorted(
+    os.path.splitext(os.path.basename(fn))[0]
+    for fn in glob.glob(os.path.join(ROOT_DIR, 'plugins', 'modules', '*.py'))
+    if not os.path.basename(fn).startswith('_'))
+
+# Python code that imports a module in a new process and prints the import
+# time and whether modules that are only needed for testing were imported
+IMPORT_CODE = """
+import sys, time, json
+start_time = time.perf_counter()
+import plugins.modules.{module_name}
+import_time = time.perf_counter() - start_time
+print(json.dumps({{
+    'import_time': import_time,
+    'mock_imported': 'zhmcclient_mock' in sys.modules,
+}}))
+"""
+
+# Number of imports per module, of which the fastest is used
+IMPORT_REPEAT = 3
+
+
+def import_module(module_name):
+    """
+    Import a module in a new Python process and return the result printed by
+    IMPORT_CODE.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    output = subprocess.check_output(
+        [sys.executable, '-c', IMPORT_CODE.format(module_name=module_name)],
+        cwd=ROOT_DIR, env=env)
+    return json.loads(output)
+
+
+@pytest.mark.parametrize(
+    "module_name", MODULE_NAMES)
+def test_benchmark_import_time(module_name):
+    """
+    Benchmark the import time of a module, and check that it does not import
+    the zhmcclient_mock package.
+    """
+    results = [import_module(module_name) for _ in range(IMPORT_REPEAT)]
+    import_time = min(r['import_time'] for r in results)
+    name = f"import[{module_name}]"
+    result = {
+        'wall_time': round(import_time, 4),
+        'request_count': 0,
+        'requests': {},
+    }
+    RESULTS[name] = result
+    assert not results[0]['mock_imported'], (
+        f"Module {module_name} imports the zhmcclient_mock package")
+    assert_baseline(name, result)
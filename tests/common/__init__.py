@@ -0,0 +1 @@
+# this file is required to get the pytest working with relative imports
@@ -0,0 +1,408 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generator for synthetic mocked HMC definitions of configurable size, for
+performance testing.
+
+The generated definitions have the format defined in
+FAKED_HMC_DEFINITION_SCHEMA of zhmcclient_mock, and can be used to create a
+zhmcclient_mock.FakedSession with FakedSession.from_hmc_dict(). The resource
+properties are based on the objects in the mocked HMC definition file
+tests/end2end/mocked_hmc_z16.yaml, and the generated definition is
+deterministic for a given seed.
+
+Usage as a script, to write a mocked HMC definition file:
+
+    python tests/common/mocked_hmc_generator.py --partitions 1000 \\
+        --output mocked_hmc_large.yaml
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import sys
+import uuid
+import random
+import argparse
+from copy import deepcopy
+import yaml
+from zhmcclient_mock import FakedSession
+
+# Mocked HMC definition file whose objects are used as templates
+BASE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'end2end', 'mocked_hmc_z16.yaml')
+
+# Default counts of the generated resources. The counts of partitions,
+# adapters and storage groups are per DPM CPC, the count of LPARs is per
+# classic CPC, the counts of NICs and HBAs are per partition, and the count
+# of storage volumes is per storage group.
+DEFAULT_COUNTS = {
+    'dpm_cpcs': 1,
+    'classic_cpcs': 0,
+    'partitions': 10,
+    'lpars': 10,
+    'adapters': 4,
+    'nics': 1,
+    'hbas': 0,
+    'storage_groups': 0,
+    'storage_volumes': 1,
+    'users': 5,
+    'user_roles': 2,
+}
+
+PARTITION_STATUSES = ('active', 'stopped', 'paused', 'degraded')
+LPAR_STATUSES = ('operating', 'not-activated', 'not-operating')
+
+
+class _Generator:
+    """
+    Generator state for one mocked HMC definition.
+    """
+
+    def __init__(self, seed, base_file):
+        self.rng = random.Random(seed)
+        with open(base_file, encoding='utf-8') as fp:
+            self.base = yaml.safe_load(fp)['hmc_definition']
+        base_cpcs = {c['properties']['dpm-enabled']: c
+                     for c in self.base['cpcs']}
+        self.dpm_cpc = base_cpcs[True]
+        self.classic_cpc = base_cpcs[False]
+
+    def oid(self):
+        """
+        Return a new object ID in UUID format, determined by the seed.
+        """
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def template(self, resource, **props):
+        """
+        Return a copy of the properties of a resource definition from the
+        base file, updated with the specified properties.
+        """
+        result = deepcopy(resource['properties'])
+        result.update(props)
+        return result
+
+    def console(self, counts):
+        """
+        Return the console definition with the users, user roles and storage
+        groups.
+        """
+        base = self.base['consoles'][0]
+        console = {
+            'properties': deepcopy(base['properties']),
+            'password_rules': deepcopy(base['password_rules']),
+            'tasks': deepcopy(base['tasks']),
+            'user_roles': deepcopy(base['user_roles']),
+            'users': [],
+            'storage_groups': [],
+        }
+        role_uris = []
+        role_base = base['user_roles'][0]
+        for i in range(counts['user_roles']):
+            oid = self.oid()
+            role_uris.append(f'/api/user-roles/{oid}')
+            console['user_roles'].append({'properties': self.template(
+                role_base, **{
+                    'object-id': oid,
+                    'name': f'ROLE{i + 1}',
+                    'description': f'Synthetic user role ROLE{i + 1}',
+                    'type': 'user-defined',
+                })})
+        user_base = base['users'][1]
+        for i in range(counts['users']):
+            user_roles = [role_uris[i % len(role_uris)]] if role_uris else []
+            console['users'].append({'properties': self.template(
+                user_base, **{
+                    'object-id': self.oid(),
+                    'name': f'USER{i + 1}',
+                    'description': f'Synthetic user USER{i + 1}',
+                    'user-roles': user_roles,
+                    'primary-mfa-server-definition-uri': None,
+                    'backup-mfa-server-definition-uri': None,
+                })})
+        return console
+
+    def storage_groups(self, cpc_name, cpc_uri, counts):
+        """
+        Return the storage group definitions for a DPM CPC.
+        """
+        base = self.base['consoles'][0]['storage_groups'][0]
+        base_sv = base['storage_volumes'][0]
+        result = []
+        for i in range(counts['storage_groups']):
+            name = f'{cpc_name}_SG{i + 1}'
+            volumes = []
+            for j in range(counts['storage_volumes']):
+                volumes.append({'properties': self.template(
+                    base_sv, **{
+                        'element-id': self.oid(),
+                        'name': f'{name}_SV{j + 1}',
+                        'description': f'Synthetic storage volume {j + 1}',
+                        'size': float(self.rng.choice((10, 20, 50, 100))),
+                        'usage': 'boot' if j == 0 else 'data',
+                    })})
+            result.append({
+                'properties': self.template(base, **{
+                    'object-id': self.oid(),
+                    'name': name,
+                    'description': f'Synthetic storage group {name}',
+                    'cpc-uri': cpc_uri,
+                }),
+                'storage_volumes': volumes,
+            })
+        return result
+
+    def adapters(self, cpc_name, counts):
+        """
+        Return the adapter and virtual switch definitions for a DPM CPC,
+        alternating between OSA and FCP adapters.
+        """
+        base_osa, base_fcp = self.dpm_cpc['adapters'][:2]
+        adapters = []
+        vswitches = []
+        for i in range(counts['adapters']):
+            oid = self.oid()
+            base = base_osa if i % 2 == 0 else base_fcp
+            name = f"{'OSA' if i % 2 == 0 else 'FCP'}{i + 1}"
+            adapters.append({
+                'properties': self.template(base, **{
+                    'object-id': oid,
+                    'name': name,
+                    'description': f'Synthetic adapter {name} in {cpc_name}',
+                    'adapter-id': f'{0x100 + i:03X}',
+                    'channel-path-id': f'{i:03X}',
+                }),
+                'ports': deepcopy(base['ports']),
+            })
+            if i % 2 == 0:
+                vswitches.append({'properties': {
+                    'object-id': self.oid(),
+                    'name': f'Virtual Switch for {name}',
+                    'description': f'Synthetic virtual switch for {name}',
+                    'backing-adapter-uri': f'/api/adapters/{oid}',
+                    'port': 0,
+                }})
+        return adapters, vswitches
+
+    def partitions(self, cpc_name, adapters, vswitches, sg_uris, counts):
+        """
+        Return the partition definitions for a DPM CPC, with NICs backed by
+        the virtual switches, HBAs backed by the FCP adapters, and
+        attachments of the storage groups.
+        """
+        base = self.dpm_cpc['partitions'][0]
+        base_nic = base['nics'][0]
+        fcp_port_uris = [
+            f"/api/adapters/{a['properties']['object-id']}/storage-ports/"
+            f"{a['ports'][0]['properties']['element-id']}"
+            for a in adapters if a['properties']['type'] == 'fcp']
+        result = []
+        for i in range(counts['partitions']):
+            name = f'{cpc_name}_PART{i + 1}'
+            memory = self.rng.choice((4096, 8192, 16384))
+            partition = {'properties': self.template(base, **{
+                'object-id': self.oid(),
+                'name': name,
+                'description': f'Synthetic partition {name}',
+                'short-name': f'P{i + 1:07d}',
+                'status': self.rng.choice(PARTITION_STATUSES),
+                'ifl-processors': self.rng.randint(1, 4),
+                'initial-memory': memory,
+                'maximum-memory': memory,
+                'storage-group-uris':
+                    [sg_uris[i % len(sg_uris)]] if sg_uris else [],
+            })}
+            if vswitches:
+                partition['nics'] = []
+                for j in range(counts['nics']):
+                    vswitch = vswitches[(i + j) % len(vswitches)]
+                    vswitch_oid = vswitch['properties']['object-id']
+                    partition['nics'].append({'properties': self.template(
+                        base_nic, **{
+                            'element-id': self.oid(),
+                            'name': f'NIC{j + 1}',
+                            'description': f'Synthetic NIC {j + 1}',
+                            'device-number': f'{0x1000 + j:04X}',
+                            'virtual-switch-uri':
+                                f'/api/virtual-switches/{vswitch_oid}',
+                        })})
+            if fcp_port_uris:
+                partition['hbas'] = []
+                for j in range(counts['hbas']):
+                    port_uri = fcp_port_uris[(i + j) % len(fcp_port_uris)]
+                    partition['hbas'].append({'properties': {
+                        'element-id': self.oid(),
+                        'name': f'HBA{j + 1}',
+                        'description': f'Synthetic HBA {j + 1}',
+                        'device-number': f'{0x2000 + j:04X}',
+                        'adapter-port-uri': port_uri,
+                        'wwpn': f'{self.rng.getrandbits(64):016X}',
+                    }})
+            result.append(partition)
+        return result
+
+    def dpm_cpc_def(self, index, counts, console):
+        """
+        Return the definition of a DPM CPC, and add its storage groups to
+        the console definition.
+        """
+        name = f'CPC_DPM{index + 1}'
+        oid = self.oid()
+        cpc_uri = f'/api/cpcs/{oid}'
+        sgs = self.storage_groups(name, cpc_uri, counts)
+        console['storage_groups'].extend(sgs)
+        sg_uris = [f"/api/storage-groups/{sg['properties']['object-id']}"
+                   for sg in sgs]
+        adapters, vswitches = self.adapters(name, counts)
+        return {
+            'properties': self.template(self.dpm_cpc, **{
+                'object-id': oid,
+                'name': name,
+                'description': f'Synthetic DPM CPC {name}',
+            }),
+            'adapters': adapters,
+            'virtual_switches': vswitches,
+            'partitions': self.partitions(
+                name, adapters, vswitches, sg_uris, counts),
+        }
+
+    def classic_cpc_def(self, index, counts):
+        """
+        Return the definition of a classic mode CPC with its LPARs.
+        """
+        name = f'CPC_CLA{index + 1}'
+        base_lpar = self.classic_cpc['lpars'][0]
+        base_iap = self.classic_cpc['image_activation_profiles'][0]
+        lpars = []
+        iaps = []
+        for i in range(counts['lpars']):
+            lpar_name = f'L{index + 1:02d}{i + 1:04d}'
+            status = self.rng.choice(LPAR_STATUSES)
+            lpars.append({'properties': self.template(base_lpar, **{
+                'object-id': self.oid(),
+                'name': lpar_name,
+                'description': f'Synthetic LPAR {lpar_name} on {name}',
+                'partition-number': i + 1,
+                'partition-identifier': i + 1,
+                'status': status,
+                'activation-mode':
+                    'not-set' if status == 'not-activated' else 'linux',
+                'next-activation-profile-name': lpar_name,
+                'last-used-activation-profile': lpar_name,
+            })})
+            iaps.append({'properties': self.template(base_iap, **{
+                'name': lpar_name,
+                'description': f'Image activation profile {lpar_name}',
+            })})
+        return {
+            'properties': self.template(self.classic_cpc, **{
+                'object-id': self.oid(),
+                'name': name,
+                'description': f'Synthetic classic mode CPC {name}',
+            }),
+            'lpars': lpars,
+            'reset_activation_profiles':
+                deepcopy(self.classic_cpc['reset_activation_profiles']),
+            'load_activation_profiles':
+                deepcopy(self.classic_cpc['load_activation_profiles']),
+            'image_activation_profiles': iaps,
+        }
+
+
+def generate_hmc_definition(seed=0, hmc_host='hmc_synthetic',
+                            base_file=BASE_FILE, **counts):
+    """
+    Generate a synthetic mocked HMC definition.
+
+    Parameters:
+      seed (int): Seed for the random values and object IDs. The same seed
+        and counts result in the same definition.
+      hmc_host (str): Host name of the mocked HMC.
+      base_file (str): Path name of the mocked HMC definition file whose
+        objects are used as templates.
+      **counts: Counts of the generated resources, overriding the defaults
+        in DEFAULT_COUNTS.
+
+    Returns:
+      dict: The mocked HMC definition, i.e. the value of the 'hmc_definition'
+      item of a mocked HMC definition file.
+    """
+    unknown = set(counts) - set(DEFAULT_COUNTS)
+    if unknown:
+        raise ValueError(f"Unknown resource counts: {sorted(unknown)}")
+    counts = dict(DEFAULT_COUNTS, **counts)
+    gen = _Generator(seed, base_file)
+    console = gen.console(counts)
+    cpcs = [gen.dpm_cpc_def(i, counts, console)
+            for i in range(counts['dpm_cpcs'])]
+    cpcs.extend(gen.classic_cpc_def(i, counts)
+                for i in range(counts['classic_cpcs']))
+    return {
+        'host': hmc_host,
+        'api_version': gen.base['api_version'],
+        'consoles': [console],
+        'cpcs': cpcs,
+    }
+
+
+def faked_session(seed=0, **counts):
+    """
+    Return a zhmcclient_mock.FakedSession for a synthetic mocked HMC
+    definition (see generate_hmc_definition()).
+    """
+    hmc_def = generate_hmc_definition(seed=seed, **counts)
+    return FakedSession.from_hmc_dict({'hmc_definition': hmc_def})
+
+
+def main(argv=None):
+    """
+    Write a synthetic mocked HMC definition file.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic mocked HMC definition file.")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed for random values. Default: 0")
+    parser.add_argument('--host', default='hmc_synthetic',
+                        help="Host name of the mocked HMC. "
+                        "Default: hmc_synthetic")
+    for name, default in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int,
+                            default=default, dest=name,
+                            help=f"Count of {name.replace('_', ' ')}. "
+                            f"Default: {default}")
+    parser.add_argument('--output', '-o', default='-',
+                        help="Output file. Default: standard output")
+    args = parser.parse_args(argv)
+    counts = {name: getattr(args, name) for name in DEFAULT_COUNTS}
+    hmc_def = generate_hmc_definition(
+        seed=args.seed, hmc_host=args.host, **counts)
+    header = ("# Synthetic mocked HMC definition generated by "
+              "tests/common/mocked_hmc_generator.py\n"
+              f"# Seed: {args.seed}, counts: {counts}\n\n")
+    data = yaml.safe_dump({'hmc_definition': hmc_def}, sort_keys=False)
+    if args.output == '-':
+        sys.stdout.write(header + data)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as fp:
+            fp.write(header + data)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -329,6 +329,7 @@ def test_zhmc_adapter_facts(
             'match': None,
             'state': 'facts',
             'properties': None,
+            'adapters': None,
             'log_file': LOG_FILE,
             '_faked_session': faked_session,
         }
@@ -657,6 +658,7 @@ def test_zhmc_adapter_states(
                 'match': input_match2,
                 'state': input_state,
                 'properties': input_props,
+                'adapters': None,
                 'log_file': LOG_FILE,
                 '_faked_session': faked_session,
             }
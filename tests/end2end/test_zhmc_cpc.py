@@ -215,12 +215,18 @@ def test_zhmc_cpc_facts(
             'hmc_host': hmc_host,
             'hmc_auth': hmc_auth,
             'name': cpc.name,
+            'names': None,
             'state': 'facts',
             'select_properties': select_properties,
+            'include': ['partitions', 'adapters', 'storage_groups'],
+            'include_additional_properties': None,
+            'operation_timeout': 3600,
             'activation_profile_name': None,
             'properties': None,
             'bundle_level': None,
             'upgrade_timeout': 10800,
+            'upgrade_wait': True,
+            'upgrade_max_parallel': 1,
             'accept_firmware': True,
             'log_file': LOG_FILE,
             '_faked_session': faked_session,
@@ -771,6 +771,7 @@ def test_zhmc_lpar_state(
                     'store_status_indicator', False),
                 'timeout': input_kwargs.get('timeout', 60),
                 'force': input_kwargs.get('force', False),
+                'wait': True,
                 'os_ipl_token': input_kwargs.get('os_ipl_token', None),
                 'properties': input_kwargs.get('properties', None),
                 'log_file': LOG_FILE,
@@ -1013,6 +1014,7 @@ def test_zhmc_lpar_facts(
             'store_status_indicator': False,
             'timeout': 60,
             'force': False,
+            'wait': True,
             'os_ipl_token': None,
             'properties': None,
             'log_file': LOG_FILE,
@@ -688,6 +688,11 @@ def test_zhmc_partition_facts(
             'expand_storage_groups': False,
             'expand_crypto_adapters': False,
             'expand_nics': False,
+            'wait': True,
+            'nics': None,
+            'hbas': None,
+            'virtual_functions': None,
+            'storage_groups': None,
             'log_file': LOG_FILE,
             '_faked_session': faked_session,
         }
@@ -976,6 +981,11 @@ def test_zhmc_partition_state(
                 'expand_storage_groups': False,
                 'expand_crypto_adapters': False,
                 'expand_nics': False,
+                'wait': True,
+                'nics': None,
+                'hbas': None,
+                'virtual_functions': None,
+                'storage_groups': None,
                 'log_file': LOG_FILE,
                 '_faked_session': faked_session,
             }
@@ -1426,6 +1436,11 @@ def test_zhmc_partition_properties(
                     'expand_storage_groups': False,
                     'expand_crypto_adapters': False,
                     'expand_nics': False,
+                    'wait': True,
+                    'nics': None,
+                    'hbas': None,
+                    'virtual_functions': None,
+                    'storage_groups': None,
                     'log_file': LOG_FILE,
                     '_faked_session': faked_session,
                 }
@@ -1592,6 +1607,11 @@ def test_zhmc_partition_boot_stovol(
                 'expand_storage_groups': False,
                 'expand_crypto_adapters': False,
                 'expand_nics': False,
+                'wait': True,
+                'nics': None,
+                'hbas': None,
+                'virtual_functions': None,
+                'storage_groups': None,
                 'log_file': LOG_FILE,
                 '_faked_session': faked_session,
             }
@@ -1750,6 +1770,11 @@ def test_zhmc_partition_iso_mount(
                 'expand_storage_groups': False,
                 'expand_crypto_adapters': False,
                 'expand_nics': False,
+                'wait': True,
+                'nics': None,
+                'hbas': None,
+                'virtual_functions': None,
+                'storage_groups': None,
                 'log_file': LOG_FILE,
                 '_faked_session': faked_session,
             }
@@ -215,7 +215,9 @@ def test_zhmc_storage_volume_list(
         additional_properties=additional_properties)
     exp_storage_volume_dict = {}
     for storage_volume in exp_storage_volumes:
-        exp_properties = {}
+        exp_properties = {
+            'storage_group_name': picked_storage_group.name,
+        }
         for pname_hmc, pvalue in storage_volume.properties.items():
             pname = pname_hmc.replace('-', '_')
             exp_properties[pname] = pvalue
@@ -226,6 +228,8 @@ def test_zhmc_storage_volume_list(
         'hmc_host': hmc_host,
         'hmc_auth': hmc_auth,
         'storage_group_name': picked_storage_group.name,
+        'storage_group_name_pattern': None,
+        'cpc_name': None,
         'name': picked_storage_volume_name,
         'fulfillment_state': fulfillment_state,
         'maximum_size': maximum_size,
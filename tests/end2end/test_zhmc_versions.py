@@ -183,6 +183,7 @@ def test_zhmc_versions(
         'hmc_host': hmc_host,
         'hmc_auth': hmc_auth,
         'cpc_names': cpc_names,
+        'api_features': True,
         'log_file': LOG_FILE,
         '_faked_session': faked_session,
     }
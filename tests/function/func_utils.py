@@ -20,6 +20,8 @@ Utility functions for function testing.
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import re
+
 
 def mock_ansible_module(ansible_mod_cls, params, check_mode):
     """
@@ -31,3 +33,43 @@ def mock_ansible_module(ansible_mod_cls, params, check_mode):
     mod_obj.fail_json.configure_mock(side_effect=SystemExit(1))
     mod_obj.exit_json.configure_mock(side_effect=SystemExit(0))
     return mod_obj
+
+
+class RequestCounter:
+    """
+    Counter for the HMC requests that are made against a faked session.
+
+    The counter wraps the get(), post() and delete() methods of the faked
+    session, so it must be created before the code to be tested is run.
+    """
+
+    def __init__(self, session):
+        self.requests = []  # List of tuples (method, uri)
+        for method in ('get', 'post', 'delete'):
+            func = getattr(session, method)
+
+            def counted(uri, *args, _func=func, _method=method, **kwargs):
+                self.requests.append((_method.upper(), uri.split('?')[0]))
+                return _func(uri, *args, **kwargs)
+
+            setattr(session, method, counted)
+
+    def count(self, method=None, pattern=None):
+        """
+        Return the number of requests, optionally only those with an HTTP
+        method and with a URI (without query parameters) that matches a
+        regular expression pattern.
+        """
+        return len([
+            1 for m, uri in self.requests
+            if (method is None or m == method) and
+            (pattern is None or re.fullmatch(pattern, uri))])
+
+    def reset(self):
+        """
+        Reset the counter.
+        """
+        self.requests = []
+
+    def __str__(self):
+        return "\n".join(f"{m} {uri}" for m, uri in self.requests)
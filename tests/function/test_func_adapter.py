@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for the 'zhmc_adapter' Ansible module.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+import pytest
+
+from zhmcclient_mock import FakedSession
+
+from plugins.modules import zhmc_adapter
+
+from .func_utils import mock_ansible_module, RequestCounter
+
+# FakedSession() init arguments
+FAKED_SESSION_KWARGS = dict(
+    host='fake-host',
+    hmc_name='faked-hmc-name',
+    hmc_version='2.14.0',
+    api_version='2.23'
+)
+
+# Faked Console that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CONSOLE = {
+    'object-uri': '/api/console',
+    'class': 'console',
+    'name': 'hmc-1',
+    'description': 'Console HMC1',
+    'version': '2.14.0',
+}
+
+# Faked CPC in DPM mode that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CPC = {
+    'object-id': 'fake-cpc-1',
+    'object-uri': '/api/cpcs/fake-cpc-1',
+    'class': 'cpc',
+    'name': 'cpc-name-1',
+    'description': 'CPC #1 in DPM mode',
+    'status': 'active',
+    'dpm-enabled': True,
+    'is-ensemble-member': False,
+    'iml-mode': 'dpm',
+}
+
+# Number of faked OSA adapters that are used for all tests
+ADAPTER_COUNT = 12
+
+# Number of ports of each faked OSA adapter
+PORT_COUNT = 2
+
+
+def faked_session_with_adapters():
+    """
+    Return a faked session with ADAPTER_COUNT OSA adapters named 'OSA<i>'
+    with adapter IDs '1<i in hex>0', each with PORT_COUNT ports.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC)
+    for i in range(ADAPTER_COUNT):
+        faked_adapter = faked_cpc.adapters.add({
+            'object-id': f'fake-osa-{i}',
+            'name': f'OSA{i}',
+            'description': f'OSA adapter #{i}',
+            'adapter-id': f'1{i:X}0',
+            'adapter-family': 'osa',
+            'type': 'osd',
+            'status': 'active',
+            'channel-path-id': f'{i:02X}',
+            'network-port-uris': [],
+        })
+        for j in range(PORT_COUNT):
+            faked_adapter.ports.add({
+                'element-id': f'{j}',
+                'name': f'Port {j}',
+                'index': j,
+            })
+    return session
+
+
+def adapter_params(session, **kwargs):
+    """
+    Return the module parameters for zhmc_adapter (must be all required +
+    optional).
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC['name'],
+        'name': None,
+        'match': None,
+        'state': 'set',
+        'properties': None,
+        'adapters': None,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def adapter_item(name, match=None, properties=None):
+    """
+    Return an item of the 'adapters' module parameter.
+    """
+    return dict(name=name, match=match, properties=properties)
+
+
+def get_failure_msg(mod_obj):
+    """
+    Return the module failure message, as a string (i.e. the 'msg' argument
+    of the call to fail_json()).
+    If the module succeeded, return None.
+    """
+
+    def func(msg, **kwargs):
+        # pylint: disable=unused-argument
+        return msg
+
+    if not mod_obj.fail_json.called:
+        return None
+    call_args = mod_obj.fail_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+def get_module_output(mod_obj):
+    """
+    Return the module output as a tuple (changed, adapters)
+    (i.e. the arguments of the call to exit_json()).
+    If the module failed, return None.
+    """
+
+    def func(changed, adapters, **kwargs):
+        # pylint: disable=unused-argument
+        return changed, adapters
+
+    if not mod_obj.exit_json.called:
+        return None
+    call_args = mod_obj.exit_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+@pytest.mark.parametrize(
+    "check_mode", [False, True])
+@mock.patch("plugins.modules.zhmc_adapter.AnsibleModule", autospec=True)
+def test_adapter_multiple_set(ansible_mod_cls, check_mode):
+    """
+    Test that multiple adapters are renamed and updated with a single adapter
+    listing, and that their ports are returned.
+    """
+    session = faked_session_with_adapters()
+    counter = RequestCounter(session)
+    items = [
+        adapter_item('OSD_110', match=dict(adapter_id='110'),
+                     properties=dict(description='OSA in slot 110')),
+        adapter_item('OSA2', properties=dict(description='New description')),
+        adapter_item('OSA3', properties=dict(description='OSA adapter #3')),
+        adapter_item('OSD_140', match=dict(channel_path_id='4'),
+                     properties=dict(description='OSA in slot 140')),
+    ]
+    params = adapter_params(session, adapters=items)
+
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_adapter.main()
+
+    exit_code = exc_info.value.args[0]
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    changed, reports = get_module_output(mod_obj)
+    assert changed is True
+
+    assert [r['name'] for r in reports] == \
+        ['OSD_110', 'OSA2', 'OSA3', 'OSD_140']
+    assert [r['status'] for r in reports] == ['complete'] * 4
+    assert [r['changed'] for r in reports] == [True, True, False, True]
+    for item, report in zip(items, reports):
+        adapter = report['adapter']
+        assert adapter['name'] == item['name']
+        assert adapter['description'] == item['properties']['description']
+        assert [p['name'] for p in adapter['ports']] == \
+            [f'Port {j}' for j in range(PORT_COUNT)]
+    assert reports[0]['adapter']['adapter-id'] == '110'
+    assert reports[3]['adapter']['adapter-id'] == '140'
+
+    assert counter.count('GET', r'/api/cpcs/[^/]+/adapters') == 1
+
+    adapters = session.hmc.cpcs.list()[0].adapters
+    exp_names = {'OSA1', 'OSA4'} if check_mode else {'OSD_110', 'OSD_140'}
+    act_names = {a.properties['name'] for a in adapters.list()}
+    assert exp_names <= act_names
+
+
+@mock.patch("plugins.modules.zhmc_adapter.AnsibleModule", autospec=True)
+def test_adapter_multiple_facts(ansible_mod_cls):
+    """
+    Test that the facts of multiple adapters are returned with a single
+    adapter listing.
+    """
+    session = faked_session_with_adapters()
+    counter = RequestCounter(session)
+    items = [adapter_item(f'OSA{i}') for i in range(ADAPTER_COUNT)]
+    params = adapter_params(session, state='facts', adapters=items)
+
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_adapter.main()
+
+    assert exc_info.value.args[0] == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    changed, reports = get_module_output(mod_obj)
+    assert changed is False
+    for i, report in enumerate(reports):
+        assert report['status'] == 'complete'
+        assert report['adapter']['name'] == f'OSA{i}'
+        assert report['adapter']['description'] == f'OSA adapter #{i}'
+        assert len(report['adapter']['ports']) == PORT_COUNT
+
+    assert counter.count('GET', r'/api/cpcs/[^/]+/adapters') == 1
+    assert counter.count('GET', r'/api/adapters/[^/]+') == ADAPTER_COUNT
+    assert counter.count('GET', r'/api/adapters/[^/]+/network-ports/.+') == \
+        ADAPTER_COUNT * PORT_COUNT
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (
+            dict(),
+            "ParameterError: One of the 'name' and 'adapters' module "
+            "parameters must be specified.",
+        ),
+        (
+            dict(name='OSA1', adapters=[adapter_item('OSA2')]),
+            "ParameterError: The 'name' module parameter is mutually "
+            "exclusive",
+        ),
+        (
+            dict(properties={}, adapters=[adapter_item('OSA2')]),
+            "ParameterError: The 'properties' module parameter is mutually "
+            "exclusive",
+        ),
+        (
+            dict(state='absent', adapters=[adapter_item('OSA2')]),
+            "ParameterError: The 'adapters' module parameter is supported "
+            "only for state=set and state=facts",
+        ),
+        (
+            dict(adapters=[adapter_item('OSA2'), adapter_item('OSA2')]),
+            "ParameterError: Module parameter 'adapters' specifies duplicate "
+            "adapter names.",
+        ),
+        (
+            dict(adapters=[adapter_item('OSA2'),
+                           adapter_item('OSD', match=dict(adapter_id='120'))]),
+            "ParameterError: Module parameter 'adapters' specifies the same "
+            "adapter more than once.",
+        ),
+        (
+            dict(adapters=[adapter_item('OSA2'), adapter_item('OSA99')]),
+            "ParameterError: Adapter 'OSA99' was not found in CPC",
+        ),
+        (
+            dict(adapters=[adapter_item('OSA', match=dict(type='osd'))]),
+            "ParameterError: Adapter 'OSA' was not uniquely identified in "
+            "CPC",
+        ),
+        (
+            dict(adapters=[
+                adapter_item('OSA1', properties=dict(description='x')),
+                adapter_item('OSA2', properties=dict(port_count=1))]),
+            "ParameterError: Invalid adapter property 'port_count'",
+        ),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_adapter.AnsibleModule", autospec=True)
+def test_adapter_multiple_errors(ansible_mod_cls, kwargs, exp_msg_pattern):
+    """
+    Test the parameter validation for multiple adapters, and that no adapter
+    is changed if the validation fails.
+    """
+    session = faked_session_with_adapters()
+    params = adapter_params(session, **kwargs)
+
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_adapter.main()
+
+    assert exc_info.value.args[0] == 1
+    assert get_failure_msg(mod_obj).startswith(exp_msg_pattern)
+    adapters = session.hmc.cpcs.list()[0].adapters
+    for i, faked_adapter in enumerate(adapters.list()):
+        assert faked_adapter.properties['description'] == \
+            f'OSA adapter #{i}'
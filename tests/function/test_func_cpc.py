@@ -26,12 +26,14 @@ from unittest import mock
 import re
 import pytest
 
+import zhmcclient
 from zhmcclient import Client
 from zhmcclient_mock import FakedSession
 
 from plugins.modules import zhmc_cpc
+from plugins.module_utils import common
 
-from .func_utils import mock_ansible_module
+from .func_utils import mock_ansible_module, RequestCounter
 
 # Faked Console that is used for all tests
 # (with property names as specified in HMC data model)
@@ -397,8 +399,12 @@ class TestCpc:
             'hmc_auth': dict(userid='fake-userid',
                              password='fake-password'),
             'name': cpc.name,
+            'names': None,
             'state': input_state,
             'select_properties': None,
+            'include': ['partitions', 'adapters', 'storage_groups'],
+            'include_additional_properties': None,
+            'operation_timeout': 3600,
             'activation_profile_name': None,
             'properties': input_properties,
             'bundle_level': None,
@@ -453,3 +459,732 @@ class TestCpc:
                         assert hmc_name in cpc.properties
                         assert exp_value == cpc.properties[hmc_name], \
                             f"Unexpected value for property {hmc_name!r}"
+
+
+# Maximum number of HMC requests for CPC facts
+CPC_FACTS_MAX_REQUESTS = 5
+
+
+@pytest.mark.parametrize(
+    "child_count", [1, 10, 50])
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_facts_request_count(ansible_mod_cls, child_count):
+    """
+    Test that the HMC requests for CPC facts do not grow with the number of
+    partitions and adapters in the CPC.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_2)
+    for i in range(child_count):
+        faked_cpc.partitions.add({
+            'object-id': f'fake-part-{i}',
+            'name': f'PART{i}',
+            'status': 'stopped',
+        })
+        faked_cpc.adapters.add({
+            'object-id': f'fake-adapter-{i}',
+            'name': f'OSA{i}',
+            'type': 'osd',
+            'adapter-family': 'osa',
+        })
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'name': FAKED_CPC_2_NAME,
+        'names': None,
+        'state': 'facts',
+        'select_properties': None,
+        'include': ['partitions', 'adapters', 'storage_groups'],
+        'include_additional_properties': None,
+        'operation_timeout': 3600,
+        'activation_profile_name': None,
+        'properties': None,
+        'bundle_level': None,
+        'upgrade_timeout': 10800,
+        'upgrade_wait': True,
+        'upgrade_max_parallel': 1,
+        'accept_firmware': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    counter = RequestCounter(session)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_cpc.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    _, cpc_props = get_module_output(mod_obj)
+    assert len(cpc_props['partitions']) == child_count
+    assert len(cpc_props['adapters']) == child_count
+    assert counter.count() <= CPC_FACTS_MAX_REQUESTS, \
+        f"Unexpected number of HMC requests:\n{counter}"
+    assert counter.count('GET', r'/api/partitions/[^/]+') == 0
+    assert counter.count('GET', r'/api/adapters/[^/]+') == 0
+
+
+def cpc_facts_params(session, **kwargs):
+    """
+    Return the module parameters for CPC facts (must be all required +
+    optional).
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'name': FAKED_CPC_2_NAME,
+        'names': None,
+        'state': 'facts',
+        'select_properties': None,
+        'include': ['partitions', 'adapters', 'storage_groups'],
+        'include_additional_properties': None,
+        'operation_timeout': 3600,
+        'activation_profile_name': None,
+        'properties': None,
+        'bundle_level': None,
+        'upgrade_timeout': 10800,
+        'upgrade_wait': True,
+        'upgrade_max_parallel': 1,
+        'accept_firmware': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+@pytest.mark.parametrize(
+    "include, include_add_props, exp_list_uris", [
+        ([], None, []),
+        (['partitions'], None,
+         [FAKED_CPC_2_URI + '/partitions']),
+        (['adapters', 'storage_groups'], None,
+         [FAKED_CPC_2_URI + '/adapters', '/api/storage-groups']),
+        (['partitions', 'adapters', 'storage_groups'],
+         {'partitions': ['ifl_processors'], 'adapters': ['port_count']},
+         [FAKED_CPC_2_URI + '/partitions', FAKED_CPC_2_URI + '/adapters',
+          '/api/storage-groups']),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_facts_include(
+        ansible_mod_cls, include, include_add_props, exp_list_uris):
+    """
+    Test that CPC facts list only the child resources selected with the
+    'include' module parameter, with their additional properties.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_2)
+    faked_cpc.partitions.add({
+        'object-id': 'fake-part-1',
+        'name': 'PART1',
+        'status': 'stopped',
+    })
+    faked_cpc.adapters.add({
+        'object-id': 'fake-adapter-1',
+        'name': 'OSA1',
+        'type': 'osd',
+        'adapter-family': 'osa',
+    })
+    list_uris = []
+    session_get = session.get
+
+    def get(uri, *args, **kwargs):
+        if uri.split('?')[0] != FAKED_CPC_2_URI and uri != '/api/cpcs':
+            list_uris.append(uri)
+        return session_get(uri, *args, **kwargs)
+
+    session.get = get
+    params = cpc_facts_params(
+        session, include=include,
+        include_additional_properties=include_add_props)
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_cpc.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    _, cpc_props = get_module_output(mod_obj)
+    for child in ('partitions', 'adapters', 'storage_groups'):
+        assert (child.replace('_', '-') in cpc_props) == (child in include)
+    assert sorted(u.split('?')[0] for u in list_uris) == sorted(exp_list_uris)
+    for child, prop_names in (include_add_props or {}).items():
+        uri = [u for u in list_uris if u.split('?')[0].endswith(child)][0]
+        assert 'additional-properties=' + \
+            ','.join(p.replace('_', '-') for p in prop_names) in uri
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (dict(include_additional_properties={'foo': ['name']}),
+         "ParameterError: Invalid child resource 'foo'"),
+        (dict(include_additional_properties={'storage_groups': ['name']}),
+         "ParameterError: Child resource 'storage_groups' does not support"),
+        (dict(include=['adapters'],
+              include_additional_properties={'partitions': ['name']}),
+         "ParameterError: Child resource 'partitions' is specified in the "
+         "'include_additional_properties' module parameter but not in"),
+        (dict(include_additional_properties={'partitions': 'name'}),
+         "ParameterError: The value for child resource 'partitions'"),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_facts_include_errors(ansible_mod_cls, kwargs, exp_msg_pattern):
+    """
+    Test the validation of the 'include_additional_properties' module
+    parameter.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    session.hmc.cpcs.add(FAKED_CPC_2)
+    params = cpc_facts_params(session, **kwargs)
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_cpc.main()
+
+    assert exc_info.value.args[0] == 1
+    assert get_failure_msg(mod_obj).startswith(exp_msg_pattern)
+
+
+def faked_session_with_cpcs(cpcs):
+    """
+    Return a faked session with CPCs, specified as a list of tuples
+    (name, dpm_enabled, status).
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    for name, dpm_enabled, status in cpcs:
+        session.hmc.cpcs.add({
+            'object-id': f'fake-{name}',
+            'name': name,
+            'description': f'CPC {name}',
+            'status': status,
+            'dpm-enabled': dpm_enabled,
+            'is-ensemble-member': False,
+            'iml-mode': 'dpm' if dpm_enabled else 'lpar',
+        })
+    return session
+
+
+# CPCs for the tests of the 'names' module parameter
+MULTI_CPCS = [
+    ('CPCA', True, 'not-operating'),
+    ('CPCB', True, 'active'),
+    ('CPCC', False, 'no-power'),
+    ('CPCD', False, 'operating'),
+]
+
+
+def run_multi_module(ansible_mod_cls, params, check_mode=False):
+    """
+    Run the zhmc_cpc module with the 'names' module parameter and return a
+    tuple (exit_code, kwargs of the exit_json() or fail_json() call).
+    """
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode)
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_cpc.main()
+    exit_code = exc_info.value.args[0]
+    if exit_code == 0:
+        return exit_code, mod_obj.exit_json.call_args[1]
+    return exit_code, mod_obj.fail_json.call_args[1]
+
+
+@pytest.mark.parametrize(
+    "check_mode", [False, True])
+@pytest.mark.parametrize(
+    "state, properties, exp_started, exp_changed", [
+        ('active', None,
+         {'CPCA': 'start', 'CPCC': 'activate'},
+         {'CPCA': True, 'CPCB': False, 'CPCC': True, 'CPCD': False}),
+        ('active', {'description': 'new'},
+         {'CPCA': 'start', 'CPCC': 'activate'},
+         {'CPCA': True, 'CPCB': True, 'CPCC': True, 'CPCD': True}),
+        ('inactive', None,
+         {'CPCB': 'stop', 'CPCD': 'deactivate'},
+         {'CPCA': False, 'CPCB': True, 'CPCC': False, 'CPCD': True}),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_names(
+        ansible_mod_cls, wait_func, state, properties, exp_started,
+        exp_changed, check_mode):
+    """
+    Test that the activations or deactivations for the 'names' module
+    parameter are all started before any of them is awaited, and that the
+    properties are set on each activated CPC.
+    """
+    session = faked_session_with_cpcs(MULTI_CPCS)
+    cpc_names = [c[0] for c in MULTI_CPCS]
+    params = cpc_facts_params(
+        session, name=None, names=cpc_names, state=state,
+        properties=properties, activation_profile_name='PROF1', include=[])
+    started = {}
+    awaited = []
+
+    def start_func(operation):
+        def func(cpc, **kwargs):
+            assert not awaited, "Operation started after a completion wait"
+            assert kwargs['wait_for_completion'] is False
+            if operation == 'activate':
+                assert kwargs['activation_profile_name'] == 'PROF1'
+            started[cpc.name] = operation
+            return f'job-{cpc.name}'
+        return func
+
+    def wait(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        awaited.append(job)
+
+    wait_func.side_effect = wait
+
+    # The code to be tested
+    with mock.patch.object(zhmcclient.Cpc, 'start', autospec=True,
+                           side_effect=start_func('start')), \
+            mock.patch.object(zhmcclient.Cpc, 'activate',
+                              autospec=True,
+                              side_effect=start_func('activate')), \
+            mock.patch.object(zhmcclient.Cpc, 'stop', autospec=True,
+                              side_effect=start_func('stop')), \
+            mock.patch.object(zhmcclient.Cpc, 'deactivate',
+                              autospec=True,
+                              side_effect=start_func('deactivate')):
+        exit_code, kwargs = run_multi_module(
+            ansible_mod_cls, params, check_mode)
+
+    assert exit_code == 0, f"Module unexpectedly failed: {kwargs}"
+    if check_mode:
+        assert started == {}
+        assert awaited == []
+    else:
+        assert started == exp_started
+        assert sorted(awaited) == sorted(f'job-{n}' for n in exp_started)
+    reports = kwargs['cpcs']
+    assert kwargs['changed'] is True
+    assert [r['name'] for r in reports] == cpc_names
+    for report in reports:
+        assert report['status'] == 'complete'
+        assert report['error'] is None
+        assert report['changed'] == exp_changed[report['name']]
+        assert report['duration'] >= 0
+        if state == 'active':
+            assert report['cpc']['name'] == report['name']
+            if properties:
+                assert report['cpc']['description'] == 'new'
+        else:
+            assert 'cpc' not in report
+
+
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_names_failures(ansible_mod_cls, wait_func):
+    """
+    Test that the module fails with the outcome for each CPC if the
+    activation of any CPC fails or times out.
+    """
+    session = faked_session_with_cpcs(
+        [('CPCA', True, 'not-operating'), ('CPCB', True, 'not-operating'),
+         ('CPCC', True, 'not-operating')])
+    params = cpc_facts_params(
+        session, name=None, names=['CPCA', 'CPCB', 'CPCC'], state='active',
+        include=[])
+
+    def start(cpc, wait_for_completion):
+        # pylint: disable=unused-argument
+        if cpc.name == 'CPCC':
+            raise zhmcclient.HTTPError({
+                'http-status': 409, 'reason': 1, 'message': "Busy",
+                'request-uri': cpc.uri, 'request-method': 'POST'})
+        return f'job-{cpc.name}'
+
+    def wait(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        if job == 'job-CPCB':
+            raise zhmcclient.OperationTimeout("Timed out", 3600)
+
+    wait_func.side_effect = wait
+
+    # The code to be tested
+    with mock.patch.object(zhmcclient.Cpc, 'start', autospec=True,
+                           side_effect=start):
+        exit_code, kwargs = run_multi_module(ansible_mod_cls, params)
+
+    assert exit_code == 1
+    assert kwargs['msg'].startswith(
+        "Ensuring state=active has not completed for 2 of 3 CPCs: "
+        "CPCB, CPCC")
+    reports = kwargs['cpcs']
+    assert [r['status'] for r in reports] == ['complete', 'timeout', 'failed']
+    assert [r['changed'] for r in reports] == [True, True, False]
+    assert 'Busy' in reports[2]['error']
+
+
+@pytest.mark.parametrize(
+    "multi", [False, True])
+@pytest.mark.parametrize(
+    "state, dpm_enabled, status, operation", [
+        ('active', True, 'not-operating', 'start'),
+        ('active', False, 'no-power', 'activate'),
+        ('inactive', True, 'active', 'stop'),
+        ('inactive', False, 'operating', 'deactivate'),
+    ]
+)
+@pytest.mark.parametrize(
+    "error, exp_calls", [
+        (zhmcclient.HTTPError({
+            'http-status': 503, 'reason': 0, 'message': "Unavailable",
+            'request-uri': '/api/cpcs/fake-CPCA', 'request-method': 'POST'}),
+         2),
+        (zhmcclient.ConnectTimeout("Timed out", None, 30, 3), 1),
+    ]
+)
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_job_submission_retries(
+        ansible_mod_cls, wait_func, sleep_func, error, exp_calls, state,
+        dpm_enabled, status, operation, multi):
+    # pylint: disable=unused-argument
+    """
+    Test that the activation and deactivation of a CPC in classic and DPM
+    mode are retried the same way: A submission that the HMC rejected is
+    retried, and a submission for which the connection timed out is not.
+    """
+    session = faked_session_with_cpcs([('CPCA', dpm_enabled, status)])
+    if multi:
+        params = cpc_facts_params(
+            session, name=None, names=['CPCA'], state=state,
+            activation_profile_name='PROF1', include=[])
+    else:
+        params = cpc_facts_params(
+            session, name='CPCA', state=state,
+            activation_profile_name='PROF1', include=[])
+    submit_func = mock.Mock(side_effect=[error, 'job-CPCA'])
+
+    def submit(cpc, **kwargs):
+        assert kwargs['wait_for_completion'] is False
+        return submit_func(cpc.name)
+
+    # The code to be tested
+    with mock.patch.object(zhmcclient.Cpc, operation, autospec=True,
+                           side_effect=submit):
+        exit_code, kwargs = run_multi_module(ansible_mod_cls, params)
+
+    assert submit_func.call_count == exp_calls
+    if exp_calls == 2:
+        assert exit_code == 0, f"Module unexpectedly failed: {kwargs}"
+        assert wait_func.call_args[0][0] == 'job-CPCA'
+        assert kwargs['retries'] == {f'{operation} /api/cpcs/fake-CPCA': 1}
+    else:
+        assert exit_code == 1
+        assert wait_func.call_count == 0
+        assert 'retries' not in kwargs
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (dict(names=['CPCA'], state='facts'),
+         "ParameterError: The 'names' module parameter is only permitted for "
+         "state=active, state=inactive and state=upgrade"),
+        (dict(names=['CPCA'], name='CPCA'),
+         "ParameterError: The 'name' and 'names' module parameters are "
+         "mutually exclusive"),
+        (dict(name=None),
+         "ParameterError: The 'name' module parameter is required"),
+        (dict(names=['CPCA', 'CPCA']),
+         "ParameterError: Module parameter 'names' specifies duplicate CPC "
+         "names"),
+        (dict(names=['CPCA', 'CPCX']),
+         "ParameterError: CPC 'CPCX' does not exist"),
+        (dict(names=['CPCA', 'CPCC']),
+         "ParameterError: CPC 'CPCC' is in classic mode and activation "
+         "requires the 'activation_profile_name' parameter"),
+        (dict(names=['CPCA', 'CPCE']),
+         "StatusError: CPC 'CPCE' cannot be activated because it is in "
+         "status 'not-communicating'"),
+    ]
+)
+@mock.patch.object(zhmcclient.Cpc, 'start', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_names_errors(ansible_mod_cls, start_func, kwargs,
+                          exp_msg_pattern):
+    """
+    Test the parameter and status checks for the 'names' module parameter,
+    which are all done before any CPC is activated.
+    """
+    session = faked_session_with_cpcs(
+        MULTI_CPCS + [('CPCE', True, 'not-communicating')])
+    kwargs = dict(dict(name=None, state='active', include=[]), **kwargs)
+    params = cpc_facts_params(session, **kwargs)
+
+    # The code to be tested
+    exit_code, result = run_multi_module(ansible_mod_cls, params)
+
+    assert exit_code == 1
+    assert result['msg'].startswith(exp_msg_pattern)
+    assert start_func.call_count == 0
+
+
+def faked_upgrade_session(cpcs):
+    """
+    Return a faked session with CPCs as for faked_session_with_cpcs(), and
+    an HMC that supports firmware upgrades.
+    """
+    session = faked_session_with_cpcs(cpcs)
+    session.hmc.consoles.console.update(
+        {'ec-mcl-description': {'bundle-level': 'H40'}})
+    return session
+
+
+def upgrade_params(session, names, **kwargs):
+    """
+    Return the module parameters for upgrading multiple CPCs.
+    """
+    kwargs = dict(dict(
+        name=None, names=names, state='upgrade', bundle_level='S71',
+        upgrade_max_parallel=2, include=[]), **kwargs)
+    return cpc_facts_params(session, **kwargs)
+
+
+def already_installed_error(cpc):
+    """
+    Return the HTTPError for an SE that is already at the bundle level.
+    """
+    return zhmcclient.HTTPError({
+        'http-status': 400, 'reason': 356, 'message': "Already installed",
+        'request-uri': cpc.uri, 'request-method': 'POST'})
+
+
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch.object(zhmcclient.Cpc, 'single_step_install', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_upgrade_waves(
+        ansible_mod_cls, install_func, wait_func, monkeypatch, tmp_path):
+    """
+    Test that multiple CPCs are upgraded in waves of up to
+    'upgrade_max_parallel' CPCs, and that a CPC whose SE is already at the
+    bundle level is not changed.
+    """
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    cpc_names = ['CPC1', 'CPC2', 'CPC3', 'CPC4', 'CPC5']
+    session = faked_upgrade_session(
+        [(n, True, 'active') for n in cpc_names])
+    params = upgrade_params(session, cpc_names)
+    events = []
+
+    def install(cpc, bundle_level, accept_firmware, wait_for_completion,
+                operation_timeout):
+        # pylint: disable=unused-argument
+        assert bundle_level == 'S71'
+        assert wait_for_completion is False
+        events.append(('submit', cpc.name))
+        if cpc.name == 'CPC4':
+            raise already_installed_error(cpc)
+        return zhmcclient.Job(session, f'/api/jobs/{cpc.name}', 'POST',
+                              cpc.uri)
+
+    def wait(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        events.append(('wait', job.uri.split('/')[-1]))
+
+    install_func.side_effect = install
+    wait_func.side_effect = wait
+
+    # The code to be tested
+    exit_code, kwargs = run_multi_module(ansible_mod_cls, params)
+
+    assert exit_code == 0, f"Module unexpectedly failed: {kwargs}"
+    assert kwargs['changed'] is True
+    reports = kwargs['cpcs']
+    assert [r['name'] for r in reports] == cpc_names
+    assert [r['status'] for r in reports] == ['complete'] * 5
+    assert [r['changed'] for r in reports] == [True, True, True, False, True]
+    for report in reports:
+        assert report['cpc']['name'] == report['name']
+
+    # Each wave is submitted only after the previous wave has completed
+    waves = [['CPC1', 'CPC2'], ['CPC3', 'CPC4'], ['CPC5']]
+    wave_events = []
+    for wave in waves:
+        n_events = len(wave) + len([n for n in wave if n != 'CPC4'])
+        wave_events.append(events[:n_events])
+        events = events[n_events:]
+    assert events == []
+    for wave, w_events in zip(waves, wave_events):
+        assert sorted(n for e, n in w_events if e == 'submit') == wave
+        assert sorted(n for e, n in w_events if e == 'wait') == \
+            [n for n in wave if n != 'CPC4']
+
+    # The journal is empty after completion
+    journal = common.JobJournal.from_environment('fake-host')
+    for cpc_name in cpc_names:
+        assert journal.get(f'/api/cpcs/fake-{cpc_name}') is None
+
+
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch.object(zhmcclient.Cpc, 'single_step_install', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_upgrade_health_gate(
+        ansible_mod_cls, install_func, wait_func, monkeypatch, tmp_path):
+    """
+    Test that the CPCs of the waves after a wave with an unhealthy CPC are
+    skipped, and that the module fails.
+    """
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    cpc_names = ['CPC1', 'CPC2', 'CPC3', 'CPC4']
+    session = faked_upgrade_session(
+        [(n, True, 'active') for n in cpc_names])
+    params = upgrade_params(session, cpc_names)
+
+    def install(cpc, **kwargs):
+        # pylint: disable=unused-argument
+        return zhmcclient.Job(session, f'/api/jobs/{cpc.name}', 'POST',
+                              cpc.uri)
+
+    def wait(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        if job.uri == '/api/jobs/CPC2':
+            faked_cpc = session.hmc.cpcs.lookup_by_oid('fake-CPC2')
+            faked_cpc.update({'status': 'not-communicating'})
+
+    install_func.side_effect = install
+    wait_func.side_effect = wait
+
+    # The code to be tested
+    exit_code, kwargs = run_multi_module(ansible_mod_cls, params)
+
+    assert exit_code == 1
+    assert kwargs['msg'].startswith(
+        "Ensuring state=upgrade has not completed for 3 of 4 CPCs: "
+        "CPC2, CPC3, CPC4")
+    reports = kwargs['cpcs']
+    assert [r['status'] for r in reports] == \
+        ['complete', 'unhealthy', 'skipped', 'skipped']
+    assert "'not-communicating'" in reports[1]['error']
+    assert 'CPC2' in reports[2]['error']
+    assert install_func.call_count == 2
+
+
+@mock.patch.object(zhmcclient.Job, 'query_status', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.wait_for_job_completion",
+            autospec=True)
+@mock.patch.object(zhmcclient.Cpc, 'single_step_install', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_upgrade_resume(
+        ansible_mod_cls, install_func, wait_func, query_func, monkeypatch,
+        tmp_path):
+    """
+    Test that an upgrade that timed out is awaited again instead of being
+    submitted again when the module is run again.
+    """
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    cpc_names = ['CPC1', 'CPC2']
+    session = faked_upgrade_session(
+        [(n, True, 'active') for n in cpc_names])
+    installed = []
+    timeouts = ['/api/jobs/CPC1']
+
+    def install(cpc, **kwargs):
+        # pylint: disable=unused-argument
+        if cpc.name in installed:
+            raise already_installed_error(cpc)
+        return zhmcclient.Job(session, f'/api/jobs/{cpc.name}', 'POST',
+                              cpc.uri)
+
+    def wait(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        if job.uri in timeouts:
+            raise zhmcclient.OperationTimeout("Timed out", 10800)
+        installed.append(job.uri.split('/')[-1])
+
+    install_func.side_effect = install
+    wait_func.side_effect = wait
+    query_func.return_value = ('running', None, None, None)
+    journal = common.JobJournal.from_environment('fake-host')
+
+    exit_code, kwargs = run_multi_module(
+        ansible_mod_cls, upgrade_params(session, cpc_names))
+
+    assert exit_code == 1
+    assert [r['status'] for r in kwargs['cpcs']] == ['timeout', 'complete']
+    assert journal.get('/api/cpcs/fake-CPC1')['job-uri'] == '/api/jobs/CPC1'
+    assert install_func.call_count == 2
+
+    # The code to be tested
+    timeouts.clear()
+    exit_code, kwargs = run_multi_module(
+        ansible_mod_cls, upgrade_params(session, cpc_names))
+
+    assert exit_code == 0, f"Module unexpectedly failed: {kwargs}"
+    assert [r['status'] for r in kwargs['cpcs']] == ['complete', 'complete']
+    assert [r['changed'] for r in kwargs['cpcs']] == [True, False]
+    # CPC1 was resumed and only CPC2 was submitted again
+    assert install_func.call_count == 3
+    assert install_func.call_args[0][0].name == 'CPC2'
+    assert query_func.call_count == 1
+    assert journal.get('/api/cpcs/fake-CPC1') is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (dict(upgrade_wait=False),
+         "ParameterError: The 'upgrade_wait' module parameter must be true"),
+        (dict(upgrade_max_parallel=0),
+         "ParameterError: The 'upgrade_max_parallel' module parameter must "
+         "be at least 1"),
+        (dict(bundle_level=None),
+         None),
+    ]
+)
+@mock.patch.object(zhmcclient.Cpc, 'single_step_install', autospec=True)
+@mock.patch("plugins.modules.zhmc_cpc.AnsibleModule", autospec=True)
+def test_cpc_upgrade_errors(
+        ansible_mod_cls, install_func, kwargs, exp_msg_pattern):
+    """
+    Test the parameter checks for upgrading multiple CPCs.
+    """
+    session = faked_upgrade_session([('CPC1', True, 'active')])
+    params = upgrade_params(session, ['CPC1'], **kwargs)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    if exp_msg_pattern is None:
+        # The check for missing parameters is done by AnsibleModule
+        mod_obj.fail_on_missing_params.side_effect = SystemExit(1)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_cpc.main()
+
+    assert exc_info.value.args[0] == 1
+    if exp_msg_pattern:
+        assert mod_obj.fail_json.call_args[1]['msg'].startswith(
+            exp_msg_pattern)
+    else:
+        mod_obj.fail_on_missing_params.assert_called_once_with(
+            ['bundle_level'])
+    assert install_func.call_count == 0
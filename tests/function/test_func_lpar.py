@@ -29,8 +29,9 @@ from zhmcclient import Client
 from zhmcclient_mock import FakedSession
 
 from plugins.modules import zhmc_lpar
+from plugins.module_utils import common
 
-from .func_utils import mock_ansible_module
+from .func_utils import mock_ansible_module, RequestCounter
 
 # FakedSession() init arguments
 FAKED_SESSION_KWARGS = dict(
@@ -437,6 +438,7 @@ class TestLpar:
             'status_timeout': 60,
             'allow_status_exceptions': True,
             'force': False,
+            'wait': True,
             'os_ipl_token': None,
             'properties': input_props,
             'log_file': None,
@@ -525,6 +527,7 @@ class TestLpar:
             'status_timeout': 60,
             'allow_status_exceptions': True,
             'force': False,
+            'wait': True,
             'os_ipl_token': None,
             'properties': None,
             'log_file': None,
@@ -555,3 +558,187 @@ class TestLpar:
             assert pvalue == exp_value
 
 # TODO: Add tests for updating read-only properties
+
+
+# Maximum number of HMC requests for LPAR facts
+LPAR_FACTS_MAX_REQUESTS = 3
+
+
+@pytest.mark.parametrize(
+    "lpar_count", [1, 10, 50])
+@mock.patch("plugins.modules.zhmc_lpar.AnsibleModule", autospec=True)
+def test_lpar_facts_request_count(ansible_mod_cls, lpar_count):
+    """
+    Test that the HMC requests for LPAR facts do not grow with the number of
+    LPARs in the CPC.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    for i in range(lpar_count):
+        lpar_props = dict(FAKED_LPAR_1_BASE)
+        lpar_props.update(FAKED_LPAR_1_DELTA_ACTIVE)
+        if i > 0:
+            lpar_props['object-id'] = f'{FAKED_LPAR_1_OID}-{i}'
+            lpar_props['object-uri'] = f'{FAKED_LPAR_1_URI}-{i}'
+            lpar_props['name'] = f'{FAKED_LPAR_1_NAME}X{i}'
+        faked_cpc.lpars.add(lpar_props)
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_LPAR_1_NAME,
+        'state': 'facts',
+        'select_properties': None,
+        'activation_profile_name': None,
+        'load_address': None,
+        'load_parameter': None,
+        'clear_indicator': True,
+        'store_status_indicator': False,
+        'timeout': 60,
+        'status_timeout': 60,
+        'allow_status_exceptions': True,
+        'force': False,
+        'wait': True,
+        'os_ipl_token': None,
+        'properties': None,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    counter = RequestCounter(session)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_lpar.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    _, lpar_props = get_module_output(mod_obj)
+    assert lpar_props['name'] == FAKED_LPAR_1_NAME
+    assert counter.count() <= LPAR_FACTS_MAX_REQUESTS, \
+        f"Unexpected number of HMC requests:\n{counter}"
+    assert counter.count('GET', r'/api/logical-partitions/[^/]+') <= 1
+
+
+@pytest.mark.parametrize(
+    "desired_state", ['active', 'loaded'])
+@mock.patch("plugins.modules.zhmc_lpar.AnsibleModule", autospec=True)
+def test_lpar_properties_no_wait(ansible_mod_cls, desired_state):
+    """
+    Test that properties are rejected together with wait=false, without
+    changing the LPAR.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    lpar_props = dict(FAKED_LPAR_1_BASE)
+    lpar_props.update(FAKED_LPAR_1_DELTA_INACTIVE)
+    faked_lpar = faked_cpc.lpars.add(lpar_props)
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_LPAR_1_NAME,
+        'state': desired_state,
+        'select_properties': None,
+        'activation_profile_name': None,
+        'load_address': None,
+        'load_parameter': None,
+        'clear_indicator': True,
+        'store_status_indicator': False,
+        'timeout': 60,
+        'status_timeout': 60,
+        'allow_status_exceptions': True,
+        'force': False,
+        'wait': False,
+        'os_ipl_token': None,
+        'properties': {'description': 'new description'},
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_lpar.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 1
+    assert 'wait=false' in get_failure_msg(mod_obj)
+    assert faked_lpar.properties['status'] == 'not-activated'
+    assert faked_lpar.properties['description'] != 'new description'
+
+
+@pytest.mark.parametrize(
+    "desired_state, func_name", [
+        ('inactive', 'ensure_lpar_inactive'),
+        ('active', 'ensure_lpar_active'),
+        ('loaded', 'ensure_lpar_loaded'),
+    ])
+@mock.patch("plugins.modules.zhmc_lpar.AnsibleModule", autospec=True)
+def test_lpar_task_deadline(ansible_mod_cls, desired_state, func_name):
+    """
+    Test that the LPAR status changes are limited by the task deadline.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    lpar_props = dict(FAKED_LPAR_1_BASE)
+    lpar_props.update(FAKED_LPAR_1_DELTA_INACTIVE)
+    faked_cpc.lpars.add(lpar_props)
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_LPAR_1_NAME,
+        'state': desired_state,
+        'select_properties': None,
+        'activation_profile_name': None,
+        'load_address': None,
+        'load_parameter': None,
+        'clear_indicator': True,
+        'store_status_indicator': False,
+        'timeout': 60,
+        'status_timeout': 60,
+        'allow_status_exceptions': True,
+        'force': False,
+        'wait': True,
+        'os_ipl_token': None,
+        'properties': None,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with mock.patch.object(zhmc_lpar, func_name, return_value=False) \
+            as ensure_func:
+        with pytest.raises(SystemExit) as exc_info:
+            zhmc_lpar.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    deadline = ensure_func.call_args.kwargs['deadline']
+    assert isinstance(deadline, common.Deadline)
+    assert deadline.timeout == \
+        session.retry_timeout_config.operation_timeout
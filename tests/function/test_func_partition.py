@@ -26,12 +26,13 @@ from unittest import mock
 import re
 import pytest
 
+import zhmcclient
 from zhmcclient import Client
 from zhmcclient_mock import FakedSession
 
 from plugins.modules import zhmc_partition
 
-from .func_utils import mock_ansible_module
+from .func_utils import mock_ansible_module, RequestCounter
 
 # FakedSession() init arguments
 FAKED_SESSION_KWARGS = dict(
@@ -1881,3 +1882,350 @@ class TestPartition:
         msg = get_failure_msg(mod_obj)
         pattern = fr'^{error_msg_pattern}$'
         assert re.match(pattern, msg)
+
+
+# Maximum number of HMC requests for partition facts with expand_nics,
+# excluding the one 'Get NIC Properties' request per NIC
+PARTITION_FACTS_MAX_REQUESTS = 5
+
+
+@pytest.mark.parametrize(
+    "nic_count", [1, 4, 16])
+@mock.patch("plugins.modules.zhmc_partition.AnsibleModule", autospec=True)
+def test_partition_facts_request_count(ansible_mod_cls, nic_count):
+    """
+    Test that the HMC requests for partition facts with expand_nics do not
+    grow with the number of NICs, beyond retrieving each NIC.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    faked_partition = faked_cpc.partitions.add(FAKED_PARTITION_1)
+    faked_cpc.adapters.add(FAKED_ADAPTER_1)
+    faked_cpc.virtual_switches.add(FAKED_VSWITCH_1)
+    for i in range(nic_count):
+        nic_props = dict(FAKED_NIC_1)
+        nic_props['element-id'] = f'{FAKED_NIC_1_OID}-{i}'
+        nic_props['element-uri'] = f'{FAKED_NIC_1_URI}-{i}'
+        nic_props['name'] = f'{FAKED_NIC_1_NAME}-{i}'
+        faked_partition.nics.add(nic_props)
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_PARTITION_1_NAME,
+        'state': 'facts',
+        'select_properties': None,
+        'image_name': None,
+        'image_file': None,
+        'ins_file': None,
+        'properties': None,
+        'nics': None,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
+        'expand_storage_groups': False,
+        'expand_crypto_adapters': False,
+        'expand_nics': True,
+        'wait': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    counter = RequestCounter(session)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_partition.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    _, part_props = get_module_output(mod_obj)
+    assert len(part_props['nics']) == nic_count
+    assert part_props['nics'][0]['adapter-name'] == FAKED_ADAPTER_1_NAME
+    assert counter.count() <= nic_count + PARTITION_FACTS_MAX_REQUESTS, \
+        f"Unexpected number of HMC requests:\n{counter}"
+    assert counter.count('GET', r'/api/partitions/[^/]+/nics/[^/]+') == \
+        nic_count
+    assert counter.count('GET', r'/api/virtual-switches(/[^/]+)?') <= 1
+    assert counter.count('GET', r'/api/adapters(/[^/]+)?') <= 1
+
+
+# Faked zEDC adapter that is used for the virtual functions
+FAKED_ZEDC_1_NAME = 'zedc adapter #1'
+FAKED_ZEDC_1 = {
+    'object-id': 'fake-zedc-adapter-1',
+    'object-uri': '/api/adapters/fake-zedc-adapter-1',
+    'parent': FAKED_CPC_1_URI,
+    'class': 'adapter',
+    'name': FAKED_ZEDC_1_NAME,
+    'description': 'zEDC adapter #1',
+    'type': 'zedc',
+    'adapter-family': 'accelerator',
+    'adapter-id': '120',
+}
+
+
+@pytest.mark.parametrize(
+    "check_mode", [False, True])
+@mock.patch("plugins.modules.zhmc_partition.AnsibleModule", autospec=True)
+def test_partition_children_reconcile(ansible_mod_cls, check_mode):
+    """
+    Test that the NICs and virtual functions of a partition are reconciled
+    with the 'nics' and 'virtual_functions' module parameters.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    faked_partition = faked_cpc.partitions.add(FAKED_PARTITION_1)
+    adapter_props = dict(FAKED_ADAPTER_1)
+    adapter_props['network-port-uris'] = []
+    faked_adapter = faked_cpc.adapters.add(adapter_props)
+    port_props = dict(FAKED_PORT_1)
+    del port_props['element-uri']
+    faked_adapter.ports.add(port_props)
+    faked_cpc.adapters.add(FAKED_ZEDC_1)
+    faked_cpc.virtual_switches.add(FAKED_VSWITCH_1)
+    faked_partition.nics.add(FAKED_NIC_1)
+    old_nic_props = dict(FAKED_NIC_1)
+    old_nic_props['element-id'] = 'fake-nic-old'
+    old_nic_props['element-uri'] = FAKED_PARTITION_1_URI + '/nics/fake-nic-old'
+    old_nic_props['name'] = 'nic-old'
+    faked_partition.nics.add(old_nic_props)
+
+    # Prepare module input parameters (must be all required + optional)
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_PARTITION_1_NAME,
+        'state': 'stopped',
+        'select_properties': None,
+        'image_name': None,
+        'image_file': None,
+        'ins_file': None,
+        'properties': None,
+        'nics': [
+            {
+                'name': FAKED_NIC_1_NAME,
+                'properties': {'description': 'NIC #1 updated'},
+            },
+            {
+                'name': 'nic-2',
+                'properties': {
+                    'adapter_name': FAKED_ADAPTER_1_NAME,
+                    'adapter_port': FAKED_PORT_1_INDEX,
+                    'device_number': '0300',
+                },
+            },
+        ],
+        'hbas': None,
+        'virtual_functions': [
+            {
+                'name': 'vf-1',
+                'properties': {
+                    'adapter_name': FAKED_ZEDC_1_NAME,
+                    'device_number': '0400',
+                },
+            },
+        ],
+        'storage_groups': None,
+        'expand_storage_groups': False,
+        'expand_crypto_adapters': False,
+        'expand_nics': False,
+        'wait': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+    # Prepare mocks for AnsibleModule object
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_partition.main()
+    exit_code = exc_info.value.args[0]
+
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    changed, _ = get_module_output(mod_obj)
+    assert changed is True
+
+    client = Client(session)
+    partition = client.cpcs.find(name=FAKED_CPC_1['name']).partitions.find(
+        name=FAKED_PARTITION_1_NAME)
+    nics = {nic.name: nic for nic in partition.nics.list(
+        full_properties=True)}
+    vf_names = [vf.name for vf in partition.virtual_functions.list()]
+    if check_mode:
+        assert sorted(nics) == [FAKED_NIC_1_NAME, 'nic-old']
+        assert vf_names == []
+        return
+    assert sorted(nics) == [FAKED_NIC_1_NAME, 'nic-2']
+    assert nics[FAKED_NIC_1_NAME].get_property('description') == \
+        'NIC #1 updated'
+    assert nics['nic-2'].get_property('virtual-switch-uri') == \
+        FAKED_VSWITCH_1_URI
+    assert vf_names == ['vf-1']
+
+    # A second run with the same parameters does not change anything
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode)
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_partition.main()
+    assert exc_info.value.args[0] == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    changed, _ = get_module_output(mod_obj)
+    assert changed is False
+
+
+def faked_session_with_nic(partition_status):
+    """
+    Return a faked session with partition #1 in the specified status, with
+    NIC #1 backed by adapter #1 through virtual switch #1.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    faked_cpc = session.hmc.cpcs.add(FAKED_CPC_1)
+    partition_props = dict(FAKED_PARTITION_1)
+    partition_props['status'] = partition_status
+    faked_partition = faked_cpc.partitions.add(partition_props)
+    adapter_props = dict(FAKED_ADAPTER_1)
+    adapter_props['network-port-uris'] = []
+    faked_adapter = faked_cpc.adapters.add(adapter_props)
+    port_props = dict(FAKED_PORT_1)
+    del port_props['element-uri']
+    faked_adapter.ports.add(port_props)
+    faked_cpc.virtual_switches.add(FAKED_VSWITCH_1)
+    faked_partition.nics.add(FAKED_NIC_1)
+    return session
+
+
+def children_params(session, state, nics):
+    """
+    Return the module parameters for zhmc_partition (must be all required +
+    optional) for reconciling the NICs of partition #1.
+    """
+    return {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_PARTITION_1_NAME,
+        'state': state,
+        'select_properties': None,
+        'image_name': None,
+        'image_file': None,
+        'ins_file': None,
+        'properties': None,
+        'nics': nics,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
+        'expand_storage_groups': False,
+        'expand_crypto_adapters': False,
+        'expand_nics': False,
+        'wait': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+
+
+@pytest.mark.parametrize(
+    "nic_props, exp_stop", [
+        ({'description': 'NIC #1 updated'}, False),
+        ({'mac_address': '02:00:00:00:00:01'}, True),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_partition.start_partition", autospec=True)
+@mock.patch("plugins.modules.zhmc_partition.stop_partition", autospec=True)
+@mock.patch("plugins.modules.zhmc_partition.AnsibleModule", autospec=True)
+def test_partition_children_stop(
+        ansible_mod_cls, stop_func, start_func, nic_props, exp_stop):
+    """
+    Test that the partition is stopped before updating NIC properties that
+    cannot be updated while the partition is active, and only then.
+    """
+    session = faked_session_with_nic('active')
+    faked_partition = session.hmc.cpcs.list()[0].partitions.list()[0]
+    faked_nic = faked_partition.nics.list()[0]
+
+    def stop(logger, partition, check_mode, deadline=None):
+        # pylint: disable=unused-argument
+        assert faked_nic.properties['mac-address'] == \
+            FAKED_NIC_1['mac-address']
+        faked_partition.properties['status'] = 'stopped'
+        return True
+
+    stop_func.side_effect = stop
+    start_func.return_value = False
+    params = children_params(session, 'active', [
+        {'name': FAKED_NIC_1_NAME, 'properties': nic_props},
+    ])
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with pytest.raises(SystemExit):
+        zhmc_partition.main()
+
+    assert stop_func.call_count == (1 if exp_stop else 0), \
+        f"Failure message: {get_failure_msg(mod_obj)}"
+    prop_name, value = next(iter(nic_props.items()))
+    assert faked_nic.properties[prop_name.replace('_', '-')] == value
+
+
+@mock.patch("plugins.modules.zhmc_partition.find_nic_for_500_12",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_partition.AnsibleModule", autospec=True)
+def test_partition_children_500_12(ansible_mod_cls, find_nic_func):
+    """
+    Test that the HTTP 500.12 error when creating a NIC is circumvented by
+    renaming the NIC that was created with another name.
+    """
+    session = faked_session_with_nic('stopped')
+    faked_partition = session.hmc.cpcs.list()[0].partitions.list()[0]
+    nic_spec_props = {
+        'adapter_name': FAKED_ADAPTER_1_NAME,
+        'adapter_port': FAKED_PORT_1_INDEX,
+        'device_number': '0300',
+    }
+
+    def create(self, properties):
+        # pylint: disable=unused-argument
+        nic_props = dict(properties)
+        nic_props['name'] = 'partition-link-nic'
+        faked_partition.nics.add(nic_props)
+        raise zhmcclient.HTTPError({
+            'http-status': 500, 'reason': 12,
+            'message': "Fake internal error"})
+
+    find_nic_func.side_effect = \
+        lambda logger, props, partition: partition.nics.find(
+            name='partition-link-nic')
+    params = children_params(session, 'stopped', [
+        {'name': FAKED_NIC_1_NAME, 'properties': None},
+        {'name': 'nic-2', 'properties': nic_spec_props},
+    ])
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # Exercise the code to be tested
+    with mock.patch.object(zhmcclient.NicManager, 'create', create):
+        with pytest.raises(SystemExit) as exc_info:
+            zhmc_partition.main()
+
+    assert exc_info.value.args[0] == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    assert find_nic_func.call_count == 1
+    assert find_nic_func.call_args[0][1] == nic_spec_props
+    nic_names = [nic.properties['name'] for nic in faked_partition.nics.list()]
+    assert sorted(nic_names) == sorted([FAKED_NIC_1_NAME, 'nic-2'])
@@ -0,0 +1,699 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for the 'zhmc_storage_group' Ansible module.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+import pytest
+
+import zhmcclient
+from zhmcclient import Client
+from zhmcclient_mock import FakedSession
+
+from plugins.modules import zhmc_storage_group
+
+from .func_utils import mock_ansible_module, RequestCounter
+
+# FakedSession() init arguments
+FAKED_SESSION_KWARGS = dict(
+    host='fake-host',
+    hmc_name='faked-hmc-name',
+    hmc_version='2.14.0',
+    api_version='2.23'
+)
+
+# Faked Console that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CONSOLE_URI = '/api/console'
+FAKED_CONSOLE = {
+    'object-uri': FAKED_CONSOLE_URI,
+    'class': 'console',
+    'name': 'hmc-1',
+    'description': 'Console HMC1',
+    'version': '2.14.0',
+}
+
+# Faked CPC in DPM mode that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CPC_1_OID = 'fake-cpc-1'
+FAKED_CPC_1_URI = '/api/cpcs/' + FAKED_CPC_1_OID
+FAKED_CPC_1 = {
+    'object-id': FAKED_CPC_1_OID,
+    'object-uri': FAKED_CPC_1_URI,
+    'class': 'cpc',
+    'name': 'cpc-name-1',
+    'description': 'CPC #1 in DPM mode',
+    'status': 'active',
+    'dpm-enabled': True,
+    'is-ensemble-member': False,
+    'iml-mode': 'dpm',
+    'available-features-list': [
+        {
+            'name': 'dpm-storage-management',
+            'description': 'DPM storage management',
+            'state': True,
+        }
+    ],
+}
+
+# Faked storage group that is used for these tests
+FAKED_SG_1_NAME = 'sg-1'
+FAKED_SG_1_OID = 'fake-sg-1'
+FAKED_SG_1_URI = '/api/storage-groups/' + FAKED_SG_1_OID
+FAKED_SG_1 = {
+    'object-id': FAKED_SG_1_OID,
+    'object-uri': FAKED_SG_1_URI,
+    'class': 'storage-group',
+    'parent': FAKED_CONSOLE_URI,
+    'cpc-uri': FAKED_CPC_1_URI,
+    'name': FAKED_SG_1_NAME,
+    'description': 'Storage group #1',
+    'type': 'fcp',
+    'shared': False,
+    'fulfillment-state': 'complete',
+    'connectivity': 4,
+    'max-partitions': 1,
+    'storage-volume-uris': [],
+    'virtual-storage-resource-uris': [],
+    'candidate-adapter-port-uris': [],
+}
+
+
+def faked_session_with_sg(volume_count):
+    """
+    Return a faked session with a storage group that has volume_count storage
+    volumes named 'sv-<i>' with a size of 16 GiB.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    session.hmc.cpcs.add(FAKED_CPC_1)
+    faked_sg = session.hmc.consoles.console.storage_groups.add(FAKED_SG_1)
+    for i in range(volume_count):
+        faked_sg.storage_volumes.add({
+            'name': f'sv-{i}',
+            'description': f'Storage volume #{i}',
+            'size': 16.0,
+            'usage': 'data',
+            'fulfillment-state': 'complete',
+        })
+    return session
+
+
+def sg_params(session, **kwargs):
+    """
+    Return the module parameters for zhmc_storage_group (must be all
+    required + optional).
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_name': FAKED_CPC_1['name'],
+        'name': FAKED_SG_1_NAME,
+        'names': None,
+        'state': 'present',
+        'properties': None,
+        'volumes': None,
+        'expand': False,
+        'partition_properties': None,
+        'discover_wait': False,
+        'discover_timeout': 300,
+        'wait_for_fulfillment': False,
+        'fulfillment_timeout': 600,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def get_failure_msg(mod_obj):
+    """
+    Return the module failure message, as a string (i.e. the 'msg' argument
+    of the call to fail_json()).
+    If the module succeeded, return None.
+    """
+
+    def func(msg, **kwargs):
+        # pylint: disable=unused-argument
+        return msg
+
+    if not mod_obj.fail_json.called:
+        return None
+    call_args = mod_obj.fail_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+def get_module_output(mod_obj):
+    """
+    Return the module output as a tuple (changed, storage_group_properties)
+    (i.e. the arguments of the call to exit_json()).
+    If the module failed, return None.
+    """
+
+    def func(changed, storage_group, **kwargs):
+        # pylint: disable=unused-argument
+        return changed, storage_group
+
+    if not mod_obj.exit_json.called:
+        return None
+    call_args = mod_obj.exit_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+def run_module(ansible_mod_cls, params, check_mode):
+    """
+    Run the zhmc_storage_group module and return its output.
+    """
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode)
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_group.main()
+    exit_code = exc_info.value.args[0]
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    return get_module_output(mod_obj)
+
+
+@pytest.mark.parametrize(
+    "volume_count", [0, 8, 64])
+@pytest.mark.parametrize(
+    "check_mode", [False, True])
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_reconcile(
+        ansible_mod_cls, add_art_func, check_mode, volume_count):
+    # pylint: disable=unused-argument
+    """
+    Test that the storage volumes of a storage group are reconciled with the
+    'volumes' module parameter in a single Modify Storage Group Properties
+    operation, regardless of the number of storage volumes.
+    """
+    session = faked_session_with_sg(volume_count)
+    volumes = [
+        {'name': f'sv-{i}', 'properties': {'size': 32}}
+        for i in range(1, volume_count)]
+    volumes.append({'name': 'sv-new', 'properties': {'size': 8}})
+    params = sg_params(session, volumes=volumes)
+    counter = RequestCounter(session)
+
+    # The code to be tested
+    changed, _ = run_module(ansible_mod_cls, params, check_mode)
+
+    assert changed is True
+    modify_uri = FAKED_SG_1_URI + '/operations/modify'
+    assert counter.count('POST', modify_uri) == (0 if check_mode else 1)
+    assert counter.count('GET', FAKED_SG_1_URI + '/storage-volumes') == 1
+    assert counter.count(
+        'GET', FAKED_SG_1_URI + '/storage-volumes/.+') == 0
+
+    client = Client(session)
+    sg = client.consoles.console.storage_groups.find(name=FAKED_SG_1_NAME)
+    svs = {sv.name: sv for sv in sg.storage_volumes.list()}
+    if check_mode:
+        assert sorted(svs) == sorted(f'sv-{i}' for i in range(volume_count))
+        return
+    assert sorted(svs) == sorted(v['name'] for v in volumes)
+    for v in volumes:
+        assert svs[v['name']].get_property('size') == v['properties']['size']
+
+    # Running the module again must not change anything
+    counter.reset()
+    changed, _ = run_module(ansible_mod_cls, params, check_mode)
+
+    assert changed is False
+    assert counter.count('POST', modify_uri) == 0
+
+
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_full_properties(ansible_mod_cls, add_art_func):
+    # pylint: disable=unused-argument
+    """
+    Test that the full properties of existing storage volumes are retrieved
+    only when properties are specified that are not returned by the list
+    operation, and that the storage group properties are modified in the same
+    operation as the storage volumes.
+    """
+    session = faked_session_with_sg(2)
+    volumes = [
+        {'name': 'sv-0', 'properties': {'description': 'Storage volume #0'}},
+        {'name': 'sv-1', 'properties': {'description': 'Updated'}},
+    ]
+    params = sg_params(session, volumes=volumes,
+                       properties={'description': 'Updated'})
+    counter = RequestCounter(session)
+
+    # The code to be tested
+    changed, sg_props = run_module(ansible_mod_cls, params, False)
+
+    assert changed is True
+    assert 'storage-volumes' not in sg_props
+    assert sg_props['description'] == 'Updated'
+    assert counter.count('POST', FAKED_SG_1_URI + '/operations/modify') == 1
+    assert counter.count('GET', FAKED_SG_1_URI + '/storage-volumes/.+') == 2
+
+    client = Client(session)
+    sg = client.consoles.console.storage_groups.find(name=FAKED_SG_1_NAME)
+    sv = sg.storage_volumes.find(name='sv-1')
+    assert sv.get_property('description') == 'Updated'
+
+
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_create(ansible_mod_cls, add_art_func):
+    # pylint: disable=unused-argument
+    """
+    Test that the storage volumes of a new storage group are created in the
+    Create Storage Group operation.
+    """
+    session = faked_session_with_sg(0)
+    volumes = [{'name': f'sv-{i}', 'properties': {'size': 16}}
+               for i in range(4)]
+    params = sg_params(session, name='sg-new', volumes=volumes,
+                       properties={'type': 'fcp'})
+    counter = RequestCounter(session)
+
+    # The code to be tested
+    changed, _ = run_module(ansible_mod_cls, params, False)
+
+    assert changed is True
+    assert counter.count('POST', '/api/storage-groups') == 1
+    assert counter.count('POST', '/api/storage-groups/.+') == 0
+    assert counter.count('GET', '/api/storage-groups/.+/storage-volumes') == 0
+
+    client = Client(session)
+    sg = client.consoles.console.storage_groups.find(name='sg-new')
+    assert sorted(sv.name for sv in sg.storage_volumes.list()) == \
+        [v['name'] for v in volumes]
+
+
+@pytest.mark.parametrize(
+    "volumes, exp_msg_pattern", [
+        ([{'name': 'sv-0'}, {'name': 'sv-0'}],
+         "ParameterError: Module parameter 'volumes' specifies storage "
+         "volumes with duplicate names"),
+        ([{'name': 'sv-0', 'properties': {'foo': 1}}],
+         "ParameterError: Property 'foo' of storage volume 'sv-0' is not "
+         "defined"),
+        ([{'name': 'sv-0', 'properties': {'uuid': 'abc'}}],
+         "ParameterError: Property 'uuid' of storage volume 'sv-0' is not "
+         "allowed"),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_errors(ansible_mod_cls, volumes, exp_msg_pattern):
+    """
+    Test errors in the 'volumes' module parameter, which must fail before
+    any change is made.
+    """
+    session = faked_session_with_sg(1)
+    params = sg_params(session, volumes=volumes)
+    counter = RequestCounter(session)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_group.main()
+
+    assert exc_info.value.args[0] == 1
+    assert get_failure_msg(mod_obj).startswith(exp_msg_pattern)
+    assert counter.count('POST') == 0
+
+
+def faked_session_with_sgs(sg_names):
+    """
+    Return a faked session with FCP storage groups with the specified names.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    session.hmc.cpcs.add(FAKED_CPC_1)
+    for sg_name in sg_names:
+        sg_props = dict(FAKED_SG_1)
+        del sg_props['object-id']
+        del sg_props['object-uri']
+        sg_props['name'] = sg_name
+        session.hmc.consoles.console.storage_groups.add(sg_props)
+    return session
+
+
+@pytest.mark.parametrize(
+    "discover_wait", [True, False])
+@mock.patch("plugins.modules.zhmc_storage_group.wait_for_job_completion",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch.object(zhmcclient.StorageGroup, 'discover_fcp', autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_discover_multiple(
+        ansible_mod_cls, discover_func, add_art_func, wait_func,
+        discover_wait):
+    # pylint: disable=unused-argument
+    """
+    Test that the FCP discovery is started for all storage groups specified
+    in the 'names' module parameter before any completion is awaited, and
+    that the outcome is returned for each storage group.
+    """
+    sg_names = [f'sg-{i}' for i in range(6)]
+    session = faked_session_with_sgs(sg_names)
+    started = []
+    awaited = []
+
+    def discover_fcp(storage_group, force_restart, wait_for_completion):
+        # pylint: disable=unused-argument
+        assert not awaited, "Discovery started after a completion wait"
+        started.append(storage_group.name)
+        return zhmcclient.Job(session, f'/api/jobs/{storage_group.name}',
+                              'POST', storage_group.uri)
+
+    def wait_for_job_completion(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        awaited.append(job.uri)
+        if job.uri == '/api/jobs/sg-1':
+            raise zhmcclient.OperationTimeout("Timed out", operation_timeout)
+        if job.uri == '/api/jobs/sg-2':
+            raise zhmcclient.HTTPError({
+                'http-status': 409, 'reason': 490,
+                'message': "Discovery failed",
+                'request-uri': job.uri, 'request-method': 'GET'})
+
+    discover_func.side_effect = discover_fcp
+    wait_func.side_effect = wait_for_job_completion
+    params = sg_params(session, name=None, names=sg_names, state='discover',
+                       discover_wait=discover_wait)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_group.main()
+
+    assert sorted(started) == sg_names
+    if not discover_wait:
+        assert exc_info.value.args[0] == 0
+        assert not awaited
+        kwargs = mod_obj.exit_json.call_args[1]
+        assert [r['status'] for r in kwargs['storage_groups']] == \
+            ['submitted'] * len(sg_names)
+        assert kwargs['job_uris'] == [f'/api/jobs/{n}' for n in sg_names]
+        return
+
+    assert exc_info.value.args[0] == 1
+    kwargs = mod_obj.fail_json.call_args[1]
+    assert kwargs['msg'].startswith(
+        "FCP discovery has failed or timed out for 2 of 6 storage groups: "
+        "sg-1, sg-2")
+    reports = kwargs['storage_groups']
+    assert [r['name'] for r in reports] == sg_names
+    assert [r['status'] for r in reports] == \
+        ['complete', 'timeout', 'failed', 'complete', 'complete', 'complete']
+    for report in reports:
+        if report['status'] == 'complete':
+            assert report['storage_group']['name'] == report['name']
+            assert report['error'] is None
+        else:
+            assert 'storage_group' not in report
+            assert report['error']
+    assert add_art_func.call_count == 4
+    assert kwargs['job_uris'] == ['/api/jobs/sg-1']
+
+
+@mock.patch("plugins.modules.zhmc_storage_group.wait_for_job_completion",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch.object(zhmcclient.StorageGroup, 'discover_fcp', autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_discover_multiple_connection_errors(
+        ansible_mod_cls, discover_func, add_art_func, wait_func):
+    # pylint: disable=unused-argument
+    """
+    Test that errors other than HTTP errors when starting a discovery, waiting
+    for it or retrieving the storage group properties are reported as failed
+    discoveries of the affected storage groups.
+    """
+    sg_names = [f'sg-{i}' for i in range(4)]
+    session = faked_session_with_sgs(sg_names)
+
+    def discover_fcp(storage_group, force_restart, wait_for_completion):
+        # pylint: disable=unused-argument
+        if storage_group.name == 'sg-1':
+            raise zhmcclient.ConnectionError("Connection refused", None)
+        return zhmcclient.Job(session, f'/api/jobs/{storage_group.name}',
+                              'POST', storage_group.uri)
+
+    def wait_for_job_completion(job, operation_timeout, deadline):
+        # pylint: disable=unused-argument
+        if job.uri == '/api/jobs/sg-2':
+            raise zhmcclient.ConnectionError("Connection reset", None)
+
+    def add_artificial_properties(sg_properties, storage_group, *args):
+        # pylint: disable=unused-argument
+        if storage_group.name == 'sg-3':
+            raise zhmcclient.ConnectionError("Connection reset", None)
+
+    discover_func.side_effect = discover_fcp
+    wait_func.side_effect = wait_for_job_completion
+    add_art_func.side_effect = add_artificial_properties
+    params = sg_params(session, name=None, names=sg_names, state='discover',
+                       discover_wait=True)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_group.main()
+
+    assert exc_info.value.args[0] == 1
+    kwargs = mod_obj.fail_json.call_args[1]
+    reports = kwargs['storage_groups']
+    assert [r['status'] for r in reports] == \
+        ['complete', 'failed', 'failed', 'failed']
+    assert [bool(r['error']) for r in reports] == [False, True, True, True]
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (dict(names=['sg-0']),
+         "ParameterError: The 'names' module parameter is only permitted for "
+         "state=discover"),
+        (dict(names=['sg-0'], state='discover'),
+         "ParameterError: The 'name' and 'names' module parameters are "
+         "mutually exclusive"),
+        (dict(name=None, state='facts'),
+         "ParameterError: The 'name' module parameter is required"),
+        (dict(name=None, names=['sg-0', 'sg-0'], state='discover'),
+         "ParameterError: Module parameter 'names' specifies duplicate "
+         "storage group names"),
+        (dict(name=None, names=['sg-0', 'sg-x'], state='discover'),
+         "ParameterError: Storage group 'sg-x' does not exist"),
+    ]
+)
+@mock.patch.object(zhmcclient.StorageGroup, 'discover_fcp', autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_discover_multiple_errors(
+        ansible_mod_cls, discover_func, kwargs, exp_msg_pattern):
+    """
+    Test errors in the 'name' and 'names' module parameters, which must fail
+    before any discovery is started.
+    """
+    session = faked_session_with_sgs(['sg-0'])
+    params = sg_params(session, **kwargs)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_group.main()
+
+    assert exc_info.value.args[0] == 1
+    assert get_failure_msg(mod_obj).startswith(exp_msg_pattern)
+    assert discover_func.call_count == 0
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_wait_for_fulfillment(
+        ansible_mod_cls, add_art_func, sleep_func):
+    # pylint: disable=unused-argument
+    """
+    Test that state=present with 'wait_for_fulfillment' waits until the
+    storage volumes are fulfilled, with one storage volume list operation per
+    check.
+    """
+    session = faked_session_with_sg(0)
+    volumes = [{'name': f'sv-{i}', 'properties': {'size': 16}}
+               for i in range(4)]
+    params = sg_params(session, volumes=volumes, wait_for_fulfillment=True)
+    faked_sg = session.hmc.consoles.console.storage_groups.lookup_by_oid(
+        FAKED_SG_1_OID)
+    checks = []
+
+    def sleep(seconds):
+        # pylint: disable=unused-argument
+        checks.append(1)
+        # The storage volumes get fulfilled after two checks
+        if len(checks) == 2:
+            for faked_sv in faked_sg.storage_volumes.list():
+                faked_sv.update({'fulfillment-state': 'complete'})
+
+    sleep_func.side_effect = sleep
+    counter = RequestCounter(session)
+
+    # The code to be tested
+    changed, _ = run_module(ansible_mod_cls, params, False)
+
+    assert changed is True
+    assert sleep_func.call_count == 2
+    # One list operation for the reconciliation, and three for the checks
+    assert counter.count('GET', FAKED_SG_1_URI + '/storage-volumes') == 4
+
+
+@pytest.mark.parametrize(
+    "expand, partition_properties, exp_part_props", [
+        (False, None, None),
+        (False, ['status', 'ifl_processors', 'status'],
+         ['object-uri', 'name', 'status', 'ifl-processors']),
+        (True, ['status'], ['object-uri', 'name', 'status']),
+        (True, None, 'full'),
+    ]
+)
+@mock.patch.object(zhmcclient.StorageGroup, 'list_attached_partitions',
+                   autospec=True)
+def test_sg_attached_partitions(
+        list_parts_func, expand, partition_properties, exp_part_props):
+    """
+    Test that add_artificial_properties() lists the attached partitions once,
+    and retrieves only the properties specified in 'partition_properties'.
+    """
+    session = faked_session_with_sg(0)
+    faked_cpc = session.hmc.cpcs.lookup_by_oid(FAKED_CPC_1_OID)
+    for i in range(12):
+        faked_cpc.partitions.add({
+            'name': f'part-{i}',
+            'status': 'active',
+            'ifl-processors': 2,
+        })
+    client = Client(session)
+    storage_group = client.consoles.console.storage_groups.find(
+        name=FAKED_SG_1_NAME)
+    cpc = client.cpcs.find(name=FAKED_CPC_1['name'])
+
+    def list_attached_partitions(sg):
+        # pylint: disable=unused-argument
+        # Minimal properties, as returned by 'Get Partitions for a Storage
+        # Group'
+        return [
+            cpc.partitions.resource_object(
+                p.uri, {k: p.properties[k]
+                        for k in ('object-uri', 'name', 'status')})
+            for p in cpc.partitions.list()]
+
+    list_parts_func.side_effect = list_attached_partitions
+    get_uris = []
+    session_get = session.get
+
+    def get(uri, *args, **kwargs):
+        if uri.startswith('/api/partitions/'):
+            get_uris.append(uri)
+        return session_get(uri, *args, **kwargs)
+
+    session.get = get
+    counter = RequestCounter(session)
+    sg_properties = {}
+
+    # The code to be tested
+    zhmc_storage_group.add_artificial_properties(
+        sg_properties, storage_group, expand, partition_properties)
+
+    assert list_parts_func.call_count == 1
+    assert sg_properties['attached-partition-names'] == \
+        [f'part-{i}' for i in range(12)]
+    if exp_part_props is None:
+        assert 'attached-partitions' not in sg_properties
+        assert counter.count('GET', r'/api/partitions/.*') == 0
+        return
+    parts = sg_properties['attached-partitions']
+    assert [p['name'] for p in parts] == [f'part-{i}' for i in range(12)]
+    assert counter.count('GET', r'/api/partitions/.*') == 12
+    for part in parts:
+        if exp_part_props == 'full':
+            assert part['ifl-processors'] == 2
+            assert part['class'] == 'partition'
+        else:
+            assert set(exp_part_props).issubset(part.keys())
+    for uri in get_uris:
+        if exp_part_props == 'full':
+            assert '?' not in uri
+        else:
+            # Selective retrieval of the properties
+            assert uri.split('?')[1] == \
+                'properties=' + ','.join(exp_part_props)
+
+
+@pytest.mark.parametrize(
+    "volumes, exp_calls", [
+        # Modifying existing storage volumes is retried
+        ([{'name': 'sv-0', 'properties': {'size': 32}}], 2),
+        # Creating storage volumes is not retried
+        ([{'name': 'sv-0'}, {'name': 'sv-new', 'properties': {'size': 8}}],
+         1),
+    ]
+)
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.add_artificial_properties",
+            autospec=True)
+@mock.patch("plugins.modules.zhmc_storage_group.AnsibleModule", autospec=True)
+def test_sg_volumes_create_not_retried(
+        ansible_mod_cls, add_art_func, sleep_func, volumes, exp_calls):
+    # pylint: disable=unused-argument
+    """
+    Test that a transient error of the Modify Storage Group Properties
+    operation is retried only if it does not create storage volumes.
+    """
+    session = faked_session_with_sg(1)
+    params = sg_params(session, volumes=volumes)
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    update_func = zhmcclient.StorageGroup.update_properties
+    calls = []
+
+    def update_properties(storage_group, properties):
+        calls.append(properties)
+        if len(calls) == 1:
+            raise zhmcclient.HTTPError({
+                'http-status': 503, 'reason': 0,
+                'message': "Service unavailable",
+                'request-uri': storage_group.uri, 'request-method': 'POST'})
+        return update_func(storage_group, properties)
+
+    # The code to be tested
+    with mock.patch.object(zhmcclient.StorageGroup, 'update_properties',
+                           autospec=True, side_effect=update_properties):
+        with pytest.raises(SystemExit) as exc_info:
+            zhmc_storage_group.main()
+
+    assert len(calls) == exp_calls
+    if exp_calls == 1:
+        assert exc_info.value.args[0] == 1
+        assert '503' in get_failure_msg(mod_obj)
+    else:
+        assert exc_info.value.args[0] == 0
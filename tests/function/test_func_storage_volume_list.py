@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for the 'zhmc_storage_volume_list' Ansible module.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+import pytest
+
+from zhmcclient_mock import FakedSession
+
+from plugins.modules import zhmc_storage_volume_list
+
+from .func_utils import mock_ansible_module, RequestCounter
+
+# FakedSession() init arguments
+FAKED_SESSION_KWARGS = dict(
+    host='fake-host',
+    hmc_name='faked-hmc-name',
+    hmc_version='2.14.0',
+    api_version='2.23'
+)
+
+# Faked Console that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CONSOLE = {
+    'object-uri': '/api/console',
+    'class': 'console',
+    'name': 'hmc-1',
+    'description': 'Console HMC1',
+    'version': '2.14.0',
+}
+
+# Faked CPCs in DPM mode that are used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CPCS = [
+    {
+        'object-id': f'fake-cpc-{i}',
+        'object-uri': f'/api/cpcs/fake-cpc-{i}',
+        'class': 'cpc',
+        'name': f'cpc-name-{i}',
+        'description': f'CPC #{i} in DPM mode',
+        'status': 'active',
+        'dpm-enabled': True,
+        'is-ensemble-member': False,
+        'iml-mode': 'dpm',
+    } for i in (1, 2)
+]
+
+# Storage groups that are used for all tests, as tuples (name, CPC index,
+# number of storage volumes)
+SGS = [
+    ('sg-a1', 0, 3),
+    ('sg-a2', 0, 0),
+    ('sg-b1', 0, 2),
+    ('sg-a3', 1, 4),
+]
+
+
+def faked_session_with_sgs():
+    """
+    Return a faked session with the storage groups in SGS. The storage
+    volumes are named '<sg>-sv-<i>', and every other storage volume is a
+    pending boot volume.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    for cpc_props in FAKED_CPCS:
+        session.hmc.cpcs.add(cpc_props)
+    for sg_name, cpc_index, volume_count in SGS:
+        faked_sg = session.hmc.consoles.console.storage_groups.add({
+            'class': 'storage-group',
+            'parent': FAKED_CONSOLE['object-uri'],
+            'cpc-uri': FAKED_CPCS[cpc_index]['object-uri'],
+            'name': sg_name,
+            'type': 'fcp',
+            'shared': False,
+            'fulfillment-state': 'complete',
+            'storage-volume-uris': [],
+        })
+        for i in range(volume_count):
+            faked_sg.storage_volumes.add({
+                'name': f'{sg_name}-sv-{i}',
+                'size': 16.0,
+                'usage': 'boot' if i % 2 else 'data',
+                'fulfillment-state': 'pending' if i % 2 else 'complete',
+            })
+    return session
+
+
+def svl_params(session, **kwargs):
+    """
+    Return the module parameters for zhmc_storage_volume_list (must be all
+    required + optional).
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'storage_group_name': None,
+        'storage_group_name_pattern': None,
+        'cpc_name': None,
+        'name': None,
+        'fulfillment_state': None,
+        'maximum_size': None,
+        'minimum_size': None,
+        'usage': None,
+        'additional_properties': [],
+        'full_properties': False,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def get_failure_msg(mod_obj):
+    """
+    Return the module failure message, as a string (i.e. the 'msg' argument
+    of the call to fail_json()).
+    If the module succeeded, return None.
+    """
+
+    def func(msg, **kwargs):
+        # pylint: disable=unused-argument
+        return msg
+
+    if not mod_obj.fail_json.called:
+        return None
+    call_args = mod_obj.fail_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+def get_module_output(mod_obj):
+    """
+    Return the module output as a tuple (changed, storage_volumes)
+    (i.e. the arguments of the call to exit_json()).
+    If the module failed, return None.
+    """
+
+    def func(changed, storage_volumes, **kwargs):
+        # pylint: disable=unused-argument
+        return changed, storage_volumes
+
+    if not mod_obj.exit_json.called:
+        return None
+    call_args = mod_obj.exit_json.call_args
+    return func(*call_args[0], **call_args[1])
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_sg_names, exp_states", [
+        (
+            "Single storage group",
+            dict(storage_group_name='sg-a1'),
+            ['sg-a1'],
+            ['complete', 'pending'],
+        ),
+        (
+            "All storage groups of a CPC",
+            dict(cpc_name='cpc-name-1'),
+            ['sg-a1', 'sg-a2', 'sg-b1'],
+            ['complete', 'pending'],
+        ),
+        (
+            "Storage groups with matching names",
+            dict(storage_group_name_pattern='sg-a.*'),
+            ['sg-a1', 'sg-a2', 'sg-a3'],
+            ['complete', 'pending'],
+        ),
+        (
+            "Storage groups of a CPC with matching names and volume filter",
+            dict(cpc_name='cpc-name-1', storage_group_name_pattern='sg-a.*',
+                 fulfillment_state='pending'),
+            ['sg-a1', 'sg-a2'],
+            ['pending'],
+        ),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_storage_volume_list.AnsibleModule",
+            autospec=True)
+def test_svl_multiple_sgs(
+        ansible_mod_cls, desc, kwargs, exp_sg_names, exp_states):
+    # pylint: disable=unused-argument
+    """
+    Test that the storage volumes of the selected storage groups are listed
+    with one storage group listing and one storage volume listing per storage
+    group, and that each storage volume is tagged with its storage group.
+    """
+    session = faked_session_with_sgs()
+    counter = RequestCounter(session)
+    params = svl_params(session, **kwargs)
+
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode=False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_volume_list.main()
+
+    exit_code = exc_info.value.args[0]
+    assert exit_code == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{get_failure_msg(mod_obj)}"
+    changed, storage_volumes = get_module_output(mod_obj)
+    assert changed is False
+
+    exp_sv_names = []
+    for sg_name, _, volume_count in SGS:
+        if sg_name in exp_sg_names:
+            exp_sv_names.extend(
+                f'{sg_name}-sv-{i}' for i in range(volume_count)
+                if ('pending' if i % 2 else 'complete') in exp_states)
+    assert sorted(sv['name'] for sv in storage_volumes) == \
+        sorted(exp_sv_names)
+    for sv in storage_volumes:
+        assert sv['name'].startswith(sv['storage_group_name'] + '-sv-')
+        assert sv['fulfillment_state'] in exp_states
+
+    assert counter.count('GET', r'/api/storage-groups') == 1
+    assert counter.count(
+        'GET', r'/api/storage-groups/[^/]+/storage-volumes') == \
+        len(exp_sg_names)
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_msg_pattern", [
+        (
+            dict(),
+            "ParameterError: One of the 'storage_group_name', ",
+        ),
+        (
+            dict(storage_group_name='sg-a1', cpc_name='cpc-name-1'),
+            "ParameterError: The 'storage_group_name' module parameter is "
+            "mutually exclusive",
+        ),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_storage_volume_list.AnsibleModule",
+            autospec=True)
+def test_svl_multiple_sgs_errors(ansible_mod_cls, kwargs, exp_msg_pattern):
+    """
+    Test the parameter validation for selecting the storage groups.
+    """
+    session = faked_session_with_sgs()
+    params = svl_params(session, **kwargs)
+
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, check_mode=False)
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_storage_volume_list.main()
+
+    assert exc_info.value.args[0] == 1
+    assert get_failure_msg(mod_obj).startswith(exp_msg_pattern)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for the 'zhmc_versions' Ansible module.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+import pytest
+
+import zhmcclient
+from zhmcclient_mock import FakedSession
+
+from plugins.modules import zhmc_versions
+
+from .func_utils import mock_ansible_module
+
+# FakedSession() init arguments
+FAKED_SESSION_KWARGS = dict(
+    host='fake-host',
+    hmc_name='faked-hmc-name',
+    hmc_version='2.16.0',
+    api_version='4.10'
+)
+
+# Faked Console that is used for all tests
+# (with property names as specified in HMC data model)
+FAKED_CONSOLE = {
+    'object-uri': '/api/console',
+    'class': 'console',
+    'name': 'hmc-1',
+    'description': 'Console HMC1',
+    'version': '2.16.0',
+}
+
+# Number of faked CPCs that are used for all tests
+CPC_COUNT = 12
+
+
+def faked_session_with_cpcs():
+    """
+    Return a faked session with CPC_COUNT CPCs named 'CPC<i>'.
+    """
+    session = FakedSession(**FAKED_SESSION_KWARGS)
+    session.hmc.consoles.add(FAKED_CONSOLE)
+    for i in range(CPC_COUNT):
+        session.hmc.cpcs.add({
+            'object-id': f'fake-cpc-{i}',
+            'name': f'CPC{i}',
+            'status': 'active',
+            'has-unacceptable-status': False,
+            'dpm-enabled': True,
+            'se-version': '2.16.0',
+        })
+    return session
+
+
+def versions_params(session, **kwargs):
+    """
+    Return the module parameters for zhmc_versions (must be all required +
+    optional).
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'cpc_names': None,
+        'api_features': True,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def run_module(ansible_mod_cls, params):
+    """
+    Run the zhmc_versions module and return its 'versions' output.
+    """
+    mod_obj = mock_ansible_module(ansible_mod_cls, params, False)
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_versions.main()
+    assert exc_info.value.args[0] == 0, \
+        "Module unexpectedly failed with this message:\n" \
+        f"{mod_obj.fail_json.call_args}"
+    return mod_obj.exit_json.call_args[1]['versions']
+
+
+@pytest.mark.parametrize(
+    "cpc_names", [None, ['CPC3', 'CPC5'], []])
+@pytest.mark.parametrize(
+    "api_features", [True, False])
+@mock.patch.object(zhmcclient.Cpc, 'list_api_features', autospec=True)
+@mock.patch.object(zhmcclient.Console, 'list_api_features', autospec=True)
+@mock.patch("plugins.modules.zhmc_versions.AnsibleModule", autospec=True)
+def test_versions_api_features(
+        ansible_mod_cls, console_features_func, cpc_features_func,
+        monkeypatch, api_features, cpc_names):
+    """
+    Test that the API features are retrieved for the HMC and the requested
+    CPCs only if 'api_features' is True.
+    """
+    monkeypatch.delenv('ZHMC_FEATURE_CACHE_TTL', raising=False)
+    console_features_func.return_value = ['hmc-feature']
+    cpc_features_func.side_effect = lambda cpc: [f'{cpc.name}-feature']
+    session = faked_session_with_cpcs()
+    params = versions_params(
+        session, api_features=api_features, cpc_names=cpc_names)
+
+    # The code to be tested
+    versions = run_module(ansible_mod_cls, params)
+
+    exp_cpc_names = [f'CPC{i}' for i in range(CPC_COUNT)] \
+        if cpc_names is None else cpc_names
+    assert [c['name'] for c in versions['cpcs']] == exp_cpc_names
+    if api_features:
+        assert versions['hmc_api_features'] == ['hmc-feature']
+        for cpc_vers in versions['cpcs']:
+            assert cpc_vers['cpc_api_features'] == \
+                [f"{cpc_vers['name']}-feature"]
+        assert console_features_func.call_count == 1
+        assert cpc_features_func.call_count == len(exp_cpc_names)
+    else:
+        assert 'hmc_api_features' not in versions
+        for cpc_vers in versions['cpcs']:
+            assert 'cpc_api_features' not in cpc_vers
+        assert console_features_func.call_count == 0
+        assert cpc_features_func.call_count == 0
+
+
+@mock.patch.object(zhmcclient.Cpc, 'list_api_features', autospec=True)
+@mock.patch.object(zhmcclient.Console, 'list_api_features', autospec=True)
+@mock.patch("plugins.modules.zhmc_versions.AnsibleModule", autospec=True)
+def test_versions_feature_cache(
+        ansible_mod_cls, console_features_func, cpc_features_func,
+        monkeypatch, tmp_path):
+    """
+    Test that the API features are cached across module invocations when
+    ZHMC_FEATURE_CACHE_TTL is set.
+    """
+    monkeypatch.setenv('ZHMC_FEATURE_CACHE_TTL', '3600')
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    console_features_func.return_value = ['hmc-feature']
+    cpc_features_func.side_effect = lambda cpc: [f'{cpc.name}-feature']
+
+    versions1 = run_module(
+        ansible_mod_cls, versions_params(faked_session_with_cpcs()))
+
+    assert console_features_func.call_count == 1
+    assert cpc_features_func.call_count == CPC_COUNT
+
+    # The code to be tested
+    versions2 = run_module(
+        ansible_mod_cls, versions_params(faked_session_with_cpcs()))
+
+    assert versions2 == versions1
+    assert console_features_func.call_count == 1
+    assert cpc_features_func.call_count == CPC_COUNT
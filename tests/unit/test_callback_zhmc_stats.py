@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the 'zhmc_stats' Ansible callback plugin.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+from unittest import mock
+import pytest
+
+from plugins.callback import zhmc_stats
+
+
+def zhmc_stats_item(requests, wait_time=0.0, logon_time=None):
+    """
+    Return a '_zhmc_stats' module result item for a dict of request keys and
+    (count, time) tuples.
+    """
+    return {
+        'requests': {
+            key: {'count': count, 'time': time_, 'p95_time': time_,
+                  'bytes': 100 * count}
+            for key, (count, time_) in requests.items()
+        },
+        'request_count': sum(c for c, _ in requests.values()),
+        'request_time': sum(t for _, t in requests.values()),
+        'request_p95_time': None,
+        'response_bytes': sum(100 * c for c, _ in requests.values()),
+        'logon_time': logon_time,
+        'waits': {},
+        'wait_time': wait_time,
+    }
+
+
+def task_result(name, module_result):
+    """
+    Return a mocked task result for the callback methods.
+    """
+    result = mock.Mock()
+    result._result = module_result
+    result._host.get_name.return_value = 'localhost'
+    result._task.get_name.return_value = name
+    result._task.action = 'ibm.ibm_zhmc.zhmc_partition'
+    result._task._uuid = name
+    return result
+
+
+@pytest.mark.parametrize(
+    "request_key, exp_type", [
+        ('GET /api/cpcs', 'cpcs'),
+        ('GET /api/partitions/{id}', 'partitions'),
+        ('GET /api/partitions/{id}/nics/{id}', 'nics'),
+        ('GET /api/cpcs/{id}/partitions', 'partitions'),
+        ('POST /api/partitions/{id}/operations/start', 'partitions'),
+        ('GET /api/console/users/{id}', 'users'),
+        ('POST /api/sessions', 'sessions'),
+    ]
+)
+def test_callback_resource_type(request_key, exp_type):
+    """
+    Test resource_type().
+    """
+
+    # The code to be tested
+    rtype = zhmc_stats.resource_type(request_key)
+
+    assert rtype == exp_type
+
+
+def test_callback_task_stats():
+    """
+    Test task_stats() for a module result with loop items.
+    """
+    module_result = {
+        'changed': True,
+        'results': [
+            {'_zhmc_stats': zhmc_stats_item(
+                {'GET /api/partitions/{id}': (2, 1.0)}, wait_time=3.0,
+                logon_time=0.5)},
+            {'_zhmc_stats': zhmc_stats_item(
+                {'GET /api/partitions/{id}/nics/{id}': (4, 2.0)}),
+             'retries': {'POST /api/partitions/x/operations/start': 2}},
+            'not-a-dict',
+        ],
+    }
+
+    # The code to be tested
+    stats = zhmc_stats.task_stats(module_result)
+
+    assert stats == {
+        'request_count': 6,
+        'request_time': 3.0,
+        'response_bytes': 600,
+        'wait_time': 3.0,
+        'logon_time': 0.5,
+        'requests_by_resource': {'partitions': 2, 'nics': 4},
+        'retries': 2,
+    }
+    assert zhmc_stats.task_stats({'changed': False}) is None
+
+
+def test_callback_report(tmp_path):
+    """
+    Test that the callback plugin summarizes the task results and writes the
+    JSON report file.
+    """
+    with mock.patch.dict('os.environ', {}, clear=True):
+        callback = zhmc_stats.CallbackModule(display=mock.Mock(verbosity=0))
+        assert 'ZHMC_STATS' not in zhmc_stats.os.environ
+    callback.report_file = str(tmp_path / 'report.json')
+    callback.top = 1
+    fast = task_result('fast', {'_zhmc_stats': zhmc_stats_item(
+        {'GET /api/cpcs': (1, 0.1)})})
+    slow = task_result('slow', {'_zhmc_stats': zhmc_stats_item(
+        {'GET /api/partitions/{id}': (3, 2.5)}, wait_time=10.0)})
+    other = task_result('other', {'changed': False})
+
+    # The code to be tested
+    for result in (fast, slow, other):
+        callback.v2_runner_on_start(result._host, result._task)
+    callback.v2_runner_on_ok(fast)
+    callback.v2_runner_on_failed(slow)
+    callback.v2_runner_on_ok(other)
+    callback.v2_playbook_on_stats(mock.Mock())
+
+    with open(callback.report_file, encoding='utf-8') as fp:
+        report = json.load(fp)
+    assert [t['task'] for t in report['tasks']] == ['fast', 'slow']
+    assert report['tasks'][1]['failed'] is True
+    assert len(report['slowest_tasks']) == 1
+    totals = report['totals']
+    assert totals['tasks'] == 2
+    assert totals['request_count'] == 4
+    assert totals['wait_time'] == 10.0
+    assert report['requests_by_resource'] == {'partitions': 3, 'cpcs': 1}
+    assert callback._display.display.call_count > 0
+
+
+def test_callback_report_file_error(tmp_path):
+    """
+    Test that the callback plugin displays a warning if the JSON report file
+    cannot be written.
+    """
+    callback = zhmc_stats.CallbackModule(display=mock.Mock(verbosity=0))
+    callback.report_file = str(tmp_path / 'missing' / 'report.json')
+    result = task_result('task', {'_zhmc_stats': zhmc_stats_item(
+        {'GET /api/cpcs': (1, 0.1)})})
+    callback.v2_runner_on_start(result._host, result._task)
+    callback.v2_runner_on_ok(result)
+
+    # The code to be tested
+    callback.v2_playbook_on_stats(mock.Mock())
+
+    assert callback._display.warning.call_count == 1
+    msg = callback._display.warning.call_args[0][0]
+    assert msg.startswith(
+        f"Cannot write HMC statistics report file {callback.report_file}: ")
+    for call in callback._display.display.call_args_list:
+        assert 'report written' not in call[0][0]
+
+
+@pytest.mark.parametrize(
+    "env, exp_value", [
+        ({}, 'true'),
+        ({'ZHMC_STATS': 'false'}, 'false'),
+    ])
+def test_callback_enable_module_stats(env, exp_value):
+    """
+    Test that enabling the module statistics sets ZHMC_STATS only if it is
+    not set.
+    """
+    with mock.patch.dict('os.environ', env, clear=True):
+
+        # The code to be tested
+        zhmc_stats.CallbackModule.enable_module_stats()
+
+        assert zhmc_stats.os.environ['ZHMC_STATS'] == exp_value
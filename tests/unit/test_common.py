@@ -20,14 +20,26 @@ Unit tests for the 'module_utils.common' Python module.
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import os
 import re
+import json
+import multiprocessing
+import pstats
+import time
+import threading
+from unittest import mock
 from copy import deepcopy
 from collections.abc import Sequence, Mapping, Set
 from types import ModuleType
 import pytest
 from immutabledict import immutabledict
 
-from zhmcclient import BaseResource
+import requests
+import urllib3
+from zhmcclient import BaseResource, Client, Session, HTTPError, \
+    ConnectTimeout, ReadTimeout, StatusTimeout, NotificationConnectionError
+from zhmcclient import ConnectionError as ClientConnectionError
+from zhmcclient_mock import FakedSession
 
 from plugins.module_utils import common
 
@@ -1047,3 +1059,1390 @@ def test_common_hyphened_value(desc, in_value, exp_value):
     assert_disparate_equal(in_value, saved_value)
 
     assert act_value == exp_value
+
+
+def setup_faked_dpm_cpc(num_partitions):
+    """
+    Set up a faked HMC with a CPC in DPM mode that has the specified number of
+    stopped partitions, and return a tuple (session, cpc) with the
+    FakedSession and the zhmcclient.Cpc object.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    faked_cpc = session.hmc.cpcs.add({
+        'object-id': 'fake-cpc-1',
+        'name': 'CPC1',
+        'dpm-enabled': True,
+    })
+    for i in range(num_partitions):
+        faked_cpc.partitions.add({
+            'object-id': f'fake-part-{i}',
+            'name': f'PART{i}',
+            'status': 'stopped',
+        })
+    client = Client(session)
+    cpc = client.cpcs.find(name='CPC1')
+    return session, cpc
+
+
+def test_common_pull_partition_status():
+    """
+    Test that pull_partition_status() retrieves only the status of the
+    partition, using its URI.
+    """
+    session, cpc = setup_faked_dpm_cpc(3)
+    partition = cpc.partitions.resource_object('fake-part-1')
+
+    with mock.patch.object(session, 'get', wraps=session.get) as get_mock:
+
+        # The code to be tested
+        status = common.pull_partition_status(partition)
+
+    assert status == 'stopped'
+    assert get_mock.call_count == 1
+    uri = get_mock.call_args[0][0]
+    assert uri == f'{partition.uri}?properties=status'
+
+
+COMMON_DEADLINE_LIMIT_TESTCASES = [
+    # Testcases for test_common_deadline_limit()
+    # The list items are tuples with the following items:
+    # - desc (string): description of the testcase.
+    # - deadline_timeout (int): Timeout for the Deadline object.
+    # - timeout (int): Timeout of the nested wait.
+    # - exp_limit (int): Expected limited timeout.
+
+    (
+        "No deadline, no nested timeout",
+        None,
+        None,
+        None,
+    ),
+    (
+        "No deadline, nested timeout 0",
+        0,
+        0,
+        None,
+    ),
+    (
+        "No deadline, nested timeout",
+        None,
+        30,
+        30,
+    ),
+    (
+        "Deadline, no nested timeout",
+        100,
+        None,
+        100,
+    ),
+    (
+        "Deadline larger than nested timeout",
+        100,
+        30,
+        30,
+    ),
+    (
+        "Deadline smaller than nested timeout",
+        20,
+        30,
+        20,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, deadline_timeout, timeout, exp_limit",
+    COMMON_DEADLINE_LIMIT_TESTCASES)
+@mock.patch("plugins.module_utils.common.time.time", autospec=True)
+def test_common_deadline_limit(
+        time_func, desc, deadline_timeout, timeout, exp_limit):
+    # pylint: disable=unused-argument
+    """
+    Test the Deadline.limit() method.
+    """
+    time_func.return_value = 1000.0
+    deadline = common.Deadline(deadline_timeout)
+
+    # The code to be tested
+    limit = deadline.limit(timeout)
+
+    assert limit == exp_limit
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_poll_until_backoff(sleep_func):
+    """
+    Test that poll_until() polls with exponentially increasing intervals up to
+    the maximum interval, and records the wait in the wait metrics.
+    """
+    results = [(False, None)] * 6 + [(True, 'done')]
+    common.WAIT_METRICS.reset()
+
+    # The code to be tested
+    done, value = common.poll_until(
+        iter(results).__next__, kind='test', intervals=(1.0, 4.0, 2.0),
+        jitter=0)
+
+    assert (done, value) == (True, 'done')
+    sleep_times = [c[0][0] for c in sleep_func.call_args_list]
+    assert sleep_times == [1.0, 2.0, 4.0, 4.0, 4.0, 4.0]
+    metrics = common.WAIT_METRICS.as_dict()
+    assert metrics['test']['waits'] == 1
+    assert metrics['test']['polls'] == 7
+    assert metrics['test']['timeouts'] == 0
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+@mock.patch("plugins.module_utils.common.time.time", autospec=True)
+def test_common_poll_until_deadline(time_func, sleep_func):
+    """
+    Test that poll_until() stops polling when the deadline has passed, even
+    if the timeout of the wait has not yet expired.
+    """
+    clock = [1000.0]
+    time_func.side_effect = lambda: clock[0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    sleep_func.side_effect = sleep
+    common.WAIT_METRICS.reset()
+    deadline = common.Deadline(20)
+    clock[0] += 15
+
+    def check():
+        return False, 'not yet'
+
+    # The code to be tested
+    done, value = common.poll_until(
+        check, timeout=60, deadline=deadline, kind='test')
+
+    assert (done, value) == (False, 'not yet')
+    assert clock[0] == 1020.0
+    metrics = common.WAIT_METRICS.as_dict()
+    assert metrics['test']['timeouts'] == 1
+    assert metrics['test']['time'] == 5.0
+
+
+def test_common_poll_until_wakeup():
+    """
+    Test that poll_until() ends a poll interval early when the wakeup event
+    is set.
+    """
+    wakeup = common.WakeupEvent()
+    checks = []
+
+    def check():
+        checks.append(time.time())
+        if len(checks) < 3:
+            threading.Timer(0.05, wakeup.set).start()
+            return False, None
+        return True, 'done'
+
+    start_time = time.time()
+
+    # The code to be tested
+    done, value = common.poll_until(
+        check, timeout=60, kind='test', intervals=(30.0, 30.0, 1.0),
+        wakeup=wakeup)
+
+    assert (done, value) == (True, 'done')
+    assert len(checks) == 3
+    assert time.time() - start_time < 5
+
+
+def test_common_poll_until_wakeup_min_interval():
+    """
+    Test that poll_until() keeps the minimum interval between checks when
+    the wakeup event is set repeatedly.
+    """
+    wakeup = common.WakeupEvent()
+    checks = []
+
+    def check():
+        checks.append(time.time())
+        if len(checks) < 3:
+            wakeup.set()
+            return False, None
+        return True, 'done'
+
+    # The code to be tested
+    done, value = common.poll_until(
+        check, timeout=60, kind='test', intervals=(30.0, 30.0, 1.0),
+        wakeup=wakeup, min_interval=0.2)
+
+    assert (done, value) == (True, 'done')
+    assert checks[1] - checks[0] >= 0.2
+    assert checks[2] - checks[1] >= 0.2
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_poll_until_wakeup_closed(sleep_func):
+    """
+    Test that poll_until() falls back to polling with the fallback intervals
+    when the wakeup event is closed.
+    """
+    wakeup = common.WakeupEvent()
+    results = iter([(False, None)] * 3 + [(True, 'done')])
+
+    def check():
+        wakeup.close()
+        return next(results)
+
+    # The code to be tested
+    done, value = common.poll_until(
+        check, timeout=60, kind='test', intervals=(30.0, 30.0, 1.0),
+        jitter=0, wakeup=wakeup, fallback_intervals=(1.0, 4.0, 2.0))
+
+    assert (done, value) == (True, 'done')
+    sleep_times = [c[0][0] for c in sleep_func.call_args_list]
+    assert sleep_times == [1.0, 2.0]
+
+
+def sg_session_with_volumes(states):
+    """
+    Return a faked session and a storage group with storage volumes that have
+    the specified fulfillment states.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.14.0', '2.23')
+    session.hmc.consoles.add({'object-uri': '/api/console', 'name': 'hmc1'})
+    session.hmc.cpcs.add({'object-id': 'cpc1', 'name': 'cpc1',
+                          'dpm-enabled': True})
+    faked_sg = session.hmc.consoles.console.storage_groups.add({
+        'object-id': 'sg1', 'name': 'sg1', 'type': 'fcp',
+        'cpc-uri': '/api/cpcs/cpc1', 'storage-volume-uris': []})
+    faked_svs = [faked_sg.storage_volumes.add({
+        'name': f'sv{i}', 'fulfillment-state': state, 'size': 1.0,
+        'usage': 'data'}) for i, state in enumerate(states)]
+    client = Client(session)
+    storage_group = client.consoles.console.storage_groups.find(name='sg1')
+    return storage_group, faked_svs
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_wait_for_fulfillment(sleep_func):
+    """
+    Test that wait_for_fulfillment() returns when the targeted storage volumes
+    are fulfilled, with one storage volume list operation per check.
+    """
+    storage_group, faked_svs = sg_session_with_volumes(
+        ['pending', 'pending', 'incomplete'])
+    list_func = storage_group.storage_volumes.list
+    checks = []
+
+    def list_svs():
+        checks.append(1)
+        if len(checks) == 3:
+            faked_svs[0].update({'fulfillment-state': 'complete'})
+            faked_svs[1].update({'fulfillment-state': 'complete'})
+        return list_func()
+
+    auth = {'userid': 'fake-userid', 'password': 'fake-password'}
+    with mock.patch.object(storage_group.storage_volumes, 'list',
+                           side_effect=list_svs):
+
+        # The code to be tested
+        common.wait_for_fulfillment(
+            storage_group, auth, [faked_svs[0].uri, faked_svs[1].uri],
+            timeout=60)
+
+    assert len(checks) == 3
+    assert sleep_func.call_count == 2
+
+    # The code to be tested
+    with pytest.raises(StatusTimeout) as exc_info:
+        common.wait_for_fulfillment(storage_group, auth, timeout=1)
+
+    assert "sv2 of storage group sg1 timed out" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "hmc_auth, topic, connect_exc, exp_notifications", [
+        ({'userid': 'u', 'password': 'p'}, 'topic1', None, True),
+        ({'userid': 'u', 'password': 'p'}, None, None, False),
+        ({'session_id': 's'}, 'topic1', None, False),
+        ({'userid': 'u', 'password': 'p'}, 'topic1',
+         NotificationConnectionError("no STOMP"), False),
+    ]
+)
+@mock.patch("plugins.module_utils.common.NotificationReceiver", autospec=True)
+def test_common_object_notifications(
+        receiver_cls, hmc_auth, topic, connect_exc, exp_notifications):
+    """
+    Test that ObjectNotifications sets the wakeup event for notifications of
+    the objects, and that it falls back to polling when notifications cannot
+    be received.
+    """
+    session = mock.Mock(object_topic=topic, actual_host='hmc1',
+                        verify_cert=False)
+    receiver = receiver_cls.return_value
+    receiver.connect.side_effect = connect_exc
+    received = threading.Event()
+
+    def notifications():
+        yield {'object-uri': '/api/other'}, {}
+        yield {'object-uri': '/api/storage-groups/sg1'}, {}
+        received.wait(5)
+
+    receiver.notifications.side_effect = notifications
+
+    # The code to be tested
+    with common.ObjectNotifications(
+            session, hmc_auth, ['/api/storage-groups/sg1']) as notifications:
+        if exp_notifications:
+            assert notifications.wakeup.wait(5)
+            received.set()
+        else:
+            assert notifications.wakeup is None
+
+    if exp_notifications:
+        assert notifications.wakeup.closed
+        receiver.close.assert_called_once_with()
+        receiver_cls.assert_called_once_with(
+            topic, 'hmc1', 'u', 'p', verify_cert=False)
+    elif connect_exc is None:
+        receiver_cls.assert_not_called()
+
+
+@mock.patch("plugins.module_utils.common.NotificationReceiver", autospec=True)
+def test_common_object_notifications_lost(receiver_cls):
+    """
+    Test that ObjectNotifications closes the wakeup event when the receiving
+    thread ends while notifications are still needed.
+    """
+    session = mock.Mock(object_topic='topic1', actual_host='hmc1',
+                        verify_cert=False)
+    receiver = receiver_cls.return_value
+
+    def notifications():
+        yield {'object-uri': '/api/other'}, {}
+        raise NotificationConnectionError("connection lost")
+
+    receiver.notifications.side_effect = notifications
+    hmc_auth = {'userid': 'u', 'password': 'p'}
+
+    # The code to be tested
+    with common.ObjectNotifications(
+            session, hmc_auth, ['/api/storage-groups/sg1']) as notifications:
+        assert notifications.wakeup.wait(5)
+        assert notifications.wakeup.closed
+
+
+def test_common_submitted_jobs_result():
+    """
+    Test that submitted_jobs_result() returns the URIs of the submitted jobs
+    and resets them.
+    """
+    common.SUBMITTED_JOBS.reset()
+    assert common.submitted_jobs_result() == {}
+
+    job1 = mock.Mock(uri='/api/jobs/1')
+    job2 = mock.Mock(uri='/api/jobs/2')
+    common.SUBMITTED_JOBS.add(job1)
+    common.SUBMITTED_JOBS.add(job2)
+
+    # The code to be tested
+    result = common.submitted_jobs_result()
+
+    assert result == {'job_uris': ['/api/jobs/1', '/api/jobs/2']}
+    assert common.submitted_jobs_result() == {}
+
+
+def test_common_run_concurrently():
+    """
+    Test that run_concurrently() returns the results in the order of the
+    items, and raises the first exception after all calls have completed.
+    """
+    calls = []
+
+    def func(item):
+        calls.append(item)
+        if item in (3, 5):
+            raise ValueError(item)
+        return item * 10
+
+    # The code to be tested
+    result = common.run_concurrently(func, [1, 2, 4], max_workers=2)
+
+    assert result == [10, 20, 40]
+
+    calls.clear()
+
+    # The code to be tested
+    with pytest.raises(ValueError) as exc_info:
+        common.run_concurrently(func, [1, 3, 4, 5], max_workers=4)
+
+    assert exc_info.value.args == (3,)
+    assert sorted(calls) == [1, 3, 4, 5]
+
+
+def test_common_file_semaphore(tmp_path):
+    """
+    Test that a FileSemaphore grants no more than its count of slots, and
+    grants a waiting slot once a slot is released.
+    """
+    sem = common.FileSemaphore(str(tmp_path), 'test', 2)
+    slot1 = sem.acquire()
+    slot2 = sem.acquire()
+    acquired = threading.Event()
+
+    def acquire_third():
+        slot3 = sem.acquire()
+        acquired.set()
+        sem.release(slot3)
+
+    thread = threading.Thread(target=acquire_third)
+    thread.start()
+    assert not acquired.wait(0.3)
+
+    # The code to be tested
+    sem.release(slot1)
+
+    assert acquired.wait(5)
+    thread.join()
+    sem.release(slot2)
+
+
+def test_common_file_semaphore_timeout(tmp_path):
+    """
+    Test that a FileSemaphore raises GovernorError when no slot becomes free
+    within the timeout, and that a waiter does not block other waiters.
+    """
+    sem = common.FileSemaphore(str(tmp_path), 'test', 1)
+    slot1 = sem.acquire()
+    acquired = threading.Event()
+
+    def acquire_other():
+        slot = sem.acquire(timeout=10)
+        acquired.set()
+        sem.release(slot)
+
+    thread = threading.Thread(target=acquire_other)
+    thread.start()
+    start_time = time.time()
+
+    with pytest.raises(common.GovernorError):
+
+        # The code to be tested
+        sem.acquire(timeout=0.3)
+
+    assert 0.3 <= time.time() - start_time < 5
+    assert not acquired.is_set()
+    sem.release(slot1)
+    assert acquired.wait(5)
+    thread.join()
+
+
+def _semaphore_waiter(directory, index, out_path):
+    """
+    Process function for test_common_file_semaphore_order(), that acquires
+    a slot and records its index in the output file.
+    """
+    sem = common.FileSemaphore(directory, 'test', 1)
+    slot = sem.acquire(timeout=30)
+    with open(out_path, 'a', encoding='utf-8') as fp:
+        fp.write(f"{index}\n")
+    time.sleep(0.1)
+    sem.release(slot)
+
+
+def _semaphore_queue(directory):
+    """
+    Return the tickets of the waiters of the FileSemaphore 'test'.
+    """
+    queue_path = os.path.join(directory, 'test.queue')
+    try:
+        with open(queue_path, encoding='utf-8') as fp:
+            return json.load(fp)['waiting']
+    except (OSError, ValueError):
+        return []
+
+
+def _wait_for_waiters(directory, count):
+    """
+    Wait until the FileSemaphore 'test' has the specified number of waiters.
+    """
+    end_time = time.time() + 10
+    while len(_semaphore_queue(directory)) < count:
+        assert time.time() < end_time, "Waiter did not queue up"
+        time.sleep(0.01)
+
+
+def test_common_file_semaphore_order(tmp_path):
+    """
+    Test that a FileSemaphore grants the slots to waiting processes in the
+    order of their arrival, and skips waiters that terminated while waiting.
+    """
+    directory = str(tmp_path)
+    out_path = str(tmp_path / 'order.txt')
+    sem = common.FileSemaphore(directory, 'test', 1)
+    slot = sem.acquire()
+    ctx = multiprocessing.get_context('fork')
+    processes = []
+    for index in range(5):
+        process = ctx.Process(
+            target=_semaphore_waiter, args=(directory, index, out_path))
+        process.start()
+        processes.append(process)
+        _wait_for_waiters(directory, index + 1)
+
+    # A waiter that terminates abnormally does not block the later waiters
+    processes[2].kill()
+    processes[2].join()
+
+    # The code to be tested
+    sem.release(slot)
+
+    for process in processes:
+        process.join(30)
+    with open(out_path, encoding='utf-8') as fp:
+        order = [int(line) for line in fp]
+    assert order == [0, 1, 3, 4]
+    assert _semaphore_queue(directory) == []
+
+
+def test_common_file_rate_limiter(tmp_path):
+    """
+    Test that a FileRateLimiter spaces requests according to its rate.
+    """
+    limiter = common.FileRateLimiter(str(tmp_path), 'test', 20)
+    start_time = time.time()
+
+    # The code to be tested
+    for _ in range(5):
+        limiter.acquire()
+
+    assert time.time() - start_time >= 0.2
+
+
+COMMON_GOVERNOR_ENV_TESTCASES = [
+    # Testcases for test_common_governor_from_environment()
+    # Each list item is a testcase with the following tuple items:
+    # * env (dict): Environment variables to be set.
+    # * exp_governor (bool): Whether a governor is expected to be returned.
+    # * exp_exc (bool): Whether ParameterError is expected to be raised.
+    ({}, False, False),
+    ({'ZHMC_MAX_SESSIONS': '0'}, False, False),
+    ({'ZHMC_MAX_SESSIONS': '4'}, True, False),
+    ({'ZHMC_MAX_REQUESTS': '8', 'ZHMC_REQUEST_RATE': '2.5'}, True, False),
+    ({'ZHMC_MAX_SESSIONS': 'four'}, False, True),
+    ({'ZHMC_REQUEST_RATE': '-1'}, False, True),
+    ({'ZHMC_GOVERNOR_TIMEOUT': '10'}, False, False),
+    ({'ZHMC_MAX_SESSIONS': '4', 'ZHMC_GOVERNOR_TIMEOUT': '0'}, True, False),
+    ({'ZHMC_MAX_SESSIONS': '4', 'ZHMC_GOVERNOR_TIMEOUT': 'x'}, False, True),
+]
+
+
+@pytest.mark.parametrize(
+    "env, exp_governor, exp_exc",
+    COMMON_GOVERNOR_ENV_TESTCASES)
+def test_common_governor_from_environment(
+        monkeypatch, tmp_path, env, exp_governor, exp_exc):
+    """
+    Test HmcGovernor.from_environment().
+    """
+    for envvar in ('ZHMC_MAX_SESSIONS', 'ZHMC_MAX_REQUESTS',
+                   'ZHMC_REQUEST_RATE', 'ZHMC_GOVERNOR_TIMEOUT'):
+        monkeypatch.delenv(envvar, raising=False)
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    for envvar, value in env.items():
+        monkeypatch.setenv(envvar, value)
+
+    if exp_exc:
+        with pytest.raises(common.ParameterError):
+
+            # The code to be tested
+            common.HmcGovernor.from_environment('fake-host')
+
+    else:
+
+        # The code to be tested
+        governor = common.HmcGovernor.from_environment('fake-host')
+
+        assert (governor is not None) == exp_governor
+
+
+def test_common_governor_session(tmp_path):
+    """
+    Test that an HmcGovernor attached to a zhmcclient session governs its
+    HTTP requests and limits the number of sessions.
+    """
+    governor = common.HmcGovernor(
+        'fake-host', max_sessions=1, max_requests=1, directory=str(tmp_path))
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+
+    # The code to be tested
+    governor.attach(session)
+
+    # pylint: disable=protected-access
+    requests_session = session._new_session(session.retry_timeout_config)
+    adapter = requests_session.adapters['https://']
+    assert adapter.send.func == governor.send_request
+
+    governor.acquire_session()
+    other = common.HmcGovernor(
+        'fake-host', max_sessions=1, directory=str(tmp_path))
+    acquired = threading.Event()
+
+    def acquire_other():
+        other.acquire_session()
+        acquired.set()
+        other.release_session()
+
+    thread = threading.Thread(target=acquire_other)
+    thread.start()
+    assert not acquired.wait(0.3)
+    governor.release_session()
+    assert acquired.wait(5)
+    thread.join()
+
+
+COMMON_SELECTOR_ENV_TESTCASES = [
+    # Testcases for test_common_selector_from_environment()
+    # Each list item is a testcase with the following tuple items:
+    # * env (dict): Environment variables to be set.
+    # * hmc_host (str or list): The HMC host(s).
+    # * exp_selector (bool): Whether a selector is expected to be returned.
+    # * exp_exc (bool): Whether ParameterError is expected to be raised.
+    ({}, ['hmc1', 'hmc2'], False, False),
+    ({'ZHMC_HMC_SELECTION': 'order'}, ['hmc1', 'hmc2'], False, False),
+    ({'ZHMC_HMC_SELECTION': 'latency'}, ['hmc1', 'hmc2'], True, False),
+    ({'ZHMC_HMC_SELECTION': 'Latency', 'ZHMC_HMC_SELECTION_TTL': '60'},
+     ['hmc1', 'hmc2'], True, False),
+    ({'ZHMC_HMC_SELECTION': 'latency'}, ['hmc1'], False, False),
+    ({'ZHMC_HMC_SELECTION': 'latency'}, 'hmc1', False, False),
+    ({'ZHMC_HMC_SELECTION': 'fastest'}, ['hmc1', 'hmc2'], False, True),
+    ({'ZHMC_HMC_SELECTION': 'latency', 'ZHMC_HMC_SELECTION_TTL': 'long'},
+     ['hmc1', 'hmc2'], False, True),
+    ({'ZHMC_HMC_SELECTION': 'latency', 'ZHMC_HMC_SELECTION_TTL': '-1'},
+     ['hmc1', 'hmc2'], False, True),
+]
+
+
+@pytest.mark.parametrize(
+    "env, hmc_host, exp_selector, exp_exc",
+    COMMON_SELECTOR_ENV_TESTCASES)
+def test_common_selector_from_environment(
+        monkeypatch, tmp_path, env, hmc_host, exp_selector, exp_exc):
+    """
+    Test HmcSelector.from_environment().
+    """
+    for envvar in ('ZHMC_HMC_SELECTION', 'ZHMC_HMC_SELECTION_TTL'):
+        monkeypatch.delenv(envvar, raising=False)
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    for envvar, value in env.items():
+        monkeypatch.setenv(envvar, value)
+
+    if exp_exc:
+        with pytest.raises(common.ParameterError):
+
+            # The code to be tested
+            common.HmcSelector.from_environment(hmc_host)
+
+    else:
+
+        # The code to be tested
+        selector = common.HmcSelector.from_environment(hmc_host)
+
+        assert (selector is not None) == exp_selector
+
+
+def test_common_selector_ordered_hosts(tmp_path):
+    """
+    Test HmcSelector.ordered_hosts() for ordering the HMCs by their response
+    time, and for caching the order.
+    """
+    rtts = {'hmc1': 0.3, 'hmc2': None, 'hmc3': 0.1}
+    probed = []
+
+    def probe(host):
+        probed.append(host)
+        return rtts[host]
+
+    selector = common.HmcSelector(
+        ['hmc1', 'hmc2', 'hmc3'], ttl=60, directory=str(tmp_path))
+    with mock.patch.object(selector, 'probe', side_effect=probe):
+
+        # The code to be tested
+        hosts = selector.ordered_hosts()
+
+        assert hosts == ['hmc3', 'hmc1', 'hmc2']
+        assert sorted(probed) == ['hmc1', 'hmc2', 'hmc3']
+
+        # The order is now cached, also for other selectors
+        probed.clear()
+        other = common.HmcSelector(
+            ['hmc1', 'hmc2', 'hmc3'], ttl=60, directory=str(tmp_path))
+        assert other.ordered_hosts() == ['hmc3', 'hmc1', 'hmc2']
+        assert selector.ordered_hosts() == ['hmc3', 'hmc1', 'hmc2']
+        assert probed == []
+
+        # An expired order is not used
+        selector.ttl = 0.01
+        time.sleep(0.02)
+        rtts['hmc2'] = 0.05
+        assert selector.ordered_hosts() == ['hmc2', 'hmc3', 'hmc1']
+        assert len(probed) == 3
+
+
+def test_common_selector_unhealthy(tmp_path):
+    """
+    Test that HmcSelector.ordered_hosts() returns the HMCs in the order given
+    and does not cache that order if no HMC responded.
+    """
+    selector = common.HmcSelector(
+        ['hmc1', 'hmc2'], ttl=60, directory=str(tmp_path))
+    with mock.patch.object(selector, 'probe', return_value=None) as probe:
+
+        # The code to be tested
+        hosts = selector.ordered_hosts()
+
+        assert hosts == ['hmc1', 'hmc2']
+        selector.ordered_hosts()
+        assert probe.call_count == 4
+
+
+def test_common_selector_probe():
+    """
+    Test HmcSelector.probe() for a responding and a failing HMC.
+    """
+    selector = common.HmcSelector(['hmc1', 'hmc2'], ttl=0)
+    with mock.patch.object(Session, 'get', autospec=True) as get_func:
+        get_func.return_value = {'api-major-version': 4}
+
+        # The code to be tested
+        rtt = selector.probe('hmc1')
+
+        assert rtt is not None and rtt >= 0
+        assert get_func.call_args[0][1] == '/api/version'
+        assert get_func.call_args[1] == {'logon_required': False}
+
+        get_func.side_effect = ConnectTimeout(
+            "Connect timeout", None, 10, 0)
+
+        # The code to be tested
+        rtt = selector.probe('hmc2')
+
+        assert rtt is None
+
+
+def test_common_selector_open_session(monkeypatch, tmp_path):
+    """
+    Test that open_session() uses the HMCs in the order of their latency if
+    enabled.
+    """
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    monkeypatch.setenv('ZHMC_HMC_SELECTION', 'latency')
+    params = {
+        'hmc_host': ['hmc1', 'hmc2'],
+        'hmc_auth': {'userid': 'fake-user', 'password': 'fake-pw'},
+    }
+    with mock.patch.object(common.HmcSelector, 'ordered_hosts',
+                           return_value=['hmc2', 'hmc1']):
+
+        # The code to be tested
+        session, logoff = common.open_session(params)
+
+        assert session.host == ['hmc2', 'hmc1']
+        assert logoff is True
+
+
+COMMON_ROUTED_HOSTS_TESTCASES = [
+    # Testcases for test_common_routed_hosts()
+    # Each list item is a testcase with the following tuple items:
+    # * hmc_host (str or list): The HMC host(s) specified by the user.
+    # * hosts (str or list): The HMC host(s) in the order otherwise used.
+    # * read_only (bool): Whether the session is read-only.
+    # * exp_hosts (str or list): The expected HMC host(s).
+    ('hmc1', 'hmc1', True, 'hmc1'),
+    (['hmc1'], ['hmc1'], True, ['hmc1']),
+    (['hmc1', 'hmc2'], ['hmc1', 'hmc2'], False, ['hmc1', 'hmc2']),
+    (['hmc1', 'hmc2'], ['hmc1', 'hmc2'], True, ['hmc2', 'hmc1']),
+    (['hmc1', 'hmc2'], ['hmc2', 'hmc1'], False, ['hmc1', 'hmc2']),
+    (['hmc1', 'hmc2', 'hmc3'], ['hmc3', 'hmc1', 'hmc2'], True,
+     ['hmc3', 'hmc2', 'hmc1']),
+    (['hmc1', 'hmc2', 'hmc3'], ['hmc3', 'hmc1', 'hmc2'], False,
+     ['hmc1', 'hmc3', 'hmc2']),
+]
+
+
+@pytest.mark.parametrize(
+    "hmc_host, hosts, read_only, exp_hosts",
+    COMMON_ROUTED_HOSTS_TESTCASES)
+def test_common_routed_hosts(hmc_host, hosts, read_only, exp_hosts):
+    """
+    Test routed_hosts().
+    """
+
+    # The code to be tested
+    result = common.routed_hosts(hmc_host, hosts, read_only)
+
+    assert result == exp_hosts
+
+
+@pytest.mark.parametrize(
+    "split, read_only, exp_hosts", [
+        (None, True, ['hmc1', 'hmc2']),
+        ('false', True, ['hmc1', 'hmc2']),
+        ('true', False, ['hmc1', 'hmc2']),
+        ('true', True, ['hmc2', 'hmc1']),
+    ]
+)
+def test_common_read_write_split(monkeypatch, split, read_only, exp_hosts):
+    """
+    Test that open_session() routes read-only sessions to the alternate HMC
+    if read/write splitting is enabled.
+    """
+    monkeypatch.delenv('ZHMC_HMC_SELECTION', raising=False)
+    if split is None:
+        monkeypatch.delenv('ZHMC_READ_WRITE_SPLIT', raising=False)
+    else:
+        monkeypatch.setenv('ZHMC_READ_WRITE_SPLIT', split)
+    params = {
+        'hmc_host': ['hmc1', 'hmc2'],
+        'hmc_auth': {'userid': 'fake-user', 'password': 'fake-pw'},
+    }
+
+    # The code to be tested
+    session, _ = common.open_session(params, read_only=read_only)
+
+    assert session.host == exp_hosts
+
+
+def http_error(status, reason):
+    """
+    Return a zhmcclient.HTTPError with the specified status and reason codes.
+    """
+    return HTTPError({
+        'http-status': status, 'reason': reason, 'message': "Fake error",
+        'request-uri': '/api/fake', 'request-method': 'POST'})
+
+
+def connection_error(refused):
+    """
+    Return a zhmcclient.ConnectionError for a refused connection (i.e. the
+    request has not reached the HMC) or for a connection reset.
+    """
+    if refused:
+        reason = urllib3.exceptions.NewConnectionError(
+            None, "Connection refused")
+        details = requests.exceptions.ConnectionError(
+            urllib3.exceptions.MaxRetryError(None, '/api/fake', reason))
+    else:
+        details = requests.exceptions.ConnectionError(
+            urllib3.exceptions.ProtocolError(
+                "Connection aborted.", ConnectionResetError()))
+    return ClientConnectionError("fake", details)
+
+
+COMMON_RETRY_TESTCASES = [
+    # Testcases for test_common_retry_policy_call()
+    # Each list item is a testcase with the following tuple items:
+    # * errors (list): Exceptions raised by the consecutive calls of the
+    #   function, before it succeeds.
+    # * attempts (int): Maximum number of retries of the retry policy.
+    # * exp_calls (int): Expected number of calls of the function.
+    # * exp_exc (bool): Whether the last error is expected to be raised.
+    ([], 3, 1, False),
+    ([http_error(409, 2)], 3, 2, False),
+    ([http_error(409, 2), http_error(503, 0)], 3, 3, False),
+    ([ConnectTimeout("fake", None, 30, 3)], 3, 2, False),
+    ([connection_error(refused=True)], 3, 2, False),
+    ([http_error(409, 2)] * 4, 3, 4, True),
+    ([http_error(409, 2)], 0, 1, True),
+    ([http_error(409, 3)], 3, 1, True),
+    ([http_error(404, 1)], 3, 1, True),
+    ([http_error(409, 1)], 3, 1, True),
+    ([ReadTimeout("fake", None, 300, 3)], 3, 1, True),
+    ([connection_error(refused=False)], 3, 1, True),
+]
+
+
+@pytest.mark.parametrize(
+    "errors, attempts, exp_calls, exp_exc",
+    COMMON_RETRY_TESTCASES)
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_retry_policy_call(
+        sleep_func, errors, attempts, exp_calls, exp_exc):
+    # pylint: disable=unused-argument
+    """
+    Test RetryPolicy.call() and the recording of the retries.
+    """
+    policy = common.RetryPolicy(attempts=attempts)
+    func = mock.Mock(side_effect=errors + ['result'])
+    common.RETRY_STATS.reset()
+
+    if exp_exc:
+        with pytest.raises(type(errors[exp_calls - 1])):
+
+            # The code to be tested
+            policy.call('POST /api/fake', func, 'arg', kw='kw')
+
+    else:
+
+        # The code to be tested
+        result = policy.call('POST /api/fake', func, 'arg', kw='kw')
+
+        assert result == 'result'
+
+    assert func.call_count == exp_calls
+    assert func.call_args == mock.call('arg', kw='kw')
+    exp_retries = {'POST /api/fake': exp_calls - 1} if exp_calls > 1 else {}
+    assert common.RETRY_STATS.as_dict() == exp_retries
+    assert common.module_result_items() == \
+        ({'retries': exp_retries} if exp_retries else {})
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_retry_operation(sleep_func):
+    # pylint: disable=unused-argument
+    """
+    Test that retry_operation() retries a method of a resource object upon
+    transient errors and records the retries.
+    """
+    resource = mock.Mock(uri='/api/fake/1')
+    resource.update_properties.side_effect = [http_error(409, 2), None]
+    common.RETRY_STATS.reset()
+
+    # The code to be tested
+    result = common.retry_operation(
+        resource, 'update_properties', {'description': 'x'})
+
+    assert result is None
+    assert resource.update_properties.call_args_list == \
+        [mock.call({'description': 'x'})] * 2
+    assert common.RETRY_STATS.as_dict() == {
+        'update_properties /api/fake/1': 1,
+    }
+    common.RETRY_STATS.reset()
+
+
+@pytest.mark.parametrize(
+    "error, exp_calls", [
+        (http_error(409, 2), 2),
+        (http_error(503, 0), 2),
+        (connection_error(refused=True), 2),
+        (ConnectTimeout("fake", None, 30, 3), 1),
+        (ReadTimeout("fake", None, 300, 3), 1),
+        (connection_error(refused=False), 1),
+    ]
+)
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+def test_common_retry_job_submission(sleep_func, error, exp_calls):
+    # pylint: disable=unused-argument
+    """
+    Test that retry_job_submission() submits an asynchronous operation
+    without waiting for its completion, and retries the submission only upon
+    transient errors for which the HMC has certainly not accepted it.
+    """
+    resource = mock.Mock(uri='/api/fake/1')
+    resource.start.side_effect = [error, 'job']
+    common.RETRY_STATS.reset()
+
+    if exp_calls == 1:
+        with pytest.raises(type(error)):
+
+            # The code to be tested
+            common.retry_job_submission(resource, 'start')
+
+    else:
+
+        # The code to be tested
+        result = common.retry_job_submission(resource, 'start')
+
+        assert result == 'job'
+
+    assert resource.start.call_args_list == \
+        [mock.call(wait_for_completion=False)] * exp_calls
+    exp_retries = {'start /api/fake/1': 1} if exp_calls > 1 else {}
+    assert common.RETRY_STATS.as_dict() == exp_retries
+    common.RETRY_STATS.reset()
+
+
+def test_common_retry_session_not_wrapped():
+    """
+    Test that open_session() does not retry the HMC operations of the
+    session, so that non-idempotent operations such as creations are not
+    retried.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16', '4.10')
+    post_func = mock.Mock(side_effect=[http_error(503, 0), 'posted'])
+    session.post = post_func
+    common.RETRY_STATS.reset()
+
+    # The code to be tested
+    session, _ = common.open_session(dict(_faked_session=session))
+
+    with pytest.raises(HTTPError):
+        session.post('/api/fake', body={})
+    assert post_func.call_count == 1
+    assert common.RETRY_STATS.as_dict() == {}
+
+
+COMMON_URI_TEMPLATE_TESTCASES = [
+    # Testcases for test_common_uri_template()
+    # The list items are tuples with the following items:
+    # - uri (str): Input URI
+    # - exp_template (str): Expected URI template
+
+    ('/api/cpcs', '/api/cpcs'),
+    ('/api/partitions/0c5d7e5a-66a1-11ef-8a7e-fa163e3fcd42',
+     '/api/partitions/{id}'),
+    ('/api/partitions/0c5d7e5a66a111ef8a7efa163e3fcd42/nics/'
+     '1f2e3d4c-66a1-11ef-8a7e-fa163e3fcd42', '/api/partitions/{id}/nics/{id}'),
+    ('/api/adapters/0c5d7e5a-66a1-11ef-8a7e-fa163e3fcd42/network-ports/0',
+     '/api/adapters/{id}/network-ports/{id}'),
+    ('https://hmc1:6794/api/partitions?name=part1&properties=status',
+     '/api/partitions'),
+    ('/api/sessions/this-session', '/api/sessions/this-session'),
+]
+
+
+@pytest.mark.parametrize(
+    "uri, exp_template",
+    COMMON_URI_TEMPLATE_TESTCASES)
+def test_common_uri_template(uri, exp_template):
+    """
+    Test uri_template().
+    """
+
+    # The code to be tested
+    template = common.uri_template(uri)
+
+    assert template == exp_template
+
+
+@pytest.mark.parametrize(
+    "values, exp_result", [
+        ([], None),
+        ([1.0], 1.0),
+        ([3.0, 1.0, 2.0], 3.0),
+        ([float(v) for v in range(1, 101)], 95.0),
+    ]
+)
+def test_common_percentile(values, exp_result):
+    """
+    Test percentile() with the 95th percentile.
+    """
+
+    # The code to be tested
+    result = common.percentile(values, 95)
+
+    assert result == exp_result
+
+
+def test_common_request_stats():
+    """
+    Test that RequestStats accumulates the requests per method and URI
+    template, including the Logon time.
+    """
+    stats = common.RequestStats()
+
+    # The code to be tested
+    stats.record('post', '/api/sessions', 0.5, 200)
+    stats.record('GET', '/api/partitions/0c5d7e5a-66a1-11ef-8a7e-fa163e3fcd42',
+                 0.25, 1000)
+    stats.record('GET', '/api/partitions/1c5d7e5a-66a1-11ef-8a7e-fa163e3fcd42',
+                 0.75, 3000)
+
+    result = stats.as_dict()
+
+    assert result == {
+        'requests': {
+            'GET /api/partitions/{id}': {
+                'count': 2, 'time': 1.0, 'p95_time': 0.75, 'bytes': 4000},
+            'POST /api/sessions': {
+                'count': 1, 'time': 0.5, 'p95_time': 0.5, 'bytes': 200},
+        },
+        'request_count': 3,
+        'request_time': 1.5,
+        'request_p95_time': 0.75,
+        'response_bytes': 4200,
+        'logon_time': 0.5,
+    }
+    stats.reset()
+    assert stats.as_dict()['request_count'] == 0
+    assert stats.as_dict()['logon_time'] is None
+
+
+def test_common_request_stats_session():
+    """
+    Test that RequestStats attached to a zhmcclient session records its HTTP
+    requests.
+    """
+    stats = common.RequestStats()
+    session = Session('fake-host', 'fake-user', 'fake-pw')
+
+    # The code to be tested
+    stats.attach(session)
+
+    # pylint: disable=protected-access
+    requests_session = session._new_session(session.retry_timeout_config)
+    adapter = requests_session.adapters['https://']
+    assert adapter.send.func == stats.send_request
+
+    send_func = mock.Mock(return_value=mock.Mock(content=b'{"a": 1}'))
+    request = mock.Mock(method='GET', url='https://fake-host:6794/api/cpcs')
+    stats.send_request(send_func, request, timeout=10)
+    send_func.assert_called_once_with(request, timeout=10)
+    result = stats.as_dict()
+    assert result['requests']['GET /api/cpcs']['count'] == 1
+    assert result['response_bytes'] == 8
+
+
+@pytest.mark.parametrize(
+    "envvar_value, exp_stats", [
+        (None, False),
+        ('false', False),
+        ('true', True),
+        ('1', True),
+    ]
+)
+def test_common_stats_result(envvar_value, exp_stats):
+    """
+    Test that the HMC request statistics of a faked session are returned in
+    the module result items only when enabled.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16', '4.10')
+    session.hmc.cpcs.add({'object-id': 'fake-cpc-oid', 'name': 'CPC1'})
+    env = {} if envvar_value is None else {'ZHMC_STATS': envvar_value}
+    with mock.patch.dict('os.environ', env, clear=True):
+        common.module_result_items()
+        session, _ = common.open_session(
+            {'hmc_host': 'fake-host', 'hmc_auth': {},
+             '_faked_session': session})
+        session.get('/api/cpcs')
+        session.get('/api/cpcs')
+        common.WAIT_METRICS.record('job', 2.0, 3, False)
+
+        # The code to be tested
+        items = common.module_result_items()
+
+    if not exp_stats:
+        assert items == {}
+        return
+    stats = items['_zhmc_stats']
+    assert stats['requests']['GET /api/cpcs']['count'] == 2
+    assert stats['request_count'] == 2
+    assert stats['response_bytes'] == 0
+    assert stats['logon_time'] is None
+    assert stats['waits'] == {
+        'job': {'waits': 1, 'polls': 3, 'time': 2.0, 'timeouts': 0}}
+    assert stats['wait_time'] == 2.0
+
+
+def test_common_stats_enabled_invalid():
+    """
+    Test that an invalid value of the ZHMC_STATS environment variable is
+    rejected.
+    """
+    with mock.patch.dict('os.environ', {'ZHMC_STATS': 'maybe'}):
+        with pytest.raises(common.ParameterError):
+
+            # The code to be tested
+            common.stats_enabled()
+
+
+@pytest.mark.parametrize(
+    "enabled", [False, True]
+)
+def test_common_module_profiler(tmp_path, enabled):
+    """
+    Test that log_init() and module_result_items() profile a module invocation
+    into the directory in the ZHMC_PROFILE_DIR environment variable.
+    """
+    profile_dir = tmp_path / 'profiles'
+    env = {'ZHMC_PROFILE_DIR': str(profile_dir)} if enabled else {}
+    with mock.patch.dict('os.environ', env, clear=True):
+
+        # The code to be tested
+        common.log_init('zhmc_fake')
+        sorted(range(1000))
+        items = common.module_result_items()
+
+    if not enabled:
+        assert items == {}
+        assert not profile_dir.exists()
+        return
+    filepath = items['_zhmc_profile']
+    assert os.path.dirname(filepath) == str(profile_dir)
+    assert os.path.basename(filepath).startswith('zhmc_fake-')
+    assert filepath.endswith('.pstats')
+    stats = pstats.Stats(filepath)
+    assert stats.total_calls > 0
+    assert common.PROFILER.profile is None
+
+
+def _profiled_worker(item):
+    """
+    Worker function for test_common_module_profiler_threads().
+    """
+    return sorted(range(item))
+
+
+def test_common_module_profiler_threads(tmp_path):
+    """
+    Test that the profile file of a module invocation covers the worker
+    threads of run_concurrently().
+    """
+    env = {'ZHMC_PROFILE_DIR': str(tmp_path)}
+    with mock.patch.dict('os.environ', env, clear=True):
+        common.log_init('zhmc_fake')
+
+        # The code to be tested
+        common.run_concurrently(_profiled_worker, [10, 20, 30], 3)
+
+        items = common.module_result_items()
+
+    stats = pstats.Stats(items['_zhmc_profile'])
+    func_names = [func[2] for func in stats.stats]
+    assert '_profiled_worker' in func_names
+
+
+def test_common_module_profiler_atexit(tmp_path):
+    """
+    Test that a started profiler writes the profile file at process exit if
+    the module result was not created.
+    """
+    env = {'ZHMC_PROFILE_DIR': str(tmp_path)}
+    profiler = common.ModuleProfiler()
+    with mock.patch.dict('os.environ', env, clear=True), \
+            mock.patch.object(common.atexit, 'register') as register_mock:
+        profiler.start('zhmc_fake')
+        sorted(range(1000))
+        register_mock.assert_called_once_with(profiler.stop)
+
+        # The code to be tested (as called at process exit)
+        filepath = profiler.stop()
+
+    assert os.path.dirname(filepath) == str(tmp_path)
+    assert pstats.Stats(filepath).total_calls > 0
+
+
+def test_common_is_faked_session():
+    """
+    Test is_faked_session() for faked and real sessions.
+    """
+    faked_session = FakedSession('fake-host', 'fake-hmc', '2.16', '4.10')
+    real_session = Session('fake-host', 'fake-userid', 'fake-password')
+
+    # The code to be tested
+    assert common.is_faked_session(faked_session) is True
+    assert common.is_faked_session(real_session) is False
+
+
+COMMON_FEATURE_CACHE_ENV_TESTCASES = [
+    # Testcases for test_common_feature_cache_from_environment()
+    # Each list item is a testcase with the following tuple items:
+    # - env (dict): Environment variables to be set.
+    # - exp_ttl (float): Expected time to live, if no exception.
+    # - exp_exc (bool): Expect ParameterError to be raised.
+    ({}, 0, False),
+    ({'ZHMC_FEATURE_CACHE_TTL': ''}, 0, False),
+    ({'ZHMC_FEATURE_CACHE_TTL': '3600'}, 3600, False),
+    ({'ZHMC_FEATURE_CACHE_TTL': 'long'}, None, True),
+    ({'ZHMC_FEATURE_CACHE_TTL': '-1'}, None, True),
+]
+
+
+@pytest.mark.parametrize(
+    "env, exp_ttl, exp_exc",
+    COMMON_FEATURE_CACHE_ENV_TESTCASES)
+def test_common_feature_cache_from_environment(
+        monkeypatch, tmp_path, env, exp_ttl, exp_exc):
+    """
+    Test FeatureCache.from_environment().
+    """
+    monkeypatch.delenv('ZHMC_FEATURE_CACHE_TTL', raising=False)
+    monkeypatch.setenv('ZHMC_GOVERNOR_DIR', str(tmp_path))
+    for envvar, value in env.items():
+        monkeypatch.setenv(envvar, value)
+
+    if exp_exc:
+        with pytest.raises(common.ParameterError):
+
+            # The code to be tested
+            common.FeatureCache.from_environment('hmc1')
+
+    else:
+
+        # The code to be tested
+        cache = common.FeatureCache.from_environment('hmc1')
+
+        assert cache.ttl == exp_ttl
+
+
+def test_common_feature_cache(tmp_path):
+    """
+    Test FeatureCache.features() for caching the feature lists per key, and
+    for not using expired entries.
+    """
+    calls = []
+
+    def list_func(key):
+        def func():
+            calls.append(key)
+            return [f'{key}-feature']
+        return func
+
+    cache = common.FeatureCache('hmc1', ttl=60, directory=str(tmp_path))
+
+    # The code to be tested
+    assert cache.features('a', list_func('a')) == ['a-feature']
+    assert cache.features('b', list_func('b')) == ['b-feature']
+
+    assert calls == ['a', 'b']
+
+    # The feature lists are now cached, also for other caches of the same
+    # HMC host, but not for other HMC hosts
+    other = common.FeatureCache('hmc1', ttl=60, directory=str(tmp_path))
+    assert other.features('a', list_func('a')) == ['a-feature']
+    assert other.features('b', list_func('b')) == ['b-feature']
+    assert calls == ['a', 'b']
+    other = common.FeatureCache('hmc2', ttl=60, directory=str(tmp_path))
+    assert other.features('a', list_func('a')) == ['a-feature']
+    assert calls == ['a', 'b', 'a']
+
+    # Expired entries are not used
+    cache.ttl = 0.01
+    time.sleep(0.02)
+    assert cache.features('a', list_func('a')) == ['a-feature']
+    assert calls == ['a', 'b', 'a', 'a']
+
+
+def test_common_feature_cache_disabled(tmp_path):
+    """
+    Test that FeatureCache.features() with a time to live of 0 always
+    retrieves the feature list and does not create a cache file.
+    """
+    cache = common.FeatureCache('hmc1', ttl=0, directory=str(tmp_path))
+    list_func = mock.Mock(return_value=['feature'])
+
+    # The code to be tested
+    assert cache.features('a', list_func) == ['feature']
+    assert cache.features('a', list_func) == ['feature']
+
+    assert list_func.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_common_job_journal(tmp_path):
+    """
+    Test JobJournal for setting, getting and removing entries, which are
+    shared by the journals of the same HMC host.
+    """
+    journal = common.JobJournal('hmc1', directory=str(tmp_path))
+
+    # The code to be tested
+    assert journal.get('/api/cpcs/1') is None
+    journal.set('/api/cpcs/1', {'job-uri': '/api/jobs/1'})
+    journal.set('/api/cpcs/2', {'job-uri': '/api/jobs/2'})
+
+    other = common.JobJournal('hmc1', directory=str(tmp_path))
+    assert other.get('/api/cpcs/1') == {'job-uri': '/api/jobs/1'}
+    other.remove('/api/cpcs/1')
+    other.remove('/api/cpcs/3')
+    assert journal.get('/api/cpcs/1') is None
+    assert journal.get('/api/cpcs/2') == {'job-uri': '/api/jobs/2'}
+    assert common.JobJournal(
+        'hmc2', directory=str(tmp_path)).get('/api/cpcs/2') is None
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the 'zhmc_job' Ansible module.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from unittest import mock
+import pytest
+import zhmcclient
+import zhmcclient_mock
+
+from plugins.modules import zhmc_job
+
+
+def job_params(job_uris, session, **kwargs):
+    """
+    Return the module parameters for zhmc_job.
+    """
+    params = {
+        'hmc_host': 'fake-host',
+        'hmc_auth': dict(userid='fake-userid',
+                         password='fake-password'),
+        'job_uris': job_uris,
+        'timeout': 60,
+        'max_parallel': 10,
+        'log_file': None,
+        '_faked_session': session,
+    }
+    params.update(kwargs)
+    return params
+
+
+def not_found_error(uri):
+    """
+    Return a HTTPError for a job that does not exist.
+    """
+    return zhmcclient.HTTPError({
+        'http-status': 404, 'reason': 1, 'message': "Job not found",
+        'request-uri': uri, 'request-method': 'GET'})
+
+
+@mock.patch("plugins.module_utils.common.time.sleep", autospec=True)
+@mock.patch.object(zhmcclient.Job, 'delete', autospec=True)
+@mock.patch.object(zhmcclient.Job, 'query_status', autospec=True)
+def test_job_perform_task(query_status_func, delete_func, sleep_func):
+    # pylint: disable=unused-argument
+    """
+    Test perform_task() with jobs that complete, fail and do not exist.
+    """
+    session = zhmcclient_mock.FakedSession('fake-host', 'fake-hmc', '2.16',
+                                           '4.10')
+    polls = {}
+
+    def query_status(job):
+        polls[job.uri] = polls.get(job.uri, 0) + 1
+        if job.uri == '/api/jobs/running':
+            if polls[job.uri] < 3:
+                return 'running', None, None, None
+            return 'complete', 204, None, None
+        if job.uri == '/api/jobs/failed':
+            return 'complete', 409, 1, {'message': "Failed"}
+        raise not_found_error(job.uri)
+
+    query_status_func.side_effect = query_status
+    job_uris = ['/api/jobs/running', '/api/jobs/failed', '/api/jobs/gone']
+
+    # The code to be tested
+    changed, jobs = zhmc_job.perform_task(
+        job_params(job_uris, session), check_mode=False)
+
+    assert changed is False
+    assert [j['uri'] for j in jobs] == job_uris
+    assert [j['status'] for j in jobs] == \
+        ['complete', 'complete', 'not-found']
+    assert [j['failed'] for j in jobs] == [False, True, True]
+    assert jobs[1]['job_status_code'] == 409
+    assert jobs[1]['job_results'] == {'message': "Failed"}
+    assert polls['/api/jobs/running'] == 3
+    deleted_uris = sorted(c[0][0].uri for c in delete_func.call_args_list)
+    assert deleted_uris == ['/api/jobs/failed', '/api/jobs/running']
+
+
+@mock.patch.object(zhmcclient.Job, 'delete', autospec=True)
+@mock.patch.object(zhmcclient.Job, 'query_status', autospec=True)
+def test_job_perform_task_check_mode(query_status_func, delete_func):
+    """
+    Test perform_task() in check mode, which does not wait and does not
+    delete jobs.
+    """
+    session = zhmcclient_mock.FakedSession('fake-host', 'fake-hmc', '2.16',
+                                           '4.10')
+    query_status_func.return_value = ('running', None, None, None)
+
+    # The code to be tested
+    changed, jobs = zhmc_job.perform_task(
+        job_params(['/api/jobs/1'], session), check_mode=True)
+
+    assert changed is False
+    assert jobs[0]['status'] == 'running'
+    assert query_status_func.call_count == 1
+    assert delete_func.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "status, failed, exp_msg_pattern", [
+        ('complete', False, None),
+        ('complete', True, "1 of 1 jobs have failed"),
+        ('running', False, "Timeout expired after 60 s"),
+    ]
+)
+@mock.patch("plugins.modules.zhmc_job.perform_task", autospec=True)
+@mock.patch("plugins.modules.zhmc_job.AnsibleModule", autospec=True)
+def test_job_main(ansible_mod_cls, perform_task_func, status, failed,
+                  exp_msg_pattern):
+    """
+    Test main() for successful and failed jobs and for an expired timeout.
+    """
+    params = job_params(['/api/jobs/1'], None)
+    jobs = [zhmc_job.job_report('/api/jobs/1', status)]
+    jobs[0]['failed'] = failed
+    perform_task_func.return_value = (False, jobs)
+
+    mod_obj = ansible_mod_cls.return_value
+    mod_obj.params = params
+    mod_obj.check_mode = False
+    mod_obj.fail_json.configure_mock(side_effect=SystemExit(1))
+    mod_obj.exit_json.configure_mock(side_effect=SystemExit(0))
+
+    # The code to be tested
+    with pytest.raises(SystemExit) as exc_info:
+        zhmc_job.main()
+
+    if exp_msg_pattern is None:
+        assert exc_info.value.args[0] == 0
+        mod_obj.exit_json.assert_called_once_with(changed=False, jobs=jobs)
+    else:
+        assert exc_info.value.args[0] == 1
+        assert mod_obj.fail_json.call_count == 1
+        kwargs = mod_obj.fail_json.call_args[1]
+        assert kwargs['msg'].startswith(exp_msg_pattern)
+        assert kwargs['jobs'] == jobs
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the synthetic mocked HMC generator used in performance tests.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+import zhmcclient
+from zhmcclient_mock import FakedSession
+
+from tests.common import mocked_hmc_generator
+
+
+def test_generator_deterministic():
+    """
+    Test that the generated definition is determined by the seed.
+    """
+
+    # The code to be tested
+    def1 = mocked_hmc_generator.generate_hmc_definition(seed=42)
+    def2 = mocked_hmc_generator.generate_hmc_definition(seed=42)
+    def3 = mocked_hmc_generator.generate_hmc_definition(seed=43)
+
+    assert def1 == def2
+    assert def1 != def3
+
+
+def test_generator_counts():
+    """
+    Test that a faked session for a generated definition has the specified
+    numbers of resources.
+    """
+
+    # The code to be tested
+    session = mocked_hmc_generator.faked_session(
+        seed=1, dpm_cpcs=2, classic_cpcs=1, partitions=20, lpars=7,
+        adapters=6, nics=3, hbas=2, storage_groups=4, storage_volumes=5,
+        users=9, user_roles=3)
+
+    client = zhmcclient.Client(session)
+    dpm_cpcs = client.cpcs.list(filter_args={'dpm-enabled': True})
+    classic_cpcs = client.cpcs.list(filter_args={'dpm-enabled': False})
+    assert len(dpm_cpcs) == 2
+    assert len(classic_cpcs) == 1
+    assert len(classic_cpcs[0].lpars.list()) == 7
+    cpc = dpm_cpcs[0]
+    assert len(cpc.adapters.list()) == 6
+    assert len(cpc.virtual_switches.list()) == 3
+    partitions = cpc.partitions.list()
+    assert len(partitions) == 20
+    assert len(partitions[0].nics.list()) == 3
+    assert len(partitions[0].hbas.list()) == 2
+    console = client.consoles.console
+    assert len(console.users.list(filter_args={'type': 'standard'})) == 9
+    assert len(console.user_roles.list(
+        filter_args={'type': 'user-defined'})) == 3
+    storage_groups = console.storage_groups.list()
+    assert len(storage_groups) == 8
+    assert len(storage_groups[0].storage_volumes.list()) == 5
+
+
+def test_generator_unknown_count():
+    """
+    Test that an unknown resource count is rejected.
+    """
+    with pytest.raises(ValueError):
+
+        # The code to be tested
+        mocked_hmc_generator.generate_hmc_definition(nets=1)
+
+
+def test_generator_main(tmp_path):
+    """
+    Test that the generated mocked HMC definition file can be loaded.
+    """
+    filepath = str(tmp_path / 'mocked_hmc.yaml')
+
+    # The code to be tested
+    rc = mocked_hmc_generator.main(
+        ['--seed', '5', '--partitions', '3', '--output', filepath])
+
+    assert rc == 0
+    session = FakedSession.from_hmc_yaml_file(filepath)
+    client = zhmcclient.Client(session)
+    assert len(client.cpcs.list()[0].partitions.list()) == 3
@@ -53,6 +53,10 @@ def test_main_success(ansible_mod_cls, perform_task_func):
         'image_file': None,
         'ins_file': None,
         'properties': None,
+        'nics': None,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
         'expand_storage_groups': False,
         'expand_crypto_adapters': False,
         'expand_nics': False,
@@ -82,6 +86,10 @@ def test_main_success(ansible_mod_cls, perform_task_func):
     assert exit_code == 0
 
     # Assert call to AnsibleModule()
+    child_options = dict(
+        name=dict(required=True, type='str'),
+        properties=dict(required=False, type='dict', default=None),
+    )
     expected_argument_spec = dict(
         hmc_host=dict(required=True, type='raw'),
         hmc_auth=dict(
@@ -105,6 +113,14 @@ def test_main_success(ansible_mod_cls, perform_task_func):
         select_properties=dict(required=False, type='list', elements='str',
                                default=None),
         properties=dict(required=False, type='dict', default=None),
+        nics=dict(required=False, type='list', elements='dict', default=None,
+                  options=child_options),
+        hbas=dict(required=False, type='list', elements='dict', default=None,
+                  options=child_options),
+        virtual_functions=dict(required=False, type='list', elements='dict',
+                               default=None, options=child_options),
+        storage_groups=dict(required=False, type='list', elements='str',
+                            default=None),
         image_name=dict(required=False, type='str', default=None),
         image_file=dict(required=False, type='str', default=None),
         ins_file=dict(required=False, type='str', default=None),
@@ -113,6 +129,7 @@ def test_main_success(ansible_mod_cls, perform_task_func):
         expand_crypto_adapters=dict(required=False, type='bool',
                                     default=False),
         expand_nics=dict(required=False, type='bool', default=None),
+        wait=dict(required=False, type='bool', default=True),
         log_file=dict(required=False, type='str', default=None),
         _faked_session=dict(required=False, type='raw'),
     )
@@ -154,6 +171,10 @@ def test_main_param_error(ansible_mod_cls, perform_task_func):
         'image_file': None,
         'ins_file': None,
         'properties': None,
+        'nics': None,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
         'expand_storage_groups': False,
         'expand_crypto_adapters': False,
         'expand_nics': False,
@@ -702,3 +723,125 @@ def test_part_create_check_mode_partition(
 
 
 # The other functions of the module are tested with function tests.
+
+
+def reconcile_params(**kwargs):
+    """
+    Return the module parameters for reconcile_children().
+    """
+    params = {
+        'nics': None,
+        'hbas': None,
+        'virtual_functions': None,
+        'storage_groups': None,
+    }
+    params.update(kwargs)
+    return params
+
+
+def named_mock(name, **kwargs):
+    """
+    Return a mock object with a name attribute.
+    """
+    obj = mock.Mock(**kwargs)
+    obj.name = name
+    return obj
+
+
+@pytest.mark.parametrize(
+    "check_mode", [False, True])
+def test_part_reconcile_storage_groups(check_mode):
+    """
+    Test reconcile_children() for attaching and detaching storage groups.
+    """
+    sg1 = named_mock('sg1')
+    sg2 = named_mock('sg2')
+    sg3 = named_mock('sg3')
+    cpc = named_mock('cpc1', uri='/api/cpcs/cpc1')
+    cpc.manager.console.storage_groups.list.return_value = [sg1, sg2, sg3]
+    partition = named_mock('part1')
+    partition.list_attached_storage_groups.return_value = [sg1, sg3]
+    params = reconcile_params(storage_groups=['sg1', 'sg2'])
+
+    # The code to be tested
+    changed = zhmc_partition.reconcile_children(
+        params, cpc, partition, False, check_mode)
+
+    assert changed is True
+    if check_mode:
+        partition.attach_storage_group.assert_not_called()
+        partition.detach_storage_group.assert_not_called()
+    else:
+        partition.attach_storage_group.assert_called_once_with(sg2)
+        partition.detach_storage_group.assert_called_once_with(sg3)
+    cpc.manager.console.storage_groups.list.assert_called_once_with(
+        filter_args={'cpc-uri': cpc.uri})
+
+
+def test_part_reconcile_unchanged():
+    """
+    Test reconcile_children() for a new partition without child elements
+    and for module parameters that are not specified.
+    """
+    cpc = named_mock('cpc1')
+    partition = named_mock('part1')
+
+    # The code to be tested
+    changed = zhmc_partition.reconcile_children(
+        reconcile_params(nics=[], storage_groups=[]), cpc, partition, True,
+        False)
+
+    assert changed is False
+    partition.nics.list.assert_not_called()
+    partition.list_attached_storage_groups.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "params, exp_msg_pattern", [
+        (reconcile_params(nics=[{'name': 'nic1'}, {'name': 'nic1'}]),
+         "Module parameter 'nics' specifies NICs with duplicate names"),
+        (reconcile_params(nics=[{'name': 'nic1',
+                                 'properties': {'foo': 1}}]),
+         "Property 'foo' of NIC 'nic1' is not defined"),
+        (reconcile_params(nics=[{'name': 'nic1',
+                                 'properties': {'adapter_name': 'osa1'}}]),
+         r"Artificial properties \('adapter_name', 'adapter_port'\) of a "
+         "NIC must either all be specified"),
+        (reconcile_params(hbas=[{'name': 'hba1',
+                                 'properties': {'adapter_name': 'fcp2',
+                                                'adapter_port': 0}}]),
+         "The backing adapter of HBA 'hba1' cannot be changed"),
+        (reconcile_params(virtual_functions=[
+            {'name': 'vf1', 'properties': {'adapter_name': 'zedc9'}}]),
+         "Artificial property 'adapter_name' does not specify the name of "
+         "an existing adapter: 'zedc9'"),
+        (reconcile_params(storage_groups=['sg9']),
+         "Module parameter 'storage_groups' specifies a storage group that "
+         "does not exist on CPC 'cpc1': 'sg9'"),
+    ]
+)
+def test_part_reconcile_errors(params, exp_msg_pattern):
+    """
+    Test reconcile_children() for invalid module parameters.
+    """
+    port = mock.Mock(uri='/api/adapters/fcp2/storage-ports/0')
+    fcp2 = named_mock('fcp2', uri='/api/adapters/fcp2')
+    fcp2.ports.find.return_value = port
+    cpc = named_mock('cpc1', uri='/api/cpcs/cpc1')
+    cpc.adapters.list.return_value = [fcp2]
+    cpc.manager.console.storage_groups.list.return_value = []
+    hba1 = named_mock('hba1', properties={
+        'adapter-port-uri': '/api/adapters/fcp1/storage-ports/0'})
+    partition = named_mock('part1')
+    partition.hbas.list.return_value = [hba1]
+    partition.nics.list.return_value = []
+    partition.virtual_functions.list.return_value = []
+    partition.list_attached_storage_groups.return_value = []
+
+    with pytest.raises(module_utils.ParameterError) as exc_info:
+
+        # The code to be tested
+        zhmc_partition.reconcile_children(
+            params, cpc, partition, False, False)
+
+    assert re.match(exp_msg_pattern, str(exc_info.value))